@@ -0,0 +1,102 @@
+"""
+Benchmark ChromaDB Worker Pool vs One-Shot Subprocesses
+Compares per-company latency of the warm worker pool against spawning a
+fresh interpreter per company (the original chromadb_isolated behaviour).
+
+Usage:
+    python benchmark_chromadb_pool.py                      # ping job, 10 iterations
+    python benchmark_chromadb_pool.py --job company_profile --companies 20
+    python benchmark_chromadb_pool.py --job company_news --companies 5 --limit 5
+"""
+
+import argparse
+import os
+import statistics
+import time
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from core.models import Company
+from core.chromadb_isolated import get_worker_pool, run_isolated
+
+
+def print_header(text):
+    """Print a nice header"""
+    print("\n" + "="*80)
+    print(f"  {text}")
+    print("="*80)
+
+
+def build_jobs(job_type, count, limit):
+    """Return (label, params) pairs for the benchmark"""
+    if job_type == 'ping':
+        return [(f"ping {i}", {}) for i in range(count)]
+
+    companies = Company.objects.filter(is_active=True).order_by('id')[:count]
+    if job_type == 'company_news':
+        return [(c.name, {'company_id': c.id, 'limit': limit}) for c in companies]
+    return [(c.name, {'company_id': c.id}) for c in companies]
+
+
+def run_path(jobs, job_type, use_pool, timeout):
+    """Run all jobs through one path and return per-job latencies"""
+    latencies = []
+    failures = 0
+    for label, params in jobs:
+        start = time.perf_counter()
+        result = run_isolated(job_type, params, timeout=timeout, label=label, use_pool=use_pool)
+        latencies.append(time.perf_counter() - start)
+        if not result.get('success'):
+            failures += 1
+            print(f"  [FAIL] {label}: {result.get('error')}")
+    return latencies, failures
+
+
+def report(name, latencies, failures):
+    if not latencies:
+        print(f"\n{name}: no jobs run")
+        return
+    print(f"\n{name}")
+    print(f"  jobs:   {len(latencies)} ({failures} failed)")
+    print(f"  total:  {sum(latencies):.2f}s")
+    print(f"  mean:   {statistics.mean(latencies):.3f}s")
+    print(f"  median: {statistics.median(latencies):.3f}s")
+    print(f"  min:    {min(latencies):.3f}s")
+    print(f"  max:    {max(latencies):.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--job', choices=['ping', 'company_profile', 'company_news'], default='ping')
+    parser.add_argument('--companies', type=int, default=10, help='Number of companies (or pings)')
+    parser.add_argument('--limit', type=int, default=5, help='News items per company for company_news')
+    parser.add_argument('--timeout', type=int, default=180)
+    args = parser.parse_args()
+
+    jobs = build_jobs(args.job, args.companies, args.limit)
+    print_header(f"CHROMADB ISOLATION BENCHMARK: {args.job} x {len(jobs)}")
+
+    print("\nOne-shot subprocess per company...")
+    oneshot, oneshot_failed = run_path(jobs, args.job, use_pool=False, timeout=args.timeout)
+
+    print("\nWarm worker pool (includes first-job start-up)...")
+    pool = get_worker_pool()
+    pooled, pooled_failed = run_path(jobs, args.job, use_pool=True, timeout=args.timeout)
+
+    report("One-shot subprocess", oneshot, oneshot_failed)
+    report("Worker pool", pooled, pooled_failed)
+    if len(pooled) > 1:
+        report("Worker pool (excluding start-up job)", pooled[1:], pooled_failed)
+
+    if oneshot and pooled:
+        speedup = statistics.mean(oneshot) / statistics.mean(pooled)
+        print(f"\nMean per-company speedup: {speedup:.1f}x")
+    print(f"Pool stats: {pool.stats}")
+
+    pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
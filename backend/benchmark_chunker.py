@@ -0,0 +1,146 @@
+"""
+Benchmark Streaming Chunker vs Legacy Chunkers
+Compares peak RSS and throughput of the shared streaming chunker
+(mcp_servers/text_chunker.py) against the previous implementations on a
+large report: full-document tiktoken encode + decode per window (RAG/news)
+and word splitting (GPU worker).
+
+Each mode runs in its own process so peak RSS is measured independently.
+
+Usage:
+    python benchmark_chunker.py                     # synthetic 1,000-page report
+    python benchmark_chunker.py --pages 2000
+    python benchmark_chunker.py --file report.md    # Docling markdown export
+"""
+
+import argparse
+import multiprocessing
+import random
+import resource
+import sys
+import time
+
+PAGE_PARAGRAPHS = [
+    "The {zone} zone hosts an Indicated Mineral Resource of {t} Mt grading {g} g/t Au for "
+    "{oz} oz contained gold at a 0.5 g/t cut-off. Drill hole DDH-23-{n:03d} intersected "
+    "{g} g/t Au over {m} m, including higher-grade intervals within the quartz-carbonate vein system.",
+    "Sample preparation was completed at an accredited laboratory. Certified reference materials, "
+    "blanks and duplicates were inserted at a rate of one in twenty samples, and the QP reviewed "
+    "all QA/QC results without identifying material bias.",
+    "| Category | Tonnes (Mt) | Grade (g/t) | Contained (koz) |\n|---|---|---|---|\n"
+    "| Measured | {t} | {g} | {oz} |\n| Indicated | {t} | {g} | {oz} |\n| Inferred | {t} | {g} | {oz} |",
+    "The base case after-tax NPV at a 5% discount rate is US${npv} million with an IRR of {irr}% "
+    "and a payback period of {pb} years, using a long-term gold price of US$1,850/oz.",
+]
+
+
+def build_report(pages: int) -> str:
+    """Build a Docling-like markdown report with headings every 25 pages"""
+    rng = random.Random(42)
+    parts = []
+    for page in range(pages):
+        if page % 25 == 0:
+            parts.append(f"## {page // 25 + 1} Section {page // 25 + 1}")
+        for template in PAGE_PARAGRAPHS:
+            parts.append(template.format(
+                zone=rng.choice(["North", "Main", "Porphyry", "Deep"]),
+                t=round(rng.uniform(0.5, 40), 2), g=round(rng.uniform(0.3, 9), 2),
+                oz=rng.randint(10000, 900000), n=rng.randint(1, 999), m=round(rng.uniform(1, 60), 1),
+                npv=rng.randint(50, 900), irr=round(rng.uniform(8, 45), 1), pb=round(rng.uniform(1, 6), 1),
+            ))
+        parts.append(f"Page {page + 1}")
+    return "\n\n".join(parts)
+
+
+def peak_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def legacy_tiktoken(text, encoding):
+    tokens = encoding.encode(text)
+    chunks = []
+    start = 0
+    while start < len(tokens):
+        end = min(start + 512, len(tokens))
+        chunks.append({'text': encoding.decode(tokens[start:end]), 'token_count': end - start})
+        start = end - 50
+        if end >= len(tokens):
+            break
+    return len(chunks)
+
+
+def legacy_words(text, encoding):
+    words = text.split()
+    chunks = []
+    start = 0
+    while start < len(words):
+        end = min(start + 512, len(words))
+        chunks.append({'text': ' '.join(words[start:end])})
+        start = end - 50 if end < len(words) else end
+    return len(chunks)
+
+
+def streaming(text, encoding):
+    from mcp_servers.text_chunker import iter_chunks
+    count = 0
+    for _ in iter_chunks(text, max_tokens=512, overlap_tokens=50, encoding=encoding, respect_headings=True):
+        count += 1
+    return count
+
+
+MODES = {
+    'legacy_tiktoken': legacy_tiktoken,
+    'legacy_words': legacy_words,
+    'streaming': streaming,
+}
+
+
+def run_mode(mode, pages, path, queue):
+    from mcp_servers.text_chunker import get_encoding
+    encoding = get_encoding()
+    text = open(path, encoding='utf-8').read() if path else build_report(pages)
+    baseline = peak_rss_mb()
+
+    start = time.perf_counter()
+    chunk_count = MODES[mode](text, encoding)
+    elapsed = time.perf_counter() - start
+
+    queue.put({
+        'mode': mode,
+        'chunks': chunk_count,
+        'seconds': elapsed,
+        'mb_per_sec': len(text.encode('utf-8')) / (1024 * 1024) / elapsed,
+        'peak_rss_mb': peak_rss_mb(),
+        'rss_growth_mb': peak_rss_mb() - baseline,
+        'text_mb': len(text) / (1024 * 1024),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pages', type=int, default=1000)
+    parser.add_argument('--file', help='Text/markdown file to chunk instead of the synthetic report')
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context('spawn')
+    print("=" * 80)
+    print(f"  CHUNKER BENCHMARK ({args.file or f'{args.pages}-page synthetic report'})")
+    print("=" * 80)
+    print(f"{'mode':<18}{'chunks':>8}{'seconds':>10}{'MB/s':>8}{'peak RSS':>11}{'RSS growth':>12}")
+
+    for mode in MODES:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=run_mode, args=(mode, args.pages, args.file, queue))
+        proc.start()
+        result = queue.get()
+        proc.join()
+        print(f"{result['mode']:<18}{result['chunks']:>8}{result['seconds']:>10.2f}"
+              f"{result['mb_per_sec']:>8.2f}{result['peak_rss_mb']:>9.0f}MB{result['rss_growth_mb']:>10.0f}MB")
+
+    print(f"\nInput size: {result['text_mb']:.1f} MB of text")
+
+
+if __name__ == '__main__':
+    main()
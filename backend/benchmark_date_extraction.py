@@ -0,0 +1,802 @@
+"""
+Benchmark Compiled Date Extraction vs Per-Call Regex Chains
+Runs the four listing-page date parsers (parse_date_comprehensive,
+parse_date_standalone, CompanyDataScraper._parse_date_text and
+MiningNewsScraper._parse_date) over the text of every anchor and element of
+news listing pages, as the crawlers do, with the previous implementations
+and with the mcp_servers.date_extraction engine. Checks that both return the
+same dates and reports strings parsed per second, memo hits and the rule
+order the hit counters settled on.
+
+Listing pages are read from crawl fixtures (the JSON files recorded by
+benchmark_document_crawler.py --record, {start_url, pages}) or from a
+directory of saved .html files. Without either, a built-in corpus of listing
+pages is generated from the date formats seen on mining company sites.
+
+The crawler check then drives crawl_html_news_pages itself over the same
+saved pages (or, without a corpus, one replayed site per listing layout that
+parses its dates inline: post-item, postArticle, list-item and year-tab
+month/day divs, div.post month spans, flex date boxes, PDF rows and
+Squarespace PDF file names). Each strategy catches and logs its own
+exceptions, so the check fails on any logged programming error (an undefined
+name, a bad attribute) and on layouts that yield no dated release.
+
+The previous parse_date_standalone raised UnboundLocalError on month-day
+dates without a year ("Jan 15"): a function-local datetime import shadowed
+the module one. Those strings are counted separately rather than as
+differences.
+
+Usage:
+    python benchmark_date_extraction.py
+    python benchmark_date_extraction.py --pages 400 --runs 5
+    python benchmark_date_extraction.py --fixtures fixtures/sites/
+    python benchmark_date_extraction.py --html saved_pages/
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Tuple
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from bs4 import BeautifulSoup
+
+from mcp_servers import website_crawler
+from mcp_servers.date_extraction import (
+    EXTRACTORS, article_date_extractor, leading_date_extractor, listing_text_date_extractor,
+    standalone_date_extractor,
+)
+
+LEGACY_MONTH_MAP = {
+    'jan': '01', 'january': '01', 'feb': '02', 'february': '02',
+    'mar': '03', 'march': '03', 'apr': '04', 'april': '04',
+    'may': '05', 'jun': '06', 'june': '06', 'jul': '07', 'july': '07',
+    'aug': '08', 'august': '08', 'sep': '09', 'sept': '09', 'september': '09',
+    'oct': '10', 'october': '10', 'nov': '11', 'november': '11',
+    'dec': '12', 'december': '12'
+}
+
+
+def legacy_parse_date_comprehensive(text: str) -> Tuple[Optional[str], str]:
+    """The previous website_crawler.parse_date_comprehensive"""
+    if not text:
+        return None, text
+
+    text = text.strip()
+    original_text = text
+    date_str = None
+
+    match = re.match(r'^(\d{1,2})\.(\d{1,2})\.(20\d{2}|\d{2})\s*[-–]?\s*(.*)$', text)
+    if match:
+        first = match.group(1).zfill(2)
+        second = match.group(2).zfill(2)
+        year = match.group(3)
+        if len(year) == 2:
+            year = f"20{year}" if int(year) <= 50 else f"19{year}"
+        first_int, second_int = int(first), int(second)
+
+        if 1 <= first_int <= 12 and 1 <= second_int <= 31:
+            date_str = f"{year}-{first}-{second}"
+            text = match.group(4).strip() if match.group(4) else ''
+            return date_str, text
+        elif 1 <= second_int <= 12 and 1 <= first_int <= 31:
+            date_str = f"{year}-{second}-{first}"
+            text = match.group(4).strip() if match.group(4) else ''
+            return date_str, text
+
+    match = re.match(
+        r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s*(20\d{2})\s*[-–]?\s*(.*)$',
+        text, re.IGNORECASE
+    )
+    if match:
+        month = LEGACY_MONTH_MAP.get(match.group(1).lower(), '01')
+        day = match.group(2).zfill(2)
+        year = match.group(3)
+        date_str = f"{year}-{month}-{day}"
+        text = match.group(4).strip() if match.group(4) else ''
+        return date_str, text
+
+    match = re.match(r'^(\d{1,2})(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)([A-Z].*)', text)
+    if match:
+        day = match.group(1).zfill(2)
+        month = LEGACY_MONTH_MAP.get(match.group(2).lower(), '01')
+        remaining_title = match.group(3)
+        current_year = datetime.now().year
+        current_month = datetime.now().month
+        year = current_year if int(month) <= current_month else current_year - 1
+        date_str = f"{year}-{month}-{day}"
+        return date_str, remaining_title
+
+    match = re.match(r'^(\d{1,2})/(\d{1,2})/(\d{2})\s+(.*)$', text)
+    if match:
+        first = match.group(1).zfill(2)
+        second = match.group(2).zfill(2)
+        year_short = match.group(3)
+        year = f"20{year_short}" if int(year_short) <= 50 else f"19{year_short}"
+        first_int, second_int = int(first), int(second)
+
+        if first_int > 12 and 1 <= second_int <= 12:
+            date_str = f"{year}-{second}-{first}"
+            text = match.group(4).strip()
+            return date_str, text
+        elif second_int > 12 and 1 <= first_int <= 12:
+            date_str = f"{year}-{first}-{second}"
+            text = match.group(4).strip()
+            return date_str, text
+        elif 1 <= first_int <= 12 and 1 <= second_int <= 12:
+            dd_mm_date = f"{year}-{second}-{first}"
+            mm_dd_date = f"{year}-{first}-{second}"
+
+            try:
+                dd_mm_parsed = datetime.strptime(dd_mm_date, '%Y-%m-%d')
+                mm_dd_parsed = datetime.strptime(mm_dd_date, '%Y-%m-%d')
+                today = datetime.now()
+
+                if dd_mm_parsed > today + timedelta(days=7) and mm_dd_parsed <= today + timedelta(days=7):
+                    date_str = mm_dd_date
+                else:
+                    date_str = dd_mm_date
+            except ValueError:
+                date_str = dd_mm_date
+
+            text = match.group(4).strip()
+            return date_str, text
+
+    match = re.match(
+        r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s*(\d{1,2})\s*,?\s*(20\d{2})\s*[-–]?\s*(.*)$',
+        text, re.IGNORECASE
+    )
+    if match:
+        month = LEGACY_MONTH_MAP.get(match.group(1).lower(), '01')
+        day = match.group(2).zfill(2)
+        year = match.group(3)
+        date_str = f"{year}-{month}-{day}"
+        text = match.group(4).strip() if match.group(4) else ''
+        return date_str, text
+
+
+    match = re.search(r'(20\d{2})(\d{2})(\d{2})', text)
+    if match:
+        year, month, day = match.group(1), match.group(2), match.group(3)
+        if 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
+            date_str = f"{year}-{month}-{day}"
+            return date_str, original_text
+
+    match = re.search(r'(20\d{2})[_-](\d{2})[_-](\d{2})', text)
+    if match:
+        year, month, day = match.group(1), match.group(2), match.group(3)
+        if 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
+            date_str = f"{year}-{month}-{day}"
+            return date_str, original_text
+
+    match = re.search(
+        r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+(\d{1,2}),?\s*(20\d{2})',
+        text, re.IGNORECASE
+    )
+    if match:
+        month_name = match.group(1).lower()[:3]
+        month = LEGACY_MONTH_MAP.get(month_name, '01')
+        day = match.group(2).zfill(2)
+        year = match.group(3)
+        date_str = f"{year}-{month}-{day}"
+        return date_str, original_text
+
+    match = re.search(r'(\d{1,2})/(\d{1,2})/(20\d{2})', text)
+    if match:
+        first = match.group(1).zfill(2)
+        second = match.group(2).zfill(2)
+        year = match.group(3)
+        first_int, second_int = int(first), int(second)
+
+        if first_int > 12 and 1 <= second_int <= 12:
+            date_str = f"{year}-{second}-{first}"
+            return date_str, original_text
+        elif second_int > 12 and 1 <= first_int <= 12:
+            date_str = f"{year}-{first}-{second}"
+            return date_str, original_text
+        elif 1 <= first_int <= 12 and 1 <= second_int <= 12:
+            dd_mm_date = f"{year}-{second}-{first}"
+            mm_dd_date = f"{year}-{first}-{second}"
+            try:
+                dd_mm_parsed = datetime.strptime(dd_mm_date, "%Y-%m-%d")
+                mm_dd_parsed = datetime.strptime(mm_dd_date, "%Y-%m-%d")
+                now = datetime.now()
+                future_threshold = now + timedelta(days=7)
+                if dd_mm_parsed > future_threshold and mm_dd_parsed <= future_threshold:
+                    return mm_dd_date, original_text
+                return dd_mm_date, original_text
+            except (ValueError, TypeError):
+                return dd_mm_date, original_text
+
+    return None, original_text
+
+
+def legacy_parse_date_standalone(text: str) -> Optional[str]:
+    """The previous website_crawler.parse_date_standalone"""
+    if not text:
+        return None
+    text = text.strip()
+
+    text = re.sub(r'(\d)(st|nd|rd|th)\b', r'\1', text)
+
+    match = re.match(r'^(\d{1,2})\.(\d{1,2})\.(20\d{2}|\d{2})$', text)
+    if match:
+        first, second, year = match.groups()
+        if len(year) == 2:
+            year = f"20{year}"
+        first_int, second_int = int(first), int(second)
+
+        if first_int > 12 and 1 <= second_int <= 12:
+            return f"{year}-{second.zfill(2)}-{first.zfill(2)}"
+        elif second_int > 12 and 1 <= first_int <= 12:
+            return f"{year}-{first.zfill(2)}-{second.zfill(2)}"
+        elif 1 <= first_int <= 12 and 1 <= second_int <= 31:
+            return f"{year}-{first.zfill(2)}-{second.zfill(2)}"
+        return f"{year}-{second.zfill(2)}-{first.zfill(2)}"
+
+    match = re.match(
+        r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s*(20\d{2})$',
+        text, re.IGNORECASE
+    )
+    if match:
+        month = LEGACY_MONTH_MAP.get(match.group(1).lower()[:3], '01')
+        day = match.group(2).zfill(2)
+        year = match.group(3)
+        return f"{year}-{month}-{day}"
+
+    match = re.match(
+        r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})\s*/\s*(20\d{2})$',
+        text, re.IGNORECASE
+    )
+    if match:
+        month = LEGACY_MONTH_MAP.get(match.group(1).lower()[:3], '01')
+        day = match.group(2).zfill(2)
+        year = match.group(3)
+        return f"{year}-{month}-{day}"
+
+    match = re.match(
+        r'^(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(20\d{2})$',
+        text, re.IGNORECASE
+    )
+    if match:
+        day = match.group(1).zfill(2)
+        month = LEGACY_MONTH_MAP.get(match.group(2).lower()[:3], '01')
+        year = match.group(3)
+        return f"{year}-{month}-{day}"
+
+    match = re.match(
+        r'^(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec),?\s+(20\d{2})$',
+        text, re.IGNORECASE
+    )
+    if match:
+        day = match.group(1).zfill(2)
+        month = LEGACY_MONTH_MAP.get(match.group(2).lower(), '01')
+        year = match.group(3)
+        return f"{year}-{month}-{day}"
+
+    match = re.match(
+        r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})\s+(20\d{2})$',
+        text, re.IGNORECASE
+    )
+    if match:
+        month = LEGACY_MONTH_MAP.get(match.group(1).lower(), '01')
+        day = match.group(2).zfill(2)
+        year = match.group(3)
+        return f"{year}-{month}-{day}"
+
+    match = re.match(
+        r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s*(20\d{2})$',
+        text, re.IGNORECASE
+    )
+    if match:
+        month = LEGACY_MONTH_MAP.get(match.group(1).lower(), '01')
+        day = match.group(2).zfill(2)
+        year = match.group(3)
+        return f"{year}-{month}-{day}"
+
+    match = re.match(
+        r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.\s*(\d{1,2}),?\s*(20\d{2})$',
+        text, re.IGNORECASE
+    )
+    if match:
+        month = LEGACY_MONTH_MAP.get(match.group(1).lower(), '01')
+        day = match.group(2).zfill(2)
+        year = match.group(3)
+        return f"{year}-{month}-{day}"
+
+    match = re.match(r'^(\d{1,2})/(\d{1,2})/(20\d{2}|\d{2})$', text)
+    if match:
+        first, second, year = match.groups()
+        if len(year) == 2:
+            year = f"20{year}"
+        first_int, second_int = int(first), int(second)
+
+        if first_int > 12 and 1 <= second_int <= 12:
+            return f"{year}-{second.zfill(2)}-{first.zfill(2)}"
+        elif second_int > 12 and 1 <= first_int <= 12:
+            return f"{year}-{first.zfill(2)}-{second.zfill(2)}"
+        elif 1 <= first_int <= 12 and 1 <= second_int <= 12:
+            dd_mm_date = f"{year}-{second.zfill(2)}-{first.zfill(2)}"
+            mm_dd_date = f"{year}-{first.zfill(2)}-{second.zfill(2)}"
+            try:
+                from datetime import datetime, timedelta
+                dd_mm_parsed = datetime.strptime(dd_mm_date, "%Y-%m-%d")
+                mm_dd_parsed = datetime.strptime(mm_dd_date, "%Y-%m-%d")
+                now = datetime.now()
+                future_threshold = now + timedelta(days=7)
+
+                if dd_mm_parsed > future_threshold and mm_dd_parsed <= future_threshold:
+                    return mm_dd_date
+                return dd_mm_date
+            except (ValueError, TypeError):
+                return dd_mm_date
+        else:
+            return f"{year}-{second.zfill(2)}-{first.zfill(2)}"
+
+    match = re.match(
+        r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})$',
+        text, re.IGNORECASE
+    )
+    if match:
+        month = LEGACY_MONTH_MAP.get(match.group(1).lower(), '01')
+        day = match.group(2).zfill(2)
+        current_year = datetime.now().year
+        current_month = datetime.now().month
+        current_day = datetime.now().day
+        month_int = int(month)
+        day_int = int(day)
+        if month_int > current_month or (month_int == current_month and day_int > current_day):
+            year = current_year - 1
+        else:
+            year = current_year
+        return f"{year}-{month}-{day}"
+
+    return None
+
+
+def legacy_parse_date_text(text: str) -> Optional[str]:
+    """The previous CompanyDataScraper._parse_date_text"""
+    if not text:
+        return None
+
+    date_match = re.search(r'(\d{4})[/-](\d{2})[/-](\d{2})', text)
+    if date_match:
+        return f"{date_match.group(1)}-{date_match.group(2)}-{date_match.group(3)}"
+
+    slash_date = re.search(r'(\d{1,2})/(\d{1,2})/(\d{2,4})', text)
+    if slash_date:
+        month = slash_date.group(1).zfill(2)
+        day = slash_date.group(2).zfill(2)
+        year_str = slash_date.group(3)
+        if len(year_str) == 2:
+            year_int = int(year_str)
+            year = f"20{year_str}" if year_int <= 50 else f"19{year_str}"
+        else:
+            year = year_str
+        return f"{year}-{month}-{day}"
+
+    month_map = {
+        'january': '01', 'february': '02', 'march': '03', 'april': '04',
+        'may': '05', 'june': '06', 'july': '07', 'august': '08',
+        'september': '09', 'october': '10', 'november': '11', 'december': '12',
+        'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+        'jun': '06', 'jul': '07', 'aug': '08', 'sep': '09',
+        'oct': '10', 'nov': '11', 'dec': '12'
+    }
+
+    month_pattern = r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[.,]?\s+(\d{1,2})\w*[.,]?\s+(\d{4})'
+    month_match = re.search(month_pattern, text, re.IGNORECASE)
+    if month_match:
+        month = month_map.get(month_match.group(1).lower(), '01')
+        day = month_match.group(2).zfill(2)
+        year = month_match.group(3)
+        return f"{year}-{month}-{day}"
+
+    day_first_pattern = r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[.,]?\s+(\d{4})'
+    day_match = re.search(day_first_pattern, text, re.IGNORECASE)
+    if day_match:
+        day = day_match.group(1).zfill(2)
+        month = month_map.get(day_match.group(2).lower(), '01')
+        year = day_match.group(3)
+        return f"{year}-{month}-{day}"
+
+    abbrev_concat_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s*(\d{1,2})(\d{4})'
+    abbrev_match = re.search(abbrev_concat_pattern, text, re.IGNORECASE)
+    if abbrev_match:
+        month = month_map.get(abbrev_match.group(1).lower(), '01')
+        day = abbrev_match.group(2).zfill(2)
+        year = abbrev_match.group(3)
+        return f"{year}-{month}-{day}"
+
+    spaced_slash_pattern = r'(\d{1,2})\s*/\s*(\d{1,2})\s*/\s*(\d{4})'
+    spaced_match = re.search(spaced_slash_pattern, text)
+    if spaced_match:
+        month = spaced_match.group(1).zfill(2)
+        day = spaced_match.group(2).zfill(2)
+        year = spaced_match.group(3)
+        return f"{year}-{month}-{day}"
+
+    dot_short_year_pattern = r'(\d{1,2})\.(\d{1,2})\.(\d{2})(?!\d)'
+    dot_match = re.search(dot_short_year_pattern, text)
+    if dot_match:
+        month = dot_match.group(1).zfill(2)
+        day = dot_match.group(2).zfill(2)
+        year_short = dot_match.group(3)
+        year_int = int(year_short)
+        year = f"20{year_short}" if year_int <= 50 else f"19{year_short}"
+        return f"{year}-{month}-{day}"
+
+    dot_full_year_pattern = r'(\d{1,2})\.(\d{1,2})\.(\d{4})'
+    dot_full_match = re.search(dot_full_year_pattern, text)
+    if dot_full_match:
+        month = dot_full_match.group(1).zfill(2)
+        day = dot_full_match.group(2).zfill(2)
+        year = dot_full_match.group(3)
+        return f"{year}-{month}-{day}"
+
+    return None
+
+
+def legacy_parse_article_date(date_str: str) -> Optional[str]:
+    """The previous MiningNewsScraper._parse_date"""
+    if not date_str:
+        return None
+
+    iso_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', date_str)
+    if iso_match:
+        return f"{iso_match.group(1)}-{iso_match.group(2)}-{iso_match.group(3)}"
+
+    month_day_year = re.search(
+        r'(January|February|March|April|May|June|July|August|September|October|November|December|'
+        r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[.\s]+(\d{1,2})[,\s]+(\d{4})',
+        date_str,
+        re.IGNORECASE
+    )
+    if month_day_year:
+        month_name = month_day_year.group(1).lower()[:3]
+        day = month_day_year.group(2).zfill(2)
+        year = month_day_year.group(3)
+
+        month_map = {
+            'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+            'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
+            'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+        }
+        month = month_map.get(month_name, '01')
+        return f"{year}-{month}-{day}"
+
+    day_month_year = re.search(
+        r'(\d{1,2})[.\s]+(January|February|March|April|May|June|July|August|September|October|November|December|'
+        r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[.\s]+(\d{4})',
+        date_str,
+        re.IGNORECASE
+    )
+    if day_month_year:
+        day = day_month_year.group(1).zfill(2)
+        month_name = day_month_year.group(2).lower()[:3]
+        year = day_month_year.group(3)
+
+        month_map = {
+            'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+            'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
+            'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+        }
+        month = month_map.get(month_name, '01')
+        return f"{year}-{month}-{day}"
+
+    numeric_match = re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', date_str)
+    if numeric_match:
+        month = numeric_match.group(1).zfill(2)
+        day = numeric_match.group(2).zfill(2)
+        year = numeric_match.group(3)
+        return f"{year}-{month}-{day}"
+
+    return None
+
+
+def new_parse_date_comprehensive(text):
+    return leading_date_extractor(text) if text else (None, text)
+
+
+def new_parse_date_standalone(text):
+    return standalone_date_extractor(text) if text else None
+
+
+def new_parse_date_text(text):
+    return listing_text_date_extractor(text) if text else None
+
+
+def new_parse_article_date(text):
+    return article_date_extractor(text) if text else None
+
+
+PARSERS = [
+    # (name, legacy, compiled, extractor, which element texts the crawlers pass it)
+    ('parse_date_comprehensive', legacy_parse_date_comprehensive, new_parse_date_comprehensive,
+     leading_date_extractor, 'anchors'),
+    ('parse_date_standalone', legacy_parse_date_standalone, new_parse_date_standalone,
+     standalone_date_extractor, 'elements'),
+    ('_parse_date_text', legacy_parse_date_text, new_parse_date_text,
+     listing_text_date_extractor, 'elements'),
+    ('MiningNewsScraper._parse_date', legacy_parse_article_date, new_parse_article_date,
+     article_date_extractor, 'elements'),
+]
+
+NAV = ['Home', 'About Us', 'Corporate', 'Management', 'Board of Directors', 'Projects', 'Investors',
+       'News', 'News Releases', 'Presentations', 'Financials', 'Contact', 'Subscribe', 'Read More',
+       'View PDF', 'Download PDF', 'Next', 'Previous', '1', '2', '3', '© 2026 All rights reserved',
+       'TSX-V: ABC | OTCQB: ABCDF', 'Shares Outstanding: 142,350,211']
+TITLES = ['Intersects {m} m of {g} g/t Au at {z} Zone', 'Announces ${a} Million Private Placement',
+          'Closes Flow-Through Financing', 'Provides Exploration Update on {z}', 'Files NI 43-101 Technical Report',
+          'Appoints New Chief Financial Officer', 'Commences {m},000 Metre Drill Program at {z}',
+          'Reports Q{q} Financial Results', 'Grants Stock Options', 'Receives Drilling Permit for {z}']
+ZONES = ['Eagle', 'Raven', 'Blackwater', 'Discovery', 'Red Lake', 'Timmins']
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October',
+          'November', 'December']
+DATE_FORMATS = [
+    lambda d: d.strftime('%B %d, %Y').replace(' 0', ' '),    # 1911 Gold: December 17, 2025
+    lambda d: d.strftime('%m.%d.%Y'),                          # Aztec Minerals: 01.07.2026
+    lambda d: d.strftime('%B %d / %Y'),                        # GoldMining: January 22 / 2026
+    lambda d: d.strftime('%d %B %Y').upper(),                  # Cantex: 28 JANUARY 2026
+    lambda d: d.strftime('%d %b, %Y'),                         # Firefox Gold: 20 Jan, 2026
+    lambda d: d.strftime('%b %d %Y'),                          # Aston Bay: Nov 17 2025
+    lambda d: d.strftime('%b %d, %Y'),                         # 55 North Mining: Jul 7, 2025
+    lambda d: d.strftime('%b. %d, %Y'),                        # Morien Resources: Dec. 17, 2025
+    lambda d: d.strftime('%m/%d/%y'),
+    lambda d: d.strftime('%b %d'),                             # Freegold Ventures: Jan 15
+    lambda d: d.strftime('%Y-%m-%d'),
+    lambda d: d.strftime('%B %dth, %Y'),
+]
+
+
+def build_listing_page(seed):
+    """A news listing page: navigation, then dated release rows in one site-specific format"""
+    rng = random.Random(seed)
+    date_format = DATE_FORMATS[seed % len(DATE_FORMATS)]
+    rows = []
+    day = datetime(2026, 1, 20)
+    for _ in range(rng.randint(15, 40)):
+        day -= timedelta(days=rng.randint(2, 20))
+        title = rng.choice(TITLES).format(m=rng.randint(2, 90), g=round(rng.uniform(0.5, 20), 2),
+                                          z=rng.choice(ZONES), a=rng.randint(2, 40), q=rng.randint(1, 4))
+        href = f"/news/{day.strftime('%Y%m%d')}-{title.lower().replace(' ', '-')[:40]}/"
+        layout = rng.random()
+        if layout < 0.4:
+            rows.append(f'<li><span class="date">{date_format(day)}</span><a href="{href}">{title}</a></li>')
+        elif layout < 0.7:
+            rows.append(f'<div class="item"><a href="{href}">{date_format(day)} {title}</a><p>Read More</p></div>')
+        else:
+            rows.append(f'<article><time>{date_format(day)}</time><h3><a href="{href}">{title}</a></h3></article>')
+    nav = ''.join(f'<li><a href="/{text.lower().replace(" ", "-")}/">{text}</a></li>' for text in NAV)
+    return f"<html><body><nav><ul>{nav}</ul></nav><main>{''.join(rows)}</main><footer>{nav}</footer></body></html>"
+
+
+def load_pages(args):
+    if args.fixtures:
+        pages = []
+        for path in sorted(Path(args.fixtures).glob('*.json')):
+            pages.extend(json.loads(path.read_text(encoding='utf-8'))['pages'].values())
+        return pages
+    if args.html:
+        return [path.read_text(encoding='utf-8', errors='replace') for path in sorted(Path(args.html).glob('*.html'))]
+    return [build_listing_page(seed) for seed in range(args.pages)]
+
+
+def page_texts(html):
+    """Anchor texts and element texts, in document order, as the listing-page parsers see them"""
+    soup = BeautifulSoup(html, 'html.parser')
+    anchors = [a.get_text(strip=True)[:100] for a in soup.find_all('a')]
+    elements = [element.get_text(strip=True) for element in soup.find_all(
+        ['a', 'time', 'span', 'p', 'li', 'div', 'h2', 'h3', 'h4', 'article'])]
+    return anchors, elements
+
+
+def safe(parser):
+    def run(text):
+        try:
+            return parser(text)
+        except UnboundLocalError:
+            return UnboundLocalError
+    return run
+
+
+def time_strings_per_second(parser, texts, runs, reset=None):
+    timings = []
+    for _ in range(runs):
+        if reset:
+            reset()
+        started = time.perf_counter()
+        for text in texts:
+            parser(text)
+        timings.append(time.perf_counter() - started)
+    return len(texts) / statistics.median(timings)
+
+
+# One replayed site per listing layout whose strategy parses dates inline
+LAYOUT_SITES = {
+    'post-item': '<div class="post-item"><h4 class="post-item__title"><a href="/news/gold-intercepts/">'
+                 'Company Intersects 12 m of 5.1 g/t Au at Eagle</a></h4>'
+                 '<span class="post-item__date-mobile">22 Jan, 2026</span></div>',
+    'postArticle': '<div class="postArticle"><div class="postTitle"><h3><a href="/news/placement/">'
+                   'Company Announces $5 Million Private Placement</a></h3></div><p>January 13, 2026</p></div>'
+                   '<div class="postArticle"><div class="postTitle"><h3><a href="/news/permit/">'
+                   'Company Receives Drilling Permit for Raven</a></h3></div><p>13 February 2026</p></div>',
+    'list-item': '<div class="list-item"><div class="date"><div class="month">Mar</div><div class="day">5</div>'
+                 '<div class="year">2026</div></div><div class="title"><a href="/news/exploration-update/">'
+                 'Company Provides Exploration Update on Discovery</a></div></div>',
+    'year-tab': '<div id="tab-2026"><div class="row"><div class="date"><div class="month">Feb</div>'
+                '<div class="day">3</div></div><div class="text"><div class="title"><a href="/news/drill-program/">'
+                'Company Commences 5,000 Metre Drill Program</a></div></div></div></div>',
+    'div.post': '<div class="post"><span class="month">Feb</span><span class="day">2</span>'
+                '<h3>Company Closes Flow-Through Financing</h3><a href="/news/flow-through/">Read</a></div>'
+                '<div class="post"><span class="month">February 09</span><span class="day">2026</span>'
+                '<h3>Company Files NI 43-101 Technical Report</h3><a href="/news/technical-report/">Read</a></div>',
+    'flex-date-box': '<div class="flex flex-wrap"><div class="uk-width-auto"><div>Jan</div><div>15</div>'
+                     '<div>2026</div></div><div class="uk-width-expand"><a href="/news/cfo/">'
+                     'Company Appoints New Chief Financial Officer</a></div></div>',
+    'pdf-row': '<table><tr><td><p>January 9, 2026 Company Reports Q4 Financial Results '
+               '<a href="/docs/q4-results.pdf">View</a></p></td></tr></table>',
+    'pdf-list': '<ul><li><a href="/docs/stock-options.pdf">Company Grants Stock Options to Directors</a>'
+                ' Mar 3, 2026</li></ul>',
+    'squarespace-pdfs': ''.join(f'<a href="/s/Press-release-ABC-{month}-14-2026-FINAL.pdf">Download</a>'
+                                for month in ('Jan', 'Feb', 'Mar')),
+}
+
+
+class ReplayResult:
+    def __init__(self, html):
+        self.html = html or ''
+        self.success = html is not None
+
+
+class ReplayCrawler:
+    """Serves a site's saved pages; any other URL gets the site's default page (or a failed fetch)"""
+
+    def __init__(self, pages, default=None):
+        self.pages = pages
+        self.default = default
+
+    async def arun(self, url, config=None, **kwargs):
+        return ReplayResult(self.pages.get(url) or self.pages.get(url.rstrip('/')) or self.default)
+
+
+class LoggedErrors(logging.Handler):
+    """Collects the crawler's logged exceptions that point at a bug rather than at the page"""
+
+    BUG = re.compile(r"name '\w+' is not defined|referenced before assignment|object has no attribute|"
+                     r"object is not (subscriptable|callable|iterable)|unsupported operand|"
+                     r"missing \d+ required|takes \d+ positional")
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.errors = []
+
+    def emit(self, record):
+        message = record.getMessage()
+        if self.BUG.search(message):
+            self.errors.append(message)
+
+
+def crawl_sites(args):
+    """(name, start url, pages, default page) for the crawler check"""
+    if args.fixtures:
+        sites = []
+        for path in sorted(Path(args.fixtures).glob('*.json')):
+            fixture = json.loads(path.read_text(encoding='utf-8'))
+            sites.append((path.stem, fixture['start_url'], fixture['pages'], None))
+        return sites
+    if args.html:
+        return [(path.stem, f"https://{path.stem.lower().replace('_', '-')}.invalid", {},
+                 path.read_text(encoding='utf-8', errors='replace'))
+                for path in sorted(Path(args.html).glob('*.html'))]
+    return [(name, f"https://{name.replace('.', '-')}.invalid", {}, f"<html><body><main>{body}</main></body></html>")
+            for name, body in LAYOUT_SITES.items()]
+
+
+def check_crawler(sites):
+    """Run crawl_html_news_pages over replayed sites; True if any site logged a bug or found no dated release"""
+    handler = LoggedErrors()
+    crawler_logger = logging.getLogger(website_crawler.__name__)
+    previous_level = crawler_logger.level
+    crawler_logger.addHandler(handler)
+    crawler_logger.setLevel(logging.DEBUG)
+    crawl_session = website_crawler.crawl_session
+    synthetic = all(not pages for _, _, pages, _ in sites)
+
+    print(f"\n  crawl_html_news_pages over {len(sites)} replayed sites:")
+    failed = False
+    try:
+        for name, start_url, pages, default in sites:
+            @asynccontextmanager
+            async def replay_session(pages=pages, default=default):
+                yield ReplayCrawler(pages, default)
+
+            website_crawler.crawl_session = replay_session
+            handler.errors = []
+            news, _ = asyncio.run(website_crawler.crawl_html_news_pages(start_url, months=24))
+            dated = sum(1 for item in news if item.get('date'))
+            problem = bool(handler.errors) or (synthetic and not dated)
+            failed = failed or problem
+            print(f"  {'[FAIL]' if problem else '[OK]  '} {name:<24} releases={len(news):<4} dated={dated}")
+            for message in handler.errors[:3]:
+                print(f"         {message[:100]}")
+    finally:
+        website_crawler.crawl_session = crawl_session
+        crawler_logger.removeHandler(handler)
+        crawler_logger.setLevel(previous_level)
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures', help='Directory of recorded site JSON files')
+    parser.add_argument('--html', help='Directory of saved listing page .html files')
+    parser.add_argument('--pages', type=int, default=200, help='Generated listing pages when no corpus is given')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--skip-crawl', action='store_true', help='Skip the crawl_html_news_pages check')
+    args = parser.parse_args()
+
+    anchors, elements = [], []
+    for html in load_pages(args):
+        page_anchors, page_elements = page_texts(html)
+        anchors.extend(page_anchors)
+        elements.extend(page_elements)
+    corpus = {'anchors': anchors, 'elements': elements}
+
+    print("=" * 80)
+    print(f"  DATE EXTRACTION BENCHMARK ({len(anchors)} anchor texts, {len(elements)} element texts)")
+    print("=" * 80)
+
+    failed = False
+    print(f"\n{'parser':<32}{'dates':>8}{'diffs':>7}{'legacy/s':>13}{'compiled/s':>13}{'speedup':>9}")
+    for name, legacy, compiled, extractor, source in PARSERS:
+        texts = corpus[source]
+        legacy_safe = safe(legacy)
+        legacy_results = [legacy_safe(text) for text in texts]
+        compiled_results = [compiled(text) for text in texts]
+        legacy_errors = sum(1 for result in legacy_results if result is UnboundLocalError)
+        differences = [(text, old, new) for text, old, new in zip(texts, legacy_results, compiled_results)
+                       if old != new and old is not UnboundLocalError]
+        dates = sum(1 for result in compiled_results if (result[0] if isinstance(result, tuple) else result))
+        for text, old, new in differences[:5]:
+            print(f"  [DIFF] {text[:60]!r}: legacy {old} compiled {new}")
+        failed = failed or bool(differences)
+
+        legacy_rate = time_strings_per_second(legacy_safe, texts, args.runs)
+        cold_rate = time_strings_per_second(compiled, texts, args.runs, reset=extractor.reset_stats)
+        print(f"{name:<32}{dates:>8}{len(differences):>7}{legacy_rate:>13,.0f}{cold_rate:>13,.0f}"
+              f"{cold_rate / legacy_rate:>8.1f}x")
+        if legacy_errors:
+            print(f"  ({legacy_errors} strings raised UnboundLocalError in the previous version)")
+
+    print("\n  Compiled timings start each run with an empty memo; memo hits come from repeated")
+    print("  navigation and footer text within the corpus.\n")
+    for extractor in EXTRACTORS:
+        stats = extractor.stats()
+        print(f"  {extractor.name:<13} calls={stats['calls']:<8} no-digit={stats['rejected_without_digit']:<8} "
+              f"memo hits={stats['memo_hits']}")
+        print(f"  {'':<13} order: {' > '.join(' | '.join(tier) for tier in stats['rule_order'])}")
+
+    if not args.skip_crawl:
+        failed = check_crawler(crawl_sites(args)) or failed
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
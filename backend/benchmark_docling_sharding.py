@@ -0,0 +1,143 @@
+"""
+Benchmark Page-Parallel Docling Conversion vs Single-Process Conversion
+Converts one PDF with the shared converter service (mcp_servers/docling_service.py)
+in its current single-process mode and in page-window sharded mode, and
+reports wall time, throughput and peak memory of the whole process tree
+(the sharded mode loads the models in every shard worker process).
+
+Each mode runs in its own process so memory is measured independently.
+Model loading is timed separately from conversion.
+
+Usage:
+    python benchmark_docling_sharding.py --file report.pdf
+    python benchmark_docling_sharding.py --file report.pdf --window 25 --workers 4
+    python benchmark_docling_sharding.py --file report.pdf --modes sharded
+"""
+
+import argparse
+import multiprocessing
+import os
+import threading
+import time
+from pathlib import Path
+
+MODES = ('single', 'sharded')
+
+
+def tree_rss_mb(pid: int) -> float:
+    """Current RSS of pid and all its descendants in MB (Linux /proc)"""
+    page_mb = os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    total = 0.0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f'/proc/{current}/statm') as f:
+                total += int(f.read().split()[1]) * page_mb
+            with open(f'/proc/{current}/task/{current}/children') as f:
+                stack.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return total
+
+
+class PeakSampler(threading.Thread):
+    """Polls the process tree's RSS and keeps the maximum"""
+
+    def __init__(self, interval: float = 0.2):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        pid = os.getpid()
+        while not self._stop_event.is_set():
+            self.peak_mb = max(self.peak_mb, tree_rss_mb(pid))
+            self._stop_event.wait(self.interval)
+
+    def stop(self) -> float:
+        self._stop_event.set()
+        self.join()
+        return max(self.peak_mb, tree_rss_mb(os.getpid()))
+
+
+def run_mode(mode, path, window, workers, queue):
+    from mcp_servers.docling_service import LocalDoclingService, count_pdf_pages
+
+    page_count = count_pdf_pages(Path(path))
+    sampler = PeakSampler()
+    sampler.start()
+
+    if mode == 'single':
+        service = LocalDoclingService()
+        start = time.perf_counter()
+        service.warm_up()
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        data = service.convert(Path(path))
+        elapsed = time.perf_counter() - start
+    else:
+        service = LocalDoclingService(shard_min_pages=1, shard_pages=window, shard_workers=workers)
+        # Start the shard workers and load the models in each of them
+        start = time.perf_counter()
+        service.warm_up_shard_workers()
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        data = service.convert_sharded(Path(path), page_count)
+        elapsed = time.perf_counter() - start
+
+    queue.put({
+        'mode': mode,
+        'processes': 1 if mode == 'single' else service.shard_workers,
+        'pages': data['page_count'],
+        'tables': len(data['tables']),
+        'load_seconds': load_seconds,
+        'seconds': elapsed,
+        'pages_per_sec': data['page_count'] / elapsed if elapsed else 0.0,
+        'peak_tree_rss_mb': sampler.stop(),
+        'text_chars': len(data['text']),
+    })
+    if mode == 'sharded':
+        service.shutdown_shard_workers()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--file', required=True, help='PDF to convert')
+    parser.add_argument('--window', type=int, default=25, help='Pages per window in sharded mode')
+    parser.add_argument('--workers', type=int, default=0, help='Shard worker processes in sharded mode (0 = available CPUs)')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context('spawn')
+    print("=" * 80)
+    print(f"  DOCLING SHARDING BENCHMARK ({Path(args.file).name}, window={args.window})")
+    print("=" * 80)
+    print(f"{'mode':<10}{'procs':>6}{'pages':>7}{'tables':>8}{'load s':>9}{'convert s':>11}"
+          f"{'pages/s':>9}{'peak RSS':>11}")
+
+    results = {}
+    for mode in args.modes:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=run_mode, args=(mode, args.file, args.window, args.workers, queue))
+        proc.start()
+        result = queue.get()
+        proc.join()
+        results[mode] = result
+        print(f"{result['mode']:<10}{result['processes']:>6}{result['pages']:>7}{result['tables']:>8}"
+              f"{result['load_seconds']:>9.1f}{result['seconds']:>11.1f}{result['pages_per_sec']:>9.2f}"
+              f"{result['peak_tree_rss_mb']:>9.0f}MB")
+
+    if len(results) == 2:
+        single, sharded = results['single'], results['sharded']
+        print(f"\nSpeed-up: {single['seconds'] / sharded['seconds']:.2f}x wall time, "
+              f"{sharded['peak_tree_rss_mb'] / single['peak_tree_rss_mb']:.2f}x peak memory")
+        print(f"Extracted text: {single['text_chars']:,} vs {sharded['text_chars']:,} characters "
+              f"(sharded adds a [Page N] marker per page)")
+
+
+if __name__ == '__main__':
+    main()
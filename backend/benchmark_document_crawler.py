@@ -0,0 +1,234 @@
+"""
+Benchmark Document Discovery: Priority Frontier vs Recursive Crawl
+Replays recorded company websites through MiningDocumentCrawler with a fixed
+per-page latency and compares the concurrent priority frontier
+(_crawl_frontier) against the previous depth-first recursive crawl, which
+awaited every link in turn. Reports pages fetched, unique PDFs found and
+PDFs found per second under the same page budget.
+
+Fixture sites are JSON files mapping URL -> HTML. Without --fixtures, a set
+of synthetic sites is generated whose project section links to many detail
+pages before the investor/technical report pages are reached (the layout that
+used to spend the page budget in one branch).
+
+Usage:
+    python benchmark_document_crawler.py
+    python benchmark_document_crawler.py --latency 0.5 --max-pages 30 --workers 6
+    python benchmark_document_crawler.py --fixtures fixtures/sites/
+    python benchmark_document_crawler.py --record https://example-mining.com --fixtures fixtures/sites/
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from bs4 import BeautifulSoup
+from crawl4ai import CrawlerRunConfig
+
+from mcp_servers.crawl_engine import crawl_session
+from mcp_servers.website_crawler import MiningDocumentCrawler
+
+DEFAULT_KEYWORDS = [
+    'ni 43-101', 'ni43-101', 'ni43101',
+    'technical report', 'resource estimate',
+    'pea', 'prefeasibility', 'feasibility',
+    'mineral resource', 'mineral reserve'
+]
+
+
+class ReplayResult:
+    def __init__(self, html):
+        self.html = html or ''
+        self.success = html is not None
+
+
+class ReplayCrawler:
+    """Serves recorded pages with a fixed latency, like a browser fetch"""
+
+    def __init__(self, pages, latency):
+        self.pages = pages
+        self.latency = latency
+        self.fetches = 0
+
+    async def arun(self, url, config=None, **kwargs):
+        self.fetches += 1
+        await asyncio.sleep(self.latency)
+        return ReplayResult(self.pages.get(url) or self.pages.get(url.rstrip('/')))
+
+
+class RecordingCrawler:
+    """Passes fetches to a real crawler and keeps the HTML of each successful page"""
+
+    def __init__(self, crawler):
+        self.crawler = crawler
+        self.pages = {}
+
+    async def arun(self, url, config=None, **kwargs):
+        result = await self.crawler.arun(url=url, config=config, **kwargs)
+        if result.success:
+            self.pages[url] = result.html
+        return result
+
+
+def build_site(seed):
+    """Synthetic mining company site: a project listing wider than the page budget, section links in the footer"""
+    rng = random.Random(seed)
+    base = f"https://company{seed}.example.com"
+    pages = {}
+    nav = ['/about/', '/projects/', '/news/', '/investors/', '/investors/presentations/',
+           '/investors/reports/', '/technical-reports/', '/contact/']
+
+    def page(links, pdfs=()):
+        body = ''.join(f'<a href="{href}">{text}</a>' for href, text in links)
+        body += ''.join(f'<div class="row"><a href="{href}">{text}</a></div>' for href, text in pdfs)
+        menu = ''.join(f'<a href="{href}">{href.strip("/").title()}</a>' for href in nav)
+        return f"<html><body>{body}<footer>{menu}</footer></body></html>"
+
+    projects = [f"/projects/property-{i}/" for i in range(rng.randint(45, 80))]
+    pages[base] = page([])
+    pages[f"{base}/about/"] = page([])
+    pages[f"{base}/projects/"] = page([(p, f"Property {i}") for i, p in enumerate(projects)])
+    for i, project in enumerate(projects):
+        gallery = [(f"{project}gallery-{j}/", "Photos") for j in range(3)]
+        pages[f"{base}{project}"] = page(gallery, [(f"{project}map-{i}.pdf", "Property map")] if i % 10 == 0 else [])
+        for href, _ in gallery:
+            pages[f"{base}{href}"] = page([])
+
+    def pdf_list(prefix, count, title):
+        return [(f"{prefix}{title.lower().replace(' ', '-')}-{n}.pdf", f"{title} {n} announces results")
+                for n in range(count)]
+
+    pages[f"{base}/news/"] = page([], pdf_list('/news/nr-', rng.randint(10, 20), 'News Release'))
+    pages[f"{base}/investors/"] = page([('/investors/presentations/', 'Presentations'),
+                                        ('/investors/reports/', 'Financial Reports')])
+    pages[f"{base}/investors/presentations/"] = page([], pdf_list('/investors/', rng.randint(3, 8),
+                                                                  'Corporate Presentation'))
+    pages[f"{base}/investors/reports/"] = page([], pdf_list('/investors/reports/', rng.randint(6, 12),
+                                                            'Quarterly Report'))
+    pages[f"{base}/technical-reports/"] = page([], pdf_list('/technical-reports/', rng.randint(2, 5),
+                                                            'NI 43-101 Technical Report'))
+    pages[f"{base}/contact/"] = page([])
+    return base, pages
+
+
+def load_fixtures(directory):
+    sites = []
+    for path in sorted(Path(directory).glob('*.json')):
+        fixture = json.loads(path.read_text(encoding='utf-8'))
+        sites.append((fixture['start_url'], fixture['pages']))
+    return sites
+
+
+async def record_site(start_url, directory, max_pages, max_depth):
+    """Crawl a live site with the frontier crawler and save every page it fetched"""
+    crawler = MiningDocumentCrawler()
+    async with crawl_session() as session:
+        recorder = RecordingCrawler(session)
+        await crawler._crawl_frontier(recorder, start_url, max_depth, max_pages, 600, 4,
+                                      DEFAULT_KEYWORDS, CrawlerRunConfig(cache_mode="bypass"))
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    path = Path(directory) / f"{urlparse(start_url).netloc}.json"
+    path.write_text(json.dumps({'start_url': start_url, 'pages': recorder.pages}), encoding='utf-8')
+    print(f"Recorded {len(recorder.pages)} pages to {path}")
+
+
+async def legacy_crawl_recursive(crawler, session, url, max_depth, current_depth, max_pages, keywords, config):
+    """The previous depth-first crawl: every relevant link awaited in turn"""
+    if current_depth > max_depth or len(crawler.discovered_urls) >= max_pages:
+        return
+    if url in crawler.discovered_urls:
+        return
+    crawler.discovered_urls.add(url)
+
+    result = await session.arun(url=url, config=config)
+    if not result.success:
+        return
+    soup = BeautifulSoup(result.html, 'html.parser')
+    if any(keyword in url.lower() for keyword in ['/news/', '/press-release', '/media']):
+        crawler._extract_news_titles(soup, url)
+
+    for link in soup.find_all('a', href=True):
+        href = link['href']
+        full_url = urljoin(url, href)
+        if '.pdf' in href.lower() or '.pdf' in full_url.lower().split('?')[0]:
+            crawler.pdf_urls.append({'url': full_url, 'link_text': link.get_text(strip=True), 'source_page': url})
+        elif current_depth < max_depth:
+            if crawler._is_internal_link(url, full_url):
+                if crawler._is_relevant_page(full_url, link.get_text(strip=True), keywords):
+                    await legacy_crawl_recursive(crawler, session, full_url, max_depth, current_depth + 1,
+                                                 max_pages, keywords, config)
+
+
+async def run_site(start_url, pages, args, frontier):
+    crawler = MiningDocumentCrawler()
+    session = ReplayCrawler(pages, args.latency)
+    started = time.perf_counter()
+    if frontier:
+        await crawler._crawl_frontier(session, start_url, args.max_depth, args.max_pages, args.max_seconds,
+                                      args.workers, DEFAULT_KEYWORDS, None)
+    else:
+        await legacy_crawl_recursive(crawler, session, start_url, args.max_depth, 0, args.max_pages,
+                                     DEFAULT_KEYWORDS, None)
+    seconds = time.perf_counter() - started
+    documents = crawler._process_discovered_pdfs(DEFAULT_KEYWORDS)
+    return session.fetches, len(documents), seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures', help='Directory of recorded site JSON files')
+    parser.add_argument('--record', help='Record this live site into --fixtures instead of benchmarking')
+    parser.add_argument('--sites', type=int, default=5, help='Synthetic sites when no fixtures are given')
+    parser.add_argument('--latency', type=float, default=0.2, help='Seconds per page fetch during replay')
+    parser.add_argument('--max-pages', type=int, default=50)
+    parser.add_argument('--max-depth', type=int, default=2)
+    parser.add_argument('--max-seconds', type=float, default=300)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    if args.record:
+        if not args.fixtures:
+            parser.error('--record needs --fixtures')
+        asyncio.run(record_site(args.record, args.fixtures, args.max_pages, args.max_depth))
+        return
+
+    sites = load_fixtures(args.fixtures) if args.fixtures else [build_site(seed) for seed in range(args.sites)]
+
+    print("=" * 80)
+    print(f"  DOCUMENT CRAWLER BENCHMARK ({len(sites)} sites, {args.latency}s/page, "
+          f"max_pages={args.max_pages}, depth={args.max_depth}, {args.workers} workers)")
+    print("=" * 80)
+    print(f"\n{'site':<34}{'mode':<10}{'pages':>7}{'pdfs':>7}{'seconds':>10}{'pdfs/s':>9}")
+
+    totals = {False: [0, 0, 0.0], True: [0, 0, 0.0]}
+    for start_url, pages in sites:
+        for frontier in (False, True):
+            fetched, pdfs, seconds = asyncio.run(run_site(start_url, pages, args, frontier))
+            mode = 'frontier' if frontier else 'recursive'
+            print(f"{urlparse(start_url).netloc[:33]:<34}{mode:<10}{fetched:>7}{pdfs:>7}{seconds:>10.2f}"
+                  f"{pdfs / seconds:>9.1f}")
+            for i, value in enumerate((fetched, pdfs, seconds)):
+                totals[frontier][i] += value
+
+    print()
+    for frontier in (False, True):
+        fetched, pdfs, seconds = totals[frontier]
+        print(f"  {'frontier' if frontier else 'recursive':<10} {fetched:>5} pages, {pdfs:>5} PDFs, "
+              f"{seconds:7.2f}s, {pdfs / seconds:6.1f} PDFs/s")
+    legacy_rate = totals[False][1] / totals[False][2]
+    frontier_rate = totals[True][1] / totals[True][2]
+    print(f"\n  PDFs found per second: {frontier_rate / legacy_rate:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+"""
+Benchmark HTML Parsing: lxml vs html.parser, Shared Page Trees
+Parses saved pages with BeautifulSoup's pure-Python 'html.parser' (the
+previous parser for every crawled page) and with lxml (the HTML_PARSER
+default), and reports per-page parse time and memory (tracemalloc peak
+during the parse and the size of the finished tree). Then replays a crawl in
+which the same pages are requested by several strategies and compares
+parsing each request against page_soup() sharing one tree per page.
+
+Parity: the anchors (href, text), PDF links and date-element texts found with
+each parser are compared per page, since lxml repairs malformed markup
+differently. Pages whose extraction differs are listed.
+
+Pages come from crawl fixtures (the JSON files recorded by
+benchmark_document_crawler.py --record, {start_url, pages}) or a directory
+of saved .html files. Without either, synthetic listing pages with heavy
+navigation, inline scripts and some unclosed tags are generated.
+
+Usage:
+    python benchmark_html_parsing.py
+    python benchmark_html_parsing.py --pages 40 --runs 5 --requests-per-page 3
+    python benchmark_html_parsing.py --fixtures fixtures/sites/
+    python benchmark_html_parsing.py --html saved_pages/
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from bs4 import BeautifulSoup
+
+from mcp_servers import html_parsing
+from mcp_servers.html_parsing import LXML_AVAILABLE, clear_page_trees, css, page_soup
+
+DATE_SELECTOR = 'time, .date, span.date, .news-date, .post-date, p.date'
+
+
+def build_page(seed):
+    """A news listing page: scripts and styles, a mega menu, dated rows, a footer; some tags left unclosed"""
+    rng = random.Random(seed)
+    scripts = ''.join(f"<script>var cfg{i} = {json.dumps({'k': 'x' * rng.randint(200, 2000)})};</script>"
+                      for i in range(rng.randint(5, 15)))
+    styles = '<style>' + ''.join(f'.c{i}{{margin:{i}px;color:#{i:06x}}}' for i in range(rng.randint(200, 800))) + '</style>'
+    menu = ''.join(
+        f'<li class="menu-item"><a href="/section-{i}/">Section {i}</a><ul class="sub-menu">'
+        + ''.join(f'<li><a href="/section-{i}/page-{j}/">Page {j}</a></li>' for j in range(rng.randint(4, 12)))
+        + '</ul></li>'
+        for i in range(rng.randint(6, 12))
+    )
+    rows = []
+    for n in range(rng.randint(20, 60)):
+        date = f"{rng.choice(['January', 'March', 'June', 'October'])} {rng.randint(1, 28)}, {rng.randint(2019, 2026)}"
+        title = f"Company Announces Result {n} from the {rng.choice(['Eagle', 'Raven', 'Discovery'])} Project"
+        summary = ' '.join(rng.choice(['drilling', 'gold', 'program', 'assays', 'metres', 'zone', 'the', 'of'])
+                           for _ in range(rng.randint(20, 60)))
+        if n % 7 == 0:
+            # Unclosed <p> and <li>, as on hand-edited CMS templates
+            rows.append(f'<li class="news-item"><span class="date">{date}</span><a href="/news/{n}/">{title}</a>'
+                        f'<p>{summary}<div class="links"><a href="/news/{n}.pdf">PDF</a></div>')
+        else:
+            rows.append(f'<div class="news-item"><time datetime="2025-01-01">{date}</time>'
+                        f'<h3><a href="/news/{n}/">{title}</a></h3><p>{summary}</p>'
+                        f'<a class="pdf" href="/news/{n}.pdf">Download PDF</a></div>')
+    footer = ''.join(f'<a href="/legal/{i}/">Legal {i}</a>' for i in range(30))
+    return (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>News</title>{styles}{scripts}</head>'
+            f'<body><header><nav><ul class="menu">{menu}</ul></nav></header>'
+            f'<main><ul class="news-list">{"".join(rows)}</ul></main><footer>{footer}</footer></body></html>')
+
+
+def load_pages(args):
+    if args.fixtures:
+        pages = []
+        for path in sorted(Path(args.fixtures).glob('*.json')):
+            fixture = json.loads(path.read_text(encoding='utf-8'))
+            pages.extend(fixture['pages'].items())
+        return pages
+    if args.html:
+        return [(path.name, path.read_text(encoding='utf-8', errors='replace'))
+                for path in sorted(Path(args.html).glob('*.html'))]
+    return [(f'synthetic-{seed}', build_page(seed)) for seed in range(args.pages)]
+
+
+def measure_parse(html, parser, runs):
+    """(median seconds, tracemalloc peak bytes, retained tree bytes) for one parse"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        BeautifulSoup(html, parser)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    soup = BeautifulSoup(html, parser)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del soup
+    return statistics.median(timings), peak - before, retained - before
+
+
+def extraction(soup):
+    """What the listing-page extractors read from a tree"""
+    anchors = [(a.get('href'), a.get_text(strip=True)) for a in css('a[href]').select(soup)]
+    pdfs = sorted({href for href, _ in anchors if '.pdf' in href.lower()})
+    dates = [element.get_text(strip=True) for element in css(DATE_SELECTOR).select(soup)]
+    return anchors, pdfs, dates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures', help='Directory of recorded site JSON files')
+    parser.add_argument('--html', help='Directory of saved .html pages')
+    parser.add_argument('--pages', type=int, default=30, help='Synthetic pages when no corpus is given')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--requests-per-page', type=int, default=3,
+                        help='Strategies requesting each page in the crawl replay')
+    args = parser.parse_args()
+
+    if not LXML_AVAILABLE:
+        parser.error('lxml is not installed (pip install -r requirements.txt)')
+
+    pages = load_pages(args)
+    total_kb = sum(len(html) for _, html in pages) / 1024
+    print("=" * 80)
+    print(f"  HTML PARSING BENCHMARK ({len(pages)} pages, {total_kb:,.0f} KB)")
+    print("=" * 80)
+
+    results = {'html.parser': [], 'lxml': []}
+    mismatched = []
+    for name, html in pages:
+        for parser_name in results:
+            results[parser_name].append(measure_parse(html, parser_name, args.runs))
+        old, new = extraction(BeautifulSoup(html, 'html.parser')), extraction(BeautifulSoup(html, 'lxml'))
+        if old != new:
+            mismatched.append((name, [label for label, a, b in zip(('anchors', 'pdfs', 'dates'), old, new)
+                                      if a != b]))
+
+    print(f"\n{'parser':<14}{'ms/page':>10}{'peak KB/page':>15}{'tree KB/page':>15}")
+    for parser_name, rows in results.items():
+        seconds = statistics.mean(row[0] for row in rows)
+        peak = statistics.mean(row[1] for row in rows) / 1024
+        retained = statistics.mean(row[2] for row in rows) / 1024
+        print(f"{parser_name:<14}{seconds * 1000:>10.1f}{peak:>15,.0f}{retained:>15,.0f}")
+    speedup = sum(row[0] for row in results['html.parser']) / sum(row[0] for row in results['lxml'])
+    print(f"\n  lxml parse speedup: {speedup:.1f}x")
+
+    print(f"  Extraction parity: {len(pages) - len(mismatched)}/{len(pages)} pages identical")
+    for name, fields in mismatched[:10]:
+        print(f"    [DIFF] {name[:60]}: {', '.join(fields)}")
+
+    # Crawl replay: every page requested by several strategies
+    requests = [html for _, html in pages for _ in range(args.requests_per_page)]
+    started = time.perf_counter()
+    for html in requests:
+        BeautifulSoup(html, 'html.parser')
+    per_request = time.perf_counter() - started
+
+    clear_page_trees()
+    html_parsing.stats.update(parsed=0, shared=0, parse_seconds=0.0)
+    started = time.perf_counter()
+    for _, html in pages:
+        for _ in range(args.requests_per_page):
+            page_soup(html)
+    shared = time.perf_counter() - started
+    print(f"\n  Crawl replay ({len(requests)} page requests, {len(pages)} distinct pages):")
+    print(f"    html.parser, parse per request: {per_request:7.2f}s")
+    print(f"    page_soup (lxml, shared tree):  {shared:7.2f}s   "
+          f"({html_parsing.stats['parsed']} parses, {html_parsing.stats['shared']} shared)   "
+          f"{per_request / shared:.1f}x")
+    clear_page_trees()
+
+
+if __name__ == '__main__':
+    main()
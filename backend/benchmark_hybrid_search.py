@@ -0,0 +1,149 @@
+"""
+Benchmark Hybrid (Full-Text + Vector) Search vs Vector-Only Search
+Loads a small fixture report into a temporary company, runs exact-term and
+conceptual queries through RAGManager.search_all with and without the
+PostgreSQL full-text index, and reports hit@k, MRR and latency.
+
+The fixture company, document, chunks and vectors are removed afterwards.
+
+Usage:
+    python benchmark_hybrid_search.py
+    python benchmark_hybrid_search.py --k 3 --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import time
+from datetime import date
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from django.test.utils import override_settings
+
+from core.models import Company, Document
+from mcp_servers.rag_utils import RAGManager
+
+FIXTURE_COMPANY = "Benchmark Fixture Gold Corp"
+
+# Markdown sections shaped like a Docling NI 43-101 export
+FIXTURE_SECTIONS = [
+    ("10 Drilling",
+     "The 2023 program comprised 42 diamond drill holes totalling 12,480 m. Hole DDH-23-014 "
+     "intersected 7.85 g/t Au over 14.2 m from 212 m downhole, including 21.4 g/t Au over 3.1 m. "
+     "Hole DDH-23-027 returned 2.10 g/t Au over 38.0 m in the footwall shear."),
+    ("11 Sample Preparation, Analyses and Security",
+     "Core was sawn in half and bagged on site. Samples were shipped to an accredited laboratory for "
+     "fire assay with atomic absorption finish. Certified reference materials and blanks were inserted "
+     "every 20 samples."),
+    ("13 Mineral Processing and Metallurgical Testing",
+     "Bottle roll tests on composite samples achieved gold recoveries between 91% and 94% after 48 hours "
+     "of leaching at a P80 of 75 microns. Gravity recoverable gold averaged 38%."),
+    ("14 Mineral Resource Estimates",
+     "The Indicated Mineral Resource is 8.4 Mt grading 1.62 g/t Au for 437,000 oz contained gold, "
+     "with an additional Inferred Mineral Resource of 5.1 Mt at 1.31 g/t Au for 215,000 oz, "
+     "reported at a 0.45 g/t Au cut-off grade."),
+    ("22 Economic Analysis",
+     "At a gold price of US$1,850/oz the project has an after-tax NPV at 5% discount of US$312 million "
+     "and an after-tax IRR of 28.4%, with a payback period of 2.6 years. Initial capital is US$245 million."),
+    ("16 Mining Methods",
+     "The deposit will be mined by conventional open pit methods using 144 t haul trucks, with a "
+     "life-of-mine strip ratio of 4.2:1 and a mine life of 11 years."),
+]
+
+# (query, substring the correct chunk must contain, kind)
+QUERIES = [
+    ("DDH-23-014", "DDH-23-014", "exact"),
+    ("NPV at 5% discount", "NPV at 5% discount", "exact"),
+    ("DDH-23-027 footwall", "DDH-23-027", "exact"),
+    ("0.45 g/t cut-off", "0.45 g/t Au cut-off", "exact"),
+    ("P80 of 75 microns", "P80 of 75 microns", "exact"),
+    ("How much gold is in the indicated resource?", "Indicated Mineral Resource", "conceptual"),
+    ("What are the metallurgical recoveries?", "gold recoveries", "conceptual"),
+    ("How long will the mine operate?", "mine life", "conceptual"),
+    ("How were assays quality controlled?", "Certified reference materials", "conceptual"),
+    ("What is the project's payback?", "payback period", "conceptual"),
+]
+
+
+def print_header(text):
+    """Print a nice header"""
+    print("\n" + "="*80)
+    print(f"  {text}")
+    print("="*80)
+
+
+def create_fixture(rag):
+    company = Company.objects.create(name=FIXTURE_COMPANY, status='private')
+    document = Document.objects.create(
+        company=company,
+        title="Benchmark Fixture NI 43-101 Technical Report",
+        document_type='ni43101',
+        document_date=date(2024, 1, 15),
+        file_url='https://example.com/fixture.pdf',
+    )
+    text = "\n\n".join(f"## {title}\n\n{body}" for title, body in FIXTURE_SECTIONS)
+    # Chunking starts a new chunk at each heading, so every section is one chunk
+    chunks = rag.store_document_chunks(document, text)
+    return company, document, chunks
+
+
+def run_queries(rag, hybrid, k, repeat):
+    hits, reciprocal_ranks, latencies = [], [], []
+    per_kind = {}
+    with override_settings(RAG_HYBRID_SEARCH=hybrid):
+        for query, expected, kind in QUERIES:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                results = rag.search_all(query, n_results=k, filter_company=FIXTURE_COMPANY, include_news=False)
+                latencies.append(time.perf_counter() - start)
+
+            ranked = results['combined'][:k]
+            rank = next((i for i, r in enumerate(ranked, 1) if expected in r['text']), None)
+            hits.append(rank is not None)
+            reciprocal_ranks.append(1 / rank if rank else 0.0)
+            per_kind.setdefault(kind, []).append(rank is not None)
+
+    return {
+        'hit_rate': sum(hits) / len(hits),
+        'mrr': statistics.mean(reciprocal_ranks),
+        'per_kind': {kind: sum(v) / len(v) for kind, v in per_kind.items()},
+        'latency_ms': statistics.median(latencies) * 1000,
+        'latency_p95_ms': sorted(latencies)[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--k', type=int, default=3, help='Results considered per query')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per query')
+    args = parser.parse_args()
+
+    rag = RAGManager()
+    company, document, chunks = create_fixture(rag)
+    print_header(f"HYBRID SEARCH BENCHMARK ({chunks} fixture chunks, {len(QUERIES)} queries, k={args.k})")
+
+    try:
+        # Warm the query embedding cache so both modes pay the same embedding cost
+        for query, _, _ in QUERIES:
+            rag.search_all(query, n_results=args.k, filter_company=FIXTURE_COMPANY, include_news=False)
+
+        for label, hybrid in (("Vector only", False), ("Hybrid (full-text + vector)", True)):
+            stats = run_queries(rag, hybrid, args.k, args.repeat)
+            print(f"\n{label}")
+            print(f"  hit@{args.k}:      {stats['hit_rate']:.0%}")
+            for kind, rate in stats['per_kind'].items():
+                print(f"    {kind:<11} {rate:.0%}")
+            print(f"  MRR:        {stats['mrr']:.3f}")
+            print(f"  median:     {stats['latency_ms']:.1f} ms")
+            print(f"  p95:        {stats['latency_p95_ms']:.1f} ms")
+    finally:
+        rag._delete_document_vectors(document.id)
+        company.delete()
+
+
+if __name__ == '__main__':
+    main()
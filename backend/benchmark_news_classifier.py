@@ -0,0 +1,324 @@
+"""
+Benchmark Compiled News Classifier vs Per-Pattern Searches
+Checks core.news_classifier against a regression corpus of real-world style
+news titles with known classifications, then compares it with the previous
+_classify_news (one re.search per pattern string, lists rebuilt on every
+call) on a large title set and reports titles classified per second.
+
+Every title must classify identically with both implementations; any
+difference is printed and the script exits with status 1.
+
+Usage:
+    python benchmark_news_classifier.py
+    python benchmark_news_classifier.py --titles 200000 --runs 5
+    python benchmark_news_classifier.py --from-db        # every NewsRelease and CompanyNews title
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from decimal import Decimal, InvalidOperation
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from core.news_classifier import classify_news, classify_news_batch
+
+# (title, expected fields); fields not listed must have their default value
+REGRESSION_CORPUS = [
+    ("Acme Gold Intersects 12.5 m of 8.2 g/t Au at Eagle Zone",
+     {'news_type': 'drill_results', 'is_material': True, 'has_drill_results': True,
+      'best_intercept': '12.5 m of 8.2 g/t'}),
+    ("Drilling Results Extend Mineralization 300 Metres Down Plunge",
+     {'news_type': 'drill_results', 'is_material': True, 'has_drill_results': True}),
+    ("Northern Metals Returns 2.1% Cu over 45 Metres",
+     {'news_type': 'drill_results', 'is_material': True, 'has_drill_results': True}),
+    ("Assay Results Confirm High-Grade Silver Shoot",
+     {'news_type': 'drill_results', 'is_material': True, 'has_drill_results': True}),
+    ("Hole BR-22 Cuts 30 metres of 1.4% Ni",
+     {'news_type': 'drill_results', 'is_material': True, 'has_drill_results': True,
+      'best_intercept': '30 metres of 1.4%'}),
+    ("Trenching Program Returns Samples Grading 14 g/t Gold",
+     {'news_type': 'drill_results', 'is_material': True, 'has_drill_results': True}),
+    ("Company Announces Maiden Mineral Resource Estimate for Red Lake Project",
+     {'news_type': 'resource_estimate', 'is_material': True}),
+    ("Updated NI 43-101 Technical Report Filed on SEDAR+",
+     {'news_type': 'resource_estimate', 'is_material': True}),
+    ("Inferred Resource Grows to 2.3 Million Ounces",
+     {'news_type': 'resource_estimate', 'is_material': True}),
+    ("Resource Update Adds 1.2 Moz at Discovery Zone",
+     {'news_type': 'resource_estimate', 'is_material': True}),
+    ("Acme Announces $5 Million Non-Brokered Private Placement at $0.25 per Unit",
+     {'news_type': 'financing', 'is_material': True, 'financing_type': 'private_placement',
+      'financing_amount': Decimal('5000000'), 'financing_price_per_unit': Decimal('0.25')}),
+    ("Closes Private Placement of Units",
+     {'news_type': 'financing', 'is_material': True, 'financing_type': 'private_placement'}),
+    ("Company Announces C$15 Million Bought Deal Financing",
+     {'news_type': 'financing', 'is_material': True, 'financing_type': 'bought_deal',
+      'financing_amount': Decimal('15000000')}),
+    ("Upsized Underwritten Offering of Common Shares",
+     {'news_type': 'financing', 'is_material': True, 'financing_type': 'bought_deal'}),
+    ("$3.5M Flow-Through Financing to Fund 2025 Drill Program",
+     {'news_type': 'financing', 'is_material': True, 'financing_type': 'flow_through',
+      'financing_amount': Decimal('3500000')}),
+    ("Announces Rights Offering to Existing Shareholders",
+     {'news_type': 'financing', 'is_material': True, 'financing_type': 'rights_offering'}),
+    ("Board Approves Early Warrant Exercise Incentive Program",
+     {'news_type': 'financing', 'is_material': True, 'financing_type': 'warrant_exercise'}),
+    ("Secures US$40 Million Credit Facility for Mine Construction",
+     {'news_type': 'financing', 'is_material': True, 'financing_type': 'debt',
+      'financing_amount': Decimal('40000000')}),
+    ("Issues 1,250,000 Convertible Debentures",
+     {'news_type': 'financing', 'is_material': True, 'financing_type': 'debt'}),
+    # Financing overrides drill results, but the drill fields stay set ("10 m" is read as $10M, as before)
+    ("Private Placement Proceeds to Follow Up 10 m of 5 g/t Intercept",
+     {'news_type': 'financing', 'is_material': True, 'financing_type': 'private_placement',
+      'financing_amount': Decimal('10000000'), 'has_drill_results': True, 'best_intercept': '10 m of 5 g/t'}),
+    # The first financing type in priority order wins, not the leftmost match
+    ("Bought Deal and Concurrent Private Placement",
+     {'news_type': 'financing', 'is_material': True, 'financing_type': 'private_placement'}),
+    ("Flow-Through Bought Deal Closed",
+     {'news_type': 'financing', 'is_material': True, 'financing_type': 'bought_deal'}),
+    ("Completes Acquisition of Adjacent Claims",
+     {'news_type': 'acquisition', 'is_material': True}),
+    ("Signs Option Agreement to Earn-In 70% of Lynx Property",
+     {'news_type': 'acquisition', 'is_material': True}),
+    ("Shareholders Approve Merger with Silverline",
+     {'news_type': 'acquisition', 'is_material': True}),
+    ("Appoints Jane Doe as Chief Financial Officer",
+     {'news_type': 'management'}),
+    ("CEO Transition Plan Announced",
+     {'news_type': 'management'}),
+    ("Exploration Update on Summer Field Program",
+     {'news_type': 'exploration'}),
+    ("Company Commences 10,000 Metre Drill Program",
+     {'news_type': 'exploration'}),
+    ("Geophysical Survey Identifies New Targets",
+     {'news_type': 'exploration'}),
+    ("Reports Record Quarterly Production",
+     {'news_type': 'production', 'is_material': True}),
+    ("First Gold Pour at Blackwater",
+     {'news_type': 'production', 'is_material': True}),
+    ("Receives Environmental Assessment Approval",
+     {'news_type': 'regulatory'}),
+    ("Mining Permit Granted for Phase 2",
+     {'news_type': 'regulatory'}),
+    # Acquisition is checked before management
+    ("Appoints Advisor Following Acquisition",
+     {'news_type': 'acquisition', 'is_material': True}),
+    # 'moz' matches inside words, as before
+    ("Mozambique Graphite Update",
+     {'news_type': 'resource_estimate', 'is_material': True}),
+    ("Annual General Meeting Results",
+     {}),
+    ("Company to Present at Mining Conference",
+     {}),
+    ("",
+     {}),
+]
+
+DEFAULTS = {
+    'news_type': 'general',
+    'is_material': False,
+    'financing_type': 'none',
+    'financing_amount': None,
+    'financing_price_per_unit': None,
+    'has_drill_results': False,
+    'best_intercept': '',
+}
+
+
+def legacy_classify_news(title):
+    """The previous views._classify_news: one re.search per pattern string"""
+    title_lower = title.lower()
+    result = dict(DEFAULTS)
+
+    drill_patterns = [
+        r'drill\s*result', r'drilling\s*result', r'intersect', r'intercept', r'assay\s*result',
+        r'returns?\s+\d+', r'\d+\.?\d*\s*g/t', r'\d+\.?\d*\s*%\s*(cu|zn|pb|ni)',
+        r'metres?\s+of\s+\d+', r'meters?\s+of\s+\d+', r'grading\s+\d+',
+    ]
+    for pattern in drill_patterns:
+        if re.search(pattern, title_lower):
+            result['news_type'] = 'drill_results'
+            result['is_material'] = True
+            result['has_drill_results'] = True
+            intercept_match = re.search(
+                r'(\d+\.?\d*)\s*(m|metres?|meters?)\s*(of|@|at)\s*(\d+\.?\d*)\s*(g/t|%)', title_lower
+            )
+            if intercept_match:
+                result['best_intercept'] = intercept_match.group(0)
+            break
+
+    resource_patterns = [
+        r'resource\s*estimate', r'mineral\s*resource', r'indicated\s*resource', r'inferred\s*resource',
+        r'measured\s*resource', r'resource\s*update', r'ni\s*43-?101', r'43-?101',
+        r'million\s*(oz|ounces)', r'moz', r'resource\s*of\s*\d+',
+    ]
+    if result['news_type'] == 'general':
+        for pattern in resource_patterns:
+            if re.search(pattern, title_lower):
+                result['news_type'] = 'resource_estimate'
+                result['is_material'] = True
+                break
+
+    financing_patterns = {
+        'private_placement': [r'private\s*placement', r'non-?brokered', r'closes?\s*private',
+                              r'announces?\s*private'],
+        'bought_deal': [r'bought\s*deal', r'brokered\s*offering', r'underwritten\s*offering',
+                        r'prospectus\s*offering'],
+        'flow_through': [r'flow-?through', r'flow\s*through\s*shares?', r'fts\s*financing'],
+        'rights_offering': [r'rights\s*offering', r'rights\s*issue'],
+        'warrant_exercise': [r'warrant\s*exercise', r'exercises?\s*warrants?'],
+        'debt': [r'debt\s*financing', r'loan\s*facility', r'credit\s*facility', r'convertible\s*debenture'],
+    }
+    for financing_type, patterns in financing_patterns.items():
+        for pattern in patterns:
+            if re.search(pattern, title_lower):
+                result['news_type'] = 'financing'
+                result['is_material'] = True
+                result['financing_type'] = financing_type
+                amount_match = re.search(r'\$?\s*(\d+(?:,\d{3})*(?:\.\d+)?)\s*(million|m\b)', title_lower)
+                if amount_match:
+                    try:
+                        result['financing_amount'] = Decimal(amount_match.group(1).replace(',', '')) * 1000000
+                    except (ValueError, InvalidOperation, AttributeError):
+                        pass
+                price_match = re.search(r'\$\s*(\d+\.?\d*)\s*per\s*(unit|share)', title_lower)
+                if price_match:
+                    try:
+                        result['financing_price_per_unit'] = Decimal(price_match.group(1))
+                    except (ValueError, InvalidOperation, AttributeError):
+                        pass
+                break
+        if result['financing_type'] != 'none':
+            break
+
+    general_categories = [
+        ('acquisition', True, [r'acqui(re|sition)', r'merger', r'amalgamat', r'take-?over',
+                               r'business\s*combination', r'purchase\s*agreement', r'option\s*agreement',
+                               r'earn-?in']),
+        ('management', False, [r'appoint', r'ceo\s*(change|transition|resign|depart)',
+                               r'new\s*(ceo|cfo|president|director)', r'board\s*(change|appointment)',
+                               r'management\s*change', r'executive\s*change']),
+        ('exploration', False, [r'exploration\s*update', r'exploration\s*program', r'field\s*program',
+                                r'sampling\s*result', r'geophysic', r'survey\s*result', r'commence.*drill',
+                                r'start.*drill']),
+        ('production', True, [r'production\s*update', r'production\s*result', r'quarterly\s*production',
+                              r'annual\s*production', r'gold\s*pour', r'first\s*pour',
+                              r'commercial\s*production']),
+        ('regulatory', False, [r'permit', r'environmental\s*assessment', r'eia\b', r'regulatory\s*approv',
+                               r'license\s*grant', r'licence\s*grant']),
+    ]
+    for news_type, is_material, patterns in general_categories:
+        if result['news_type'] != 'general':
+            break
+        for pattern in patterns:
+            if re.search(pattern, title_lower):
+                result['news_type'] = news_type
+                if is_material:
+                    result['is_material'] = True
+                break
+
+    return result
+
+
+def synthetic_titles(count, seed=7):
+    """Press-release style titles mixing every category with filler headlines"""
+    rng = random.Random(seed)
+    companies = ['Acme Gold', 'Northern Metals', 'Silverline Resources', 'Copperhead Mining', 'Lynx Lithium']
+    templates = [
+        "{c} Intersects {m} m of {g} g/t Au at {z} Zone",
+        "{c} Drilling Results Extend {z} Mineralization",
+        "{c} Returns {g}% Cu over {m} Metres",
+        "{c} Announces Updated Mineral Resource Estimate for {z}",
+        "{c} Files NI 43-101 Technical Report",
+        "{c} Announces ${a} Million Non-Brokered Private Placement at ${p} per Unit",
+        "{c} Closes ${a}M Bought Deal Financing",
+        "{c} Completes Flow-Through Financing",
+        "{c} Secures ${a} Million Credit Facility",
+        "{c} Completes Acquisition of {z} Property",
+        "{c} Appoints New CEO",
+        "{c} Provides Exploration Update on {z}",
+        "{c} Reports Quarterly Production Results",
+        "{c} Receives Drilling Permit for {z}",
+        "{c} to Present at {z} Investor Conference",
+        "{c} Announces Annual General Meeting Results",
+        "{c} Publishes {z} Sustainability Report",
+        "{c} Comments on Recent Market Activity",
+        "{c} Corporate Update and Outlook",
+        "{c} Announces Grant of Stock Options",
+    ]
+    zones = ['Eagle', 'Raven', 'Blackwater', 'Discovery', 'Red Lake', 'Timmins', 'Nevada']
+    return [
+        rng.choice(templates).format(
+            c=rng.choice(companies), z=rng.choice(zones), m=rng.randint(2, 120),
+            g=round(rng.uniform(0.3, 25), 2), a=rng.randint(1, 60), p=round(rng.uniform(0.05, 2), 2),
+        ) + ('' if rng.random() < 0.7 else f" ({rng.randint(1000, 9999)})")
+        for _ in range(count)
+    ]
+
+
+def titles_from_db():
+    from core.models import CompanyNews, NewsRelease
+    return (list(NewsRelease.objects.values_list('title', flat=True))
+            + list(CompanyNews.objects.values_list('title', flat=True)))
+
+
+def time_titles_per_second(function, titles, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        function(titles)
+        timings.append(time.perf_counter() - started)
+    return len(titles) / statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--titles', type=int, default=50000, help='Synthetic titles to classify')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--from-db', action='store_true', help='Classify stored news titles instead')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("  NEWS CLASSIFIER BENCHMARK")
+    print("=" * 80)
+
+    failures = 0
+    for title, expected in REGRESSION_CORPUS:
+        expected = {**DEFAULTS, **expected}
+        for name, result in (('compiled', classify_news(title)), ('legacy', legacy_classify_news(title))):
+            if result != expected:
+                failures += 1
+                print(f"  [FAIL] {name}: {title!r}\n         expected {expected}\n         got      {result}")
+    print(f"\n  Regression corpus: {len(REGRESSION_CORPUS)} titles, {failures} failures")
+
+    titles = titles_from_db() if args.from_db else synthetic_titles(args.titles)
+    legacy = [legacy_classify_news(title) for title in titles]
+    differences = [(title, old, new) for title, old, new in zip(titles, legacy, classify_news_batch(titles))
+                   if old != new]
+    for title, old, new in differences[:10]:
+        print(f"  [DIFF] {title!r}\n         legacy   {old}\n         compiled {new}")
+    print(f"  Legacy comparison: {len(titles)} titles, {len(differences)} differences")
+
+    print(f"\n{'implementation':<34}{'titles/s':>14}")
+    legacy_rate = time_titles_per_second(lambda ts: [legacy_classify_news(t) for t in ts], titles, args.runs)
+    single_rate = time_titles_per_second(lambda ts: [classify_news(t) for t in ts], titles, args.runs)
+    batch_rate = time_titles_per_second(classify_news_batch, titles, args.runs)
+    print(f"{'legacy _classify_news':<34}{legacy_rate:>14,.0f}")
+    print(f"{'classify_news':<34}{single_rate:>14,.0f}   {single_rate / legacy_rate:.1f}x")
+    print(f"{'classify_news_batch':<34}{batch_rate:>14,.0f}   {batch_rate / legacy_rate:.1f}x")
+
+    if failures or differences:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""
+Benchmark Single-Pass NI 43-101 Section Locator vs Per-Pattern Scans
+Compares RLMProcessor.locate_sections (one scan with a combined keyword
+alternation) against the previous implementation (one re.finditer per
+section pattern) on a large synthetic NI 43-101 report, and checks that both
+return the same sections. Also times chunk classification as substring
+checks vs a combined keyword regex (the substring checks are kept: Python's
+C-level substring search is faster than one regex scan here).
+
+Usage:
+    python benchmark_section_locator.py                  # ~5 MB fixture report
+    python benchmark_section_locator.py --repeat 40 --runs 10
+    python benchmark_section_locator.py --file report.md # Docling markdown export
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from mcp_servers.rlm_processor import RLMProcessor
+
+SECTION_HEADINGS = [
+    "1. Summary", "2. Introduction", "3. Reliance on Other Experts", "4. Property Description and Location",
+    "5. Accessibility, Climate, Local Resources, Infrastructure and Physiography", "6. History",
+    "7. Geological Setting and Mineralization", "8. Deposit Types", "9. Exploration", "10. Drilling",
+    "11. Sample Preparation, Analyses and Security", "12. Data Verification",
+    "13. Mineral Processing and Metallurgical Testing", "14. Mineral Resource Estimates",
+    "15. Mineral Reserve Estimates", "16. Mining Methods", "17. Recovery Methods", "18. Project Infrastructure",
+    "19. Market Studies and Contracts", "20. Environmental Studies, Permitting and Social or Community Impact",
+    "21. Capital and Operating Costs", "22. Economic Analysis", "23. Adjacent Properties",
+    "24. Other Relevant Data and Information", "25. Interpretation and Conclusions", "26. Recommendations",
+]
+
+BODY = [
+    "Core was logged, photographed and split on site. Samples were shipped to an accredited laboratory "
+    "for fire assay. Certified reference materials and blanks were inserted every {n} samples.",
+    "The Indicated resource estimate totals {t} Mt at {g} grade g/t Au at a {c} g/t cut-off, "
+    "reported within a pit shell optimised at US$1,850/oz.",
+    "| Category | Tonnage (Mt) | Grade (g/t) | Contained (koz) |\n|---|---|---|---|\n"
+    "| Indicated | {t} | {g} | {oz} |\n| Inferred | {t} | {g} | {oz} |",
+    "Gold mineralization is hosted in quartz-carbonate veins along the sheared contact; the deposit "
+    "remains open at depth below hole DDH-23-{n:03d}.",
+    "The after-tax NPV at 5% is US${npv} million with an IRR of {irr}%; initial capex is US${capex} million.",
+    "Road access is year-round and grid power is available {n} km from site.",
+]
+
+
+def build_report(repeat: int) -> str:
+    """One full 26-section report body, repeated (large reports restate headings in appendices)"""
+    rng = random.Random(7)
+    parts = []
+    for _ in range(repeat):
+        for heading in SECTION_HEADINGS:
+            parts.append(f"## {heading}")
+            for _ in range(8):
+                parts.append(rng.choice(BODY).format(
+                    n=rng.randint(1, 999), t=round(rng.uniform(1, 60), 1), g=round(rng.uniform(0.4, 8), 2),
+                    c=round(rng.uniform(0.2, 1), 2), oz=rng.randint(10_000, 900_000),
+                    npv=rng.randint(50, 900), irr=round(rng.uniform(8, 45), 1), capex=rng.randint(80, 900),
+                ))
+    return "\n\n".join(parts)
+
+
+def legacy_locate_sections(document_text):
+    section_positions = []
+    text_lower = document_text.lower()
+    for pattern, section_name in RLMProcessor.NI43101_SECTIONS:
+        for match in re.finditer(pattern, text_lower, re.IGNORECASE):
+            section_positions.append({"start": match.start(), "name": section_name, "title": match.group(0)})
+    section_positions.sort(key=lambda x: x["start"])
+    return section_positions
+
+
+def legacy_classify(content):
+    content_lower = content.lower()
+    types = []
+    if any(kw in content_lower for kw in ['resource estimate', 'tonnage', 'grade g/t']):
+        types.append("resources")
+    if any(kw in content_lower for kw in ['npv', 'irr', 'capex', 'economic']):
+        types.append("economics")
+    if any(kw in content_lower for kw in ['geology', 'mineralization', 'deposit']):
+        types.append("geology")
+    if any(kw in content_lower for kw in ['drilling', 'assay', 'sample']):
+        types.append("exploration")
+    if any(kw in content_lower for kw in ['recommendation', 'conclusion']):
+        types.append("conclusions")
+    return types if types else ["general"]
+
+
+CLASSIFY_MATCHER = re.compile("|".join(
+    re.escape(kw) for _, keywords in RLMProcessor.CONTENT_TYPE_KEYWORDS for kw in keywords
+))
+CLASSIFY_LOOKUP = {kw: name for name, keywords in RLMProcessor.CONTENT_TYPE_KEYWORDS for kw in keywords}
+
+
+def regex_classify(content):
+    found = {CLASSIFY_LOOKUP[m] for m in CLASSIFY_MATCHER.findall(content.lower())}
+    types = [name for name, _ in RLMProcessor.CONTENT_TYPE_KEYWORDS if name in found]
+    return types if types else ["general"]
+
+
+def time_runs(fn, arg, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn(arg)
+        timings.append(time.perf_counter() - start)
+    return result, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20, help='Copies of the 26-section body in the fixture')
+    parser.add_argument('--runs', type=int, default=5, help='Timed runs per implementation (median reported)')
+    parser.add_argument('--file', help='Markdown file to scan instead of the fixture report')
+    args = parser.parse_args()
+
+    text = open(args.file, encoding='utf-8').read() if args.file else build_report(args.repeat)
+    size_mb = len(text.encode('utf-8')) / (1024 * 1024)
+    print("=" * 80)
+    print(f"  SECTION LOCATOR BENCHMARK ({size_mb:.1f} MB, median of {args.runs} runs)")
+    print("=" * 80)
+
+    legacy, legacy_s = time_runs(legacy_locate_sections, text, args.runs)
+    single, single_s = time_runs(RLMProcessor.locate_sections, text, args.runs)
+    legacy_keys = [(s['start'], s['name']) for s in legacy]
+    single_keys = [(s['start'], s['name']) for s in single]
+    print(f"\nSection headings ({len(single)} found)")
+    print(f"  per-pattern scans: {legacy_s * 1000:8.1f} ms")
+    print(f"  single pass:       {single_s * 1000:8.1f} ms  ({legacy_s / single_s:.1f}x)")
+    if legacy_keys == single_keys:
+        print("  results: identical")
+    else:
+        print(f"  results: {len(set(legacy_keys) ^ set(single_keys))} positions differ "
+              f"(overlapping matches, e.g. two patterns matching at one offset, are now reported once)")
+
+    # Classify ~100k-character windows, as the semantic strategy does per coarse chunk
+    window = 100_000
+    chunks = [text[i:i + window] for i in range(0, len(text), window)]
+    legacy_labels, legacy_s = time_runs(lambda cs: [legacy_classify(c) for c in cs], chunks, args.runs)
+    labels, current_s = time_runs(lambda cs: [RLMProcessor._classify_chunk_content(c) for c in cs], chunks, args.runs)
+    regex_labels, regex_s = time_runs(lambda cs: [regex_classify(c) for c in cs], chunks, args.runs)
+    print(f"\nChunk classification ({len(chunks)} chunks of {window:,} chars)")
+    print(f"  previous substring checks: {legacy_s * 1000:8.1f} ms")
+    print(f"  CONTENT_TYPE_KEYWORDS:     {current_s * 1000:8.1f} ms")
+    print(f"  combined keyword regex:    {regex_s * 1000:8.1f} ms")
+    print(f"  results: {'identical' if labels == legacy_labels == regex_labels else 'differ'}")
+
+
+if __name__ == '__main__':
+    main()
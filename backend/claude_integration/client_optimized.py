@@ -9,6 +9,8 @@ Implements token-efficiency strategies from Anthropic's
 3. In-environment data filtering - Filter results before returning to Claude
 4. Result caching - Cache frequently accessed data
 5. Smart aggregation - Aggregate large results to reduce tokens
+6. Prompt caching - System prompt and tool list are cached across tool-loop
+   iterations and follow-up turns (cache_control)
 
 Expected improvements:
 - 50-90% reduction in tool definition tokens
@@ -22,9 +24,11 @@ from django.core.cache import cache
 from typing import List, Dict, Any, Optional
 import hashlib
 import json
+import time
 
 from mcp_servers.tool_registry import get_registry, ToolCategory, DetailLevel
 from mcp_servers.data_filter import DataFilter, FilterConfig, TokenEstimator
+from mcp_servers.prompt_caching import UsageTotals, system_blocks
 
 
 class OptimizedClaudeClient:
@@ -59,6 +63,9 @@ class OptimizedClaudeClient:
         # Track which tools have been used this session
         self._used_tools = set()
 
+        # Token usage over all chats in this session, including prompt cache reads/writes
+        self._session_usage = UsageTotals()
+
     def _get_server(self, server_type: str):
         """Lazy load server instances"""
         if server_type not in self._servers:
@@ -283,15 +290,14 @@ class OptimizedClaudeClient:
 
         # Track token usage for optimization metrics
         initial_tool_tokens = TokenEstimator.estimate_tokens(tools)
+        usage = UsageTotals()
+
+        # Tools precede the system prompt in the request, so the breakpoint on
+        # the system block caches both for every tool-loop iteration
+        system = system_blocks(system_prompt)
 
         # Initial API call
-        response = self.client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=max_tokens,
-            system=system_prompt,
-            tools=tools,
-            messages=messages
-        )
+        response = self._create_message(usage, max_tokens, system, tools, messages)
 
         all_tool_calls = []
         tools_loaded_dynamically = []
@@ -335,13 +341,7 @@ class OptimizedClaudeClient:
                 {"role": "user", "content": tool_results}
             ])
 
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=max_tokens,
-                system=system_prompt,
-                tools=tools,
-                messages=messages
-            )
+            response = self._create_message(usage, max_tokens, system, tools, messages)
 
         # Extract final response
         final_message = ""
@@ -349,25 +349,50 @@ class OptimizedClaudeClient:
             if hasattr(content_block, "text"):
                 final_message += content_block.text
 
+        # Totals over every call of the tool loop
+        usage_stats = usage.as_dict()
+
         return {
             'message': final_message,
             'tool_calls': all_tool_calls,
             'usage': {
-                'input_tokens': response.usage.input_tokens,
-                'output_tokens': response.usage.output_tokens
+                'input_tokens': usage_stats['input_tokens'],
+                'output_tokens': usage_stats['output_tokens'],
+                'cache_creation_input_tokens': usage_stats['cache_creation_input_tokens'],
+                'cache_read_input_tokens': usage_stats['cache_read_input_tokens'],
+                'api_calls': usage_stats['api_calls']
             },
             'optimization_metrics': {
                 'initial_tool_tokens': initial_tool_tokens,
                 'tools_loaded': len(tools),
                 'tools_loaded_dynamically': tools_loaded_dynamically,
                 'cached_results': sum(1 for tc in all_tool_calls if tc.get('cached')),
-                'total_tool_calls': len(all_tool_calls)
+                'total_tool_calls': len(all_tool_calls),
+                'prompt_cache_hit_rate': usage_stats['cache_hit_rate'],
+                'prompt_cache_input_cost_saving': usage_stats['input_cost_saving'],
+                'api_seconds': usage_stats['api_seconds']
             },
             'conversation_history': messages + [
                 {"role": "assistant", "content": response.content}
             ]
         }
 
+    def _create_message(self, usage: UsageTotals, max_tokens: int, system: List[Dict],
+                        tools: List[Dict], messages: List[Dict]):
+        """Messages API call that records token usage for this chat and the session"""
+        start = time.monotonic()
+        response = self.client.messages.create(
+            model="claude-sonnet-4-20250514",
+            max_tokens=max_tokens,
+            system=system,
+            tools=tools,
+            messages=messages
+        )
+        elapsed = time.monotonic() - start
+        usage.add(response.usage, elapsed)
+        self._session_usage.add(response.usage, elapsed)
+        return response
+
     def _get_optimized_system_prompt(self) -> str:
         """
         Get a shorter, more focused system prompt.
@@ -400,9 +425,27 @@ If data is unavailable, say so clearly."""
             'tools_used': list(self._used_tools),
             'unique_tools': len(self._used_tools),
             'cached_results': len(self._result_cache),
-            'servers_loaded': list(self._servers.keys())
+            'servers_loaded': list(self._servers.keys()),
+            'query_embedding_cache': self._get_query_embedding_stats(),
+            'usage': self._session_usage.as_dict(),
+            'docling': self._get_docling_stats()
         }
 
+    def _get_query_embedding_stats(self) -> Dict:
+        """Process-wide query embedding cache metrics (empty if RAG isn't loaded)"""
+        try:
+            from mcp_servers.embeddings import get_query_embedding_stats
+            return get_query_embedding_stats()
+        except ImportError:
+            return {}
+
+    def _get_docling_stats(self) -> Dict:
+        """Shared Docling converter load time and memory (empty until a document server is loaded)"""
+        server = self._servers.get('document_processor')
+        if server is None:
+            return {}
+        return server.docling_service.memory_stats()
+
     def clear_cache(self):
         """Clear the session result cache."""
         self._result_cache.clear()
@@ -3,6 +3,7 @@ Celery configuration for GoldVenture Platform
 """
 import os
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
@@ -17,3 +18,17 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 
 # Load task modules from all registered Django apps.
 app.autodiscover_tasks()
+
+
+@worker_process_init.connect
+def warm_up_document_converter(**kwargs):
+    """Load the Docling models once per worker process, before the first document job"""
+    from mcp_servers.docling_service import warm_up_docling
+    warm_up_docling()
+
+
+@worker_process_shutdown.connect
+def close_crawl_engine(**kwargs):
+    """Close this worker process's shared browser so it is not left behind"""
+    from mcp_servers.crawl_engine import shutdown_crawl_engine
+    shutdown_crawl_engine()
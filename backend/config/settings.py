@@ -350,6 +350,9 @@ CELERY_WORKER_PREFETCH_MULTIPLIER = 1  # Don't prefetch more than 1 task (preven
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True  # Retry Redis connection on startup
 CELERY_BROKER_CONNECTION_RETRY = True  # Keep retrying broker connection
 CELERY_BROKER_CONNECTION_MAX_RETRIES = 10  # Max retries before giving up
+# Worker processes load the Docling models in worker_process_init (DOCLING_WARMUP);
+# the 4s default would kill them mid-load
+CELERY_WORKER_PROC_ALIVE_TIMEOUT = int(os.getenv('CELERY_WORKER_PROC_ALIVE_TIMEOUT', '120'))
 
 # Celery Beat Schedule - Periodic Tasks
 from celery.schedules import crontab
@@ -424,3 +427,108 @@ CELERY_BEAT_SCHEDULE = {
     },
 }
 
+
+# ============================================================================
+# RAG / CHROMADB SETTINGS
+# ============================================================================
+
+# ChromaDB jobs run in isolated worker processes (see core/chromadb_isolated.py).
+# The pool keeps Django, ChromaDB and the embedder loaded between jobs; disable it
+# to spawn a fresh interpreter per job.
+CHROMA_WORKER_POOL_ENABLED = os.getenv('CHROMA_WORKER_POOL_ENABLED', 'True') == 'True'
+CHROMA_WORKER_POOL_SIZE = int(os.getenv('CHROMA_WORKER_POOL_SIZE', '1'))
+CHROMA_WORKER_MAX_JOBS = int(os.getenv('CHROMA_WORKER_MAX_JOBS', '200'))  # Recycle worker after N jobs
+CHROMA_WORKER_STARTUP_TIMEOUT = int(os.getenv('CHROMA_WORKER_STARTUP_TIMEOUT', '60'))  # Extra seconds for first job
+
+# RLM chunk extraction (see mcp_servers/rlm_processor.py)
+RLM_MAX_CONCURRENCY = int(os.getenv('RLM_MAX_CONCURRENCY', '4'))  # Parallel Claude calls per document (1 = sequential)
+RLM_TOKENS_PER_MINUTE = int(os.getenv('RLM_TOKENS_PER_MINUTE', '400000'))  # Input token budget, 0 = unlimited
+RLM_MAX_RETRIES = int(os.getenv('RLM_MAX_RETRIES', '5'))  # Retries on 429/529 responses
+RLM_EXTRACTION_MODE = os.getenv('RLM_EXTRACTION_MODE', 'tool')  # 'tool' (schema-validated tool use) or 'json' (free-form)
+RLM_MAX_REPAIRS = int(os.getenv('RLM_MAX_REPAIRS', '1'))  # Repair prompts per malformed chunk response
+
+# Anthropic prompt caching of static system prompts / tool lists (see mcp_servers/prompt_caching.py)
+ANTHROPIC_PROMPT_CACHING = os.getenv('ANTHROPIC_PROMPT_CACHING', 'True') == 'True'
+
+# Shared Docling converter (see mcp_servers/docling_service.py)
+# Models load once per process; DOCLING_WARMUP loads them when a Celery worker
+# process starts. Set DOCLING_SERVICE_URL to send conversions to a shared
+# converter started with `python manage.py run_docling_server` instead.
+DOCLING_WARMUP = os.getenv('DOCLING_WARMUP', 'True') == 'True'
+DOCLING_SERVICE_URL = os.getenv('DOCLING_SERVICE_URL', '')  # e.g. http://127.0.0.1:8765
+DOCLING_SERVICE_TIMEOUT = int(os.getenv('DOCLING_SERVICE_TIMEOUT', '1800'))  # Seconds per conversion request
+DOCLING_SERVICE_MAX_MB = int(os.getenv('DOCLING_SERVICE_MAX_MB', '200'))  # Largest PDF the server accepts
+# Page-parallel conversion: PDFs with at least DOCLING_SHARD_MIN_PAGES pages are
+# converted in DOCLING_SHARD_PAGES-page windows across shard worker processes (each
+# worker loads its own models; see benchmark_docling_sharding.py)
+DOCLING_SHARD_MIN_PAGES = int(os.getenv('DOCLING_SHARD_MIN_PAGES', '0'))  # 0 = always convert in one process
+DOCLING_SHARD_PAGES = int(os.getenv('DOCLING_SHARD_PAGES', '25'))
+DOCLING_SHARD_WORKERS = int(os.getenv('DOCLING_SHARD_WORKERS', '0'))  # 0 = available CPUs
+
+# PDF downloads (see mcp_servers/pdf_downloader.py)
+# Streamed to disk, resumed with HTTP Range on retry; the store keeps finished
+# downloads by SHA-256 so the same report URL is fetched once across jobs
+PDF_DOWNLOAD_MAX_MB = int(os.getenv('PDF_DOWNLOAD_MAX_MB', '500'))  # Rejected from Content-Length before reading
+PDF_DOWNLOAD_TIMEOUT = int(os.getenv('PDF_DOWNLOAD_TIMEOUT', '60'))
+PDF_DOWNLOAD_MAX_RETRIES = int(os.getenv('PDF_DOWNLOAD_MAX_RETRIES', '3'))
+PDF_STORE_ENABLED = os.getenv('PDF_STORE_ENABLED', 'True') == 'True'
+PDF_STORE_DIR = os.getenv('PDF_STORE_DIR', str(BASE_DIR / 'pdf_store'))
+PDF_STORE_MAX_MB = int(os.getenv('PDF_STORE_MAX_MB', '4096'))  # LRU eviction above this size
+PDF_STORE_TTL_HOURS = int(os.getenv('PDF_STORE_TTL_HOURS', str(24 * 30)))  # Re-download a URL after this long
+
+# Shared crawl engine (see mcp_servers/crawl_engine.py)
+# One headless browser per worker process, reused by every crawl instead of
+# launching Chromium per task; recycled after N pages or M MB of browser RSS
+CRAWL_ENGINE_ENABLED = os.getenv('CRAWL_ENGINE_ENABLED', 'True') == 'True'
+CRAWL_ENGINE_MAX_PAGES = int(os.getenv('CRAWL_ENGINE_MAX_PAGES', '4'))  # Pages open at once per process
+CRAWL_ENGINE_RECYCLE_PAGES = int(os.getenv('CRAWL_ENGINE_RECYCLE_PAGES', '200'))  # 0 = never
+CRAWL_ENGINE_RECYCLE_MB = int(os.getenv('CRAWL_ENGINE_RECYCLE_MB', '1500'))  # Browser RSS limit, 0 = never
+CRAWL_ENGINE_HEALTH_CHECK_IDLE = int(os.getenv('CRAWL_ENGINE_HEALTH_CHECK_IDLE', '60'))  # Check browser idle this many seconds
+
+# Company scraper scheduling (see mcp_servers/company_scraper.py)
+# Sections after the homepage are fetched concurrently, bounded per domain
+COMPANY_SCRAPER_CONCURRENT = os.getenv('COMPANY_SCRAPER_CONCURRENT', 'True') == 'True'
+COMPANY_SCRAPER_DOMAIN_CONCURRENCY = int(os.getenv('COMPANY_SCRAPER_DOMAIN_CONCURRENCY', '3'))  # Pages in flight per domain
+
+# Document discovery crawl (see MiningDocumentCrawler in mcp_servers/website_crawler.py)
+# Breadth-first priority frontier fetched by concurrent workers
+DOCUMENT_CRAWLER_WORKERS = int(os.getenv('DOCUMENT_CRAWLER_WORKERS', '4'))
+DOCUMENT_CRAWLER_MAX_SECONDS = int(os.getenv('DOCUMENT_CRAWLER_MAX_SECONDS', '300'))  # Stop starting new pages after this
+
+# HTML parsing for crawled pages (see mcp_servers/html_parsing.py)
+# lxml builds the BeautifulSoup trees when installed; each page's tree is shared by its extractors
+HTML_PARSER = os.getenv('HTML_PARSER', 'lxml')  # 'lxml' or 'html.parser'
+HTML_TREE_CACHE_PAGES = int(os.getenv('HTML_TREE_CACHE_PAGES', '8'))  # Parsed pages kept per process, 0 = no sharing
+
+# Content-addressed extraction cache (see mcp_servers/extraction_cache.py)
+# Caches Docling output by PDF SHA-256 and chunk extractions by (prompt, content, model)
+EXTRACTION_CACHE_ENABLED = os.getenv('EXTRACTION_CACHE_ENABLED', 'True') == 'True'
+EXTRACTION_CACHE_DIR = os.getenv('EXTRACTION_CACHE_DIR', str(BASE_DIR / 'extraction_cache'))
+EXTRACTION_CACHE_MAX_MB = int(os.getenv('EXTRACTION_CACHE_MAX_MB', '2048'))  # LRU eviction above this size
+
+# Query embedding cache (see mcp_servers/embeddings.py)
+# Repeated chat questions reuse the query vector instead of calling the embedding API
+EMBEDDING_QUERY_CACHE_SIZE = int(os.getenv('EMBEDDING_QUERY_CACHE_SIZE', '1024'))  # In-process LRU entries, 0 = off
+EMBEDDING_QUERY_CACHE_SHARED = os.getenv('EMBEDDING_QUERY_CACHE_SHARED', 'True') == 'True'  # Also use the Django cache (Redis)
+EMBEDDING_QUERY_CACHE_TTL = int(os.getenv('EMBEDDING_QUERY_CACHE_TTL', str(24 * 60 * 60)))
+
+# Multi-collection retrieval (see mcp_servers/retrieval.py)
+RAG_PARALLEL_RETRIEVAL = os.getenv('RAG_PARALLEL_RETRIEVAL', 'True') == 'True'  # Query collections concurrently
+RAG_FUSION_METHOD = os.getenv('RAG_FUSION_METHOD', 'rrf')  # 'rrf' or 'normalized'
+RAG_DEDUP_THRESHOLD = float(os.getenv('RAG_DEDUP_THRESHOLD', '0.85'))  # Text similarity treated as duplicate
+RAG_HYBRID_SEARCH = os.getenv('RAG_HYBRID_SEARCH', 'True') == 'True'  # Fuse PostgreSQL full-text hits with vector hits
+
+
+# ============================================================================
+# MARKET DATA SETTINGS
+# ============================================================================
+
+# Materialized latest-quote table (core.models.LatestQuote), refreshed by the
+# stock and metals price tasks. When off, latest prices are read from price
+# history with a single DISTINCT ON query.
+LATEST_QUOTES_ENABLED = os.getenv('LATEST_QUOTES_ENABLED', 'False') == 'True'
+
+# Stock price fetching (see mcp_servers/stock_price_scraper.py)
+STOCK_PRICE_MAX_WORKERS = int(os.getenv('STOCK_PRICE_MAX_WORKERS', '4'))  # Concurrent quote requests
+STOCKWATCH_REQUESTS_PER_MINUTE = int(os.getenv('STOCKWATCH_REQUESTS_PER_MINUTE', '60'))
+ALPHA_VANTAGE_REQUESTS_PER_MINUTE = int(os.getenv('ALPHA_VANTAGE_REQUESTS_PER_MINUTE', '5'))  # Free tier quota
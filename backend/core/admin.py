@@ -152,7 +152,7 @@ class DocumentProcessingJobAdmin(admin.ModelAdmin):
     readonly_fields = [
         'status', 'progress_message', 'error_message',
         'document', 'resources_created', 'chunks_created',
-        'started_at', 'completed_at', 'processing_time_seconds',
+        'started_at', 'completed_at', 'processing_time_seconds', 'stage_timings',
         'created_at', 'created_by'
     ]
 
@@ -167,7 +167,7 @@ class DocumentProcessingJobAdmin(admin.ModelAdmin):
             'fields': ('document', 'resources_created', 'chunks_created')
         }),
         ('Timing', {
-            'fields': ('created_at', 'started_at', 'completed_at', 'processing_time_seconds')
+            'fields': ('created_at', 'started_at', 'completed_at', 'processing_time_seconds', 'stage_timings')
         }),
         ('Metadata', {
             'fields': ('created_by',)
@@ -9,352 +9,439 @@ so the main Celery worker survives.
 Uses subprocess module (not multiprocessing) to avoid the "daemonic processes cannot
 have children" restriction in Celery workers.
 
+Jobs are served by a supervised pool of long-lived worker processes
+(core.chromadb_worker) that keep Django, ChromaDB, tiktoken and the embedding
+function loaded between jobs. A worker that crashes or times out is killed and
+replaced; its job is reported with crash/timeout exactly like the one-shot path.
+Set CHROMA_WORKER_POOL_ENABLED=False to fall back to one interpreter per job.
+
 See: https://github.com/chroma-core/chroma/issues/4365
 """
 
+import atexit
 import logging
+import queue
 import subprocess
+import tempfile
+import threading
+import time
 import json
 import sys
 import os
-from typing import Dict
+from typing import Dict, Optional
 from pathlib import Path
 
+from django.conf import settings
+
 logger = logging.getLogger(__name__)
 
 # Get the path to the backend directory for subprocess execution
 BACKEND_DIR = Path(__file__).parent.parent
 
+WORKER_COMMAND = [sys.executable, '-m', 'core.chromadb_worker']
+RESULT_MARKER = 'CHROMADB_RESULT:'
+
+
+def _crash_result(returncode: int, stderr: Optional[str], label: str) -> Dict:
+    """Build the result dict for a worker process that exited abnormally"""
+    # SIGSEGV = -11 on Linux
+    if returncode == -11:
+        logger.error(f"ChromaDB subprocess SIGSEGV crash for {label} (signal 11)")
+        error = 'ChromaDB subprocess crashed with SIGSEGV (signal 11)'
+    else:
+        logger.error(f"ChromaDB subprocess crashed for {label} (exit code: {returncode})")
+        error = f'Subprocess crashed with exit code {returncode}'
+    return {
+        'success': False,
+        'error': error,
+        'crash': True,
+        'exit_code': returncode,
+        'stderr': stderr[-500:] if stderr else None
+    }
 
-def process_company_news_isolated(company_name: str, company_id: int, limit: int = 25, timeout: int = 120) -> Dict:
-    """
-    Process company news in an isolated subprocess.
 
-    This wraps NewsContentProcessor._process_company_news() in a subprocess
-    to protect against SIGSEGV crashes from ChromaDB's Rust bindings.
+def _timeout_result(timeout: int, label: str) -> Dict:
+    logger.warning(f"ChromaDB processing timeout for {label} (>{timeout}s)")
+    return {
+        'success': False,
+        'error': f'Processing timeout after {timeout}s',
+        'timeout': True
+    }
 
-    Uses subprocess.run() to spawn a new Python interpreter, which avoids
-    the multiprocessing daemonic process restrictions in Celery workers.
 
-    Args:
-        company_name: Name of the company to process
-        company_id: ID of the company in the database
-        limit: Maximum number of news items to process
-        timeout: Maximum seconds to wait for the subprocess
+def _parse_result_line(line: str, label: str) -> Dict:
+    """Decode a CHROMADB_RESULT line emitted by the worker"""
+    try:
+        return json.loads(line[len(RESULT_MARKER):])
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse ChromaDB result JSON for {label}: {e}")
+        return {
+            'success': False,
+            'error': 'Failed to parse subprocess result'
+        }
 
-    Returns:
-        dict with keys:
-        - success: bool
-        - result: dict (if success) containing news_items_processed, chunks_created
-        - error: str (if failed)
-        - crash: bool (if subprocess crashed with SIGSEGV)
+
+class ChromaWorker:
     """
-    # SECURITY: Validate inputs to prevent injection
-    if not isinstance(company_id, int) or company_id <= 0:
-        return {'success': False, 'error': 'Invalid company_id'}
-    if not isinstance(limit, int) or limit <= 0 or limit > 1000:
-        return {'success': False, 'error': 'Invalid limit'}
+    A single long-lived ChromaDB worker process.
 
-    # SECURITY: Pass parameters via environment variables to avoid code injection
-    # The subprocess fetches the company name from the database using the validated company_id
-    subprocess_code = '''
-import os
-import sys
-import json
+    Jobs are written to the worker's stdin as JSON lines; a reader thread
+    forwards result lines from stdout to a queue so waits can time out
+    portably (select() does not work on pipes on Windows).
+    """
 
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    def __init__(self):
+        self._stderr = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(
+            WORKER_COMMAND,
+            cwd=str(BACKEND_DIR),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+            text=True,
+            bufsize=1,
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': 'config.settings'}
+        )
+        self.jobs_served = 0
+        self.started_at = time.monotonic()
+        self._results = queue.Queue()
+        self._reader = threading.Thread(target=self._read_stdout, daemon=True)
+        self._reader.start()
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def _read_stdout(self):
+        for line in self.process.stdout:
+            if line.startswith(RESULT_MARKER):
+                self._results.put(line.rstrip('\n'))
+        # EOF: process exited (or crashed)
+        self._results.put(None)
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def stderr_tail(self, limit: int = 500) -> Optional[str]:
+        try:
+            self._stderr.seek(0, os.SEEK_END)
+            size = self._stderr.tell()
+            self._stderr.seek(max(0, size - limit))
+            return self._stderr.read().decode('utf-8', errors='replace') or None
+        except (OSError, ValueError):
+            return None
+
+    def run(self, job: Dict, timeout: int, label: str, grace: float = 0) -> Dict:
+        """Send one job and wait up to timeout + grace seconds for its result"""
+        try:
+            self.process.stdin.write(json.dumps(job) + '\n')
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            self.process.wait()
+            return _crash_result(self.process.returncode, self.stderr_tail(), label)
+
+        try:
+            line = self._results.get(timeout=timeout + grace)
+        except queue.Empty:
+            self.kill()
+            return _timeout_result(timeout, label)
+
+        if line is None:
+            self.process.wait()
+            return _crash_result(self.process.returncode, self.stderr_tail(), label)
+
+        self.jobs_served += 1
+        return _parse_result_line(line, label)
+
+    def kill(self):
+        if self.is_alive():
+            self.process.kill()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        self._stderr.close()
+
+    def stop(self, timeout: float = 5):
+        """Close stdin so the worker exits its job loop, then reap it"""
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        self.kill()
+
+
+class ChromaWorkerPool:
+    """
+    Supervised pool of long-lived ChromaDB worker processes.
 
-import django
-django.setup()
+    - At most `size` workers run at once; callers block until one is idle.
+    - A worker that crashes (e.g. SIGSEGV) or times out is killed and a
+      replacement is started immediately so it warms up before the next job.
+    - Workers are recycled after `max_jobs_per_worker` jobs to bound any
+      memory growth inside ChromaDB.
+    """
 
-try:
-    from mcp_servers.news_content_processor import NewsContentProcessor
-    from core.models import Company
+    def __init__(self, size: int = 1, max_jobs_per_worker: int = 200, startup_timeout: int = 60):
+        self.size = max(1, size)
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.startup_timeout = startup_timeout
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers = set()
+        self._closed = False
+        self.stats = {
+            'jobs': 0,
+            'crashes': 0,
+            'timeouts': 0,
+            'workers_started': 0,
+            'workers_recycled': 0,
+        }
 
-    # Get parameters from environment (safer than f-string interpolation)
-    company_id = int(os.environ.get('CHROMA_COMPANY_ID'))
-    limit = int(os.environ.get('CHROMA_LIMIT', 25))
+    def _start_worker(self) -> ChromaWorker:
+        worker = ChromaWorker()
+        self._workers.add(worker)
+        self.stats['workers_started'] += 1
+        logger.info(f"Started ChromaDB worker process (pid {worker.pid})")
+        return worker
+
+    def _acquire(self) -> ChromaWorker:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('ChromaDB worker pool is shut down')
+            if self._idle.empty() and len(self._workers) < self.size:
+                return self._start_worker()
+        return self._idle.get()
+
+    def _release(self, worker: ChromaWorker):
+        with self._lock:
+            if self._closed:
+                self._workers.discard(worker)
+                worker.stop()
+                return
+            if worker.is_alive() and worker.jobs_served < self.max_jobs_per_worker:
+                self._idle.put(worker)
+                return
+
+            # Dead or worn out: replace it so the next caller gets a warm process
+            self._workers.discard(worker)
+            if worker.is_alive():
+                self.stats['workers_recycled'] += 1
+                worker.stop()
+            else:
+                worker.kill()
+            self._idle.put(self._start_worker())
+
+    def submit(self, job_type: str, params: Dict, timeout: int, label: str) -> Dict:
+        """Run a job on an idle worker and return its result dict"""
+        worker = self._acquire()
+        # A fresh worker still has to import Django/ChromaDB before answering
+        grace = self.startup_timeout if worker.jobs_served == 0 else 0
+        try:
+            result = worker.run({'type': job_type, 'params': params}, timeout, label, grace=grace)
+        finally:
+            self._release(worker)
+
+        with self._lock:
+            self.stats['jobs'] += 1
+            if result.get('crash'):
+                self.stats['crashes'] += 1
+            elif result.get('timeout'):
+                self.stats['timeouts'] += 1
+        return result
+
+    def warm_up(self):
+        """Start all workers up front instead of on first use"""
+        with self._lock:
+            while len(self._workers) < self.size:
+                self._idle.put(self._start_worker())
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> ChromaWorkerPool:
+    """Return the process-wide ChromaDB worker pool, creating it on first use"""
+    global _pool, _pool_pid
+    with _pool_lock:
+        # A pool inherited through fork() points at the parent's workers
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ChromaWorkerPool(
+                size=getattr(settings, 'CHROMA_WORKER_POOL_SIZE', 1),
+                max_jobs_per_worker=getattr(settings, 'CHROMA_WORKER_MAX_JOBS', 200),
+                startup_timeout=getattr(settings, 'CHROMA_WORKER_STARTUP_TIMEOUT', 60),
+            )
+            _pool_pid = os.getpid()
+        return _pool
+
+
+@atexit.register
+def shutdown_worker_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.shutdown()
+        _pool = None
+
+
+def _run_oneshot(job_type: str, params: Dict, timeout: int, label: str) -> Dict:
+    """Run a single job in a fresh interpreter (the pre-pool behaviour)"""
+    result = subprocess.run(
+        WORKER_COMMAND,
+        input=json.dumps({'type': job_type, 'params': params}) + '\n',
+        cwd=str(BACKEND_DIR),
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        env={
+            **os.environ,
+            'DJANGO_SETTINGS_MODULE': 'config.settings',
+            'CHROMA_WORKER_WARM_UP': '0',
+        }
+    )
 
-    # Fetch company name from database (prevents injection via company_name parameter)
-    company = Company.objects.get(id=company_id)
-    company_name = company.name
+    # Check for crashes (non-zero exit code)
+    if result.returncode != 0:
+        return _crash_result(result.returncode, result.stderr, label)
 
-    processor = NewsContentProcessor(company_id=company_id)
-    result = processor._process_company_news(company_name, limit=limit)
+    for line in result.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            return _parse_result_line(line, label)
 
-    # Output JSON result to stdout
-    print("CHROMADB_RESULT:" + json.dumps({"success": True, "result": result}))
-except Exception as e:
-    print("CHROMADB_RESULT:" + json.dumps({"success": False, "error": str(e), "error_type": type(e).__name__}))
-'''
+    return {
+        'success': False,
+        'error': 'No result marker found in subprocess output',
+        'stdout': result.stdout[:500] if result.stdout else None
+    }
 
-    try:
-        # Run Python subprocess with parameters passed via environment variables
-        subprocess_env = {
-            **os.environ,
-            'DJANGO_SETTINGS_MODULE': 'config.settings',
-            'CHROMA_COMPANY_ID': str(company_id),
-            'CHROMA_LIMIT': str(limit),
-        }
-        result = subprocess.run(
-            [sys.executable, '-c', subprocess_code],
-            cwd=str(BACKEND_DIR),
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            env=subprocess_env
-        )
 
-        # Check for crashes (non-zero exit code)
-        if result.returncode != 0:
-            # SIGSEGV = -11 on Linux
-            if result.returncode == -11:
-                logger.error(f"ChromaDB subprocess SIGSEGV crash for {company_name} (signal 11)")
-                return {
-                    'success': False,
-                    'error': 'ChromaDB subprocess crashed with SIGSEGV (signal 11)',
-                    'crash': True,
-                    'exit_code': result.returncode,
-                    'stderr': result.stderr[:500] if result.stderr else None
-                }
-            else:
-                logger.error(f"ChromaDB subprocess crashed for {company_name} (exit code: {result.returncode})")
-                return {
-                    'success': False,
-                    'error': f'Subprocess crashed with exit code {result.returncode}',
-                    'crash': True,
-                    'exit_code': result.returncode,
-                    'stderr': result.stderr[:500] if result.stderr else None
-                }
-
-        # Parse result from stdout
-        stdout = result.stdout
-        if 'CHROMADB_RESULT:' in stdout:
-            result_line = stdout.split('CHROMADB_RESULT:')[1].split('\n')[0]
-            try:
-                return json.loads(result_line)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse ChromaDB result JSON for {company_name}: {e}")
-                return {
-                    'success': False,
-                    'error': 'Failed to parse subprocess result'
-                }
-        else:
-            return {
-                'success': False,
-                'error': 'No result marker found in subprocess output',
-                'stdout': stdout[:500] if stdout else None
-            }
+def run_isolated(job_type: str, params: Dict, timeout: int, label: str, use_pool: bool = None) -> Dict:
+    """
+    Run a ChromaDB job outside the calling process.
 
+    Args:
+        job_type: Key in core.chromadb_worker.JOB_HANDLERS
+        params: Keyword arguments for the job handler (JSON-serialisable)
+        timeout: Maximum seconds to wait for the job
+        label: Human-readable name for log messages
+        use_pool: Use the warm worker pool (default: CHROMA_WORKER_POOL_ENABLED)
+
+    Returns:
+        dict with keys:
+        - success: bool
+        - result: dict (if success)
+        - error: str (if failed)
+        - crash: bool (if the worker crashed, e.g. SIGSEGV)
+        - timeout: bool (if the job exceeded the timeout)
+    """
+    if use_pool is None:
+        use_pool = getattr(settings, 'CHROMA_WORKER_POOL_ENABLED', True)
+
+    try:
+        if use_pool:
+            return get_worker_pool().submit(job_type, params, timeout, label)
+        return _run_oneshot(job_type, params, timeout, label)
     except subprocess.TimeoutExpired:
-        logger.warning(f"ChromaDB processing timeout for {company_name} (>{timeout}s)")
-        return {
-            'success': False,
-            'error': f'Processing timeout after {timeout}s',
-            'timeout': True
-        }
+        return _timeout_result(timeout, label)
     except Exception as e:
-        logger.error(f"Error running ChromaDB subprocess for {company_name}: {e}")
+        logger.error(f"Error running ChromaDB subprocess for {label}: {e}")
         return {
             'success': False,
             'error': 'ChromaDB processing failed. Please try again later.'
         }
 
 
-def store_company_profile_isolated(company_id: int, timeout: int = 60) -> Dict:
+def process_company_news_isolated(company_name: str, company_id: int, limit: int = 25, timeout: int = 120,
+                                  use_pool: bool = None) -> Dict:
     """
-    Store company profile in ChromaDB using an isolated subprocess.
+    Process company news in an isolated subprocess.
+
+    This wraps NewsContentProcessor._process_company_news() in a worker process
+    to protect against SIGSEGV crashes from ChromaDB's Rust bindings.
 
     Args:
-        company_id: ID of the company to store profile for
+        company_name: Name of the company to process
+        company_id: ID of the company in the database
+        limit: Maximum number of news items to process
         timeout: Maximum seconds to wait for the subprocess
+        use_pool: Use the warm worker pool (default: CHROMA_WORKER_POOL_ENABLED)
 
     Returns:
         dict with keys:
         - success: bool
-        - result: dict (if success)
+        - result: dict (if success) containing news_items_processed, chunks_created
         - error: str (if failed)
         - crash: bool (if subprocess crashed with SIGSEGV)
     """
-    # Python code to execute in subprocess
-    subprocess_code = f'''
-import os
-import sys
-import json
-
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-
-import django
-django.setup()
-
-try:
-    import chromadb
-    from chromadb.config import Settings as ChromaSettings
-    from pathlib import Path
-    from django.conf import settings
-    from mcp_servers.embeddings import get_embedding_function
-    from core.models import Company
-
-    company = Company.objects.get(id={company_id})
-
-    # Build company profile text
-    profile_parts = []
-
-    if company.description:
-        profile_parts.append(f"Company Overview: {{company.name}}\\n{{company.description}}")
-
-    if company.tagline:
-        profile_parts.append(f"Tagline: {{company.tagline}}")
-
-    if company.ticker_symbol and company.exchange:
-        profile_parts.append(f"Stock: {{company.ticker_symbol}} on {{company.exchange.upper()}}")
-
-    # Projects summary
-    projects = company.projects.all()
-    if projects:
-        project_texts = []
-        for project in projects:
-            project_text = f"Project: {{project.name}}"
-            if project.description:
-                project_text += f"\\n{{project.description}}"
-            if project.country:
-                project_text += f"\\nLocation: {{project.country}}"
-            if project.primary_commodity:
-                project_text += f"\\nCommodity: {{project.primary_commodity}}"
-            project_texts.append(project_text)
-        profile_parts.append("Projects:\\n" + "\\n\\n".join(project_texts))
-
-    if not profile_parts:
-        print("CHROMADB_RESULT:" + json.dumps({{"success": True, "result": {{"status": "skipped", "message": "No profile data to store"}}}}))
-        sys.exit(0)
-
-    full_profile = "\\n\\n".join(profile_parts)
-
-    # Store in ChromaDB
-    chroma_path = Path(settings.BASE_DIR) / "chroma_db"
-    chroma_path.mkdir(exist_ok=True)
-
-    chroma_client = chromadb.PersistentClient(
-        path=str(chroma_path),
-        settings=ChromaSettings(anonymized_telemetry=False)
-    )
-
-    # Get embedding function
-    embedding_function = get_embedding_function()
-
-    collection = chroma_client.get_or_create_collection(
-        name="company_profiles",
-        metadata={{"hnsw:space": "cosine"}},
-        embedding_function=embedding_function
-    )
+    # SECURITY: Validate inputs to prevent injection
+    if not isinstance(company_id, int) or company_id <= 0:
+        return {'success': False, 'error': 'Invalid company_id'}
+    if not isinstance(limit, int) or limit <= 0 or limit > 1000:
+        return {'success': False, 'error': 'Invalid limit'}
 
-    # Delete existing profile
-    try:
-        collection.delete(ids=[f"company_{{company.id}}_profile"])
-    except Exception:
-        pass  # Profile may not exist yet
-
-    # Add profile
-    collection.add(
-        ids=[f"company_{{company.id}}_profile"],
-        documents=[full_profile],
-        metadatas=[{{
-            "company_id": company.id,
-            "company_name": company.name,
-            "ticker": company.ticker_symbol or "",
-            "exchange": company.exchange or "",
-            "type": "company_profile"
-        }}]
+    # SECURITY: Parameters travel as JSON over stdin, never interpolated into code.
+    # The worker fetches the company name from the database using the validated company_id
+    return run_isolated(
+        'company_news',
+        {'company_id': company_id, 'limit': limit},
+        timeout=timeout,
+        label=company_name,
+        use_pool=use_pool
     )
 
-    print("CHROMADB_RESULT:" + json.dumps({{
-        "success": True,
-        "result": {{
-            "status": "success",
-            "company": company.name,
-            "chars_stored": len(full_profile)
-        }}
-    }}))
 
-except Exception as e:
-    print("CHROMADB_RESULT:" + json.dumps({{"success": False, "error": str(e), "error_type": type(e).__name__}}))
-'''
+def store_company_profile_isolated(company_id: int, timeout: int = 60, use_pool: bool = None) -> Dict:
+    """
+    Store company profile in ChromaDB using an isolated subprocess.
 
-    try:
-        # Run Python subprocess
-        result = subprocess.run(
-            [sys.executable, '-c', subprocess_code],
-            cwd=str(BACKEND_DIR),
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            env={**os.environ, 'DJANGO_SETTINGS_MODULE': 'config.settings'}
-        )
+    Args:
+        company_id: ID of the company to store profile for
+        timeout: Maximum seconds to wait for the subprocess
+        use_pool: Use the warm worker pool (default: CHROMA_WORKER_POOL_ENABLED)
 
-        # Check for crashes
-        if result.returncode != 0:
-            if result.returncode == -11:
-                logger.error(f"ChromaDB profile subprocess SIGSEGV crash for company {company_id}")
-                return {
-                    'success': False,
-                    'error': 'ChromaDB subprocess crashed with SIGSEGV (signal 11)',
-                    'crash': True,
-                    'exit_code': result.returncode
-                }
-            else:
-                logger.error(f"ChromaDB profile subprocess crashed for company {company_id} (exit: {result.returncode})")
-                return {
-                    'success': False,
-                    'error': f'Subprocess crashed with exit code {result.returncode}',
-                    'crash': True,
-                    'exit_code': result.returncode,
-                    'stderr': result.stderr[:500] if result.stderr else None
-                }
-
-        # Parse result from stdout
-        stdout = result.stdout
-        if 'CHROMADB_RESULT:' in stdout:
-            result_line = stdout.split('CHROMADB_RESULT:')[1].split('\n')[0]
-            try:
-                return json.loads(result_line)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse ChromaDB profile result JSON for company {company_id}: {e}")
-                return {
-                    'success': False,
-                    'error': 'Failed to parse subprocess result'
-                }
-        else:
-            return {
-                'success': False,
-                'error': 'No result marker found in subprocess output',
-                'stdout': stdout[:500] if stdout else None
-            }
+    Returns:
+        dict with keys:
+        - success: bool
+        - result: dict (if success)
+        - error: str (if failed)
+        - crash: bool (if subprocess crashed with SIGSEGV)
+    """
+    if not isinstance(company_id, int) or company_id <= 0:
+        return {'success': False, 'error': 'Invalid company_id'}
 
-    except subprocess.TimeoutExpired:
-        logger.warning(f"ChromaDB profile storage timeout for company {company_id} (>{timeout}s)")
-        return {
-            'success': False,
-            'error': f'Processing timeout after {timeout}s',
-            'timeout': True
-        }
-    except Exception as e:
-        logger.error(f"Error running ChromaDB profile subprocess for company {company_id}: {e}")
-        return {
-            'success': False,
-            'error': 'ChromaDB profile storage failed. Please try again later.'
-        }
+    return run_isolated(
+        'company_profile',
+        {'company_id': company_id},
+        timeout=timeout,
+        label=f"company {company_id}",
+        use_pool=use_pool
+    )
 
 
-def process_news_batch_isolated(companies: list, limit_per_company: int = 20, timeout_per_company: int = 120) -> Dict:
+def process_news_batch_isolated(companies: list, limit_per_company: int = 20, timeout_per_company: int = 120,
+                                use_pool: bool = None) -> Dict:
     """
-    Process news for multiple companies, each in an isolated subprocess.
+    Process news for multiple companies, each as a separate isolated job.
+
+    With the worker pool enabled, consecutive companies reuse the same warm
+    worker process instead of paying interpreter and model start-up each time.
 
     Args:
         companies: List of dicts with 'name' and 'id' keys
         limit_per_company: Max news items per company
         timeout_per_company: Timeout in seconds per company
+        use_pool: Use the warm worker pool (default: CHROMA_WORKER_POOL_ENABLED)
 
     Returns:
         dict with processing stats
@@ -383,7 +470,8 @@ def process_news_batch_isolated(companies: list, limit_per_company: int = 20, ti
             company_name=company_name,
             company_id=company_id,
             limit=limit_per_company,
-            timeout=timeout_per_company
+            timeout=timeout_per_company,
+            use_pool=use_pool
         )
 
         if result.get('success'):
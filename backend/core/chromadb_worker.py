@@ -0,0 +1,208 @@
+"""
+ChromaDB Isolated Worker Process
+
+Entry point for the long-lived worker processes managed by
+core.chromadb_isolated.ChromaWorkerPool. Each worker runs django.setup() and
+loads ChromaDB, tiktoken and the embedding function once, then serves jobs
+read from stdin until stdin is closed.
+
+Protocol (one JSON object per line):
+    stdin:  {"type": "company_news", "params": {"company_id": 1, "limit": 25}}
+    stdout: CHROMADB_RESULT:{"success": true, "result": {...}}
+
+Anything the job code prints is redirected to stderr so that stdout only ever
+carries result lines. A SIGSEGV from ChromaDB's Rust bindings kills only this
+process; the parent pool detects the closed pipe and starts a replacement.
+
+Run with: python -m core.chromadb_worker
+"""
+
+import json
+import os
+import sys
+
+RESULT_MARKER = 'CHROMADB_RESULT:'
+
+_news_processor = None
+_profile_collection = None
+
+
+def _get_news_processor():
+    """Return the worker's NewsContentProcessor, creating it on first use"""
+    global _news_processor
+    if _news_processor is None:
+        from mcp_servers.news_content_processor import NewsContentProcessor
+        _news_processor = NewsContentProcessor()
+    return _news_processor
+
+
+def _get_profile_collection():
+    """Return the company_profiles collection, creating it on first use"""
+    global _profile_collection
+    if _profile_collection is None:
+        import chromadb
+        from chromadb.config import Settings as ChromaSettings
+        from pathlib import Path
+        from django.conf import settings
+        from mcp_servers.embeddings import get_embedding_function
+
+        chroma_path = Path(settings.BASE_DIR) / "chroma_db"
+        chroma_path.mkdir(exist_ok=True)
+
+        chroma_client = chromadb.PersistentClient(
+            path=str(chroma_path),
+            settings=ChromaSettings(anonymized_telemetry=False)
+        )
+        _profile_collection = chroma_client.get_or_create_collection(
+            name="company_profiles",
+            metadata={"hnsw:space": "cosine"},
+            embedding_function=get_embedding_function()
+        )
+    return _profile_collection
+
+
+def process_company_news(company_id: int, limit: int = 25) -> dict:
+    """Process a company's news into the news_chunks collection"""
+    from core.models import Company
+
+    # Fetch company name from database (prevents injection via company_name parameter)
+    company = Company.objects.get(id=company_id)
+
+    processor = _get_news_processor()
+    processor.company_id = company_id
+    return processor._process_company_news(company.name, limit=limit)
+
+
+def store_company_profile(company_id: int) -> dict:
+    """Build a company's profile text and store it in the company_profiles collection"""
+    from core.models import Company
+
+    company = Company.objects.get(id=company_id)
+
+    # Build company profile text
+    profile_parts = []
+
+    if company.description:
+        profile_parts.append(f"Company Overview: {company.name}\n{company.description}")
+
+    if company.tagline:
+        profile_parts.append(f"Tagline: {company.tagline}")
+
+    if company.ticker_symbol and company.exchange:
+        profile_parts.append(f"Stock: {company.ticker_symbol} on {company.exchange.upper()}")
+
+    # Projects summary
+    projects = company.projects.all()
+    if projects:
+        project_texts = []
+        for project in projects:
+            project_text = f"Project: {project.name}"
+            if project.description:
+                project_text += f"\n{project.description}"
+            if project.country:
+                project_text += f"\nLocation: {project.country}"
+            if project.primary_commodity:
+                project_text += f"\nCommodity: {project.primary_commodity}"
+            project_texts.append(project_text)
+        profile_parts.append("Projects:\n" + "\n\n".join(project_texts))
+
+    if not profile_parts:
+        return {"status": "skipped", "message": "No profile data to store"}
+
+    full_profile = "\n\n".join(profile_parts)
+    collection = _get_profile_collection()
+
+    # Delete existing profile
+    try:
+        collection.delete(ids=[f"company_{company.id}_profile"])
+    except Exception:
+        pass  # Profile may not exist yet
+
+    collection.add(
+        ids=[f"company_{company.id}_profile"],
+        documents=[full_profile],
+        metadatas=[{
+            "company_id": company.id,
+            "company_name": company.name,
+            "ticker": company.ticker_symbol or "",
+            "exchange": company.exchange or "",
+            "type": "company_profile"
+        }]
+    )
+
+    return {
+        "status": "success",
+        "company": company.name,
+        "chars_stored": len(full_profile)
+    }
+
+
+def ping() -> dict:
+    """No-op job used for health checks and benchmarking"""
+    return {"pid": os.getpid()}
+
+
+JOB_HANDLERS = {
+    'company_news': process_company_news,
+    'company_profile': store_company_profile,
+    'ping': ping,
+}
+
+
+def _warm_up():
+    """Load ChromaDB, tiktoken and the embedder before the first job arrives"""
+    try:
+        _get_news_processor()
+        _get_profile_collection()
+    except Exception as e:
+        # Jobs will retry initialization and report the error themselves
+        print(f"ChromaDB worker warm-up failed: {e}", file=sys.stderr)
+
+
+def run_job(job: dict) -> dict:
+    """Execute one job dict and return the result envelope"""
+    from django.db import close_old_connections
+
+    handler = JOB_HANDLERS.get(job.get('type'))
+    if handler is None:
+        return {"success": False, "error": f"Unknown job type: {job.get('type')}"}
+
+    # Long-lived process: drop connections that exceeded CONN_MAX_AGE between jobs
+    close_old_connections()
+    try:
+        return {"success": True, "result": handler(**job.get('params', {}))}
+    except Exception as e:
+        return {"success": False, "error": str(e), "error_type": type(e).__name__}
+    finally:
+        close_old_connections()
+
+
+def main():
+    # Keep stdout reserved for result lines; job output goes to stderr
+    result_stream = os.fdopen(os.dup(sys.stdout.fileno()), 'w')
+    sys.stdout = sys.stderr
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    import django
+    django.setup()
+
+    if os.environ.get('CHROMA_WORKER_WARM_UP', '1') == '1':
+        _warm_up()
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError:
+            result = {"success": False, "error": "Invalid job payload"}
+        else:
+            result = run_job(job)
+
+        result_stream.write(RESULT_MARKER + json.dumps(result, default=str) + '\n')
+        result_stream.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -493,8 +493,9 @@ async def _fetch_page_with_playwright(url: str) -> Optional[str]:
     Includes retry logic for bot challenge pages.
     """
     try:
-        from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
+        from crawl4ai import CrawlerRunConfig
         from bs4 import BeautifulSoup
+        from mcp_servers.crawl_engine import crawl_session
 
         # Bot challenge indicators - these indicate the page hasn't fully loaded
         challenge_indicators = [
@@ -503,12 +504,7 @@ async def _fetch_page_with_playwright(url: str) -> Optional[str]:
             'checking the site connection', 'enable cookies', 'security check'
         ]
 
-        browser_config = BrowserConfig(
-            headless=True,
-            verbose=False,
-        )
-
-        async with AsyncWebCrawler(config=browser_config) as crawler:
+        async with crawl_session() as crawler:
             # First attempt with standard wait
             config = CrawlerRunConfig(
                 cache_mode="bypass",
@@ -628,10 +624,10 @@ def _extract_tradingview_ticker(website_url: str) -> tuple:
 
     async def _fetch_raw_html():
         try:
-            from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
+            from crawl4ai import CrawlerRunConfig
+            from mcp_servers.crawl_engine import crawl_session
 
-            browser_config = BrowserConfig(headless=True, verbose=False)
-            async with AsyncWebCrawler(config=browser_config) as crawler:
+            async with crawl_session() as crawler:
                 config = CrawlerRunConfig(
                     cache_mode="bypass",
                     delay_before_return_html=5.0,
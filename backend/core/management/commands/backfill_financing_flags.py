@@ -9,12 +9,20 @@ Usage:
     python manage.py backfill_financing_flags --months 3
     python manage.py backfill_financing_flags --months 6 --dry-run
     python manage.py backfill_financing_flags --company-id 5
+    python manage.py backfill_financing_flags --all --dry-run
+
+Titles are scanned in batches with the shared keyword detector and news
+classifier, so the whole NewsRelease table can be backfilled.
 """
 
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import timedelta
 from core.models import NewsRelease, NewsReleaseFlag, Company
+from core.news_classifier import classify_news_batch
+from core.news_ingestion import detect_keywords
+
+BATCH_SIZE = 2000
 
 
 class Command(BaseCommand):
@@ -27,6 +35,11 @@ class Command(BaseCommand):
             default=3,
             help='Number of months to backfill (default: 3)'
         )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Scan every news release regardless of date (ignores --months)'
+        )
         parser.add_argument(
             '--company-id',
             type=int,
@@ -45,6 +58,7 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         months = options['months']
+        scan_all = options['all']
         company_id = options.get('company_id')
         dry_run = options['dry_run']
         send_emails = options['send_emails']
@@ -55,13 +69,16 @@ class Command(BaseCommand):
 
         # Calculate date range
         cutoff_date = timezone.now() - timedelta(days=months * 30)
-        self.stdout.write(f'[Date] Scanning news releases from: {cutoff_date.strftime("%Y-%m-%d")}')
+        if scan_all:
+            self.stdout.write('[Date] Scanning all news releases')
+        else:
+            self.stdout.write(f'[Date] Scanning news releases from: {cutoff_date.strftime("%Y-%m-%d")}')
         self.stdout.write(f'{"[Mode] Dry run - no flags will be created" if dry_run else "[Mode] Creating flags for matches"}\n')
 
         # Get news releases to scan
-        queryset = NewsRelease.objects.filter(
-            release_date__gte=cutoff_date.date()
-        ).select_related('company')
+        queryset = NewsRelease.objects.select_related('company').order_by('id')
+        if not scan_all:
+            queryset = queryset.filter(release_date__gte=cutoff_date.date())
 
         if company_id:
             queryset = queryset.filter(company_id=company_id)
@@ -121,31 +138,40 @@ class Command(BaseCommand):
         already_flagged = 0
         processed = 0
 
-        for news in queryset:
-            processed += 1
-            if processed % 100 == 0:
+        def scan_batch(batch):
+            # One flag lookup per batch; keywords and classification for all titles at once
+            flagged_ids = set(NewsReleaseFlag.objects.filter(
+                news_release_id__in=[news.id for news in batch]
+            ).values_list('news_release_id', flat=True))
+            unflagged = [news for news in batch if news.id not in flagged_ids]
+            titles = [news.title for news in unflagged]
+            for news, detected_keywords, classification in zip(
+                unflagged, detect_keywords(titles, all_keywords), classify_news_batch(titles)
+            ):
+                if detected_keywords:
+                    # Categorize as financing or strategic investment
+                    is_strategic = any(kw in detected_keywords for kw in strategic_keywords + major_miners)
+                    category = 'Strategic Investment' if is_strategic else 'Financing'
+
+                    matches.append({
+                        'news': news,
+                        'keywords': detected_keywords,
+                        'category': category,
+                        'financing_type': classification['financing_type'],
+                    })
+            return len(batch) - len(unflagged)
+
+        batch = []
+        for news in queryset.iterator(chunk_size=BATCH_SIZE):
+            batch.append(news)
+            if len(batch) == BATCH_SIZE:
+                already_flagged += scan_batch(batch)
+                processed += len(batch)
                 self.stdout.write(f'[Progress] Processed {processed}/{total_news}...')
-
-            # Check if already flagged
-            existing_flag = NewsReleaseFlag.objects.filter(news_release=news).first()
-            if existing_flag:
-                already_flagged += 1
-                continue
-
-            # Detect keywords in title
-            title_lower = news.title.lower()
-            detected_keywords = [kw for kw in all_keywords if kw in title_lower]
-
-            if detected_keywords:
-                # Categorize as financing or strategic investment
-                is_strategic = any(kw in detected_keywords for kw in strategic_keywords + major_miners)
-                category = 'Strategic Investment' if is_strategic else 'Financing'
-
-                matches.append({
-                    'news': news,
-                    'keywords': detected_keywords,
-                    'category': category
-                })
+                batch = []
+        if batch:
+            already_flagged += scan_batch(batch)
+            processed += len(batch)
 
         # Display results
         self.stdout.write(f'\n{"="*80}')
@@ -173,6 +199,8 @@ class Command(BaseCommand):
             self.stdout.write(f'   Date: {news.release_date}')
             self.stdout.write(f'   Title: {news.title[:80]}...' if len(news.title) > 80 else f'   Title: {news.title}')
             self.stdout.write(f'   Keywords: {", ".join(keywords)}')
+            if match['financing_type'] != 'none':
+                self.stdout.write(f'   Financing type: {match["financing_type"]}')
             self.stdout.write(f'   URL: {news.url}')
 
         # Create flags if not dry run
@@ -217,7 +245,10 @@ class Command(BaseCommand):
         self.stdout.write(f'\n{"="*80}')
         self.stdout.write(self.style.SUCCESS('SUMMARY'))
         self.stdout.write(f'{"="*80}\n')
-        self.stdout.write(f'Period scanned: {cutoff_date.strftime("%Y-%m-%d")} to {timezone.now().strftime("%Y-%m-%d")}')
+        if scan_all:
+            self.stdout.write('Period scanned: all news releases')
+        else:
+            self.stdout.write(f'Period scanned: {cutoff_date.strftime("%Y-%m-%d")} to {timezone.now().strftime("%Y-%m-%d")}')
         self.stdout.write(f'News releases scanned: {total_news}')
         self.stdout.write(f'Already flagged: {already_flagged}')
         self.stdout.write(f'New matches: {len(matches)}')
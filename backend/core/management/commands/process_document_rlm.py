@@ -66,6 +66,11 @@ class Command(BaseCommand):
             action='store_true',
             help='Skip validation pass'
         )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            help='Max parallel chunk extractions (default: RLM_MAX_CONCURRENCY setting)'
+        )
         parser.add_argument(
             '--force-rlm',
             action='store_true',
@@ -132,6 +137,8 @@ class Command(BaseCommand):
 
         # Process with RLM
         processor = HybridDocumentProcessor()
+        if options.get('concurrency'):
+            processor.rlm_processor.max_concurrency = options['concurrency']
 
         if options['force_rlm']:
             # Force RLM processing
@@ -177,6 +184,8 @@ class Command(BaseCommand):
             return
 
         processor = HybridDocumentProcessor()
+        if options.get('concurrency'):
+            processor.rlm_processor.max_concurrency = options['concurrency']
         processed = 0
         succeeded = 0
         failed = 0
@@ -261,6 +270,8 @@ class Command(BaseCommand):
             self.stdout.write(f'  Chunks processed: {rlm_stats.get("chunks_processed", "N/A")}')
             self.stdout.write(f'  Successful extractions: {rlm_stats.get("successful_extractions", "N/A")}')
             self.stdout.write(f'  Processing time: {rlm_stats.get("processing_time_seconds", 0):.1f}s')
+            self.stdout.write(f'  Extraction time: {rlm_stats.get("extraction_time_seconds", 0):.1f}s '
+                              f'(concurrency {rlm_stats.get("max_concurrency", 1)})')
             self.stdout.write(f'  Validation passed: {rlm_stats.get("validation_passed", "N/A")}')
             self.stdout.write(f'  Strategy: {rlm_stats.get("decomposition_strategy", "N/A")}')
 
@@ -0,0 +1,127 @@
+"""
+Django Management Command: Shared Docling Converter Server
+Loads the Docling models once and converts PDFs for every worker that has
+DOCLING_SERVICE_URL pointing at it, instead of each worker process holding
+its own copy of the models.
+
+Endpoints:
+    POST /convert   PDF bytes in the body -> {'text', 'tables', 'page_count'}
+    GET  /stats     load time, RSS and conversion counts
+
+Usage:
+    python manage.py run_docling_server                    # 127.0.0.1:8765
+    python manage.py run_docling_server --port 9000
+    python manage.py run_docling_server --stats            # Warm up, print memory stats and exit
+"""
+
+import json
+import tempfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from mcp_servers.docling_service import get_local_docling_service
+
+
+class DoclingRequestHandler(BaseHTTPRequestHandler):
+    service = None
+    max_bytes = 0
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self._send_json(200, self.service.memory_stats())
+        else:
+            self._send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        if self.path != '/convert':
+            self._send_json(404, {'error': 'Not found'})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        if length <= 0:
+            self._send_json(400, {'error': 'Empty request body'})
+            return
+        if length > self.max_bytes:
+            self._send_json(413, {'error': f'PDF larger than {self.max_bytes // (1024 * 1024)} MB'})
+            return
+
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
+            remaining = length
+            while remaining:
+                block = self.rfile.read(min(remaining, 1024 * 1024))
+                if not block:
+                    break
+                temp_file.write(block)
+                remaining -= len(block)
+        pdf_path = Path(temp_file.name)
+
+        try:
+            self._send_json(200, self.service.convert(pdf_path))
+        except Exception as e:
+            self._send_json(500, {'error': f'Docling processing failed: {str(e)}'})
+        finally:
+            pdf_path.unlink(missing_ok=True)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = 'Run a shared Docling converter that worker processes use via DOCLING_SERVICE_URL'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--host',
+            type=str,
+            default='127.0.0.1',
+            help='Interface to bind (default: 127.0.0.1)',
+        )
+        parser.add_argument(
+            '--port',
+            type=int,
+            default=8765,
+            help='Port to listen on (default: 8765)',
+        )
+        parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='Load the models, print memory usage and exit',
+        )
+
+    def handle(self, *args, **options):
+        service = get_local_docling_service()
+
+        self.stdout.write("Loading Docling models...")
+        stats = service.warm_up()
+        self.stdout.write(self.style.SUCCESS(
+            f"Loaded in {stats['load_seconds']}s, +{stats['load_rss_delta_mb']} MB "
+            f"(RSS {stats['rss_mb']} MB)"
+        ))
+        if options['stats']:
+            self.stdout.write(json.dumps(stats, indent=2))
+            return
+
+        DoclingRequestHandler.service = service
+        DoclingRequestHandler.max_bytes = getattr(settings, 'DOCLING_SERVICE_MAX_MB', 200) * 1024 * 1024
+
+        server = ThreadingHTTPServer((options['host'], options['port']), DoclingRequestHandler)
+        self.stdout.write(self.style.SUCCESS(
+            f"Docling server listening on http://{options['host']}:{options['port']}"
+        ))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self.stdout.write("\nShutting down")
+        finally:
+            server.server_close()
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.1 on 2026-10-16 10:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0049_chunk_search_vectors'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LatestQuote',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quote_type', models.CharField(choices=[('stock', 'Stock'), ('metal', 'Metal')], max_length=10)),
+                ('metal', models.CharField(blank=True, choices=[('XAU', 'Gold'), ('XAG', 'Silver'), ('XPT', 'Platinum'), ('XPD', 'Palladium'), ('CU', 'Copper'), ('NI', 'Nickel'), ('LI', 'Lithium'), ('CO', 'Cobalt'), ('REE', 'Rare Earth Elements'), ('U', 'Uranium')], max_length=3, null=True, unique=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('company', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='latest_quote', to='core.company')),
+                ('metal_price', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.metalprice')),
+                ('stock_price', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.stockprice')),
+            ],
+            options={
+                'db_table': 'latest_quotes',
+                'indexes': [models.Index(fields=['quote_type'], name='idx_latest_quote_type')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-16 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0050_latestquote'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentprocessingjob',
+            name='stage_timings',
+            field=models.JSONField(blank=True, default=dict, help_text='Seconds spent per pipeline stage (fetch, route, convert, extract, persist)'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.0.1 on 2026-10-16 14:20
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def remove_duplicate_news(apps, schema_editor):
+    """
+    Keep one row per (company, url) before 0053 adds the unique constraints.
+
+    Releases without a URL are all kept (the NewsRelease constraint excludes
+    them). Rows with a financing flag (NewsRelease) or a processing job (CompanyNews)
+    are kept in preference to plain duplicates, then the oldest row.
+    """
+    NewsRelease = apps.get_model('core', 'NewsRelease')
+    CompanyNews = apps.get_model('core', 'CompanyNews')
+
+    duplicates = (
+        NewsRelease.objects.exclude(url='').values('company_id', 'url')
+        .annotate(rows=Count('id')).filter(rows__gt=1)
+    )
+    for group in duplicates:
+        rows = list(
+            NewsRelease.objects.filter(company_id=group['company_id'], url=group['url'])
+            .order_by('id').values_list('id', 'financing_flag__id')
+        )
+        keep = next((row_id for row_id, flag_id in rows if flag_id), rows[0][0])
+        NewsRelease.objects.filter(id__in=[row_id for row_id, _ in rows if row_id != keep]).delete()
+
+    duplicates = (
+        CompanyNews.objects.values('company_id', 'source_url')
+        .annotate(rows=Count('id')).filter(rows__gt=1)
+    )
+    for group in duplicates:
+        rows = list(
+            CompanyNews.objects.filter(company_id=group['company_id'], source_url=group['source_url'])
+            .order_by('id').values_list('id', 'processing_job_id')
+        )
+        keep = next((row_id for row_id, job_id in rows if job_id), rows[0][0])
+        CompanyNews.objects.filter(id__in=[row_id for row_id, _ in rows if row_id != keep]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0051_documentprocessingjob_stage_timings'),
+    ]
+
+    operations = [
+        # Separate from the constraints: on PostgreSQL, ALTER TABLE fails while the
+        # deletes' deferred foreign key triggers are still pending in the same transaction
+        migrations.RunPython(remove_duplicate_news, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.1 on 2026-10-16 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0052_remove_duplicate_news'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='newsrelease',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('url', ''), _negated=True),
+                fields=('company', 'url'),
+                name='unique_news_release_company_url',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='companynews',
+            constraint=models.UniqueConstraint(fields=('company', 'source_url'), name='unique_company_news_company_source_url'),
+        ),
+    ]
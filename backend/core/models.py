@@ -5,6 +5,8 @@ Designed for tracking projects, investors, financings, and market intelligence
 
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 from decimal import Decimal
@@ -675,6 +677,11 @@ class MarketData(models.Model):
             models.Index(fields=['company', '-date']),
         ]
 
+    @classmethod
+    def latest_queryset(cls):
+        """One row per company - its most recent market data (single DISTINCT ON query)"""
+        return cls.objects.order_by('company_id', '-date').distinct('company_id')
+
 
 class CommodityPrice(models.Model):
     """Precious metals, base metals, and critical minerals prices"""
@@ -740,6 +747,12 @@ class NewsRelease(models.Model):
     class Meta:
         db_table = 'news_releases'
         ordering = ['-release_date']
+        constraints = [
+            # One release per URL; releases without a URL are not deduplicated
+            models.UniqueConstraint(
+                fields=['company', 'url'], condition=~models.Q(url=''), name='unique_news_release_company_url'
+            ),
+        ]
 
 
 class Document(models.Model):
@@ -794,6 +807,14 @@ class DocumentChunk(models.Model):
     # ChromaDB reference (embeddings stored in ChromaDB, not in PostgreSQL)
     chroma_id = models.CharField(max_length=100, unique=True, blank=True, null=True)
 
+    # Full-text index for exact terms (figures, drill hole IDs) - maintained by PostgreSQL
+    search_vector = models.GeneratedField(
+        expression=SearchVector('section_title', weight='A', config='english')
+        + SearchVector('text', weight='B', config='english'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -801,6 +822,7 @@ class DocumentChunk(models.Model):
         ordering = ['document', 'chunk_index']
         indexes = [
             models.Index(fields=['document', 'chunk_index']),
+            GinIndex(fields=['search_vector'], name='idx_doc_chunk_search'),
         ]
 
 
@@ -865,6 +887,14 @@ class NewsChunk(models.Model):
     source_url = models.URLField(blank=True)
     source_date = models.DateField(null=True, blank=True)
 
+    # Full-text index for exact terms - maintained by PostgreSQL
+    search_vector = models.GeneratedField(
+        expression=SearchVector('source_title', weight='A', config='english')
+        + SearchVector('text', weight='B', config='english'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -873,6 +903,7 @@ class NewsChunk(models.Model):
         indexes = [
             models.Index(fields=['company', 'content_type']),
             models.Index(fields=['source_date']),
+            GinIndex(fields=['search_vector'], name='idx_news_chunk_search'),
         ]
 
     def __str__(self):
@@ -1036,6 +1067,8 @@ class DocumentProcessingJob(models.Model):
     started_at = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     processing_time_seconds = models.IntegerField(null=True, blank=True)
+    stage_timings = models.JSONField(default=dict, blank=True,
+                                     help_text="Seconds spent per pipeline stage (fetch, route, convert, extract, persist)")
 
     # User tracking
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
@@ -4355,6 +4388,10 @@ class CompanyNews(models.Model):
         indexes = [
             models.Index(fields=['company', 'publication_date']),
         ]
+        constraints = [
+            # Conflict target for bulk upserts in core.news_ingestion
+            models.UniqueConstraint(fields=['company', 'source_url'], name='unique_company_news_company_source_url'),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.company.name})"
@@ -4568,25 +4605,23 @@ class MetalPrice(models.Model):
         """Calculate mid-market price"""
         return (self.bid_price + self.ask_price) / 2
 
+    @classmethod
+    def latest_queryset(cls):
+        """One row per metal - its most recent price (single DISTINCT ON query)"""
+        return cls.objects.order_by('metal', '-scraped_at', '-id').distinct('metal')
+
     @classmethod
     def get_latest_prices(cls):
         """Get the most recent price for each metal"""
-        from django.db.models import Max
+        if LatestQuote.is_enabled():
+            quotes = LatestQuote.objects.filter(
+                quote_type='metal', metal_price__isnull=False
+            ).select_related('metal_price')
+            prices = {quote.metal: quote.metal_price for quote in quotes}
+            if prices:
+                return prices
 
-        latest_times = cls.objects.values('metal').annotate(
-            latest=Max('scraped_at')
-        )
-
-        prices = {}
-        for item in latest_times:
-            price = cls.objects.filter(
-                metal=item['metal'],
-                scraped_at=item['latest']
-            ).first()
-            if price:
-                prices[item['metal']] = price
-
-        return prices
+        return {price.metal: price for price in cls.latest_queryset()}
 
 
 class StockPrice(models.Model):
@@ -4630,25 +4665,26 @@ class StockPrice(models.Model):
     def __str__(self):
         return f"{self.company.ticker_symbol}: ${self.close_price} ({self.date})"
 
+    @classmethod
+    def latest_queryset(cls):
+        """One row per company - its most recent price (single DISTINCT ON query)"""
+        return cls.objects.order_by('company_id', '-date').distinct('company_id')
+
     @classmethod
     def get_latest_prices(cls):
         """Get the most recent price for each company"""
-        from django.db.models import Max
-
-        latest_dates = cls.objects.values('company').annotate(
-            latest=Max('date')
-        )
-
-        prices = {}
-        for item in latest_dates:
-            price = cls.objects.filter(
-                company_id=item['company'],
-                date=item['latest']
-            ).select_related('company').first()
-            if price:
-                prices[price.company.ticker_symbol] = price
-
-        return prices
+        if LatestQuote.is_enabled():
+            quotes = LatestQuote.objects.filter(
+                quote_type='stock', stock_price__isnull=False
+            ).select_related('stock_price__company')
+            prices = {quote.stock_price.company.ticker_symbol: quote.stock_price for quote in quotes}
+            if prices:
+                return prices
+
+        return {
+            price.company.ticker_symbol: price
+            for price in cls.latest_queryset().select_related('company')
+        }
 
     @classmethod
     def get_company_history(cls, company, days=30):
@@ -4671,6 +4707,75 @@ class StockPrice(models.Model):
         ).first()
 
 
+class LatestQuote(models.Model):
+    """
+    Materialized latest price per company and per metal.
+
+    Optional (settings.LATEST_QUOTES_ENABLED): refreshed by
+    fetch_stock_prices_task and scrape_metals_prices_task so readers get
+    every latest price from one small table instead of scanning history.
+    """
+    QUOTE_TYPES = [
+        ('stock', 'Stock'),
+        ('metal', 'Metal'),
+    ]
+
+    quote_type = models.CharField(max_length=10, choices=QUOTE_TYPES)
+    company = models.OneToOneField(
+        Company, on_delete=models.CASCADE, null=True, blank=True, related_name='latest_quote'
+    )
+    metal = models.CharField(max_length=3, choices=MetalPrice.METAL_CHOICES, null=True, blank=True, unique=True)
+    stock_price = models.ForeignKey(StockPrice, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    metal_price = models.ForeignKey(MetalPrice, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'latest_quotes'
+        indexes = [
+            models.Index(fields=['quote_type'], name='idx_latest_quote_type'),
+        ]
+
+    def __str__(self):
+        return f"Latest {self.quote_type} quote: {self.company_id or self.metal}"
+
+    @staticmethod
+    def is_enabled():
+        from django.conf import settings
+        return getattr(settings, 'LATEST_QUOTES_ENABLED', False)
+
+    @classmethod
+    def refresh_stocks(cls):
+        """Point each company's quote at its latest StockPrice (one read, one upsert)"""
+        now = timezone.now()
+        quotes = [
+            cls(quote_type='stock', company_id=company_id, stock_price_id=price_id, updated_at=now)
+            for company_id, price_id in StockPrice.latest_queryset().values_list('company_id', 'id')
+        ]
+        cls.objects.bulk_create(
+            quotes,
+            update_conflicts=True,
+            unique_fields=['company'],
+            update_fields=['stock_price', 'updated_at'],
+        )
+        return len(quotes)
+
+    @classmethod
+    def refresh_metals(cls):
+        """Point each metal's quote at its latest MetalPrice (one read, one upsert)"""
+        now = timezone.now()
+        quotes = [
+            cls(quote_type='metal', metal=metal, metal_price_id=price_id, updated_at=now)
+            for metal, price_id in MetalPrice.latest_queryset().values_list('metal', 'id')
+        ]
+        cls.objects.bulk_create(
+            quotes,
+            update_conflicts=True,
+            unique_fields=['metal'],
+            update_fields=['metal_price', 'updated_at'],
+        )
+        return len(quotes)
+
+
 # ============================================================================
 # GLOSSARY MODEL
 # ============================================================================
@@ -5007,41 +5112,60 @@ class DismissedNewsURL(models.Model):
         Check if a URL or title is similar to any dismissed news for this company.
         Returns (is_similar, matched_dismissed_record) tuple.
         """
-        from difflib import SequenceMatcher
-
-        # Check exact URL match first
-        if url:
-            if cls.objects.filter(url=url).exists():
-                return True, cls.objects.filter(url=url).first()
-
-            # Check normalized URL match
-            normalized_url = cls.normalize_url(url)
-            if normalized_url:
-                match = cls.objects.filter(
-                    company=company,
-                    normalized_url=normalized_url
-                ).first()
-                if match:
-                    return True, match
+        match = cls.find_similar_dismissed(company, [(url, title)], similarity_threshold)[0]
+        return match is not None, match
+
+    @classmethod
+    def find_similar_dismissed(cls, company, items, similarity_threshold=0.85):
+        """
+        Batch version of is_similar_to_dismissed for (url, title) pairs.
+        Returns the matched dismissed record (or None) for each item, in order.
+
+        URLs are checked in one query (exact URL across companies, normalized URL
+        within the company). Titles go through the company's trigram index
+        (core.news_dedup), which runs SequenceMatcher only on candidates that can
+        reach similarity_threshold.
+        """
+        from django.db.models import Q
+        from core.news_dedup import dismissed_title_index
+
+        items = list(items)
+        matches = [None] * len(items)
+
+        urls = {url for url, _ in items if url}
+        normalized_urls = {cls.normalize_url(url) for url in urls} - {''}
+        if urls:
+            by_url, by_normalized_url = {}, {}
+            url_filter = Q(url__in=urls)
+            if normalized_urls:
+                url_filter |= Q(company=company, normalized_url__in=normalized_urls)
+            for record in cls.objects.filter(url_filter).order_by('id'):
+                by_url.setdefault(record.url, record)
+                if record.company_id == company.pk:
+                    by_normalized_url.setdefault(record.normalized_url, record)
+            for i, (url, _) in enumerate(items):
+                if url:
+                    matches[i] = by_url.get(url) or by_normalized_url.get(cls.normalize_url(url))
 
         # Check title similarity
-        if title:
-            normalized_title = cls.normalize_title(title)
-            if normalized_title:
-                # Get all dismissed titles for this company
-                dismissed_titles = cls.objects.filter(
-                    company=company,
-                    normalized_title__isnull=False
-                ).exclude(normalized_title='').values_list('normalized_title', 'id')
-
-                for dismissed_norm_title, dismissed_id in dismissed_titles:
-                    if dismissed_norm_title:
-                        # Calculate similarity ratio
-                        similarity = SequenceMatcher(None, normalized_title, dismissed_norm_title).ratio()
-                        if similarity >= similarity_threshold:
-                            return True, cls.objects.get(id=dismissed_id)
-
-        return False, None
+        pending = [
+            (i, cls.normalize_title(title)) for i, (_, title) in enumerate(items)
+            if title and matches[i] is None
+        ]
+        pending = [(i, normalized_title) for i, normalized_title in pending if normalized_title]
+        if pending:
+            index = dismissed_title_index(company)
+            matched_ids = {}
+            if len(index):
+                for i, normalized_title in pending:
+                    dismissed_id = index.find(normalized_title, similarity_threshold)
+                    if dismissed_id is not None:
+                        matched_ids[i] = dismissed_id
+            records = cls.objects.in_bulk(set(matched_ids.values()))
+            for i, dismissed_id in matched_ids.items():
+                matches[i] = records.get(dismissed_id)
+
+        return matches
 
 
 class UserAIUsage(models.Model):
@@ -0,0 +1,129 @@
+"""
+Near-duplicate lookup for dismissed news titles.
+
+DismissedNewsURL.is_similar_to_dismissed used to compare a new headline with
+every dismissed title of the company using difflib.SequenceMatcher. The
+TitleSimilarityIndex below keeps a character-trigram inverted index over
+the normalized titles. A lookup only runs SequenceMatcher on titles that
+could still reach the threshold, so the results are exactly the same as the
+full scan.
+
+Why the candidate filter is exact: SequenceMatcher's ratio is 2M / (a + b),
+where M is the total length of its matching blocks. Consecutive blocks are
+separated by at least one unmatched character, so there are at most
+(a + b - 2M) + 1 blocks. A block of length L contains L - 2 trigram
+positions, so the two titles share at least
+
+    M - 2 * (a + b - 2M + 1)  =  5M - 2(a + b) - 2
+
+trigrams (counted with multiplicity). With M >= t(a + b) / 2, any title with
+ratio >= t shares at least (2.5t - 2)(a + b) - 2 trigrams and has a length
+within [a*t / (2 - t), a*(2 - t) / t]. Titles failing either bound are
+skipped; the rest are verified with SequenceMatcher. Below t = 0.8 the
+trigram bound is vacuous and only the length bound prunes.
+
+Indexes are cached per process and company, and rebuilt when the company's
+dismissed titles change (count, newest id or total title length).
+"""
+
+import bisect
+import math
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from difflib import SequenceMatcher
+from typing import Iterable, List, Optional, Tuple
+
+INDEX_CACHE_SIZE = 256  # Companies whose index is kept per process
+EPSILON = 1e-9  # Bounds are loosened slightly so float rounding never drops a real match
+
+
+def trigram_counts(text: str) -> Counter:
+    return Counter(text[i:i + 3] for i in range(len(text) - 2))
+
+
+class TitleSimilarityIndex:
+    """Trigram inverted index over (key, normalized title) pairs"""
+
+    def __init__(self, entries: Iterable[Tuple[int, str]]):
+        self.entries = [(key, title) for key, title in entries if title]
+        self.postings = defaultdict(list)  # trigram -> [(entry position, count)]
+        for position, (_, title) in enumerate(self.entries):
+            for trigram, count in trigram_counts(title).items():
+                self.postings[trigram].append((position, count))
+        # Entry positions ordered by title length, for the length-range scan
+        self.by_length = sorted(range(len(self.entries)), key=lambda position: len(self.entries[position][1]))
+        self.lengths = [len(self.entries[position][1]) for position in self.by_length]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _positions_with_length(self, low: float, high: float) -> List[int]:
+        start = bisect.bisect_left(self.lengths, math.ceil(low))
+        end = bisect.bisect_right(self.lengths, math.floor(high))
+        return self.by_length[start:end]
+
+    def candidates(self, title: str, threshold: float) -> List[int]:
+        """Entry positions that can reach threshold, in index order"""
+        a = len(title)
+        if not a or threshold <= 0:
+            return list(range(len(self.entries)))
+        low = a * threshold / (2 - threshold) - EPSILON
+        high = a * (2 - threshold) / threshold + EPSILON
+        factor = 2.5 * threshold - 2
+
+        if factor <= 0:
+            return sorted(self._positions_with_length(low, high))
+
+        shared = defaultdict(int)
+        for trigram, count in trigram_counts(title).items():
+            for position, entry_count in self.postings.get(trigram, ()):
+                shared[position] += min(count, entry_count)
+
+        found = set()
+        for position, overlap in shared.items():
+            b = len(self.entries[position][1])
+            if low <= b <= high and overlap >= factor * (a + b) - 2 - EPSILON:
+                found.add(position)
+        # Titles short enough that the bound allows zero shared trigrams are not in the postings
+        short_limit = min(high, 2 / factor - a)
+        if short_limit >= low:
+            found.update(self._positions_with_length(low, short_limit))
+        return sorted(found)
+
+    def find(self, title: str, threshold: float) -> Optional[int]:
+        """Key of the first indexed title with SequenceMatcher ratio >= threshold, or None"""
+        for position in self.candidates(title, threshold):
+            key, indexed_title = self.entries[position]
+            matcher = SequenceMatcher(None, title, indexed_title)
+            if matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold:
+                return key
+        return None
+
+
+_index_cache = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def dismissed_title_index(company) -> TitleSimilarityIndex:
+    """Index of the company's dismissed normalized titles, keyed by DismissedNewsURL id"""
+    from django.db.models import Count, Max, Sum
+    from django.db.models.functions import Length
+    from core.models import DismissedNewsURL
+
+    titles = DismissedNewsURL.objects.filter(company=company).exclude(normalized_title='')
+    state = titles.aggregate(count=Count('id'), newest=Max('id'), size=Sum(Length('normalized_title')))
+    signature = (state['count'], state['newest'], state['size'])
+
+    with _index_cache_lock:
+        cached = _index_cache.get(company.pk)
+        if cached and cached[0] == signature:
+            _index_cache.move_to_end(company.pk)
+            return cached[1]
+
+    index = TitleSimilarityIndex(titles.order_by('id').values_list('id', 'normalized_title'))
+    with _index_cache_lock:
+        _index_cache[company.pk] = (signature, index)
+        _index_cache.move_to_end(company.pk)
+        while len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
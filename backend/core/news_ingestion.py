@@ -0,0 +1,304 @@
+"""
+Batch ingestion of scraped news.
+
+The news scrape tasks, store_news_releases and the onboarding save paths
+used to handle each scraped item on its own: an update_or_create (or two
+filter().first() lookups), a keyword scan, a dismissal check and a flag
+get_or_create, i.e. several queries per item. The helpers below take a
+company's whole batch and work in a fixed number of queries:
+
+- existing rows are prefetched in one query (by URL and, optionally, by
+  (title, release_date));
+- financing keywords are detected for all titles in one pass;
+- NewsRelease rows are inserted with bulk_create(ignore_conflicts=True) and
+  updated with bulk_update (the (company, url) constraint is partial, so it
+  cannot be an upsert conflict target); CompanyNews rows are upserted with
+  bulk_create(update_conflicts=True) on (company, source_url);
+- dismissal checks use DismissedNewsURL.find_similar_dismissed, and
+  NewsReleaseFlag / DocumentProcessingJob rows are created in bulk.
+
+A 200-item archive scrape now costs a handful of queries instead of several
+hundred.
+"""
+
+import logging
+import re
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from django.db.models import Q
+from django.utils import timezone
+
+from core.models import CompanyNews, DismissedNewsURL, DocumentProcessingJob, NewsRelease, NewsReleaseFlag
+
+logger = logging.getLogger(__name__)
+
+_keyword_matchers = {}
+
+
+def detect_keywords(titles: Sequence[str], keywords: Sequence[str]) -> List[List[str]]:
+    """
+    Keywords found in each title (lowercased substring match, keyword order).
+
+    One combined alternation pre-screens every title, so the per-keyword check
+    only runs on the few titles that contain any keyword.
+    """
+    keywords = tuple(keywords)
+    matcher = _keyword_matchers.get(keywords)
+    if matcher is None:
+        matcher = re.compile('|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)))
+        _keyword_matchers[keywords] = matcher
+
+    detected = []
+    for title in titles:
+        title_lower = (title or '').lower()
+        if matcher.search(title_lower):
+            detected.append([kw for kw in keywords if kw in title_lower])
+        else:
+            detected.append([])
+    return detected
+
+
+def _last_per_key(rows: Iterable[Dict], key: str) -> List[Dict]:
+    """Drop earlier rows with the same key (a sequential upsert would have overwritten them)"""
+    return list({row[key]: row for row in rows}.values())
+
+
+def ingest_news_releases(
+    company,
+    items: Iterable[Dict],
+    update_existing: bool = True,
+    update_fields: Optional[Sequence[str]] = None,
+    match_title_date: bool = False,
+    flag_keywords: Optional[Sequence[str]] = None,
+    flag_cutoff_date=None,
+    similarity_threshold: float = 0.85,
+) -> Dict:
+    """
+    Create or update a company's NewsRelease rows in bulk.
+
+    Args:
+        company: Company the releases belong to
+        items: Dicts with 'url', 'title', 'release_date' and any other NewsRelease
+            fields ('release_type', 'summary', 'full_text', 'is_material', ...)
+        update_existing: Overwrite rows that already exist; if False they are skipped
+        update_fields: Fields overwritten on existing rows (default: every field given)
+        match_title_date: Also treat a row with the same (title, release_date) as existing
+        flag_keywords: Financing keywords; newly created releases whose title contains
+            one, dated on/after flag_cutoff_date and not similar to a dismissed release,
+            get a pending NewsReleaseFlag
+        similarity_threshold: Title similarity for the dismissed-news check
+
+    Returns:
+        Dict with 'created', 'updated' and 'existing' (skipped) NewsRelease lists,
+        'skipped' count (including items without a URL) and the newly created 'flags'
+    """
+    items = list(items)
+    result = {'created': [], 'updated': [], 'existing': [], 'skipped': 0, 'flags': []}
+    with_url = _last_per_key((item for item in items if item.get('url')), 'url')
+    result['skipped'] = sum(1 for item in items if not item.get('url'))
+    items = with_url
+    if not items:
+        return result
+
+    # Prefetch existing rows in one query
+    existing_filter = Q(url__in=[item['url'] for item in items])
+    if match_title_date:
+        existing_filter |= Q(
+            title__in={item['title'] for item in items},
+            release_date__in={item['release_date'] for item in items},
+        )
+    by_url, by_title_date = {}, {}
+    for release in NewsRelease.objects.filter(company=company).filter(existing_filter).order_by('id'):
+        by_url.setdefault(release.url, release)
+        by_title_date.setdefault((release.title, release.release_date), release)
+
+    inserts, updates = [], []
+    for item in items:
+        existing = by_url.get(item['url'])
+        if existing is None and match_title_date:
+            existing = by_title_date.get((item['title'], item['release_date']))
+        if existing is None:
+            inserts.append(item)
+        elif not update_existing:
+            result['existing'].append(existing)
+            result['skipped'] += 1
+        else:
+            updates.append((existing, item))  # Same URL, or same (title, date) under a new URL
+
+    fields = list(update_fields or {name for item in items for name in item if name != 'url'})
+    if inserts:
+        # Rows inserted concurrently since the prefetch are left as they are
+        releases = NewsRelease.objects.bulk_create(
+            [NewsRelease(company=company, **item) for item in inserts], ignore_conflicts=True,
+        )
+        ids = dict(NewsRelease.objects.filter(
+            company=company, url__in=[release.url for release in releases]
+        ).values_list('url', 'id'))
+        for release in releases:
+            release.pk = ids.get(release.url)
+        result['created'].extend(release for release in releases if release.pk)
+
+    if updates:
+        now = timezone.now()
+        changed_fields = sorted(set(fields) | {'url'})
+        for existing, item in updates:
+            for name in changed_fields:
+                if name in item:
+                    setattr(existing, name, item[name])
+            existing.updated_at = now
+        NewsRelease.objects.bulk_update([existing for existing, _ in updates], changed_fields + ['updated_at'])
+        result['updated'].extend(existing for existing, _ in updates)
+
+    if flag_keywords and result['created']:
+        result['flags'] = flag_financing_news(
+            company, result['created'], flag_keywords,
+            cutoff_date=flag_cutoff_date, similarity_threshold=similarity_threshold,
+        )
+    return result
+
+
+def flag_financing_news(
+    company,
+    releases: Sequence[NewsRelease],
+    keywords: Sequence[str],
+    cutoff_date=None,
+    similarity_threshold: float = 0.85,
+    check_dismissed: bool = True,
+) -> List[NewsReleaseFlag]:
+    """
+    Create pending NewsReleaseFlag rows for releases whose titles contain financing keywords.
+
+    Releases dated before cutoff_date are skipped, as are releases similar to a
+    previously dismissed one (check_dismissed). Returns the flags that did not
+    exist before, with news_release loaded, for notifications.
+    """
+    candidates = []
+    for release, detected in zip(releases, detect_keywords([r.title for r in releases], keywords)):
+        if not detected or not release.release_date:
+            continue
+        if cutoff_date and release.release_date < cutoff_date:
+            logger.info(f"  [SKIP] Old news (not flagging): {release.title[:50]}... (date: {release.release_date})")
+            continue
+        candidates.append((release, detected))
+
+    if candidates and check_dismissed:
+        matches = DismissedNewsURL.find_similar_dismissed(
+            company, [(release.url, release.title) for release, _ in candidates], similarity_threshold
+        )
+        kept = []
+        for (release, detected), match in zip(candidates, matches):
+            if match is None:
+                kept.append((release, detected))
+            else:
+                logger.info(f"  [SKIP] Similar to previously dismissed: {release.title[:50]}...")
+        candidates = kept
+
+    if not candidates:
+        return []
+
+    release_ids = [release.pk for release, _ in candidates]
+    already_flagged = set(
+        NewsReleaseFlag.objects.filter(news_release_id__in=release_ids).values_list('news_release_id', flat=True)
+    )
+    NewsReleaseFlag.objects.bulk_create(
+        [
+            NewsReleaseFlag(news_release_id=release.pk, detected_keywords=detected, status='pending')
+            for release, detected in candidates if release.pk not in already_flagged
+        ],
+        ignore_conflicts=True,
+    )
+    flags = list(
+        NewsReleaseFlag.objects.filter(news_release_id__in=release_ids)
+        .exclude(news_release_id__in=already_flagged)
+        .select_related('news_release')
+    )
+    for flag in flags:
+        logger.info(f"   Flagged financing-related news: {flag.news_release.title[:60]}...")
+        logger.info(f"     Keywords: {', '.join(flag.detected_keywords)}")
+    return flags
+
+
+def upsert_company_news(company, rows: Iterable[Dict]) -> Dict:
+    """
+    Create or update a company's CompanyNews rows in bulk, keyed by source_url.
+
+    Rows are dicts with 'source_url' and the CompanyNews fields to set. Returns
+    the saved records (with is_processed / processing_job_id of existing rows)
+    and how many were created.
+    """
+    rows = _last_per_key(rows, 'source_url')
+    if not rows:
+        return {'records': [], 'created': 0}
+
+    existing = {
+        news['source_url']: news
+        for news in CompanyNews.objects.filter(
+            company=company, source_url__in=[row['source_url'] for row in rows]
+        ).values('source_url', 'id', 'is_processed', 'processing_job_id')
+    }
+    fields = sorted({name for row in rows for name in row if name != 'source_url'})
+    records = CompanyNews.objects.bulk_create(
+        [CompanyNews(company=company, **row) for row in rows],
+        update_conflicts=True,
+        unique_fields=['company', 'source_url'],
+        update_fields=fields + ['updated_at'],
+    )
+    for record in records:
+        previous = existing.get(record.source_url)
+        if previous:
+            record.pk = record.pk or previous['id']
+            record.is_processed = previous['is_processed']
+            record.processing_job_id = previous['processing_job_id']
+    if any(record.pk is None for record in records):
+        ids = dict(CompanyNews.objects.filter(
+            company=company, source_url__in=[record.source_url for record in records]
+        ).values_list('source_url', 'id'))
+        for record in records:
+            record.pk = ids.get(record.source_url)
+    return {'records': records, 'created': len(records) - len(existing)}
+
+
+def queue_news_processing_jobs(company, records: Sequence[CompanyNews], created_by=None) -> List[tuple]:
+    """
+    Create DocumentProcessingJob rows for unprocessed PDF news that has no job yet.
+
+    Jobs are linked to their CompanyNews records. Returns (record, job) pairs
+    for the jobs created.
+    """
+    pdf_records = [
+        record for record in records
+        if record.source_url and '.pdf' in record.source_url.lower() and not record.is_processed
+    ]
+    if not pdf_records:
+        return []
+
+    queued_urls = set(DocumentProcessingJob.objects.filter(
+        url__in={record.source_url for record in pdf_records}
+    ).values_list('url', flat=True))
+    pending = list({
+        record.source_url: record for record in pdf_records if record.source_url not in queued_urls
+    }.values())
+    if not pending:
+        return []
+
+    jobs = DocumentProcessingJob.objects.bulk_create([
+        DocumentProcessingJob(
+            url=record.source_url,
+            document_type='news_release',
+            company_name=company.name,
+            project_name='',
+            status='pending',
+            created_by=created_by,
+        )
+        for record in pending
+    ])
+    if any(job.pk is None for job in jobs):
+        ids = dict(DocumentProcessingJob.objects.filter(
+            url__in=[job.url for job in jobs], status='pending'
+        ).order_by('id').values_list('url', 'id'))
+        for job in jobs:
+            job.pk = ids.get(job.url)
+    for record, job in zip(pending, jobs):
+        record.processing_job = job
+    CompanyNews.objects.bulk_update(pending, ['processing_job'])
+    return list(zip(pending, jobs))
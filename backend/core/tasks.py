@@ -231,6 +231,18 @@ def process_single_job(job: DocumentProcessingJob):
         company_name = job.company_name if job.company_name else None
         project_name = job.project_name if job.project_name else None
 
+        stage_messages = {
+            'fetch': "Downloading PDF...",
+            'route': "Reading page count...",
+            'convert': "Converting PDF with Docling...",
+            'extract': "Extracting data (this may take 30-90 minutes)...",
+            'persist': "Saving extracted data...",
+        }
+
+        def on_stage(stage):
+            job.progress_message = stage_messages.get(stage, stage)
+            job.save(update_fields=['progress_message'])
+
         # Process based on document type
         if job.document_type == 'ni43101':
             job.progress_message = "Processing NI 43-101 report (this may take 30-90 minutes)..."
@@ -239,7 +251,8 @@ def process_single_job(job: DocumentProcessingJob):
             result = processor._process_ni43101_hybrid(
                 document_url=job.url,
                 company_name=company_name,
-                project_name=project_name
+                project_name=project_name,
+                on_stage=on_stage
             )
 
         elif job.document_type == 'pea':
@@ -250,7 +263,8 @@ def process_single_job(job: DocumentProcessingJob):
             result = processor._process_ni43101_hybrid(
                 document_url=job.url,
                 company_name=company_name,
-                project_name=project_name
+                project_name=project_name,
+                on_stage=on_stage
             )
 
         elif job.document_type in ['presentation', 'fact_sheet', 'news_release', 'financial_statement']:
@@ -279,6 +293,8 @@ def process_single_job(job: DocumentProcessingJob):
                 processor=processor
             )
 
+        job.stage_timings = result.get('stage_timings', {})
+
         # Check result
         if result.get('success'):
             # Update job with success
@@ -301,6 +317,12 @@ def process_single_job(job: DocumentProcessingJob):
             logger.info(f"  - Resources created: {job.resources_created}")
             logger.info(f"  - Chunks created: {job.chunks_created}")
             logger.info(f"  - Processing time: {job.duration_display}")
+            if job.stage_timings:
+                logger.info("  - Stages: " + ", ".join(f"{stage} {seconds:.1f}s" for stage, seconds in job.stage_timings.items()))
+            cache_stats = result.get('cache_stats')
+            if cache_stats:
+                logger.info(f"  - Cache: docling {'hit' if cache_stats.get('docling_hit') else 'miss'}, "
+                            f"chunks {cache_stats.get('chunk_hits', 0)} hits / {cache_stats.get('chunk_misses', 0)} misses")
 
             # Send email notification for NI 43-101 reports
             if job.document_type == 'ni43101' and job.document_id:
@@ -410,9 +432,6 @@ def scrape_company_news_task(self, company_id):
             logger.info(f"  [ONBOARDING] Cached successful URL: {successful_url}")
 
         # Process and save news releases
-        created_count = 0
-        updated_count = 0
-
         # Check if this is a new company being onboarded (no existing NewsRelease records)
         # For new companies: use 90-day rule (3 months) to show recent financing history
         # For existing companies: use 7-day rule to avoid re-flagging old news daily
@@ -421,6 +440,7 @@ def scrape_company_news_task(self, company_id):
         if is_new_company:
             logger.info(f"  [ONBOARDING] New company detected - will flag financing from last 90 days")
 
+        items = []
         for news in news_releases:
             title = news.get('title', '').strip()
             url = news.get('url', '').strip()
@@ -450,104 +470,54 @@ def scrape_company_news_task(self, company_id):
             if not release_date:
                 continue  # Skip entries without valid dates
 
-            # Create or update news release (using URL as unique identifier)
-            # SECURITY: Use update_or_create to prevent TOCTOU race condition
-            obj, created = NewsRelease.objects.update_or_create(
-                company=company,
-                url=url,
-                defaults={
-                    'title': title,
-                    'release_type': release_type,
-                    'release_date': release_date,
-                    'summary': '',
-                    'is_material': is_financial,
-                    'full_text': ''
-                }
-            )
-
-            # Also create/update CompanyNews record (used by frontend API)
-            from core.models import CompanyNews
-            news_record, _ = CompanyNews.objects.update_or_create(
-                company=company,
-                source_url=url,
-                defaults={
-                    "title": title,
-                    "publication_date": release_date,
-                    "news_type": "corporate",
-                }
-            )
-
-            # Create document processing job for PDF news releases (for vector DB)
-            if url and '.pdf' in url.lower():
-                from core.models import DocumentProcessingJob
-                # Use get_or_create to avoid race condition (TOCTOU vulnerability)
-                job, job_created = DocumentProcessingJob.objects.get_or_create(
-                    url=url,
-                    defaults={
-                        'document_type': 'news_release',
-                        'company_name': company.name,
-                        'status': 'pending'
-                    }
-                )
-                if job_created:
-                    news_record.processing_job = job
-                    news_record.save(update_fields=['processing_job'])
-
-            if created:
-                created_count += 1
-
-                # FINANCING DETECTION: Check for financing keywords in title
-                # Uses centralized constants from top of file
-                title_lower = title.lower()
-                detected_keywords = [kw for kw in ALL_FINANCING_KEYWORDS if kw in title_lower]
-
-                # If financing keywords detected, create flag for superuser review
-                # For NEW companies (onboarding): use 90-day rule to show recent financing history
-                # For EXISTING companies: use 7-day rule to avoid re-flagging old news daily
-                if detected_keywords and release_date:
-                    from core.models import NewsReleaseFlag, DismissedNewsURL
-                    from datetime import timedelta
-
-                    # Use different cutoff based on whether this is a new company
-                    cutoff_days = NEWS_FLAG_DAYS_ONBOARDING if is_new_company else NEWS_FLAG_DAYS_DAILY
-                    cutoff_date = datetime.now().date() - timedelta(days=cutoff_days)
-                    if release_date < cutoff_date:
-                        logger.info(f"  [SKIP] Old news (not flagging): {title[:50]}... (date: {release_date})")
-                        continue
-
-                    # Check if URL or title is similar to a previously dismissed news
-                    is_similar, matched_dismissed = DismissedNewsURL.is_similar_to_dismissed(
-                        company=company,
-                        url=url,
-                        title=title,
-                        similarity_threshold=NEWS_SIMILARITY_THRESHOLD
-                    )
-                    if is_similar:
-                        logger.info(f"  [SKIP] Similar to previously dismissed: {title[:50]}...")
-                        continue
-
-                    # Only create flag if one doesn't already exist
-                    flag, flag_created = NewsReleaseFlag.objects.get_or_create(
-                        news_release=obj,
-                        defaults={
-                            'detected_keywords': detected_keywords,
-                            'status': 'pending'
-                        }
-                    )
-
-                    logger.info(f"   Flagged financing-related news: {title[:60]}...")
-                    logger.info(f"     Keywords: {', '.join(detected_keywords)}")
-
-                    # Send email notification for new flags only
-                    if flag_created:
-                        try:
-                            from core.notifications import send_financing_flag_notification
-                            send_financing_flag_notification(flag, company, obj)
-                        except Exception as e:
-                            logger.warning(f"Failed to send financing flag notification: {str(e)}")
+            items.append({
+                'url': url,
+                'title': title,
+                'release_type': release_type,
+                'release_date': release_date,
+                'summary': '',
+                'is_material': is_financial,
+                'full_text': ''
+            })
+
+        # Create or update all news releases in bulk (URL is unique per company), and flag
+        # new financing news for superuser review:
+        # For NEW companies (onboarding): use 90-day rule to show recent financing history
+        # For EXISTING companies: use 7-day rule to avoid re-flagging old news daily
+        from datetime import timedelta
+        from core.news_ingestion import ingest_news_releases, upsert_company_news, queue_news_processing_jobs
+
+        cutoff_days = NEWS_FLAG_DAYS_ONBOARDING if is_new_company else NEWS_FLAG_DAYS_DAILY
+        ingested = ingest_news_releases(
+            company,
+            items,
+            flag_keywords=ALL_FINANCING_KEYWORDS,
+            flag_cutoff_date=datetime.now().date() - timedelta(days=cutoff_days),
+            similarity_threshold=NEWS_SIMILARITY_THRESHOLD
+        )
+        created_count = len(ingested['created'])
+        updated_count = len(ingested['updated'])
+
+        # Also create/update CompanyNews records (used by frontend API), and queue
+        # document processing jobs for PDF news releases (for vector DB)
+        company_news = upsert_company_news(company, [
+            {
+                'source_url': item['url'],
+                'title': item['title'],
+                'publication_date': item['release_date'],
+                'news_type': 'corporate',
+            }
+            for item in items
+        ])
+        queue_news_processing_jobs(company, company_news['records'])
 
-            else:
-                updated_count += 1
+        # Send email notification for new flags only
+        for flag in ingested['flags']:
+            try:
+                from core.notifications import send_financing_flag_notification
+                send_financing_flag_notification(flag, company, flag.news_release)
+            except Exception as e:
+                logger.warning(f"Failed to send financing flag notification: {str(e)}")
 
         # Auto-process news content into vector database for semantic search
         # SIGSEGV-SAFE: Using subprocess isolation to protect against ChromaDB Rust binding crashes
@@ -624,6 +594,7 @@ def scrape_metals_prices_task(self):
 
         if result['success']:
             logger.info(f"Successfully scraped {result['scraped']} metals prices from Kitco")
+            _refresh_latest_quotes('metals')
             return result
         else:
             logger.error(f"Metals scrape failed: {result.get('error', 'Unknown error')}")
@@ -640,6 +611,23 @@ def scrape_metals_prices_task(self):
         }
 
 
+def _refresh_latest_quotes(kind: str):
+    """Refresh the materialized latest-quote table after a price fetch (if enabled)"""
+    from .models import LatestQuote
+
+    if not LatestQuote.is_enabled():
+        return
+    try:
+        if kind == 'stocks':
+            count = LatestQuote.refresh_stocks()
+        else:
+            count = LatestQuote.refresh_metals()
+        logger.info(f"Refreshed {count} latest {kind} quotes")
+    except Exception as e:
+        # Readers fall back to querying price history directly
+        logger.error(f"Failed to refresh latest {kind} quotes: {str(e)}")
+
+
 @shared_task(bind=True, max_retries=3, retry_backoff=True, retry_backoff_max=600, retry_jitter=True, time_limit=600, soft_time_limit=580, on_failure=log_task_failure)
 def fetch_stock_prices_task(self):
     """
@@ -656,6 +644,7 @@ def fetch_stock_prices_task(self):
         from mcp_servers.stock_price_scraper import fetch_and_save_stock_prices
 
         result = fetch_and_save_stock_prices()
+        _refresh_latest_quotes('stocks')
 
         if result['success']:
             logger.info(f"Successfully fetched {result['successful']} stock prices")
@@ -883,9 +872,7 @@ def scrape_single_company_news_task(self, company_id: int):
             logger.info(f"   {company.name}: Cached successful URL: {successful_url}")
 
         # Process and save news releases
-        created_count = 0
-        updated_count = 0
-
+        items = []
         for news in news_releases:
             title = news.get('title', '').strip()
             url = news.get('url', '').strip()
@@ -907,65 +894,38 @@ def scrape_single_company_news_task(self, company_id: int):
                 logger.debug(f"   {company.name}: Skipping news with no date: {title[:60]}")
                 continue  # Skip entries without valid dates
 
-            # Create or update news release
-            # SECURITY: Use update_or_create to prevent TOCTOU race condition
-            obj, created = NewsRelease.objects.update_or_create(
-                company=company,
-                url=url,
-                defaults={
-                    'title': title,
-                    'release_type': release_type,
-                    'release_date': release_date,
-                    'summary': '',
-                    'is_material': False,
-                    'full_text': ''
-                }
-            )
+            items.append({
+                'url': url,
+                'title': title,
+                'release_type': release_type,
+                'release_date': release_date,
+                'summary': '',
+                'is_material': False,
+                'full_text': ''
+            })
+
+        # Create or update all news releases in bulk, and flag new financing news
+        # Only flag recent news (within NEWS_FLAG_DAYS_DAILY) - older news is not actionable,
+        # and never re-flag news similar to previously dismissed
+        from datetime import timedelta
+        from core.news_ingestion import ingest_news_releases
+
+        ingested = ingest_news_releases(
+            company,
+            items,
+            flag_keywords=ALL_FINANCING_KEYWORDS,
+            flag_cutoff_date=datetime.now().date() - timedelta(days=NEWS_FLAG_DAYS_DAILY),
+            similarity_threshold=NEWS_SIMILARITY_THRESHOLD
+        )
+        created_count = len(ingested['created'])
+        updated_count = len(ingested['updated'])
 
-            if created:
-                created_count += 1
-
-                # Check for financing keywords and flag
-                # Uses centralized constants from top of file (ALL_FINANCING_KEYWORDS)
-                title_lower = title.lower()
-                detected_keywords = [kw for kw in ALL_FINANCING_KEYWORDS if kw in title_lower]
-
-                # Only flag recent news (within NEWS_FLAG_DAYS_DAILY) - older news is not actionable
-                if detected_keywords and release_date:
-                    from core.models import NewsReleaseFlag, DismissedNewsURL
-                    from datetime import timedelta
-
-                    # Only flag news releases within the configured days
-                    cutoff_date = datetime.now().date() - timedelta(days=NEWS_FLAG_DAYS_DAILY)
-                    if release_date < cutoff_date:
-                        logger.info(f"  [SKIP] Old news (not flagging): {title[:50]}...")
-                    else:
-                        # Check if URL or title is similar to previously dismissed - never re-flag
-                        is_similar, matched_dismissed = DismissedNewsURL.is_similar_to_dismissed(
-                            company=company,
-                            url=url,
-                            title=title,
-                            similarity_threshold=NEWS_SIMILARITY_THRESHOLD
-                        )
-                        if is_similar:
-                            logger.info(f"  [SKIP] Similar to dismissed: {title[:50]}...")
-                        else:
-                            flag, flag_created = NewsReleaseFlag.objects.get_or_create(
-                                news_release=obj,
-                                defaults={
-                                    'detected_keywords': detected_keywords,
-                                    'status': 'pending'
-                                }
-                            )
-                            if flag_created:
-                                logger.info(f"  [FLAG] Flagged: {title[:50]}...")
-                                try:
-                                    from core.notifications import send_financing_flag_notification
-                                    send_financing_flag_notification(flag, company, obj)
-                                except Exception as e:
-                                    logger.warning(f"Notification error: {str(e)}")
-            else:
-                updated_count += 1
+        for flag in ingested['flags']:
+            try:
+                from core.notifications import send_financing_flag_notification
+                send_financing_flag_notification(flag, company, flag.news_release)
+            except Exception as e:
+                logger.warning(f"Notification error: {str(e)}")
 
         logger.info(f"   {company.name}: {created_count} new, {updated_count} updated")
         return {
@@ -1582,14 +1542,54 @@ def cleanup_browser_processes_task(self):
     can become orphaned and accumulate, consuming memory.
 
     This task:
-    1. Finds Chrome processes older than 10 minutes (should complete within that time)
+    1. Finds Chrome processes older than 10 minutes that no live Python
+       process owns (worker processes keep a long-lived browser in their
+       shared crawl engine, see mcp_servers/crawl_engine.py)
     2. Kills them gracefully, then forcefully if needed
-    3. Cleans up /tmp/playwright* directories
+    3. Cleans up /tmp/playwright* directories older than 15 minutes that no
+       running browser uses as its --user-data-dir
 
     Runs every 10 minutes to prevent memory accumulation.
     """
+    import glob
     import subprocess
     import os
+    import time
+
+    def owned_by_python(pid):
+        """True if an ancestor of pid is a Python process (a live worker's crawl engine)"""
+        current = pid
+        for _ in range(10):
+            try:
+                with open(f'/proc/{current}/stat') as f:
+                    # comm (field 2) may contain spaces; ppid follows the closing paren
+                    ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+                if ppid <= 1:
+                    return False
+                with open(f'/proc/{ppid}/comm') as f:
+                    comm = f.read().strip().lower()
+            except (OSError, ValueError, IndexError):
+                return False
+            if comm.startswith(('python', 'celery')):
+                return True
+            current = ppid
+        return False
+
+    def browser_profile_dirs():
+        """--user-data-dir paths of running Chrome/Chromium processes"""
+        dirs = set()
+        for cmdline_file in glob.glob('/proc/[0-9]*/cmdline'):
+            try:
+                with open(cmdline_file, 'rb') as f:
+                    args = f.read().decode('utf-8', errors='replace').split('\0')
+            except OSError:
+                continue
+            if not args or 'chrom' not in os.path.basename(args[0]).lower():
+                continue
+            for arg in args:
+                if arg.startswith('--user-data-dir='):
+                    dirs.add(os.path.realpath(arg.split('=', 1)[1]))
+        return dirs
 
     logger.info("[BROWSER-CLEANUP] Starting browser process cleanup...")
 
@@ -1632,13 +1632,12 @@ def cleanup_browser_processes_task(self):
                                         # Calculate process age in seconds
                                         process_age = uptime - (starttime / clk_tck)
 
-                                        # Kill if older than 10 minutes (600 seconds)
-                                        if process_age > 600:
+                                        # Kill if older than 10 minutes (600 seconds) and orphaned
+                                        if process_age > 600 and not owned_by_python(int(pid)):
                                             logger.info(f"[BROWSER-CLEANUP] Killing old Chrome process {pid} (age: {process_age/60:.1f} min)")
                                             # Try graceful kill first
                                             subprocess.run(['kill', '-15', pid], timeout=5)
                                             # Give it a moment
-                                            import time
                                             time.sleep(1)
                                             # Force kill if still running
                                             if os.path.exists(f'/proc/{pid}'):
@@ -1650,13 +1649,17 @@ def cleanup_browser_processes_task(self):
                         except Exception as e:
                             errors.append(f"Error checking process {pid}: {e}")
 
-        # Clean up old playwright temp directories
-        import glob
+        # Clean up old playwright temp directories, except profiles of running
+        # browsers (an idle worker's engine browser leaves its profile untouched)
         import shutil
+        in_use = browser_profile_dirs()
         playwright_dirs = glob.glob('/tmp/playwright_*')
         cleaned_dirs = 0
         for pdir in playwright_dirs:
             try:
+                real_dir = os.path.realpath(pdir)
+                if any(used == real_dir or used.startswith(real_dir + os.sep) for used in in_use):
+                    continue
                 # Check if directory is older than 15 minutes
                 dir_age = time.time() - os.path.getmtime(pdir)
                 if dir_age > 900:  # 15 minutes
@@ -1746,6 +1749,12 @@ def celery_worker_health_check_task(self):
                 health_data['status'] = 'warning'
                 health_data['warning'] = f'High Chrome count: {chrome_count}'
 
+        # Shared browser of this worker process (empty if it has not crawled yet)
+        from mcp_servers.crawl_engine import get_crawl_engine_stats
+        crawl_engine_stats = get_crawl_engine_stats()
+        if crawl_engine_stats:
+            health_data['crawl_engine'] = crawl_engine_stats
+
     except Exception as e:
         logger.error(f"[HEALTH-CHECK] Error collecting health data: {e}")
         health_data['error'] = str(e)
@@ -433,6 +433,24 @@ class GPUOrchestrator:
                 check=True
             )
 
+            # Copy shared text chunker used by the worker
+            subprocess.run(
+                ['scp', '-o', 'StrictHostKeyChecking=accept-new',
+                 '/var/www/goldventure/backend/mcp_servers/text_chunker.py',
+                 f'root@{self.gpu_droplet_ip}:/opt/goldventure/'],
+                timeout=60,
+                check=True
+            )
+
+            # Copy shared PDF downloader used by the worker
+            subprocess.run(
+                ['scp', '-o', 'StrictHostKeyChecking=accept-new',
+                 '/var/www/goldventure/backend/mcp_servers/pdf_downloader.py',
+                 f'root@{self.gpu_droplet_ip}:/opt/goldventure/'],
+                timeout=60,
+                check=True
+            )
+
             # Copy website crawler for scraping jobs
             subprocess.run(
                 ['scp', '-o', 'StrictHostKeyChecking=accept-new',
@@ -26,7 +26,6 @@ import sys
 import time
 import json
 import logging
-import tempfile
 import hashlib
 import signal
 import re
@@ -39,10 +38,17 @@ from dataclasses import dataclass
 from contextlib import contextmanager
 from urllib.parse import urlparse
 
-import requests
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
+try:
+    from mcp_servers.text_chunker import chunk_list
+    from mcp_servers.pdf_downloader import DownloadError, PDFDownloader, PDFStore
+except ImportError:
+    # On the GPU droplet the chunker and downloader are copied next to this script
+    from text_chunker import chunk_list
+    from pdf_downloader import DownloadError, PDFDownloader, PDFStore
+
 # Security: URL allowlist to prevent SSRF attacks
 # Only allow downloads from trusted document sources
 ALLOWED_URL_DOMAINS = [
@@ -343,6 +349,7 @@ class DocumentProcessor:
     def __init__(self):
         self.docling_converter = None
         self.embedding_model = None
+        self.downloader = None  # Created on first download (pooled session, optional PDF store)
         self._initialize_models()
 
     def _initialize_models(self):
@@ -371,9 +378,9 @@ class DocumentProcessor:
         """Download document from URL to temporary file.
 
         Security features:
-        - URL allowlist validation (SSRF prevention)
-        - File size limit (disk exhaustion prevention)
-        - Retry with exponential backoff for transient failures
+        - URL allowlist validation (SSRF prevention), also on redirects
+        - File size limit (disk exhaustion prevention), checked before the body is read
+        - Retry with exponential backoff, resuming partial downloads with HTTP Range
         """
         # Security: Validate URL against allowlist (do this before any retries)
         is_allowed, reason = is_url_allowed(url)
@@ -384,77 +391,27 @@ class DocumentProcessor:
 
         logger.info(f"Downloading document from {url} ({reason})")
 
-        # Use headers to appear as a browser (some sites block bots)
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-
-        # Retry with exponential backoff for transient network failures
-        last_error = None
-        for attempt in range(max_retries):
-            try:
-                # Shorter timeout per attempt (60s), with retries for resilience
-                timeout = 60 if attempt < max_retries - 1 else 120  # Last attempt gets longer timeout
-                response = requests.get(url, timeout=timeout, stream=True, headers=headers)
-                response.raise_for_status()
-                break  # Success, exit retry loop
-            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-                last_error = e
-                if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) + (time.time() % 1)  # Exponential backoff with jitter
-                    logger.warning(f"Download attempt {attempt + 1} failed: {e}. Retrying in {wait_time:.1f}s...")
-                    time.sleep(wait_time)
-                else:
-                    error_msg = f"Download failed after {max_retries} attempts: {e}"
-                    logger.error(error_msg)
-                    return None, error_msg
-            except requests.exceptions.HTTPError as e:
-                # Don't retry HTTP errors (4xx, 5xx) - they're usually permanent
-                error_msg = f"HTTP error downloading document: {e.response.status_code} - {e}"
-                logger.error(error_msg)
-                return None, error_msg
+        if self.downloader is None:
+            store_dir = os.environ.get('PDF_STORE_DIR')
+            store = PDFStore(Path(store_dir), max_bytes=int(os.environ.get('PDF_STORE_MAX_MB', 4096)) * 1024 * 1024) if store_dir else None
+            self.downloader = PDFDownloader(
+                max_bytes=MAX_FILE_SIZE_BYTES,
+                url_validator=is_url_allowed,
+                store=store,
+                max_retries=max_retries
+            )
 
         try:
-
-            # Security: Check content-length header if available
-            content_length = response.headers.get('content-length')
-            if content_length and int(content_length) > MAX_FILE_SIZE_BYTES:
-                error_msg = f"File too large: {int(content_length) / 1024 / 1024:.1f} MB exceeds {MAX_FILE_SIZE_BYTES / 1024 / 1024:.0f} MB limit"
-                logger.warning(error_msg)
-                return None, error_msg
-
-            # Create temp file with appropriate extension
-            suffix = '.pdf'
-            if 'content-type' in response.headers:
-                ct = response.headers['content-type'].lower()
-                if 'pdf' in ct:
-                    suffix = '.pdf'
-
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-            total_size = 0
-
-            for chunk in response.iter_content(chunk_size=8192):
-                temp_file.write(chunk)
-                total_size += len(chunk)
-
-                # Security: Enforce size limit during download
-                if total_size > MAX_FILE_SIZE_BYTES:
-                    temp_file.close()
-                    os.unlink(temp_file.name)
-                    error_msg = f"Download aborted: exceeded {MAX_FILE_SIZE_BYTES / 1024 / 1024:.0f} MB limit"
-                    logger.warning(error_msg)
-                    return None, error_msg
-
-            temp_file.close()
-            logger.info(f"Downloaded {total_size / 1024 / 1024:.2f} MB to {temp_file.name}")
-
-            return Path(temp_file.name), None
-
-        except Exception as e:
-            error_msg = f"Failed to process download: {e}"
+            result = self.downloader.download(url)
+        except DownloadError as e:
+            error_msg = f"Download failed: {e}"
             logger.error(error_msg)
             return None, error_msg
 
+        logger.info(f"Downloaded {result.size / 1024 / 1024:.2f} MB to {result.path}"
+                    + (" (from local store)" if result.from_store else ""))
+        return result.path, None
+
     def extract_text(self, file_path: Path) -> Tuple[Optional[str], int, Optional[str]]:
         """Extract text from PDF using Docling (with OCR support for image-based PDFs)"""
         try:
@@ -501,31 +458,13 @@ class DocumentProcessor:
 
 
     def chunk_text(self, text: str, chunk_size: int = 512, overlap: int = 50) -> List[Dict]:
-        """Split text into overlapping chunks"""
+        """Split text into overlapping token chunks using the shared streaming chunker"""
         if not text:
             return []
 
-        # Simple word-based chunking
-        words = text.split()
-        chunks = []
-        start = 0
-
-        while start < len(words):
-            end = min(start + chunk_size, len(words))
-            chunk_words = words[start:end]
-            chunk_text = ' '.join(chunk_words)
-
-            chunks.append({
-                'text': chunk_text,
-                'start_word': start,
-                'end_word': end,
-                'word_count': len(chunk_words)
-            })
-
-            # Move start position with overlap
-            start = end - overlap if end < len(words) else end
+        chunks = chunk_list(text, max_tokens=chunk_size, overlap_tokens=overlap, respect_headings=True)
 
-        logger.info(f"Created {len(chunks)} chunks from {len(words)} words")
+        logger.info(f"Created {len(chunks)} chunks from {len(text)} characters")
         return chunks
 
     def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
@@ -744,9 +683,9 @@ class GPUWorker:
                 """, (
                     document_id,
                     i,
-                    chunk.get('section_title', ''),
+                    (chunk.get('section_title') or '')[:500],
                     chunk['text'],
-                    chunk['word_count'],
+                    chunk['token_count'],
                     chunk_id
                 ))
 
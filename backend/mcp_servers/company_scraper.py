@@ -4,16 +4,23 @@ Uses Crawl4AI to automatically extract comprehensive company information from mi
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import re
 import sys
+import time
 import requests
+from collections import defaultdict
 from urllib.parse import urljoin, urlparse
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from bs4 import BeautifulSoup
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
+from crawl4ai import CrawlerRunConfig
+from django.conf import settings
 from core.security_utils import check_url_safety as is_safe_url
+from .crawl_engine import crawl_session
+from .date_extraction import listing_text_date_extractor
+from .html_parsing import css, page_soup
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +29,162 @@ if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 
+def probe_pdf(url: str) -> Tuple[bool, str]:
+    """
+    Check whether url serves a PDF without downloading it.
+
+    Some sites serve PDFs from URLs without a .pdf extension (/corp-presentation/,
+    /1pager/). Follows redirects; returns (is_pdf, final_url).
+    """
+    # Use stream=True to avoid downloading the whole file
+    resp = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, stream=True, timeout=10, allow_redirects=True)
+    try:
+        content_type = resp.headers.get('Content-Type', '').lower()
+        # Check if it's a PDF by content-type or by reading first bytes
+        is_pdf = 'application/pdf' in content_type
+        if not is_pdf and resp.status_code == 200:
+            is_pdf = resp.raw.read(10).startswith(b'%PDF')
+        return is_pdf, resp.url
+    finally:
+        resp.close()
+
+
+class DomainLimiter:
+    """
+    Per-domain concurrency limit for page fetches.
+
+    Unlike asyncio.Semaphore, waiting fetches are admitted by (priority, arrival)
+    so a high-priority section is not queued behind a backlog of news URLs.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(limit, 1)
+        self._active = defaultdict(int)
+        self._waiters = defaultdict(list)
+        self._order = itertools.count()
+
+    async def acquire(self, domain: str, priority: int = 0):
+        if self._active[domain] < self.limit and not self._waiters[domain]:
+            self._active[domain] += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters[domain], (priority, next(self._order), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # If the slot was already handed over, pass it on; otherwise release() skips the cancelled waiter
+            if waiter.done() and not waiter.cancelled():
+                self.release(domain)
+            raise
+
+    def release(self, domain: str):
+        waiters = self._waiters[domain]
+        while waiters:
+            _, _, waiter = heapq.heappop(waiters)
+            if not waiter.done():
+                waiter.set_result(None)  # The slot passes straight to the next waiter
+                return
+        self._active[domain] -= 1
+
+
+class _SkippedResult:
+    """Stand-in crawl result for a fetch skipped because its section ran out of time"""
+    success = False
+    html = ''
+    status_code = None
+    error_message = 'Section time budget exhausted'
+
+
+class SectionCrawler:
+    """
+    Crawler wrapper handed to the _scrape_*_page methods in concurrent mode.
+
+    Waits for a DomainLimiter slot at the section's priority before each fetch
+    (including PDF probes, which run in a thread so they do not block the other
+    sections) and skips fetches that would start after the section's deadline.
+    """
+
+    def __init__(self, crawler, limiter: DomainLimiter, section: str, priority: int, deadline: float):
+        self.crawler = crawler
+        self.limiter = limiter
+        self.section = section
+        self.priority = priority
+        self.deadline = deadline
+        self.fetched = 0
+        self.skipped = 0
+        self.wait_seconds = 0.0
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.deadline
+
+    async def arun(self, url: str, config=None, **kwargs):
+        domain = urlparse(url).netloc
+        queued = time.monotonic()
+        await self.limiter.acquire(domain, self.priority)
+        self.wait_seconds += time.monotonic() - queued
+        try:
+            if self.expired():
+                self.skipped += 1
+                return _SkippedResult()
+            self.fetched += 1
+            return await self.crawler.arun(url=url, config=config, **kwargs)
+        finally:
+            self.limiter.release(domain)
+
+    async def probe_pdf(self, url: str) -> Tuple[bool, str]:
+        domain = urlparse(url).netloc
+        queued = time.monotonic()
+        await self.limiter.acquire(domain, self.priority)
+        self.wait_seconds += time.monotonic() - queued
+        try:
+            if self.expired():
+                self.skipped += 1
+                return False, url
+            self.fetched += 1
+            return await asyncio.to_thread(probe_pdf, url)
+        finally:
+            self.limiter.release(domain)
+
+
 class CompanyDataScraper:
     """
     Comprehensive scraper for mining company websites.
     Extracts company info, team members, documents, and news.
+
+    After the homepage, sections are scraped concurrently by default
+    (COMPANY_SCRAPER_CONCURRENT); pass concurrent=False for one page at a time.
     """
 
-    def __init__(self):
+    # URL/link keywords used to find each section's pages
+    SECTION_KEYWORDS = {
+        'about': ['about', 'corporate', 'company', 'who-we-are'],
+        'team': ['team', 'management', 'leadership', 'board', 'directors', 'executives'],
+        'investors': [
+            'investor', 'shareholders', 'financial', 'reports',
+            'presentations', 'presentation',
+            'factsheet', 'fact-sheet', 'fact_sheet',
+        ],
+        'projects': ['project', 'property', 'properties', 'assets', 'operations', 'exploration'],
+        'news': ['news', 'press', 'media', 'releases'],
+        'contact': ['contact', 'connect'],
+    }
+
+    # Concurrent mode: (priority, share of the post-homepage time budget) per section.
+    # Lower priorities get domain slots first; lower-value sections stop earlier.
+    SECTION_SCHEDULE = {
+        'about': (0, 1.0),
+        'team': (1, 1.0),
+        'investors': (2, 0.9),
+        'projects': (3, 0.9),
+        'news': (4, 0.75),
+        'contact': (5, 0.5),
+    }
+
+    def __init__(self, concurrent: Optional[bool] = None):
+        if concurrent is None:
+            concurrent = getattr(settings, 'COMPANY_SCRAPER_CONCURRENT', True)
+        self.concurrent = concurrent
         self.base_url = ""
         self.domain = ""
         self.visited_urls = set()
@@ -104,11 +260,6 @@ class CompanyDataScraper:
         self.scrape_start_time = datetime.now()
         self.max_scrape_seconds = 480  # 8 minutes max for scraping
 
-        browser_config = BrowserConfig(
-            headless=True,
-            verbose=False
-        )
-
         # Fast config - reduced delays to fit within time budget
         # With ~50 potential pages, need to keep per-page time low
         crawler_config = CrawlerRunConfig(
@@ -118,104 +269,16 @@ class CompanyDataScraper:
             wait_until="domcontentloaded",
         )
 
-        async with AsyncWebCrawler(config=browser_config) as crawler:
+        async with crawl_session() as crawler:
             # 1. Scrape homepage first (gets basic info, nav structure) - ALWAYS do this
             if 'homepage' in sections:
                 logger.info(f"[SCRAPE] Scraping homepage: {self.base_url}")
                 await self._scrape_homepage(crawler, crawler_config)
 
-            # 2. Find and scrape About/Corporate section
-            if ('about' in sections or 'team' in sections) and self._should_continue_scraping('about'):
-                about_urls = self._find_section_urls(['about', 'corporate', 'company', 'who-we-are'])
-                for url in about_urls[:2]:  # Limit to 2 about pages
-                    if not self._should_continue_scraping('about pages'):
-                        break
-                    logger.info(f"[SCRAPE] Scraping about page: {url}")
-                    await self._scrape_about_page(crawler, crawler_config, url)
-
-            # 3. Find and scrape Team/Management section
-            if 'team' in sections and self._should_continue_scraping('team'):
-                team_urls = self._find_section_urls(['team', 'management', 'leadership', 'board', 'directors', 'executives'])
-                for url in team_urls[:3]:  # Limit to 3 team pages
-                    if not self._should_continue_scraping('team pages'):
-                        break
-                    logger.info(f"[SCRAPE] Scraping team page: {url}")
-                    await self._scrape_team_page(crawler, crawler_config, url)
-
-            # 4. Find and scrape Investors section
-            if 'investors' in sections and self._should_continue_scraping('investors'):
-                investor_urls = self._find_section_urls([
-                    'investor', 'shareholders', 'financial', 'reports',
-                    'presentations', 'presentation',
-                    'factsheet', 'fact-sheet', 'fact_sheet',
-                ])
-                for url in investor_urls[:5]:
-                    if not self._should_continue_scraping('investor pages'):
-                        break
-                    logger.info(f"[SCRAPE] Scraping investor page: {url}")
-                    await self._scrape_investor_page(crawler, crawler_config, url)
-
-            # 5. Find and scrape Projects section
-            if 'projects' in sections and self._should_continue_scraping('projects'):
-                project_urls = self._find_section_urls(['project', 'property', 'properties', 'assets', 'operations', 'exploration'])
-                for url in project_urls[:3]:
-                    if not self._should_continue_scraping('project pages'):
-                        break
-                    logger.info(f"[SCRAPE] Scraping projects page: {url}")
-                    await self._scrape_projects_page(crawler, crawler_config, url)
-
-                # ENHANCED: Also look for potential project pages in nav_links
-                if self._should_continue_scraping('potential projects'):
-                    potential_project_urls = self._find_potential_project_urls()
-                    for url in potential_project_urls[:5]:
-                        if not self._should_continue_scraping('potential project pages'):
-                            break
-                        if url not in self.visited_urls:
-                            logger.info(f"[SCRAPE] Scraping potential project page: {url}")
-                            await self._scrape_projects_page(crawler, crawler_config, url)
-
-                # ENHANCED: Scrape project pages found in navigation dropdown menus
-                if self._should_continue_scraping('nav dropdown projects'):
-                    nav_dropdown_projects = self.extracted_data.get('_nav_dropdown_projects', [])
-                    for url in nav_dropdown_projects[:10]:
-                        if not self._should_continue_scraping('nav dropdown project pages'):
-                            break
-                        if url not in self.visited_urls:
-                            logger.info(f"[SCRAPE] Scraping nav dropdown project page: {url}")
-                            await self._scrape_projects_page(crawler, crawler_config, url)
-
-                # After scraping listing pages, visit individual project detail pages
-                if self._should_continue_scraping('project details'):
-                    detail_urls_to_visit = []
-                    for project in self.extracted_data.get('projects', []):
-                        source_url = project.get('source_url', '')
-                        if source_url and source_url not in self.visited_urls:
-                            path = urlparse(source_url).path.rstrip('/')
-                            parts = [p for p in path.split('/') if p]
-                            if len(parts) >= 2 and parts[0] in ['projects', 'project', 'properties', 'property']:
-                                detail_urls_to_visit.append(source_url)
-
-                    for url in detail_urls_to_visit[:10]:
-                        if not self._should_continue_scraping('project detail pages'):
-                            break
-                        logger.info(f"[SCRAPE] Scraping project detail page: {url}")
-                        await self._scrape_projects_page(crawler, crawler_config, url)
-
-            # 6. Find and scrape News section
-            if 'news' in sections and self._should_continue_scraping('news'):
-                news_urls = self._find_section_urls(['news', 'press', 'media', 'releases'])
-                for url in news_urls[:20]:  # Allow more patterns for year-based archives
-                    if not self._should_continue_scraping('news pages'):
-                        break
-                    logger.info(f"[SCRAPE] Scraping news page: {url}")
-                    await self._scrape_news_page(crawler, crawler_config, url)
-
-            # 7. Find and scrape Contact section (lowest priority - skip if short on time)
-            if 'contact' in sections and self._should_continue_scraping('contact'):
-                contact_urls = self._find_section_urls(['contact', 'connect'])
-                for url in contact_urls[:1]:
-                    logger.info(f"[SCRAPE] Scraping contact page: {url}")
-                    await self._scrape_contact_page(crawler, crawler_config, url)
+            if self.concurrent:
+                await self._scrape_sections_concurrently(crawler, crawler_config, sections)
+            else:
+                await self._scrape_sections_sequentially(crawler, crawler_config, sections)
 
         # Post-process and deduplicate
         self._post_process_data()
@@ -226,6 +289,185 @@ class CompanyDataScraper:
             'urls_visited': list(self.visited_urls),
         }
 
+    async def _scrape_sections_sequentially(self, crawler, config, sections: List[str]):
+        """Scrape the sections after the homepage one page at a time, in priority order."""
+        # 2. Find and scrape About/Corporate section
+        if ('about' in sections or 'team' in sections) and self._should_continue_scraping('about'):
+            about_urls = self._find_section_urls(self.SECTION_KEYWORDS['about'])
+            for url in about_urls[:2]:  # Limit to 2 about pages
+                if not self._should_continue_scraping('about pages'):
+                    break
+                logger.info(f"[SCRAPE] Scraping about page: {url}")
+                await self._scrape_about_page(crawler, config, url)
+
+        # 3. Find and scrape Team/Management section
+        if 'team' in sections and self._should_continue_scraping('team'):
+            team_urls = self._find_section_urls(self.SECTION_KEYWORDS['team'])
+            for url in team_urls[:3]:  # Limit to 3 team pages
+                if not self._should_continue_scraping('team pages'):
+                    break
+                logger.info(f"[SCRAPE] Scraping team page: {url}")
+                await self._scrape_team_page(crawler, config, url)
+
+        # 4. Find and scrape Investors section
+        if 'investors' in sections and self._should_continue_scraping('investors'):
+            investor_urls = self._find_section_urls(self.SECTION_KEYWORDS['investors'])
+            for url in investor_urls[:5]:
+                if not self._should_continue_scraping('investor pages'):
+                    break
+                logger.info(f"[SCRAPE] Scraping investor page: {url}")
+                await self._scrape_investor_page(crawler, config, url)
+
+        # 5. Find and scrape Projects section
+        if 'projects' in sections and self._should_continue_scraping('projects'):
+            project_urls = self._find_section_urls(self.SECTION_KEYWORDS['projects'])
+            for url in project_urls[:3]:
+                if not self._should_continue_scraping('project pages'):
+                    break
+                logger.info(f"[SCRAPE] Scraping projects page: {url}")
+                await self._scrape_projects_page(crawler, config, url)
+
+            # ENHANCED: Also look for potential project pages in nav_links
+            if self._should_continue_scraping('potential projects'):
+                potential_project_urls = self._find_potential_project_urls()
+                for url in potential_project_urls[:5]:
+                    if not self._should_continue_scraping('potential project pages'):
+                        break
+                    if url not in self.visited_urls:
+                        logger.info(f"[SCRAPE] Scraping potential project page: {url}")
+                        await self._scrape_projects_page(crawler, config, url)
+
+            # ENHANCED: Scrape project pages found in navigation dropdown menus
+            if self._should_continue_scraping('nav dropdown projects'):
+                nav_dropdown_projects = self.extracted_data.get('_nav_dropdown_projects', [])
+                for url in nav_dropdown_projects[:10]:
+                    if not self._should_continue_scraping('nav dropdown project pages'):
+                        break
+                    if url not in self.visited_urls:
+                        logger.info(f"[SCRAPE] Scraping nav dropdown project page: {url}")
+                        await self._scrape_projects_page(crawler, config, url)
+
+            # After scraping listing pages, visit individual project detail pages
+            if self._should_continue_scraping('project details'):
+                for url in self._find_project_detail_urls()[:10]:
+                    if not self._should_continue_scraping('project detail pages'):
+                        break
+                    logger.info(f"[SCRAPE] Scraping project detail page: {url}")
+                    await self._scrape_projects_page(crawler, config, url)
+
+        # 6. Find and scrape News section
+        if 'news' in sections and self._should_continue_scraping('news'):
+            news_urls = self._find_section_urls(self.SECTION_KEYWORDS['news'])
+            for url in news_urls[:20]:  # Allow more patterns for year-based archives
+                if not self._should_continue_scraping('news pages'):
+                    break
+                logger.info(f"[SCRAPE] Scraping news page: {url}")
+                await self._scrape_news_page(crawler, config, url)
+
+        # 7. Find and scrape Contact section (lowest priority - skip if short on time)
+        if 'contact' in sections and self._should_continue_scraping('contact'):
+            contact_urls = self._find_section_urls(self.SECTION_KEYWORDS['contact'])
+            for url in contact_urls[:1]:
+                logger.info(f"[SCRAPE] Scraping contact page: {url}")
+                await self._scrape_contact_page(crawler, config, url)
+
+    async def _scrape_sections_concurrently(self, crawler, config, sections: List[str]):
+        """
+        Scrape the sections after the homepage at the same time.
+
+        Each page fetch waits for a slot on its domain (at most
+        COMPANY_SCRAPER_DOMAIN_CONCURRENCY pages in flight per domain), and
+        waiting pages are admitted in section priority order, so news and contact
+        only get slots the higher-priority sections leave free. A section stops
+        starting pages once its share of the remaining time budget has elapsed.
+        Each page is parsed by its _scrape_*_page method as soon as its own fetch
+        returns, while other fetches are still in flight.
+        """
+        limiter = DomainLimiter(getattr(settings, 'COMPANY_SCRAPER_DOMAIN_CONCURRENCY', 3))
+        started = time.monotonic()
+        budget = max(self._time_remaining() - 30, 0)  # Same 30s buffer as _should_continue_scraping
+        # URLs already fetched or scheduled; the first section to claim a URL scrapes it
+        claimed_urls = set(self.visited_urls)
+
+        def make_crawler(section: str) -> SectionCrawler:
+            priority, share = self.SECTION_SCHEDULE[section]
+            return SectionCrawler(crawler, limiter, section, priority, started + budget * share)
+
+        async def scrape_pages(section_crawler: SectionCrawler, urls: List[str], scrape_page):
+            urls = [url for url in dict.fromkeys(urls) if url not in claimed_urls]
+            claimed_urls.update(urls)
+
+            async def scrape(url: str):
+                if section_crawler.expired():
+                    section_crawler.skipped += 1
+                    return
+                logger.info(f"[SCRAPE] Scraping {section_crawler.section} page: {url}")
+                await scrape_page(section_crawler, config, url)
+
+            results = await asyncio.gather(*(scrape(url) for url in urls), return_exceptions=True)
+            for url, result in zip(urls, results):
+                if isinstance(result, Exception):
+                    self.errors.append(f"Error scraping {section_crawler.section} page {url}: {result}")
+
+        async def scrape_projects(section_crawler: SectionCrawler):
+            # Listing pages first; the detail pages come from the projects they found
+            listing_urls = (
+                self._find_section_urls(self.SECTION_KEYWORDS['projects'])[:3]
+                + self._find_potential_project_urls()[:5]
+                + self.extracted_data.get('_nav_dropdown_projects', [])[:10]
+            )
+            await scrape_pages(section_crawler, listing_urls, self._scrape_projects_page)
+            await scrape_pages(section_crawler, self._find_project_detail_urls()[:10], self._scrape_projects_page)
+
+        # Coroutines start in this order, so higher-priority sections claim shared URLs first
+        crawlers = []
+        jobs = []
+        if 'about' in sections or 'team' in sections:
+            crawlers.append(make_crawler('about'))
+            urls = self._find_section_urls(self.SECTION_KEYWORDS['about'])[:2]
+            jobs.append(scrape_pages(crawlers[-1], urls, self._scrape_about_page))
+        if 'team' in sections:
+            crawlers.append(make_crawler('team'))
+            urls = self._find_section_urls(self.SECTION_KEYWORDS['team'])[:3]
+            jobs.append(scrape_pages(crawlers[-1], urls, self._scrape_team_page))
+        if 'investors' in sections:
+            crawlers.append(make_crawler('investors'))
+            urls = self._find_section_urls(self.SECTION_KEYWORDS['investors'])[:5]
+            jobs.append(scrape_pages(crawlers[-1], urls, self._scrape_investor_page))
+        if 'projects' in sections:
+            crawlers.append(make_crawler('projects'))
+            jobs.append(scrape_projects(crawlers[-1]))
+        if 'news' in sections:
+            crawlers.append(make_crawler('news'))
+            urls = self._find_section_urls(self.SECTION_KEYWORDS['news'])[:20]
+            jobs.append(scrape_pages(crawlers[-1], urls, self._scrape_news_page))
+        if 'contact' in sections:
+            crawlers.append(make_crawler('contact'))
+            urls = self._find_section_urls(self.SECTION_KEYWORDS['contact'])[:1]
+            jobs.append(scrape_pages(crawlers[-1], urls, self._scrape_contact_page))
+
+        await asyncio.gather(*jobs)
+
+        for section_crawler in crawlers:
+            logger.info(
+                f"[SCRAPE] {section_crawler.section}: {section_crawler.fetched} pages fetched, "
+                f"{section_crawler.skipped} skipped (time budget), "
+                f"{section_crawler.wait_seconds:.1f}s waiting for a slot"
+            )
+        logger.info(f"[SCRAPE] Sections finished in {time.monotonic() - started:.1f}s")
+
+    def _find_project_detail_urls(self) -> List[str]:
+        """Individual project pages linked from the project listings scraped so far."""
+        detail_urls = []
+        for project in self.extracted_data.get('projects', []):
+            source_url = project.get('source_url', '')
+            if source_url and source_url not in self.visited_urls:
+                path = urlparse(source_url).path.rstrip('/')
+                parts = [p for p in path.split('/') if p]
+                if len(parts) >= 2 and parts[0] in ['projects', 'project', 'properties', 'property']:
+                    detail_urls.append(source_url)
+        return detail_urls
+
     def _find_section_urls(self, keywords: List[str]) -> List[str]:
         """Find URLs that match section keywords from discovered links."""
         matching_urls = []
@@ -582,7 +824,7 @@ class CompanyDataScraper:
                 return
 
             self.visited_urls.add(self.base_url)
-            soup = BeautifulSoup(result.html, 'html.parser')
+            soup = page_soup(result.html)
 
             # Detect Cloudflare challenge pages and retry with longer wait
             title = soup.find('title')
@@ -602,7 +844,7 @@ class CompanyDataScraper:
                 if not result.success:
                     self.errors.append(f"Failed to bypass Cloudflare for: {self.base_url}")
                     return
-                soup = BeautifulSoup(result.html, 'html.parser')
+                soup = page_soup(result.html)
                 title = soup.find('title')
                 title_text = title.get_text(strip=True) if title else ""
                 # If still showing Cloudflare, give up
@@ -716,7 +958,7 @@ class CompanyDataScraper:
                 '[class*="hero"] h1', '[class*="banner"] h1'
             ]
             for selector in hero_selectors:
-                element = soup.select_one(selector)
+                element = css(selector).select_one(soup)
                 if element:
                     text = element.get_text(strip=True)
                     if text and len(text) < 200:
@@ -729,7 +971,7 @@ class CompanyDataScraper:
                 'header img', '[class*="logo"] img', 'a.navbar-brand img'
             ]
             for selector in logo_selectors:
-                element = soup.select_one(selector)
+                element = css(selector).select_one(soup)
                 if element and element.get('src'):
                     logo_url = urljoin(self.base_url, element['src'])
                     self.extracted_data['company']['logo_url'] = logo_url
@@ -823,7 +1065,7 @@ class CompanyDataScraper:
             # Fallback: try CSS selectors if h2 method didn't work
             if not homepage_desc:
                 for selector in about_selectors:
-                    section = soup.select_one(selector)
+                    section = css(selector).select_one(soup)
                     if section:
                         paragraphs = section.find_all('p')
                         for p in paragraphs[:5]:
@@ -943,7 +1185,7 @@ class CompanyDataScraper:
             ]
             ticker_text = ""
             for selector in ticker_selectors:
-                elements = soup.select(selector)
+                elements = css(selector).select(soup)
                 for elem in elements:
                     elem_text = elem.get_text(separator=' ')
                     # Only use if it contains exchange-like text
@@ -975,7 +1217,7 @@ class CompanyDataScraper:
                             # Look for ticker patterns in iframe content
                             ticker_text += " " + iframe_content
                             # Also check for data attributes like data-qmod-params
-                            iframe_soup = BeautifulSoup(iframe_content, 'html.parser')
+                            iframe_soup = page_soup(iframe_content)
                             for elem in iframe_soup.find_all(attrs={'data-qmod-params': True}):
                                 qmod_data = elem.get('data-qmod-params', '')
                                 if qmod_data:
@@ -1196,6 +1438,12 @@ class CompanyDataScraper:
             self.errors.append(f"Homepage scraping error: {str(e)}")
             logger.error(f"[ERROR] Homepage: {str(e)}")
 
+    async def _probe_pdf(self, crawler, url: str) -> Tuple[bool, str]:
+        """probe_pdf through the section's domain limiter in concurrent mode, directly otherwise"""
+        if isinstance(crawler, SectionCrawler):
+            return await crawler.probe_pdf(url)
+        return probe_pdf(url)
+
     async def _scrape_about_page(self, crawler, config, url: str):
         """Scrape about/corporate page for company details."""
         if url in self.visited_urls:
@@ -1204,15 +1452,8 @@ class CompanyDataScraper:
         try:
             # First, check if this URL serves a PDF directly (like /corp-presentation/)
             # Some sites serve PDFs from URLs without .pdf extension
-            import requests as sync_requests
             try:
-                resp = sync_requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, stream=True, timeout=10)
-                content_type = resp.headers.get('Content-Type', '').lower()
-                is_pdf = 'application/pdf' in content_type
-                if not is_pdf and resp.status_code == 200:
-                    first_bytes = resp.raw.read(10)
-                    is_pdf = first_bytes.startswith(b'%PDF')
-                resp.close()
+                is_pdf, _ = await self._probe_pdf(crawler, url)
 
                 if is_pdf:
                     # This URL serves a PDF directly - add it as a document
@@ -1245,7 +1486,7 @@ class CompanyDataScraper:
                 return
 
             self.visited_urls.add(url)
-            soup = BeautifulSoup(result.html, 'html.parser')
+            soup = page_soup(result.html)
 
             # Extract longer description - try multiple strategies
             description = ''
@@ -1314,7 +1555,7 @@ class CompanyDataScraper:
                 '[class*="about"]', '[class*="corporate"]', 'main', '.uk-section'
             ]
             for selector in content_selectors:
-                element = soup.select_one(selector)
+                element = css(selector).select_one(soup)
                 if element:
                     # Get all paragraphs but filter out biographies
                     paragraphs = element.find_all('p')
@@ -1569,7 +1810,7 @@ class CompanyDataScraper:
                 return
 
             self.visited_urls.add(url)
-            soup = BeautifulSoup(result.html, 'html.parser')
+            soup = page_soup(result.html)
 
             # Find team member containers
             member_selectors = [
@@ -1581,7 +1822,7 @@ class CompanyDataScraper:
             members_found = []
 
             for selector in member_selectors:
-                members = soup.select(selector)
+                members = css(selector).select(soup)
                 if members:
                     for member in members:
                         person = self._extract_person_from_element(member, url)
@@ -1658,7 +1899,7 @@ class CompanyDataScraper:
         # Name
         name_selectors = ['h2', 'h3', 'h4', '.name', '.title', '[class*="name"]']
         for selector in name_selectors:
-            name_elem = element.select_one(selector)
+            name_elem = css(selector).select_one(element)
             if name_elem:
                 name = name_elem.get_text(strip=True)
                 if name and len(name) < 100 and not self._is_title(name):
@@ -1668,7 +1909,7 @@ class CompanyDataScraper:
         # Title/Position
         title_selectors = ['.position', '.title', '.role', '[class*="position"]', '[class*="title"]', 'p']
         for selector in title_selectors:
-            title_elem = element.select_one(selector)
+            title_elem = css(selector).select_one(element)
             if title_elem:
                 title = title_elem.get_text(strip=True)
                 if title and self._is_title(title) and len(title) < 100:
@@ -1683,7 +1924,7 @@ class CompanyDataScraper:
         # Bio (longer text)
         bio_selectors = ['.bio', '.biography', '.description', 'p']
         for selector in bio_selectors:
-            bio_elems = element.select(selector)
+            bio_elems = css(selector).select(element)
             for bio_elem in bio_elems:
                 bio = bio_elem.get_text(strip=True)
                 if bio and len(bio) > 50 and bio != person.get('title'):
@@ -1893,7 +2134,7 @@ class CompanyDataScraper:
                 return
 
             self.visited_urls.add(url)
-            soup = BeautifulSoup(result.html, 'html.parser')
+            soup = page_soup(result.html)
 
             # Find all PDF links on this page
             for link in soup.find_all('a', href=True):
@@ -1996,33 +2237,20 @@ class CompanyDataScraper:
             return
 
         try:
-            # First, check if this URL serves a PDF directly using requests
+            # First, check if this URL serves a PDF directly
             # Some sites serve PDFs from URLs like /1pager/ or /corp-presentation/
-            import requests as sync_requests
             try:
                 # Validate URL is safe before fetching (SSRF protection)
                 if not is_safe_url(url):
                     return
 
-                # Use stream=True to avoid downloading the whole file
-                # Use allow_redirects=True to follow redirect URLs like /presentation-link/ -> PDF
-                resp = sync_requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, stream=True, timeout=10, allow_redirects=True)
-                content_type = resp.headers.get('Content-Type', '').lower()
-                final_url = resp.url  # Get final URL after redirects
+                # Follows redirect URLs like /presentation-link/ -> PDF
+                is_pdf, final_url = await self._probe_pdf(crawler, url)
 
                 # Validate final URL after redirects (SSRF protection)
                 if not is_safe_url(final_url):
-                    resp.close()
                     return
 
-                # Check if it's a PDF by content-type or by reading first bytes
-                is_pdf = 'application/pdf' in content_type
-                if not is_pdf and resp.status_code == 200:
-                    # Read first few bytes to check for PDF signature
-                    first_bytes = resp.raw.read(10)
-                    is_pdf = first_bytes.startswith(b'%PDF')
-                resp.close()
-
                 if is_pdf:
                     # This URL serves a PDF directly - add it as a document
                     # Use original URL for visited tracking, but final_url for the document
@@ -2065,7 +2293,7 @@ class CompanyDataScraper:
                 return
 
             self.visited_urls.add(url)
-            soup = BeautifulSoup(result.html, 'html.parser')
+            soup = page_soup(result.html)
 
             # Determine the page type from the URL to help with classification
             url_lower = url.lower()
@@ -2207,7 +2435,7 @@ class CompanyDataScraper:
                 return
 
             self.visited_urls.add(url)
-            soup = BeautifulSoup(result.html, 'html.parser')
+            soup = page_soup(result.html)
             projects_found = []
 
             # Invalid project names to skip (too generic or just keywords)
@@ -2417,7 +2645,7 @@ class CompanyDataScraper:
                 ]
 
                 for selector in project_selectors:
-                    projects = soup.select(selector)
+                    projects = css(selector).select(soup)
                     if projects:
                         for proj in projects:
                             project = self._extract_project_from_element(proj, url)
@@ -2527,7 +2755,7 @@ class CompanyDataScraper:
         # Strategy 1: Look for headers with project-specific classes first
         for selector in ['.project-name', '.property-name', '[class*="project-title"]',
                         '[class*="property-title"]', 'h2.name', 'h3.name']:
-            name_elem = element.select_one(selector)
+            name_elem = css(selector).select_one(element)
             if name_elem:
                 text = name_elem.get_text(strip=True)
                 if text and self._is_valid_project_name(text):
@@ -2546,7 +2774,7 @@ class CompanyDataScraper:
 
         # Strategy 3: Standard header extraction with validation
         for selector in ['h2', 'h3', 'h4', '.title', '.name']:
-            name_elem = element.select_one(selector)
+            name_elem = css(selector).select_one(element)
             if name_elem:
                 text = name_elem.get_text(strip=True)
                 if text and self._is_valid_project_name(text):
@@ -2621,7 +2849,7 @@ class CompanyDataScraper:
                 return
 
             self.visited_urls.add(url)
-            soup = BeautifulSoup(result.html, 'html.parser')
+            soup = page_soup(result.html)
             news_found = []
 
             # ============================================================
@@ -2767,7 +2995,7 @@ class CompanyDataScraper:
             ]
 
             for selector in news_selectors:
-                items = soup.select(selector)
+                items = css(selector).select(soup)
                 if items:
                     for item in items[:30]:  # Limit to 30 news items
                         news = self._extract_news_from_element(item, url)
@@ -3429,7 +3657,7 @@ class CompanyDataScraper:
         title_url = None
 
         for selector in title_selectors:
-            elem = element.select_one(selector)
+            elem = css(selector).select_one(element)
             if elem:
                 text = elem.get_text(strip=True)
                 # Skip date-only titles and try next selector
@@ -3512,94 +3740,7 @@ class CompanyDataScraper:
         """Parse date from text using various formats."""
         if not text:
             return None
-
-        # Format 1: ISO format (2025-12-18)
-        date_match = re.search(r'(\d{4})[/-](\d{2})[/-](\d{2})', text)
-        if date_match:
-            return f"{date_match.group(1)}-{date_match.group(2)}-{date_match.group(3)}"
-
-        # Format 1.5: MM/DD/YY or MM/DD/YYYY format (01/06/26 or 01/06/2026)
-        slash_date = re.search(r'(\d{1,2})/(\d{1,2})/(\d{2,4})', text)
-        if slash_date:
-            month = slash_date.group(1).zfill(2)
-            day = slash_date.group(2).zfill(2)
-            year_str = slash_date.group(3)
-            if len(year_str) == 2:
-                year_int = int(year_str)
-                year = f"20{year_str}" if year_int <= 50 else f"19{year_str}"
-            else:
-                year = year_str
-            return f"{year}-{month}-{day}"
-
-        # Format 2: Month Day, Year (December 18, 2025)
-        month_map = {
-            'january': '01', 'february': '02', 'march': '03', 'april': '04',
-            'may': '05', 'june': '06', 'july': '07', 'august': '08',
-            'september': '09', 'october': '10', 'november': '11', 'december': '12',
-            'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-            'jun': '06', 'jul': '07', 'aug': '08', 'sep': '09',
-            'oct': '10', 'nov': '11', 'dec': '12'
-        }
-
-        month_pattern = r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[.,]?\s+(\d{1,2})\w*[.,]?\s+(\d{4})'
-        month_match = re.search(month_pattern, text, re.IGNORECASE)
-        if month_match:
-            month = month_map.get(month_match.group(1).lower(), '01')
-            day = month_match.group(2).zfill(2)
-            year = month_match.group(3)
-            return f"{year}-{month}-{day}"
-
-        # Format 3: Day Month Year (18 December 2025)
-        day_first_pattern = r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[.,]?\s+(\d{4})'
-        day_match = re.search(day_first_pattern, text, re.IGNORECASE)
-        if day_match:
-            day = day_match.group(1).zfill(2)
-            month = month_map.get(day_match.group(2).lower(), '01')
-            year = day_match.group(3)
-            return f"{year}-{month}-{day}"
-
-        # Format 4: Abbreviated month with concatenated day/year (Jan262023 or Jan 262023)
-        # This pattern is used by Grizzly Discoveries
-        abbrev_concat_pattern = r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s*(\d{1,2})(\d{4})'
-        abbrev_match = re.search(abbrev_concat_pattern, text, re.IGNORECASE)
-        if abbrev_match:
-            month = month_map.get(abbrev_match.group(1).lower(), '01')
-            day = abbrev_match.group(2).zfill(2)
-            year = abbrev_match.group(3)
-            return f"{year}-{month}-{day}"
-
-        # Format 5: MM / DD / YYYY with spaces around slashes (11 / 19 / 2024)
-        spaced_slash_pattern = r'(\d{1,2})\s*/\s*(\d{1,2})\s*/\s*(\d{4})'
-        spaced_match = re.search(spaced_slash_pattern, text)
-        if spaced_match:
-            month = spaced_match.group(1).zfill(2)
-            day = spaced_match.group(2).zfill(2)
-            year = spaced_match.group(3)
-            return f"{year}-{month}-{day}"
-
-        # Format 6: MM.DD.YY with dots and 2-digit year (12.17.25)
-        # Used by Nobel Resources and some other sites
-        dot_short_year_pattern = r'(\d{1,2})\.(\d{1,2})\.(\d{2})(?!\d)'
-        dot_match = re.search(dot_short_year_pattern, text)
-        if dot_match:
-            month = dot_match.group(1).zfill(2)
-            day = dot_match.group(2).zfill(2)
-            year_short = dot_match.group(3)
-            # Convert 2-digit year to 4-digit (assume 20xx for years 00-50, 19xx for 51-99)
-            year_int = int(year_short)
-            year = f"20{year_short}" if year_int <= 50 else f"19{year_short}"
-            return f"{year}-{month}-{day}"
-
-        # Format 7: MM.DD.YYYY with dots and 4-digit year (12.17.2025)
-        dot_full_year_pattern = r'(\d{1,2})\.(\d{1,2})\.(\d{4})'
-        dot_full_match = re.search(dot_full_year_pattern, text)
-        if dot_full_match:
-            month = dot_full_match.group(1).zfill(2)
-            day = dot_full_match.group(2).zfill(2)
-            year = dot_full_match.group(3)
-            return f"{year}-{month}-{day}"
-
-        return None
+        return listing_text_date_extractor(text)
 
     async def _scrape_contact_page(self, crawler, config, url: str):
         """Scrape contact page for address and contact info."""
@@ -3612,7 +3753,7 @@ class CompanyDataScraper:
                 return
 
             self.visited_urls.add(url)
-            soup = BeautifulSoup(result.html, 'html.parser')
+            soup = page_soup(result.html)
             page_text = soup.get_text()
 
             # Extract emails from mailto links (more reliable)
@@ -3673,7 +3814,7 @@ class CompanyDataScraper:
             # Extract address
             address_selectors = ['.address', '[class*="address"]', 'address']
             for selector in address_selectors:
-                addr_elem = soup.select_one(selector)
+                addr_elem = css(selector).select_one(soup)
                 if addr_elem:
                     self.extracted_data['contacts']['address'] = addr_elem.get_text(strip=True)
                     break
@@ -0,0 +1,368 @@
+"""
+Shared Crawl Engine
+
+Every crawl entry point used to open its own AsyncWebCrawler, so each Celery
+task launched and tore down a full Chromium. CrawlEngine keeps one browser
+per worker process and lends it to crawls through crawl_session():
+
+    async with crawl_session() as crawler:
+        result = await crawler.arun(url=url, config=crawler_config)
+
+- The browser lives on the engine's own event-loop thread, so callers can
+  await it from any loop (every task's asyncio.run() creates a new one).
+- At most CRAWL_ENGINE_MAX_PAGES pages are open at once across all sessions.
+- A browser idle for CRAWL_ENGINE_HEALTH_CHECK_IDLE seconds is health-checked
+  before reuse, and restarted if the check fails or a page reports that the
+  browser has gone away.
+- The browser is recycled (closed once in-flight pages finish, relaunched on
+  the next page) after CRAWL_ENGINE_RECYCLE_PAGES pages, or when its
+  processes exceed CRAWL_ENGINE_RECYCLE_MB of RSS.
+- stats() reports pages/sec, failures, launches, recycles and browser memory.
+
+Set CRAWL_ENGINE_ENABLED=False to go back to one browser per crawl.
+"""
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# /proc/<pid>/comm of Chromium processes launched by Playwright
+BROWSER_PROCESS_NAMES = ('chrom', 'headless_shell')
+
+# Exception text meaning the browser itself (not just the page) is gone
+BROWSER_GONE_ERRORS = (
+    'target closed', 'browser has been closed', 'browser closed',
+    'connection closed', 'has been disconnected',
+)
+
+HEALTH_CHECK_URL = "raw:<html><body>ok</body></html>"
+
+# Browser RSS is sampled every N pages (walking /proc is not free)
+RSS_SAMPLE_PAGES = 10
+
+
+def _child_pids(pid: int):
+    """Children of every thread of pid (Playwright is started from the engine thread)"""
+    children = []
+    try:
+        tids = os.listdir(f'/proc/{pid}/task')
+    except OSError:
+        return children
+    for tid in tids:
+        try:
+            with open(f'/proc/{pid}/task/{tid}/children') as f:
+                children.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return children
+
+
+def browser_rss_mb(root_pid: Optional[int] = None) -> float:
+    """Summed RSS in MB of Chromium processes descended from root_pid (default: this process)"""
+    page_mb = os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    total = 0.0
+    stack = [root_pid or os.getpid()]
+    while stack:
+        for child in _child_pids(stack.pop()):
+            stack.append(child)
+            try:
+                with open(f'/proc/{child}/comm') as f:
+                    name = f.read().strip().lower()
+                if any(browser in name for browser in BROWSER_PROCESS_NAMES):
+                    with open(f'/proc/{child}/statm') as f:
+                        total += int(f.read().split()[1]) * page_mb
+            except (OSError, ValueError, IndexError):
+                continue
+    return total
+
+
+def _browser_gone(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(text in message for text in BROWSER_GONE_ERRORS)
+
+
+class CrawlSession:
+    """Crawler handle returned by crawl_session(); the crawlers only need arun()"""
+
+    def __init__(self, engine: 'CrawlEngine'):
+        self._engine = engine
+        self.pages = 0
+
+    async def arun(self, url: str, config=None, **kwargs):
+        self.pages += 1
+        return await self._engine.arun(url, config=config, **kwargs)
+
+
+class CrawlEngine:
+    """One long-lived headless browser per process, shared by all crawls"""
+
+    def __init__(
+        self,
+        max_pages: int = 4,
+        recycle_after_pages: int = 200,
+        recycle_rss_mb: int = 1500,
+        health_check_idle_seconds: int = 60
+    ):
+        """
+        Args:
+            max_pages: Pages open at once across all sessions
+            recycle_after_pages: Relaunch the browser after this many pages (0 = never)
+            recycle_rss_mb: Relaunch when browser processes exceed this RSS (0 = never)
+            health_check_idle_seconds: Health-check a browser idle this long before reuse
+        """
+        self.max_pages = max(1, max_pages)
+        self.recycle_after_pages = recycle_after_pages
+        self.recycle_rss_mb = recycle_rss_mb
+        self.health_check_idle_seconds = health_check_idle_seconds
+
+        self._loop = None
+        self._thread_lock = threading.Lock()
+
+        # Used only on the engine loop
+        self._crawler = None
+        self._slots = asyncio.Semaphore(self.max_pages)
+        self._browser_lock = asyncio.Lock()
+        self._idle = asyncio.Condition()
+        self._active = 0
+        self._healthy = True
+        self._last_used = 0.0
+        self._pages_since_launch = 0
+        self._busy_since = None
+
+        # Metrics
+        self.pages = 0
+        self.failures = 0
+        self.launches = 0
+        self.recycles = 0
+        self.restarts = 0
+        self.busy_seconds = 0.0
+        self.browser_rss_mb = 0.0
+        self.peak_browser_rss_mb = 0.0
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._thread_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name='crawl-engine', daemon=True)
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    async def arun(self, url: str, config=None, **kwargs):
+        """Fetch url on the shared browser (AsyncWebCrawler.arun); awaitable from any event loop"""
+        future = asyncio.run_coroutine_threadsafe(self._fetch(url, config, kwargs), self._get_loop())
+        return await asyncio.wrap_future(future)
+
+    async def _fetch(self, url: str, config, kwargs: Dict):
+        async with self._slots:
+            crawler = await self._acquire_browser()
+            await self._page_started()
+            try:
+                result = await crawler.arun(url=url, config=config, **kwargs)
+            except Exception as e:
+                self.failures += 1
+                if _browser_gone(e):
+                    self._healthy = False
+                raise
+            finally:
+                await self._page_finished()
+
+            if not getattr(result, 'success', True):
+                self.failures += 1
+                if _browser_gone(Exception(getattr(result, 'error_message', '') or '')):
+                    self._healthy = False
+            return result
+
+    async def _acquire_browser(self):
+        """Running browser for the next page: recycled, health-checked or launched as needed"""
+        async with self._browser_lock:
+            if self._crawler is not None:
+                reason = self._recycle_reason()
+                if reason:
+                    # New pages wait on the lock; in-flight pages finish first
+                    await self._wait_idle()
+                    await self._close_browser(reason)
+                    self.recycles += 1
+                elif not self._healthy or (
+                    time.monotonic() - self._last_used > self.health_check_idle_seconds
+                    and not await self._health_check()
+                ):
+                    await self._wait_idle()
+                    await self._close_browser("failed health check")
+                    self.restarts += 1
+
+            if self._crawler is None:
+                await self._launch()
+            self._last_used = time.monotonic()
+            return self._crawler
+
+    def _recycle_reason(self) -> Optional[str]:
+        if self.recycle_after_pages and self._pages_since_launch >= self.recycle_after_pages:
+            return f"{self._pages_since_launch} pages"
+        if self.recycle_rss_mb and self.browser_rss_mb > self.recycle_rss_mb:
+            return f"{self.browser_rss_mb:.0f} MB RSS"
+        return None
+
+    async def _health_check(self) -> bool:
+        from crawl4ai import CrawlerRunConfig
+        try:
+            result = await asyncio.wait_for(
+                self._crawler.arun(url=HEALTH_CHECK_URL, config=CrawlerRunConfig(cache_mode="bypass")),
+                timeout=30
+            )
+            return bool(getattr(result, 'success', False))
+        except Exception as e:
+            logger.warning(f"[CRAWL ENGINE] Health check failed: {e}")
+            return False
+
+    async def _launch(self):
+        from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+        start = time.perf_counter()
+        crawler = AsyncWebCrawler(config=BrowserConfig(headless=True, verbose=False))
+        await crawler.start()
+        self._crawler = crawler
+        self._healthy = True
+        self._pages_since_launch = 0
+        self.launches += 1
+        logger.info(f"[CRAWL ENGINE] Browser launched in {time.perf_counter() - start:.1f}s "
+                    f"(pid {os.getpid()}, launch #{self.launches})")
+
+    async def _close_browser(self, reason: str):
+        crawler, self._crawler = self._crawler, None
+        if crawler is None:
+            return
+        logger.info(f"[CRAWL ENGINE] Closing browser ({reason}) after {self._pages_since_launch} pages")
+        try:
+            await asyncio.wait_for(crawler.close(), timeout=30)
+        except Exception as e:
+            logger.warning(f"[CRAWL ENGINE] Error closing browser: {e}")
+        self.browser_rss_mb = 0.0
+
+    async def _page_started(self):
+        async with self._idle:
+            if self._active == 0:
+                self._busy_since = time.monotonic()
+            self._active += 1
+
+    async def _page_finished(self):
+        async with self._idle:
+            self._active -= 1
+            self.pages += 1
+            self._pages_since_launch += 1
+            if self._active == 0:
+                self.busy_seconds += time.monotonic() - self._busy_since
+                self._busy_since = None
+                self._idle.notify_all()
+
+        if self.pages % RSS_SAMPLE_PAGES == 0:
+            self._sample_rss()
+
+    async def _wait_idle(self):
+        async with self._idle:
+            await self._idle.wait_for(lambda: self._active == 0)
+
+    def _sample_rss(self) -> float:
+        self.browser_rss_mb = browser_rss_mb()
+        self.peak_browser_rss_mb = max(self.peak_browser_rss_mb, self.browser_rss_mb)
+        return self.browser_rss_mb
+
+    def stats(self) -> Dict:
+        busy = self.busy_seconds
+        if self._busy_since is not None:
+            busy += time.monotonic() - self._busy_since
+        rss = self._sample_rss() if self._crawler is not None else 0.0
+        return {
+            'pid': os.getpid(),
+            'running': self._crawler is not None,
+            'active_pages': self._active,
+            'max_pages': self.max_pages,
+            'pages': self.pages,
+            'failures': self.failures,
+            'busy_seconds': round(busy, 1),
+            # Throughput while at least one page was loading
+            'pages_per_sec': round(self.pages / busy, 2) if busy else 0.0,
+            'launches': self.launches,
+            'recycles': self.recycles,
+            'restarts': self.restarts,
+            'pages_since_launch': self._pages_since_launch,
+            'browser_rss_mb': round(rss, 1),
+            'peak_browser_rss_mb': round(self.peak_browser_rss_mb, 1),
+        }
+
+    def shutdown(self, timeout: float = 30):
+        """Close the browser and stop the engine loop"""
+        with self._thread_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_browser("shutdown"), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"[CRAWL ENGINE] Shutdown error: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+
+
+_engine = None
+_engine_pid = None
+_engine_lock = threading.Lock()
+
+
+def get_crawl_engine() -> CrawlEngine:
+    """Process-wide crawl engine configured from CRAWL_ENGINE_* settings"""
+    global _engine, _engine_pid
+    with _engine_lock:
+        # A forked child must not reuse the parent's browser
+        if _engine is None or _engine_pid != os.getpid():
+            _engine = CrawlEngine(
+                max_pages=getattr(settings, 'CRAWL_ENGINE_MAX_PAGES', 4),
+                recycle_after_pages=getattr(settings, 'CRAWL_ENGINE_RECYCLE_PAGES', 200),
+                recycle_rss_mb=getattr(settings, 'CRAWL_ENGINE_RECYCLE_MB', 1500),
+                health_check_idle_seconds=getattr(settings, 'CRAWL_ENGINE_HEALTH_CHECK_IDLE', 60)
+            )
+            _engine_pid = os.getpid()
+        return _engine
+
+
+def get_crawl_engine_stats() -> Dict:
+    """Stats of this process's engine (empty if no crawl has used it)"""
+    if _engine is None or _engine_pid != os.getpid():
+        return {}
+    return _engine.stats()
+
+
+def shutdown_crawl_engine():
+    if _engine is not None and _engine_pid == os.getpid():
+        _engine.shutdown()
+
+
+atexit.register(shutdown_crawl_engine)
+
+
+@asynccontextmanager
+async def crawl_session():
+    """
+    Crawler for one crawl: a handle on the shared engine, or a private
+    AsyncWebCrawler when CRAWL_ENGINE_ENABLED is off
+    """
+    if not getattr(settings, 'CRAWL_ENGINE_ENABLED', True):
+        from crawl4ai import AsyncWebCrawler, BrowserConfig
+        async with AsyncWebCrawler(config=BrowserConfig(headless=True, verbose=False)) as crawler:
+            yield crawler
+        return
+
+    session = CrawlSession(get_crawl_engine())
+    start = time.perf_counter()
+    try:
+        yield session
+    finally:
+        logger.debug(f"[CRAWL ENGINE] Session finished: {session.pages} pages in {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,416 @@
+"""
+Compiled date extraction for news listing pages.
+
+parse_date_comprehensive / parse_date_standalone (website_crawler),
+CompanyDataScraper._parse_date_text and MiningNewsScraper._parse_date each
+ran a chain of re.match / re.search calls with inline pattern strings (and
+their own month tables) on every anchor and element of every listing page.
+They are now DateExtractor instances over the rules below:
+
+- patterns are compiled once, and share one month table (MONTH_MAP);
+- text without a digit is rejected up front, since every format has one
+  (most listing-page text is navigation, "Read More" and titles);
+- results are memoized per text in an LRU cache keyed by the current date,
+  because a few rules infer the year or the DD/MM order from today's date;
+- rules are grouped into tiers. The tiers run in a fixed order. Within a
+  tier, rules are reordered by how often they have matched. A tier only
+  holds rules that can never give different results for the same text
+  (disjoint or equivalent formats), so the order never changes an answer.
+  Search-anywhere rules, where the first pattern to match wins, keep
+  one tier each.
+
+Each extractor keeps hit counters per rule (see DateExtractor.stats).
+"""
+
+import re
+import threading
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence
+
+MEMO_SIZE = 8192  # Distinct texts memoized per extractor
+REORDER_EVERY = 1000  # Uncached extractions between re-ranking rules by hits
+
+MONTH_MAP = {
+    'jan': '01', 'january': '01', 'feb': '02', 'february': '02',
+    'mar': '03', 'march': '03', 'apr': '04', 'april': '04',
+    'may': '05', 'jun': '06', 'june': '06', 'jul': '07', 'july': '07',
+    'aug': '08', 'august': '08', 'sep': '09', 'sept': '09', 'september': '09',
+    'oct': '10', 'october': '10', 'nov': '11', 'november': '11',
+    'dec': '12', 'december': '12'
+}
+
+MONTHS = 'January|February|March|April|May|June|July|August|September|October|November|December'
+MONTH_ABBREVIATIONS = 'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec'
+
+_DIGIT = re.compile(r'\d')
+_ORDINAL_SUFFIX = re.compile(r'(\d)(st|nd|rd|th)\b')
+
+
+def month_number(name: str) -> str:
+    """Two-digit month for a month name or abbreviation"""
+    return MONTH_MAP.get(name.lower(), '01')
+
+
+def _expand_year(year: str) -> str:
+    """Two-digit years: 00-50 -> 20xx, 51-99 -> 19xx"""
+    if len(year) == 2:
+        return f"20{year}" if int(year) <= 50 else f"19{year}"
+    return year
+
+
+def _day_month_or_month_day(year: str, first: str, second: str) -> str:
+    """
+    Ambiguous numeric date (both parts <= 12): DD/MM unless that would be more
+    than 7 days in the future while MM/DD is not.
+    """
+    dd_mm_date = f"{year}-{second}-{first}"
+    mm_dd_date = f"{year}-{first}-{second}"
+    try:
+        future_threshold = datetime.now() + timedelta(days=7)
+        if (datetime.strptime(dd_mm_date, '%Y-%m-%d') > future_threshold
+                and datetime.strptime(mm_dd_date, '%Y-%m-%d') <= future_threshold):
+            return mm_dd_date
+    except (ValueError, TypeError):
+        pass
+    return dd_mm_date
+
+
+class DateRule:
+    """One compiled date format and the handler that turns its match into a result"""
+
+    def __init__(self, name: str, pattern: str, handler: Callable, flags: int = 0, anchored: bool = False):
+        self.name = name
+        self.pattern = re.compile(pattern, flags)
+        self.find = self.pattern.match if anchored else self.pattern.search
+        self.handler = handler  # (match, text) -> result, or None to fall through
+        self.hits = 0
+
+
+class DateExtractor:
+    """
+    Runs tiers of DateRules over a text and returns the first rule's result.
+
+    Rules in the same tier must never give different results for the same
+    text; they are re-ranked by hit count as the extractor runs.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        tiers: Sequence[Sequence[DateRule]],
+        preprocess: Optional[Callable[[str], str]] = None,
+        fallback: Optional[Callable[[str], object]] = None,
+        memo_size: int = MEMO_SIZE,
+    ):
+        self.name = name
+        self.tiers = [list(tier) for tier in tiers]
+        self.preprocess = preprocess
+        self.fallback = fallback or (lambda text: None)
+        self.calls = 0
+        self.rejected = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._memo = lru_cache(maxsize=memo_size)(self._extract)
+
+    def __call__(self, text: str):
+        self.calls += 1
+        if self.preprocess:
+            text = self.preprocess(text)
+        if not _DIGIT.search(text):
+            self.rejected += 1
+            return self.fallback(text)
+        return self._memo(text, date.today())
+
+    def _extract(self, text: str, today: date):
+        self.misses += 1
+        if self.misses % REORDER_EVERY == 0:
+            self._reorder()
+        for tier in self.tiers:
+            for rule in tier:
+                match = rule.find(text)
+                if match:
+                    result = rule.handler(match, text)
+                    if result is not None:
+                        rule.hits += 1
+                        return result
+        return self.fallback(text)
+
+    def _reorder(self):
+        with self._lock:
+            self.tiers = [
+                sorted(tier, key=lambda rule: -rule.hits) if len(tier) > 1 else tier
+                for tier in self.tiers
+            ]
+
+    def stats(self) -> Dict:
+        memo = self._memo.cache_info()
+        return {
+            'calls': self.calls,
+            'rejected_without_digit': self.rejected,
+            'memo_hits': memo.hits,
+            'memo_size': memo.currsize,
+            'rule_order': [[rule.name for rule in tier] for tier in self.tiers],
+            'rule_hits': {rule.name: rule.hits for tier in self.tiers for rule in tier},
+        }
+
+    def reset_stats(self):
+        self.calls = self.rejected = self.misses = 0
+        self._memo.cache_clear()
+        for tier in self.tiers:
+            for rule in tier:
+                rule.hits = 0
+
+
+# ============================================================================
+# Leading / embedded dates in titles (parse_date_comprehensive)
+# Returns (date_str, text with a leading date removed)
+# ============================================================================
+
+def _rest(match, group):
+    return match.group(group).strip() if match.group(group) else ''
+
+
+def _leading_dotted(match, text):
+    first, second = match.group(1).zfill(2), match.group(2).zfill(2)
+    year = _expand_year(match.group(3))
+    first_int, second_int = int(first), int(second)
+    if 1 <= first_int <= 12 and 1 <= second_int <= 31:
+        return f"{year}-{first}-{second}", _rest(match, 4)
+    if 1 <= second_int <= 12 and 1 <= first_int <= 31:
+        return f"{year}-{second}-{first}", _rest(match, 4)
+    return None
+
+
+def _leading_month_name(month_group, day_group, year_group, rest_group):
+    def handler(match, text):
+        month = month_number(match.group(month_group))
+        return f"{match.group(year_group)}-{month}-{match.group(day_group).zfill(2)}", _rest(match, rest_group)
+    return handler
+
+
+def _leading_day_month_title(match, text):
+    """Kuya Silver: "22DecKuya Silver..." - no year, last year if the month is still ahead"""
+    month = month_number(match.group(2))
+    now = datetime.now()
+    year = now.year if int(month) <= now.month else now.year - 1
+    return f"{year}-{month}-{match.group(1).zfill(2)}", match.group(3)
+
+
+def _leading_slashed_short_year(match, text):
+    first, second = match.group(1).zfill(2), match.group(2).zfill(2)
+    year = _expand_year(match.group(3))
+    first_int, second_int = int(first), int(second)
+    if first_int > 12 and 1 <= second_int <= 12:
+        date_str = f"{year}-{second}-{first}"
+    elif second_int > 12 and 1 <= first_int <= 12:
+        date_str = f"{year}-{first}-{second}"
+    elif 1 <= first_int <= 12 and 1 <= second_int <= 12:
+        date_str = _day_month_or_month_day(year, first, second)
+    else:
+        return None
+    return date_str, match.group(4).strip()
+
+
+def _embedded_compact(match, text):
+    year, month, day = match.groups()
+    if 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
+        return f"{year}-{month}-{day}", text
+    return None
+
+
+def _embedded_month_name(match, text):
+    month = month_number(match.group(1)[:3])
+    return f"{match.group(3)}-{month}-{match.group(2).zfill(2)}", text
+
+
+def _embedded_slashed(match, text):
+    first, second = match.group(1).zfill(2), match.group(2).zfill(2)
+    year = match.group(3)
+    first_int, second_int = int(first), int(second)
+    if first_int > 12 and 1 <= second_int <= 12:
+        return f"{year}-{second}-{first}", text
+    if second_int > 12 and 1 <= first_int <= 12:
+        return f"{year}-{first}-{second}", text
+    if 1 <= first_int <= 12 and 1 <= second_int <= 12:
+        return _day_month_or_month_day(year, first, second), text
+    return None
+
+
+leading_date_extractor = DateExtractor(
+    'leading',
+    tiers=[
+        # Dates at the start of the text (disjoint formats), the rest becomes the title
+        [
+            DateRule('dotted', r'^(\d{1,2})\.(\d{1,2})\.(20\d{2}|\d{2})\s*[-–]?\s*(.*)$',
+                     _leading_dotted, anchored=True),
+            DateRule('month_name', rf'^({MONTHS})\s+(\d{{1,2}}),?\s*(20\d{{2}})\s*[-–]?\s*(.*)$',
+                     _leading_month_name(1, 2, 3, 4), re.IGNORECASE, anchored=True),
+            DateRule('day_month_title', rf'^(\d{{1,2}})({MONTH_ABBREVIATIONS})([A-Z].*)',
+                     _leading_day_month_title, anchored=True),
+            DateRule('slashed_short_year', r'^(\d{1,2})/(\d{1,2})/(\d{2})\s+(.*)$',
+                     _leading_slashed_short_year, anchored=True),
+            DateRule('month_abbreviation', rf'^({MONTH_ABBREVIATIONS})\.?\s*(\d{{1,2}})\s*,?\s*(20\d{{2}})\s*[-–]?\s*(.*)$',
+                     _leading_month_name(1, 2, 3, 4), re.IGNORECASE, anchored=True),
+        ],
+        # Dates anywhere in the text (text is returned unchanged), first format found wins
+        [DateRule('compact', r'(20\d{2})(\d{2})(\d{2})', _embedded_compact)],
+        [DateRule('iso', r'(20\d{2})[_-](\d{2})[_-](\d{2})', _embedded_compact)],
+        [DateRule('month_name_anywhere', rf'({MONTHS}|{MONTH_ABBREVIATIONS})\.?\s+(\d{{1,2}}),?\s*(20\d{{2}})',
+                  _embedded_month_name, re.IGNORECASE)],
+        [DateRule('slashed_anywhere', r'(\d{1,2})/(\d{1,2})/(20\d{2})', _embedded_slashed)],
+    ],
+    preprocess=str.strip,
+    fallback=lambda text: (None, text),
+)
+
+
+# ============================================================================
+# Dedicated date elements (parse_date_standalone)
+# The whole text must be the date; every format is disjoint, so one tier
+# ============================================================================
+
+def _standalone_preprocess(text):
+    return _ORDINAL_SUFFIX.sub(r'\1', text.strip())
+
+
+def _standalone_dotted(match, text):
+    first, second, year = match.groups()
+    if len(year) == 2:
+        year = f"20{year}"
+    first_int, second_int = int(first), int(second)
+    if first_int > 12 and 1 <= second_int <= 12:
+        return f"{year}-{second.zfill(2)}-{first.zfill(2)}"
+    if second_int > 12 and 1 <= first_int <= 12:
+        return f"{year}-{first.zfill(2)}-{second.zfill(2)}"
+    if 1 <= first_int <= 12 and 1 <= second_int <= 31:
+        # Ambiguous: MM.DD.YYYY, as on North American mining sites (Aztec Minerals: 01.07.2026)
+        return f"{year}-{first.zfill(2)}-{second.zfill(2)}"
+    return f"{year}-{second.zfill(2)}-{first.zfill(2)}"
+
+
+def _standalone_slashed(match, text):
+    first, second, year = match.groups()
+    if len(year) == 2:
+        year = f"20{year}"
+    first_int, second_int = int(first), int(second)
+    if first_int > 12 and 1 <= second_int <= 12:
+        return f"{year}-{second.zfill(2)}-{first.zfill(2)}"
+    if second_int > 12 and 1 <= first_int <= 12:
+        return f"{year}-{first.zfill(2)}-{second.zfill(2)}"
+    if 1 <= first_int <= 12 and 1 <= second_int <= 12:
+        return _day_month_or_month_day(year, first.zfill(2), second.zfill(2))
+    return f"{year}-{second.zfill(2)}-{first.zfill(2)}"
+
+
+def _month_day_year(month_group, day_group, year_group):
+    def handler(match, text):
+        month = month_number(match.group(month_group))
+        return f"{match.group(year_group)}-{month}-{match.group(day_group).zfill(2)}"
+    return handler
+
+
+def _standalone_month_day(match, text):
+    """Freegold Ventures: "Jan 15" - no year, last year if the date is still ahead"""
+    month = month_number(match.group(1))
+    day = match.group(2).zfill(2)
+    now = datetime.now()
+    month_int, day_int = int(month), int(day)
+    if month_int > now.month or (month_int == now.month and day_int > now.day):
+        year = now.year - 1
+    else:
+        year = now.year
+    return f"{year}-{month}-{day}"
+
+
+standalone_date_extractor = DateExtractor(
+    'standalone',
+    tiers=[[
+        DateRule('dotted', r'^(\d{1,2})\.(\d{1,2})\.(20\d{2}|\d{2})$', _standalone_dotted, anchored=True),
+        # 1911 Gold: December 17, 2025
+        DateRule('month_day_year', rf'^({MONTHS})\s+(\d{{1,2}}),?\s*(20\d{{2}})$',
+                 _month_day_year(1, 2, 3), re.IGNORECASE, anchored=True),
+        # GoldMining: January 22 / 2026
+        DateRule('month_day_slash_year', rf'^({MONTHS})\s+(\d{{1,2}})\s*/\s*(20\d{{2}})$',
+                 _month_day_year(1, 2, 3), re.IGNORECASE, anchored=True),
+        # Cantex: 28 JANUARY 2026
+        DateRule('day_month_year', rf'^(\d{{1,2}})\s+({MONTHS})\s+(20\d{{2}})$',
+                 _month_day_year(2, 1, 3), re.IGNORECASE, anchored=True),
+        # Firefox Gold: 20 Jan, 2026
+        DateRule('day_mon_year', rf'^(\d{{1,2}})\s+({MONTH_ABBREVIATIONS}),?\s+(20\d{{2}})$',
+                 _month_day_year(2, 1, 3), re.IGNORECASE, anchored=True),
+        # Aston Bay: Nov 17 2025
+        DateRule('mon_day_year', rf'^({MONTH_ABBREVIATIONS})\s+(\d{{1,2}})\s+(20\d{{2}})$',
+                 _month_day_year(1, 2, 3), re.IGNORECASE, anchored=True),
+        # 55 North Mining: Jul 7, 2025
+        DateRule('mon_day_comma_year', rf'^({MONTH_ABBREVIATIONS})\s+(\d{{1,2}}),\s*(20\d{{2}})$',
+                 _month_day_year(1, 2, 3), re.IGNORECASE, anchored=True),
+        # Morien Resources: Dec. 17, 2025
+        DateRule('mon_dot_day_year', rf'^({MONTH_ABBREVIATIONS})\.\s*(\d{{1,2}}),?\s*(20\d{{2}})$',
+                 _month_day_year(1, 2, 3), re.IGNORECASE, anchored=True),
+        DateRule('slashed', r'^(\d{1,2})/(\d{1,2})/(20\d{2}|\d{2})$', _standalone_slashed, anchored=True),
+        # Freegold Ventures: Jan 15
+        DateRule('mon_day', rf'^({MONTH_ABBREVIATIONS})\s+(\d{{1,2}})$',
+                 _standalone_month_day, re.IGNORECASE, anchored=True),
+    ]],
+    preprocess=_standalone_preprocess,
+)
+
+
+# ============================================================================
+# Dates anywhere in listing-page element text (CompanyDataScraper._parse_date_text)
+# ============================================================================
+
+def _year_month_day(match, text):
+    return f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
+
+
+def _month_day_numeric(match, text):
+    """MM/DD with a 2- or 4-digit year"""
+    return f"{_expand_year(match.group(3))}-{match.group(1).zfill(2)}-{match.group(2).zfill(2)}"
+
+
+listing_text_date_extractor = DateExtractor(
+    'listing_text',
+    tiers=[
+        [DateRule('iso', r'(\d{4})[/-](\d{2})[/-](\d{2})', _year_month_day)],
+        [DateRule('slashed', r'(\d{1,2})/(\d{1,2})/(\d{2,4})', _month_day_numeric)],
+        [DateRule('month_day_year', rf'({MONTHS}|{MONTH_ABBREVIATIONS})[.,]?\s+(\d{{1,2}})\w*[.,]?\s+(\d{{4}})',
+                  _month_day_year(1, 2, 3), re.IGNORECASE)],
+        [DateRule('day_month_year', rf'(\d{{1,2}})\s+({MONTHS}|{MONTH_ABBREVIATIONS})[.,]?\s+(\d{{4}})',
+                  _month_day_year(2, 1, 3), re.IGNORECASE)],
+        # Grizzly Discoveries: Jan262023
+        [DateRule('mon_day_year_concatenated', rf'({MONTH_ABBREVIATIONS})\s*(\d{{1,2}})(\d{{4}})',
+                  _month_day_year(1, 2, 3), re.IGNORECASE)],
+        [DateRule('spaced_slashed', r'(\d{1,2})\s*/\s*(\d{1,2})\s*/\s*(\d{4})', _month_day_numeric)],
+        # Nobel Resources: 12.17.25
+        [DateRule('dotted_short_year', r'(\d{1,2})\.(\d{1,2})\.(\d{2})(?!\d)', _month_day_numeric)],
+        [DateRule('dotted', r'(\d{1,2})\.(\d{1,2})\.(\d{4})', _month_day_numeric)],
+    ],
+)
+
+
+# ============================================================================
+# Article pages and feeds (MiningNewsScraper._parse_date)
+# ============================================================================
+
+article_date_extractor = DateExtractor(
+    'article',
+    tiers=[
+        [DateRule('iso', r'(\d{4})-(\d{2})-(\d{2})', _year_month_day)],
+        [DateRule('month_day_year', rf'({MONTHS}|{MONTH_ABBREVIATIONS})[.\s]+(\d{{1,2}})[,\s]+(\d{{4}})',
+                  _month_day_year(1, 2, 3), re.IGNORECASE)],
+        [DateRule('day_month_year', rf'(\d{{1,2}})[.\s]+({MONTHS}|{MONTH_ABBREVIATIONS})[.\s]+(\d{{4}})',
+                  _month_day_year(2, 1, 3), re.IGNORECASE)],
+        [DateRule('numeric', r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', _month_day_numeric)],
+    ],
+)
+
+EXTRACTORS: List[DateExtractor] = [
+    leading_date_extractor, standalone_date_extractor, listing_text_date_extractor, article_date_extractor,
+]
+
+
+def date_extraction_stats() -> Dict[str, Dict]:
+    """Hit counters and current rule order of every extractor"""
+    return {extractor.name: extractor.stats() for extractor in EXTRACTORS}
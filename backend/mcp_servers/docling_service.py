@@ -0,0 +1,540 @@
+"""
+Shared Docling Converter Service
+
+Docling's layout and table-structure models take seconds and hundreds of MB
+to load, so the DocumentConverter is built once per process and shared by
+every HybridDocumentProcessor (one per queued job, one per chat session).
+
+- LocalDoclingService: lazily builds the converter on first use (or at
+  Celery worker start, see config/celery.py) and serialises conversions
+  through a lock; reports load time and resident memory. Long PDFs can
+  instead be converted in page windows across shard worker processes
+  (DOCLING_SHARD_MIN_PAGES, mcp_servers.docling_shard_worker); the windows
+  are stitched back in page order with "[Page N]" markers so page-based
+  decomposition keeps real page numbers. The workers are started with
+  subprocess, like core.chromadb_worker, so sharding also works inside
+  Celery prefork workers; if they cannot run, sharding is switched off for
+  the process.
+- RemoteDoclingService: sends PDFs to an out-of-process converter started
+  with `python manage.py run_docling_server`, so several workers share one
+  copy of the models. Enabled by setting DOCLING_SERVICE_URL.
+
+Both return the same dict: {'text', 'tables', 'page_count'}.
+"""
+
+import json
+import logging
+import os
+import queue
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+SHARD_WORKER_COMMAND = [sys.executable, '-m', 'mcp_servers.docling_shard_worker']
+SHARD_RESULT_MARKER = 'DOCLING_SHARD_RESULT:'
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MB"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        # No /proc (macOS): fall back to the peak RSS
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def count_pdf_pages(pdf_path: Path) -> Optional[int]:
+    """
+    Page count from the PDF page tree, without rendering or converting pages
+
+    Returns None if the PDF cannot be read.
+    """
+    try:
+        from pypdf import PdfReader
+        return len(PdfReader(str(pdf_path)).pages)
+    except Exception as e:
+        logger.warning(f"[DOCLING] Could not read page tree of {Path(pdf_path).name}: {e}")
+        return None
+
+
+def _table_entry(item) -> Dict:
+    return {
+        'caption': item.caption if hasattr(item, 'caption') else None,
+        'data': item.export_to_markdown() if hasattr(item, 'export_to_markdown') else str(item)
+    }
+
+
+def docling_document_to_data(doc) -> Dict:
+    """Flatten a converted DoclingDocument into text, markdown tables and page count"""
+    from docling_core.types.doc import TableItem
+
+    tables = []
+    for item, _ in doc.iterate_items():
+        if isinstance(item, TableItem):
+            tables.append(_table_entry(item))
+
+    return {
+        'text': doc.export_to_markdown(),
+        'tables': tables,
+        'page_count': len(doc.pages) if hasattr(doc, 'pages') else 0
+    }
+
+
+PAGE_MARKER = "[Page {}]"
+
+# Converter owned by a shard worker process, reused across windows
+_window_converter = None
+
+
+def _get_window_converter():
+    global _window_converter
+    if _window_converter is None:
+        from docling.document_converter import DocumentConverter
+        _window_converter = DocumentConverter()
+    return _window_converter
+
+
+def _convert_page_window(pdf_path: str, first_page: int, last_page: int) -> Dict:
+    """Convert pages first_page..last_page (1-based, inclusive); runs in a shard worker"""
+    from docling_core.types.doc import TableItem
+
+    doc = _get_window_converter().convert(pdf_path, page_range=(first_page, last_page)).document
+
+    pages = [(page_no, doc.export_to_markdown(page_no=page_no)) for page_no in sorted(doc.pages)]
+    tables = []
+    for item, _ in doc.iterate_items():
+        if isinstance(item, TableItem):
+            entry = _table_entry(item)
+            entry['page'] = item.prov[0].page_no if getattr(item, 'prov', None) else first_page
+            tables.append(entry)
+    return {'pages': pages, 'tables': tables}
+
+
+def page_windows(page_count: int, window: int) -> List[Tuple[int, int]]:
+    """Split pages 1..page_count into (first, last) windows of at most window pages"""
+    return [(first, min(first + window - 1, page_count)) for first in range(1, page_count + 1, window)]
+
+
+def stitch_page_windows(windows: List[Dict]) -> Dict:
+    """Join converted windows in page order; each page's markdown follows a [Page N] marker"""
+    pages = sorted((page for w in windows for page in w['pages']), key=lambda page: page[0])
+    tables = sorted((table for w in windows for table in w['tables']), key=lambda table: table['page'])
+    return {
+        'text': "\n\n".join(f"{PAGE_MARKER.format(page_no)}\n\n{markdown}" for page_no, markdown in pages),
+        'tables': tables,
+        'page_count': len(pages)
+    }
+
+
+def available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+class ShardWorkerError(Exception):
+    """A shard worker could not be started or crashed"""
+
+
+class ShardWorkerTimeout(ShardWorkerError):
+    """A shard worker did not answer in time (it is killed and replaced on the next document)"""
+
+
+class ShardWorker:
+    """
+    One long-lived page-window converter process.
+
+    Jobs are written to stdin as JSON lines; a reader thread forwards result
+    lines from stdout to a queue so waits can time out (as in
+    core.chromadb_isolated.ChromaWorker).
+    """
+
+    def __init__(self):
+        self._stderr = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(
+            SHARD_WORKER_COMMAND,
+            cwd=str(BACKEND_DIR),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr,
+            text=True,
+            bufsize=1,
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings')}
+        )
+        self._results = queue.Queue()
+        self._reader = threading.Thread(target=self._read_stdout, daemon=True)
+        self._reader.start()
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def _read_stdout(self):
+        for line in self.process.stdout:
+            if line.startswith(SHARD_RESULT_MARKER):
+                self._results.put(line[len(SHARD_RESULT_MARKER):])
+        # EOF: process exited (or crashed)
+        self._results.put(None)
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def stderr_tail(self, limit: int = 500) -> str:
+        try:
+            self._stderr.seek(0, os.SEEK_END)
+            self._stderr.seek(max(0, self._stderr.tell() - limit))
+            return self._stderr.read().decode('utf-8', errors='replace')
+        except (OSError, ValueError):
+            return ''
+
+    def run(self, job_type: str, params: Dict, timeout: float) -> Dict:
+        """
+        Run one job and return its result
+
+        Raises ShardWorkerError if the worker dies, ShardWorkerTimeout if it does
+        not answer within timeout (the worker is killed), and RuntimeError if
+        the job itself failed.
+        """
+        try:
+            self.process.stdin.write(json.dumps({'type': job_type, 'params': params}) + '\n')
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            self.process.wait()
+            raise ShardWorkerError(f"Shard worker {self.pid} exited ({self.process.returncode}): {self.stderr_tail()}")
+
+        try:
+            line = self._results.get(timeout=timeout)
+        except queue.Empty:
+            self.kill()
+            raise ShardWorkerTimeout(f"Shard worker {self.pid} timed out after {timeout:.0f}s")
+        if line is None:
+            self.process.wait()
+            raise ShardWorkerError(f"Shard worker {self.pid} exited ({self.process.returncode}): {self.stderr_tail()}")
+
+        result = json.loads(line)
+        if not result.get('success'):
+            raise RuntimeError(result.get('error', 'Page window conversion failed'))
+        return result['result']
+
+    def kill(self):
+        if self.is_alive():
+            self.process.kill()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        self._stderr.close()
+
+    def stop(self, timeout: float = 5):
+        """Close stdin so the worker exits its job loop, then reap it"""
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        self.kill()
+
+
+class LocalDoclingService:
+    """Process-wide DocumentConverter, built on first use"""
+
+    def __init__(self, shard_min_pages: int = 0, shard_pages: int = 25, shard_workers: int = 0,
+                 shard_timeout: int = 1800):
+        """
+        Args:
+            shard_min_pages: Convert PDFs with at least this many pages in
+                             page windows across shard worker processes (0 = never)
+            shard_pages: Pages per window
+            shard_workers: Number of worker processes (0 = available CPUs)
+            shard_timeout: Seconds a worker may take for one window (including model loading)
+        """
+        self._converter = None
+        self._init_lock = threading.Lock()
+        # Docling pipelines are not documented as thread-safe; convert one PDF at a time
+        self._convert_lock = threading.Lock()
+        self.load_seconds = None
+        self.load_rss_delta_mb = None
+        self.conversions = 0
+        self.conversion_seconds = 0.0
+
+        self.shard_min_pages = shard_min_pages
+        self.shard_pages = max(1, shard_pages)
+        self.shard_workers = shard_workers or available_cpus()
+        self.shard_timeout = shard_timeout
+        self._workers: List[ShardWorker] = []
+        self._shard_lock = threading.Lock()
+        self.sharded_conversions = 0
+        self.sharding_disabled = None  # Reason, once the workers could not run
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._converter is not None
+
+    def _get_converter(self):
+        if self._converter is None:
+            with self._init_lock:
+                if self._converter is None:
+                    from docling.document_converter import DocumentConverter
+
+                    rss_before = current_rss_mb()
+                    start = time.perf_counter()
+                    converter = DocumentConverter()
+                    # Load the PDF layout/table models now rather than on the first convert()
+                    try:
+                        from docling.datamodel.base_models import InputFormat
+                        converter.initialize_pipeline(InputFormat.PDF)
+                    except Exception as e:
+                        logger.warning(f"[DOCLING] Pipeline pre-initialisation unavailable: {e}")
+                    self.load_seconds = time.perf_counter() - start
+                    self.load_rss_delta_mb = current_rss_mb() - rss_before
+                    self._converter = converter
+                    logger.info(f"[DOCLING] Converter loaded in {self.load_seconds:.1f}s "
+                                f"(+{self.load_rss_delta_mb:.0f} MB RSS, pid {os.getpid()})")
+        return self._converter
+
+    def warm_up(self) -> Dict:
+        """Load the converter and its models; returns memory_stats()"""
+        self._get_converter()
+        return self.memory_stats()
+
+    def _get_workers(self) -> List[ShardWorker]:
+        """Running shard workers, starting (or replacing dead) ones up to shard_workers"""
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        while len(self._workers) < self.shard_workers:
+            try:
+                worker = ShardWorker()
+            except OSError as e:
+                raise ShardWorkerError(f"Could not start shard worker: {e}")
+            self._workers.append(worker)
+            logger.info(f"[DOCLING] Started shard worker (pid {worker.pid})")
+        return self._workers
+
+    def warm_up_shard_workers(self):
+        """Start the shard workers and load their models now instead of on the first window"""
+        with self._shard_lock:
+            workers = self._get_workers()
+            errors = []
+
+            def warm(worker):
+                try:
+                    worker.run('warm_up', {}, self.shard_timeout)
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=warm, args=(worker,), daemon=True) for worker in workers]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        if errors:
+            raise errors[0]
+
+    def _run_on_workers(self, job_type: str, jobs: List[Dict]) -> List[Dict]:
+        """Run jobs across the shard workers, one job per idle worker, results in job order"""
+        workers = self._get_workers()
+        pending = queue.Queue()
+        for index, params in enumerate(jobs):
+            pending.put((index, params))
+        results = [None] * len(jobs)
+        errors = []
+
+        def drain(worker):
+            while not errors:
+                try:
+                    index, params = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    results[index] = worker.run(job_type, params, self.shard_timeout)
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=drain, args=(worker,), daemon=True) for worker in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            # Worker failures take precedence: they decide whether sharding is switched off
+            failures = [e for e in errors if isinstance(e, ShardWorkerError)]
+            raise next((e for e in failures if not isinstance(e, ShardWorkerTimeout)), (failures or errors)[0])
+        return results
+
+    def convert_sharded(self, pdf_path: Path, page_count: int) -> Dict:
+        """Convert page windows in parallel and stitch them back in page order"""
+        start = time.perf_counter()
+        windows = page_windows(page_count, self.shard_pages)
+        with self._shard_lock:
+            data = stitch_page_windows(self._run_on_workers('convert_window', [
+                {'pdf_path': str(pdf_path), 'first_page': first, 'last_page': last} for first, last in windows
+            ]))
+
+        self.sharded_conversions += 1
+        self.conversions += 1
+        self.conversion_seconds += time.perf_counter() - start
+        logger.info(f"[DOCLING] Converted {page_count} pages in {len(windows)} windows "
+                    f"on {self.shard_workers} processes in {time.perf_counter() - start:.1f}s")
+        return data
+
+    def _disable_sharding(self, reason: str):
+        """Stop the shard workers and convert every later PDF in this process"""
+        self.sharding_disabled = reason
+        with self._shard_lock:
+            for worker in self._workers:
+                worker.stop()
+            self._workers = []
+        logger.error(f"[DOCLING] Shard workers unavailable, page-parallel conversion disabled "
+                     f"for this process: {reason}")
+
+    def shutdown_shard_workers(self):
+        with self._shard_lock:
+            for worker in self._workers:
+                worker.stop()
+            self._workers = []
+
+    def convert(self, pdf_path: Path, page_count: int = None) -> Dict:
+        """
+        Convert a PDF to {'text', 'tables', 'page_count'}
+
+        page_count (if already known) decides whether to shard; otherwise it is
+        read from the PDF page tree when sharding is enabled.
+        """
+        if self.shard_min_pages and not self.sharding_disabled:
+            page_count = page_count or count_pdf_pages(pdf_path)
+            if page_count and page_count >= self.shard_min_pages:
+                try:
+                    return self.convert_sharded(pdf_path, page_count)
+                except ShardWorkerTimeout as e:
+                    logger.warning(f"[DOCLING] {e}; converting whole document")
+                except ShardWorkerError as e:
+                    self._disable_sharding(str(e))
+                except Exception as e:
+                    logger.warning(f"[DOCLING] Sharded conversion failed, converting whole document: {e}")
+
+        converter = self._get_converter()
+        with self._convert_lock:
+            start = time.perf_counter()
+            result = converter.convert(pdf_path)
+            data = docling_document_to_data(result.document)
+            self.conversions += 1
+            self.conversion_seconds += time.perf_counter() - start
+        return data
+
+    def memory_stats(self) -> Dict:
+        return {
+            'mode': 'local',
+            'pid': os.getpid(),
+            'loaded': self.is_loaded,
+            'load_seconds': round(self.load_seconds, 2) if self.load_seconds is not None else None,
+            'load_rss_delta_mb': round(self.load_rss_delta_mb, 1) if self.load_rss_delta_mb is not None else None,
+            'rss_mb': round(current_rss_mb(), 1),
+            'peak_rss_mb': round(peak_rss_mb(), 1),
+            'conversions': self.conversions,
+            'conversion_seconds': round(self.conversion_seconds, 2),
+            'sharded_conversions': self.sharded_conversions,
+            'shard_workers': self.shard_workers if self.shard_min_pages and not self.sharding_disabled else 0,
+            'sharding_disabled': self.sharding_disabled,
+        }
+
+
+class RemoteDoclingService:
+    """Client for a shared converter process (see run_docling_server)"""
+
+    def __init__(self, base_url: str, timeout: int = 1800):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def warm_up(self) -> Dict:
+        # The server loads its models at start-up; nothing to load here
+        return self.memory_stats()
+
+    def convert(self, pdf_path: Path, page_count: int = None) -> Dict:
+        with open(pdf_path, 'rb') as f:
+            response = self.session.post(
+                f"{self.base_url}/convert",
+                data=f,
+                headers={'Content-Type': 'application/pdf'},
+                timeout=self.timeout
+            )
+        if response.status_code != 200:
+            raise Exception(f"Docling server returned {response.status_code}: {response.text[:200]}")
+        return response.json()
+
+    def memory_stats(self) -> Dict:
+        try:
+            stats = self.session.get(f"{self.base_url}/stats", timeout=10).json()
+        except Exception as e:
+            stats = {'error': str(e)}
+        return {'mode': 'remote', 'url': self.base_url, 'server': stats}
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_docling_service():
+    """Return the process-wide converter service (remote if DOCLING_SERVICE_URL is set)"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                url = getattr(settings, 'DOCLING_SERVICE_URL', '')
+                if url:
+                    _service = RemoteDoclingService(url, timeout=getattr(settings, 'DOCLING_SERVICE_TIMEOUT', 1800))
+                else:
+                    _service = _local_service_from_settings()
+    return _service
+
+
+def _local_service_from_settings() -> LocalDoclingService:
+    return LocalDoclingService(
+        shard_min_pages=getattr(settings, 'DOCLING_SHARD_MIN_PAGES', 0),
+        shard_pages=getattr(settings, 'DOCLING_SHARD_PAGES', 25),
+        shard_workers=getattr(settings, 'DOCLING_SHARD_WORKERS', 0),
+        shard_timeout=getattr(settings, 'DOCLING_SERVICE_TIMEOUT', 1800)
+    )
+
+
+def get_local_docling_service() -> LocalDoclingService:
+    """Return the in-process converter regardless of DOCLING_SERVICE_URL (used by the server itself)"""
+    global _service
+    with _service_lock:
+        if not isinstance(_service, LocalDoclingService):
+            _service = _local_service_from_settings()
+        return _service
+
+
+def warm_up_docling(force: bool = False) -> Optional[Dict]:
+    """Load the Docling models now if DOCLING_WARMUP is enabled (or force); returns memory stats"""
+    if not force and not getattr(settings, 'DOCLING_WARMUP', False):
+        return None
+    service = get_docling_service()
+    try:
+        stats = service.warm_up()
+    except Exception as e:
+        logger.error(f"[DOCLING] Warm-up failed: {e}")
+        return None
+    logger.info(f"[DOCLING] Warm-up complete: {stats}")
+    return stats
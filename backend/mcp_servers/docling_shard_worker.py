@@ -0,0 +1,79 @@
+"""
+Docling Page-Window Worker Process
+
+Entry point for the shard workers started by
+mcp_servers.docling_service.LocalDoclingService for page-parallel conversion.
+Each worker builds its own DocumentConverter on the first job and keeps it
+loaded, then converts page windows read from stdin until stdin is closed.
+
+Started with subprocess (not multiprocessing), so sharding also works from
+Celery prefork workers, whose daemonic processes cannot have children.
+
+Protocol (one JSON object per line):
+    stdin:  {"type": "convert_window", "params": {"pdf_path": "/tmp/r.pdf", "first_page": 1, "last_page": 25}}
+    stdout: DOCLING_SHARD_RESULT:{"success": true, "result": {"pages": [[1, "..."]], "tables": [...]}}
+
+Anything Docling prints is redirected to stderr so that stdout only ever
+carries result lines.
+
+Run with: python -m mcp_servers.docling_shard_worker
+"""
+
+import json
+import os
+import sys
+
+RESULT_MARKER = 'DOCLING_SHARD_RESULT:'
+
+
+def convert_window(pdf_path: str, first_page: int, last_page: int) -> dict:
+    from mcp_servers.docling_service import _convert_page_window
+    return _convert_page_window(pdf_path, first_page, last_page)
+
+
+def warm_up() -> dict:
+    """Build the converter before the first window arrives"""
+    from mcp_servers.docling_service import _get_window_converter
+    _get_window_converter()
+    return {"pid": os.getpid()}
+
+
+JOB_HANDLERS = {
+    'convert_window': convert_window,
+    'warm_up': warm_up,
+}
+
+
+def run_job(job: dict) -> dict:
+    """Execute one job dict and return the result envelope"""
+    handler = JOB_HANDLERS.get(job.get('type'))
+    if handler is None:
+        return {"success": False, "error": f"Unknown job type: {job.get('type')}"}
+    try:
+        return {"success": True, "result": handler(**job.get('params', {}))}
+    except Exception as e:
+        return {"success": False, "error": str(e), "error_type": type(e).__name__}
+
+
+def main():
+    # Keep stdout reserved for result lines; Docling output goes to stderr
+    result_stream = os.fdopen(os.dup(sys.stdout.fileno()), 'w')
+    sys.stdout = sys.stderr
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError:
+            result = {"success": False, "error": "Invalid job payload"}
+        else:
+            result = run_job(job)
+
+        result_stream.write(RESULT_MARKER + json.dumps(result, default=str) + '\n')
+        result_stream.flush()
+
+
+if __name__ == '__main__':
+    main()
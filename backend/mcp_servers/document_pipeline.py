@@ -0,0 +1,235 @@
+"""
+Staged NI 43-101 Processing Pipeline
+
+Runs a technical report through explicit stages, each timed:
+
+    fetch    -> download the PDF once
+    route    -> read the page count from the PDF page tree (no conversion)
+                and choose single-pass Claude extraction or RLM
+    convert  -> one Docling conversion; the artifact is handed to later stages
+    extract  -> hybrid single-pass or RLM extraction from the Docling artifact
+    persist  -> Document, Project, resources, economics and RAG chunks
+
+Previously a long report was downloaded and converted by the hybrid path,
+then discarded and downloaded and converted again by the RLM path.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from .docling_service import count_pdf_pages
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineRun:
+    """State handed from stage to stage"""
+    document_url: str
+    company: object
+    project_name: Optional[str] = None
+    pdf_path: Optional[Path] = None
+    page_count: Optional[int] = None
+    route: Optional[str] = None
+    docling_data: Optional[Dict] = None
+    extracted_data: Optional[Dict] = None
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+
+
+class DocumentPipeline:
+    """
+    Drives a HybridDocumentProcessor through fetch/route/convert/extract/persist
+
+    Args:
+        processor: HybridDocumentProcessor providing the stage implementations
+        on_stage: Optional callback(stage_name) invoked as each stage starts,
+                  e.g. to update a DocumentProcessingJob's progress message
+    """
+
+    def __init__(self, processor, on_stage: Callable[[str], None] = None):
+        self.processor = processor
+        self.on_stage = on_stage
+
+    @contextmanager
+    def _stage(self, run: PipelineRun, name: str):
+        if self.on_stage:
+            try:
+                self.on_stage(name)
+            except Exception as e:
+                logger.warning(f"[PIPELINE] Stage callback failed for '{name}': {e}")
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            run.stage_timings[name] = round(time.perf_counter() - start, 3)
+
+    def _choose_route(self, page_count: Optional[int], mode: str) -> Optional[str]:
+        if mode in ('hybrid', 'rlm'):
+            return mode
+        if page_count is None:
+            return None
+        return 'rlm' if page_count > self.processor.RLM_PAGE_THRESHOLD else 'hybrid'
+
+    def run(self, document_url: str, company, project_name: str = None, mode: str = 'auto',
+            decomposition_strategy: str = 'hybrid', validate: bool = True) -> Dict:
+        """
+        Process one report
+
+        Args:
+            document_url: PDF URL
+            company: Company the report belongs to
+            project_name: Fallback project name if none is extracted
+            mode: 'auto' (route by page count), 'hybrid' or 'rlm'
+            decomposition_strategy: RLM decomposition strategy
+            validate: Run RLM validation
+
+        Returns:
+            Result dict of the chosen extraction path, with 'stage_timings'.
+            Exceptions propagate; the partial timings are on the exception
+            as 'stage_timings'.
+        """
+        run = PipelineRun(document_url=document_url, company=company, project_name=project_name)
+        try:
+            return self._run(run, mode, decomposition_strategy, validate)
+        except Exception as e:
+            e.stage_timings = run.stage_timings
+            raise
+        finally:
+            if run.pdf_path is not None and run.pdf_path.exists():
+                run.pdf_path.unlink()
+
+    def _run(self, run: PipelineRun, mode: str, decomposition_strategy: str, validate: bool) -> Dict:
+        processor = self.processor
+
+        with self._stage(run, 'fetch'):
+            run.pdf_path = processor._download_pdf(run.document_url)
+
+        with self._stage(run, 'route'):
+            run.page_count = count_pdf_pages(run.pdf_path)
+            run.route = self._choose_route(run.page_count, mode)
+
+        with self._stage(run, 'convert'):
+            run.docling_data = processor._process_with_docling(run.pdf_path, page_count=run.page_count)
+        run.pdf_path.unlink()
+
+        if run.route is None:
+            run.page_count = run.docling_data.get('page_count', 0)
+            run.route = self._choose_route(run.page_count, 'auto')
+        logger.info(f"[PIPELINE] {run.page_count} pages, "
+                    f"{len(run.docling_data['tables'])} tables -> {run.route}")
+
+        with self._stage(run, 'extract'):
+            if run.route == 'rlm':
+                run.extracted_data, strategy = processor._extract_rlm(
+                    run.docling_data, decomposition_strategy, validate
+                )
+            else:
+                run.extracted_data, cache_stats, response_text = processor._extract_hybrid(run.docling_data)
+
+        if run.extracted_data is None:
+            return {
+                "warning": "Could not parse structured data",
+                "raw_analysis": response_text[:1000],
+                "docling_stats": {
+                    "tables_found": len(run.docling_data['tables']),
+                    "pages": run.docling_data['page_count']
+                },
+                "cache_stats": cache_stats,
+                "stage_timings": run.stage_timings
+            }
+
+        if run.route == 'rlm':
+            description = f"Processed with RLM ({strategy.value}) on {datetime.now().strftime('%Y-%m-%d')}"
+        else:
+            description = f"Processed with Docling+Claude hybrid on {datetime.now().strftime('%Y-%m-%d')}"
+
+        with self._stage(run, 'persist'):
+            stored = processor._persist_extraction(
+                company=run.company,
+                document_url=run.document_url,
+                extracted_data=run.extracted_data,
+                docling_data=run.docling_data,
+                description=description,
+                project_name=run.project_name
+            )
+
+        if run.route == 'rlm':
+            result = self._rlm_result(run, stored, strategy)
+        else:
+            result = self._hybrid_result(run, stored, cache_stats)
+        result['stage_timings'] = run.stage_timings
+        return result
+
+    @staticmethod
+    def _processing_stats(run: PipelineRun, stored: Dict) -> Dict:
+        return {
+            "tables_extracted": len(run.docling_data['tables']),
+            "pages_processed": run.page_count,
+            "resources_stored": stored['resources_stored'],
+            "economic_study_stored": stored['economic_study_stored'],
+            "document_chunks_stored": stored['document_chunks_stored']
+        }
+
+    def _hybrid_result(self, run: PipelineRun, stored: Dict, cache_stats: Dict) -> Dict:
+        extracted_data = run.extracted_data
+        return {
+            "success": True,
+            "method": "Docling + Claude Hybrid",
+            "document_id": stored['document'].id,
+            "company": run.company.name,
+            "project": stored['project'].name if stored['project'] else None,
+            "processing_stats": self._processing_stats(run, stored),
+            "cache_stats": cache_stats,
+            "extracted_data": {
+                "document_info": extracted_data.get('document_info', {}),
+                "project_info": extracted_data.get('project_info', {}),
+                "key_findings": extracted_data.get('key_findings', {})
+            },
+            "message": "NI 43-101 processed successfully with hybrid approach"
+        }
+
+    def _rlm_result(self, run: PipelineRun, stored: Dict, strategy) -> Dict:
+        extracted_data = run.extracted_data
+        proc_meta = extracted_data.get('processing_metadata', {})
+        return {
+            "success": True,
+            "method": f"RLM ({strategy.value} decomposition)",
+            "document_id": stored['document'].id,
+            "company": run.company.name,
+            "project": stored['project'].name if stored['project'] else None,
+            "rlm_stats": {
+                "chunks_processed": proc_meta.get('chunks_processed', 0),
+                "successful_extractions": proc_meta.get('successful_extractions', 0),
+                "processing_time_seconds": proc_meta.get('processing_time_seconds', 0),
+                "extraction_time_seconds": proc_meta.get('extraction_time_seconds', 0),
+                "max_concurrency": proc_meta.get('max_concurrency', 1),
+                "rate_limit_retries": proc_meta.get('rate_limit_retries', 0),
+                "extraction_mode": proc_meta.get('extraction_mode'),
+                "parse_failures": proc_meta.get('parse_failures', 0),
+                "parse_failure_rate": proc_meta.get('parse_failure_rate', 0.0),
+                "repair_attempts": proc_meta.get('repair_attempts', 0),
+                "repaired_chunks": proc_meta.get('repaired_chunks', 0),
+                "usage": proc_meta.get('usage', {}),
+                "chunk_timings": proc_meta.get('chunk_timings', []),
+                "validation_passed": proc_meta.get('validation_passed'),
+                "decomposition_strategy": strategy.value
+            },
+            "processing_stats": self._processing_stats(run, stored),
+            "cache_stats": {
+                "docling_hit": run.docling_data.get('cache_hit', False),
+                "chunk_hits": proc_meta.get('cache_hits', 0),
+                "chunk_misses": proc_meta.get('cache_misses', 0)
+            },
+            "extracted_data": {
+                "document_info": extracted_data.get('document_info', {}),
+                "project_info": extracted_data.get('project_info', {}),
+                "key_findings": extracted_data.get('key_findings', {}),
+                "resources_summary": f"{len(extracted_data.get('mineral_resources', []))} resource categories found"
+            },
+            "message": f"NI 43-101 processed successfully with RLM ({strategy.value})"
+        }
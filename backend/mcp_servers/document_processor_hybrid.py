@@ -10,7 +10,6 @@ Based on: "Recursive Language Models" (Zhang, Kraska, Khattab - arXiv:2512.24601
 """
 
 import logging
-import requests
 
 logger = logging.getLogger(__name__)
 import anthropic
@@ -18,19 +17,18 @@ from typing import Dict, List, Any, Tuple
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-import tempfile
 import json
 import re
 from urllib.parse import urlparse
 
-from docling.document_converter import DocumentConverter
-from docling_core.types.doc import ImageRefMode, PictureItem, TableItem
-
 from .base import BaseMCPServer
 from .rlm_processor import RLMProcessor, DecompositionStrategy
+from .extraction_cache import ExtractionCache, get_extraction_cache
+from .document_pipeline import DocumentPipeline
+from .docling_service import get_docling_service
+from .pdf_downloader import DownloadError, get_pdf_downloader
 from django.conf import settings
 from core.models import Company, Project, Document, ResourceEstimate, EconomicStudy
-from core.security_utils import check_url_safety as is_safe_url
 from django.db.models import Q
 
 
@@ -51,13 +49,18 @@ class HybridDocumentProcessor(BaseMCPServer):
     # Page threshold for using RLM processing
     RLM_PAGE_THRESHOLD = 50
 
+    # Model for interpretation; also part of the chunk cache key
+    CLAUDE_MODEL = "claude-sonnet-4-20250514"
+
     def __init__(self, company_id: int = None, user=None):
         super().__init__(company_id, user)
         self.claude_client = anthropic.Anthropic(
             api_key=settings.ANTHROPIC_API_KEY
         )
-        self.doc_converter = DocumentConverter()
-        self.rlm_processor = RLMProcessor()
+        # Shared per process: Docling models load once, not per processor
+        self.docling_service = get_docling_service()
+        self.cache = get_extraction_cache()
+        self.rlm_processor = RLMProcessor(cache=self.cache)
 
     def _register_tools(self):
         """Register all document processing tools"""
@@ -229,101 +232,50 @@ class HybridDocumentProcessor(BaseMCPServer):
     # =============================================================================
 
     def _download_pdf(self, url: str) -> Path:
-        """Download PDF to temporary file with retry logic and proper headers"""
-        import time
-
-        # Use realistic browser headers to avoid 403 blocks
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'application/pdf,application/octet-stream,*/*',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Referer': '/'.join(url.split('/')[:3]) + '/',  # Set referer to domain root
-        }
-
-        max_retries = 3
-        last_error = None
+        """
+        Download PDF to a temporary file the caller deletes
 
-        # Validate URL is safe (prevent SSRF)
-        if not is_safe_url(url):
-            raise Exception(f"URL validation failed - potentially unsafe: {url}")
+        Streams to disk with Range-resumed retries, size/content-type guards
+        and SSRF checks on every redirect; repeat URLs are served from the
+        local PDF store (see pdf_downloader.py).
+        """
+        try:
+            return get_pdf_downloader().download(url).path
+        except DownloadError as e:
+            raise Exception(f"Failed to download PDF: {str(e)}")
 
-        for attempt in range(max_retries):
-            try:
-                # Use allow_redirects=False to manually validate redirects
-                response = requests.get(url, headers=headers, timeout=60, allow_redirects=False)
-
-                # Handle redirects manually to validate each destination
-                redirect_count = 0
-                while response.is_redirect and redirect_count < 5:
-                    redirect_url = response.headers.get('Location')
-                    if redirect_url and not is_safe_url(redirect_url):
-                        raise Exception(f"Redirect to unsafe URL blocked: {redirect_url}")
-                    response = requests.get(redirect_url, headers=headers, timeout=60, allow_redirects=False)
-                    redirect_count += 1
-
-                response.raise_for_status()
-
-                # Create temp file
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-                temp_file.write(response.content)
-                temp_file.close()
-
-                return Path(temp_file.name)
-            except requests.exceptions.HTTPError as e:
-                last_error = e
-                if e.response.status_code == 403:
-                    # Exponential backoff for 403 errors
-                    wait_time = 2 ** attempt
-                    logger.warning(f"[PDF DOWNLOAD] 403 Forbidden, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                    continue
-                elif e.response.status_code == 404:
-                    # Don't retry 404s
-                    raise Exception(f"Failed to download PDF: {str(e)}")
-                else:
-                    # Other HTTP errors - retry with backoff
-                    time.sleep(2 ** attempt)
-                    continue
-            except requests.exceptions.Timeout:
-                last_error = Exception(f"Request timed out after 60s")
-                time.sleep(2 ** attempt)
-                continue
-            except Exception as e:
-                last_error = e
-                time.sleep(2 ** attempt)
-                continue
+    def _process_with_docling(self, pdf_path: Path, page_count: int = None) -> Dict:
+        """
+        Extract structure and content using Docling.
 
-        raise Exception(f"Failed to download PDF after {max_retries} attempts: {str(last_error)}")
+        Results are cached by the PDF's SHA-256, so unchanged documents skip
+        conversion entirely. The returned dict has 'cache_hit' set accordingly.
+        page_count, if already known, lets long PDFs go to the sharded
+        converter without re-reading the page tree.
+        """
+        pdf_sha256 = None
+        if self.cache:
+            pdf_sha256 = ExtractionCache.hash_file(pdf_path)
+            cached = self.cache.get_docling(pdf_sha256)
+            if cached is not None:
+                logger.info(f"[DOCLING] Cache hit for PDF {pdf_sha256[:12]}")
+                cached['cache_hit'] = True
+                return cached
 
-    def _process_with_docling(self, pdf_path: Path) -> Dict:
-        """Extract structure and content using Docling"""
         try:
-            # Convert document
-            result = self.doc_converter.convert(pdf_path)
-            doc = result.document
-
-            # Extract tables
-            tables = []
-            for item, _ in doc.iterate_items():
-                if isinstance(item, TableItem):
-                    tables.append({
-                        'caption': item.caption if hasattr(item, 'caption') else None,
-                        'data': item.export_to_markdown() if hasattr(item, 'export_to_markdown') else str(item)
-                    })
-
-            # Extract full text with structure
-            markdown_text = doc.export_to_markdown()
-
-            return {
-                'text': markdown_text,
-                'tables': tables,
-                'page_count': len(doc.pages) if hasattr(doc, 'pages') else 0
-            }
+            docling_data = self.docling_service.convert(pdf_path, page_count=page_count)
         except Exception as e:
             raise Exception(f"Docling processing failed: {str(e)}")
 
+        if pdf_sha256:
+            try:
+                self.cache.set_docling(pdf_sha256, docling_data)
+            except Exception as e:
+                logger.warning(f"[DOCLING] Failed to cache output: {e}")
+
+        docling_data['cache_hit'] = False
+        return docling_data
+
     def _filter_resource_tables(self, tables: List[Dict]) -> List[Dict]:
         """Filter and prioritize tables that likely contain resource estimates"""
         resource_keywords = [
@@ -381,7 +333,7 @@ class HybridDocumentProcessor(BaseMCPServer):
         """Ask Claude to interpret extracted data"""
         try:
             message = self.claude_client.messages.create(
-                model="claude-sonnet-4-20250514",
+                model=self.CLAUDE_MODEL,
                 max_tokens=max_tokens,
                 messages=[{
                     "role": "user",
@@ -396,46 +348,50 @@ class HybridDocumentProcessor(BaseMCPServer):
     # TOOL HANDLERS
     # =============================================================================
 
+    def _find_company(self, company_name: str):
+        return Company.objects.filter(
+            Q(name__icontains=company_name) | Q(ticker_symbol__iexact=company_name)
+        ).first()
+
     def _process_ni43101_hybrid(self, document_url: str, company_name: str,
-                                project_name: str = None) -> Dict:
+                                project_name: str = None, on_stage=None) -> Dict:
         """Process NI 43-101 using Docling + Claude hybrid approach.
 
         Automatically uses RLM (Recursive Language Model) processing for
-        documents over 50 pages to ensure comprehensive extraction.
+        documents over 50 pages to ensure comprehensive extraction. The page
+        count is read from the PDF before conversion, and the PDF is
+        downloaded and converted once whichever path is taken.
         """
-        try:
-            # Find company
-            company = Company.objects.filter(
-                Q(name__icontains=company_name) | Q(ticker_symbol__iexact=company_name)
-            ).first()
+        company = self._find_company(company_name)
+        if not company:
+            return {"error": f"Company '{company_name}' not found"}
 
-            if not company:
-                return {"error": f"Company '{company_name}' not found"}
-
-            # Step 1: Download PDF
-            pdf_path = self._download_pdf(document_url)
-
-            # Step 2: Extract with Docling
-            docling_data = self._process_with_docling(pdf_path)
+        try:
+            return DocumentPipeline(self, on_stage=on_stage).run(
+                document_url=document_url,
+                company=company,
+                project_name=project_name,
+                mode='auto'
+            )
+        except Exception as e:
+            return {
+                "error": f"Hybrid processing failed: {str(e)}",
+                "stage_timings": getattr(e, 'stage_timings', {})
+            }
 
-            # Check page count - use RLM for long documents
-            page_count = docling_data.get('page_count', 0)
-            if page_count > self.RLM_PAGE_THRESHOLD:
-                logger.info(f"[HYBRID] Document has {page_count} pages (>{self.RLM_PAGE_THRESHOLD}), switching to RLM processing")
-                pdf_path.unlink()
-                return self._process_ni43101_rlm(
-                    document_url=document_url,
-                    company_name=company_name,
-                    project_name=project_name,
-                    decomposition_strategy="hybrid",
-                    validate=True
-                )
+    # =============================================================================
+    # PIPELINE STAGES (see document_pipeline.py)
+    # =============================================================================
 
-            # Clean up temp file
-            pdf_path.unlink()
+    def _extract_hybrid(self, docling_data: Dict) -> Tuple[Dict, Dict, str]:
+        """
+        Single-pass Claude interpretation of a Docling artifact
 
-            # Step 3: Claude interprets the extracted data
-            prompt = """Analyze this NI 43-101 technical report extracted by Docling.
+        Returns:
+            (extracted_data, cache_stats, response_text); extracted_data is
+            None if Claude's response could not be parsed
+        """
+        prompt = """Analyze this NI 43-101 technical report extracted by Docling.
 
 The document has been pre-processed:
 - Tables have been extracted and converted to markdown
@@ -487,174 +443,202 @@ Extract ALL key data in JSON format:
 
 Return ONLY valid JSON. Use null for missing values."""
 
-            # Filter tables to find resource-related ones
-            filtered_tables = self._filter_resource_tables(docling_data['tables'])
+        # Filter tables to find resource-related ones
+        filtered_tables = self._filter_resource_tables(docling_data['tables'])
 
-            context = f"""DOCUMENT TEXT AND STRUCTURE:
+        context = f"""DOCUMENT TEXT AND STRUCTURE:
 {docling_data['text'][:15000]}
 
 EXTRACTED TABLES ({len(docling_data['tables'])} total tables, showing {len(filtered_tables)} most relevant):
 {json.dumps(filtered_tables, indent=2)[:50000]}
 """
 
-            response_text = self._ask_claude(prompt, context, max_tokens=4000)
+        # Reuse the earlier interpretation if prompt and extracted content are unchanged
+        cache_key = ExtractionCache.chunk_key(prompt, context, self.CLAUDE_MODEL) if self.cache else None
+        extracted_data = self.cache.get_chunk(cache_key) if cache_key else None
+        cache_stats = {
+            "docling_hit": docling_data.get('cache_hit', False),
+            "chunk_hits": 1 if extracted_data is not None else 0,
+            "chunk_misses": 1 if cache_key and extracted_data is None else 0
+        }
+        if extracted_data is not None:
+            return extracted_data, cache_stats, ""
+
+        response_text = self._ask_claude(prompt, context, max_tokens=4000)
 
-            # Parse JSON response - try direct parse first, then extract if needed
+        # Parse JSON response - try direct parse first, then extract if needed
+        try:
+            extracted_data = json.loads(response_text.strip())
+        except json.JSONDecodeError:
+            # Fall back to extracting JSON from response text
             try:
-                # First, try to parse the entire response as JSON
-                extracted_data = json.loads(response_text.strip())
+                json_start = response_text.find('{')
+                json_end = response_text.rfind('}') + 1
+                if json_start != -1 and json_end > json_start:
+                    extracted_data = json.loads(response_text[json_start:json_end])
+                else:
+                    raise json.JSONDecodeError("No JSON object found", response_text, 0)
+                # Validate extracted data has expected structure
+                if not isinstance(extracted_data, dict):
+                    raise json.JSONDecodeError("Extracted data is not a dict", response_text, 0)
             except json.JSONDecodeError:
-                # Fall back to extracting JSON from response text
-                try:
-                    json_start = response_text.find('{')
-                    json_end = response_text.rfind('}') + 1
-                    if json_start != -1 and json_end > json_start:
-                        extracted_data = json.loads(response_text[json_start:json_end])
-                    else:
-                        raise json.JSONDecodeError("No JSON object found", response_text, 0)
-                    # Validate extracted data has expected structure
-                    if not isinstance(extracted_data, dict):
-                        raise json.JSONDecodeError("Extracted data is not a dict", response_text, 0)
-                except json.JSONDecodeError:
-                    return {
-                        "warning": "Could not parse structured data",
-                        "raw_analysis": response_text[:1000],
-                        "docling_stats": {
-                            "tables_found": len(docling_data['tables']),
-                            "pages": docling_data['page_count']
-                        }
-                    }
+                return None, cache_stats, response_text
 
-            # Store document
-            doc_info = extracted_data.get('document_info', {})
-            doc_date = datetime.now().date()
-            if doc_info.get('report_date'):
-                try:
-                    doc_date = datetime.strptime(doc_info['report_date'], "%Y-%m-%d").date()
-                except (ValueError, TypeError):
-                    pass  # Use default date if parsing fails
+        if cache_key:
+            try:
+                self.cache.set_chunk(cache_key, extracted_data)
+            except Exception as e:
+                logger.warning(f"[HYBRID] Failed to cache extraction: {e}")
+
+        return extracted_data, cache_stats, response_text
+
+    def _extract_rlm(self, docling_data: Dict, decomposition_strategy: str = "hybrid",
+                     validate: bool = True) -> Tuple[Dict, DecompositionStrategy]:
+        """
+        Recursive (RLM) extraction from a Docling artifact
+
+        Returns:
+            (extracted_data, strategy used)
+        """
+        strategy_map = {
+            "hybrid": DecompositionStrategy.HYBRID,
+            "section": DecompositionStrategy.SECTION_BASED,
+            "page": DecompositionStrategy.PAGE_BASED,
+            "semantic": DecompositionStrategy.SEMANTIC
+        }
+        strategy = strategy_map.get(decomposition_strategy, DecompositionStrategy.HYBRID)
+
+        rlm_result = self.rlm_processor.process_document(
+            document_text=docling_data['text'],
+            tables=docling_data['tables'],
+            strategy=strategy,
+            validate=validate
+        )
+        return self.rlm_processor.to_dict(rlm_result), strategy
 
-            document = Document.objects.create(
+    def _persist_extraction(self, company: Company, document_url: str, extracted_data: Dict,
+                            docling_data: Dict, description: str, project_name: str = None) -> Dict:
+        """
+        Store an extraction: Document, Project, resources, economics and RAG chunks
+
+        Returns:
+            Dict with 'document', 'project', 'resources_stored',
+            'economic_study_stored' and 'document_chunks_stored'
+        """
+        doc_info = extracted_data.get('document_info', {})
+        doc_date = datetime.now().date()
+        if doc_info.get('report_date'):
+            try:
+                doc_date = datetime.strptime(doc_info['report_date'], "%Y-%m-%d").date()
+            except (ValueError, TypeError):
+                pass  # Use default date if parsing fails
+
+        document = Document.objects.create(
+            company=company,
+            title=doc_info.get('title', 'NI 43-101 Technical Report'),
+            document_type='ni43101',
+            document_date=doc_date,
+            file_url=document_url,
+            description=description
+        )
+
+        # Store project
+        project = None
+        project_info = extracted_data.get('project_info', {})
+        if project_info.get('project_name') or project_name:
+            proj_name = project_info.get('project_name') or project_name
+            project, created = Project.objects.get_or_create(
                 company=company,
-                title=doc_info.get('title', 'NI 43-101 Technical Report'),
-                document_type='ni43101',
-                document_date=doc_date,
-                file_url=document_url,
-                description=f"Processed with Docling+Claude hybrid on {datetime.now().strftime('%Y-%m-%d')}"
+                name=proj_name,
+                defaults={
+                    'country': project_info.get('country', 'Unknown'),
+                    'project_stage': project_info.get('stage', 'exploration'),
+                    'primary_commodity': 'gold'
+                }
             )
+            document.project = project
+            document.save()
 
-            # Store project
-            project = None
-            project_info = extracted_data.get('project_info', {})
-            if project_info.get('project_name'):
-                project, created = Project.objects.get_or_create(
-                    company=company,
-                    name=project_info['project_name'],
-                    defaults={
-                        'country': 'Unknown',  # Will be updated from location string if available
-                        'project_stage': 'exploration',
-                        'primary_commodity': 'gold'
-                    }
-                )
-                document.project = project
-                document.save()
-
-            # Store resources
-            resources_added = 0
-            for res in extracted_data.get('mineral_resources', []):
-                if res.get('tonnage_mt') and res.get('grade'):
-                    try:
-                        # Map mineral type to specific grade field
-                        mineral_type = res.get('mineral_type', 'gold').lower()
-                        grade_value = Decimal(str(res['grade']))
-
-                        # Prepare grade fields based on mineral type
-                        grade_fields = {}
-                        if mineral_type in ['gold', 'au']:
-                            if res.get('grade_unit') == 'g/t':
-                                grade_fields['gold_grade_gpt'] = grade_value
-                            if res.get('contained_metal'):
-                                grade_fields['gold_ounces'] = Decimal(str(res['contained_metal']))
-                        elif mineral_type in ['silver', 'ag']:
-                            if res.get('grade_unit') == 'g/t':
-                                grade_fields['silver_grade_gpt'] = grade_value
-                            if res.get('contained_metal'):
-                                grade_fields['silver_ounces'] = Decimal(str(res['contained_metal']))
-                        elif mineral_type in ['copper', 'cu']:
-                            if res.get('grade_unit') == '%':
-                                grade_fields['copper_grade_pct'] = grade_value
-
-                        ResourceEstimate.objects.create(
-                            project=project or Project.objects.filter(company=company).first(),
-                            category=res.get('category', 'inferred').lower(),
-                            standard='ni43101',
-                            tonnes=Decimal(str(res['tonnage_mt'])) * Decimal('1000000'),  # Convert Mt to tonnes
-                            report_date=doc_date,
-                            effective_date=doc_date,
-                            **grade_fields
-                        )
-                        resources_added += 1
-                    except Exception as e:
-                        logger.error(f"Error storing resource: {str(e)}")
-
-            # Store economic study
-            econ_data = extracted_data.get('economic_study', {})
-            econ_stored = False
-            if econ_data.get('npv_usd_millions'):
+        # Store resources
+        resources_added = 0
+        for res in extracted_data.get('mineral_resources', []):
+            if res.get('tonnage_mt') and res.get('grade'):
                 try:
-                    EconomicStudy.objects.create(
+                    # Map mineral type to specific grade field
+                    mineral_type = res.get('mineral_type', 'gold').lower()
+                    grade_value = Decimal(str(res['grade']))
+
+                    grade_fields = {}
+                    if mineral_type in ['gold', 'au']:
+                        if res.get('grade_unit') == 'g/t':
+                            grade_fields['gold_grade_gpt'] = grade_value
+                        if res.get('contained_metal'):
+                            grade_fields['gold_ounces'] = Decimal(str(res['contained_metal']))
+                    elif mineral_type in ['silver', 'ag']:
+                        if res.get('grade_unit') == 'g/t':
+                            grade_fields['silver_grade_gpt'] = grade_value
+                        if res.get('contained_metal'):
+                            grade_fields['silver_ounces'] = Decimal(str(res['contained_metal']))
+                    elif mineral_type in ['copper', 'cu']:
+                        if res.get('grade_unit') == '%':
+                            grade_fields['copper_grade_pct'] = grade_value
+
+                    # Reserves (RLM extractions) are stored as proven/probable
+                    category = res.get('category', 'inferred').lower()
+                    if res.get('is_reserve'):
+                        category = 'proven' if 'proven' in category else 'probable'
+
+                    ResourceEstimate.objects.create(
                         project=project or Project.objects.filter(company=company).first(),
-                        study_type=econ_data.get('study_type', 'pea').lower(),
-                        study_date=doc_date,
-                        npv_usd=Decimal(str(econ_data['npv_usd_millions'])) * Decimal('1000000'),
-                        discount_rate=Decimal(str(econ_data.get('discount_rate', 5))),
-                        irr=Decimal(str(econ_data.get('irr_percent', 0))) if econ_data.get('irr_percent') else None,
-                        capex_initial=Decimal(str(econ_data.get('capex_initial_usd_millions', 0))) * Decimal('1000000'),
-                        payback_period_years=Decimal(str(econ_data.get('payback_period_years', 0))) if econ_data.get('payback_period_years') else None,
-                        mine_life_years=int(econ_data.get('mine_life_years', 0)) if econ_data.get('mine_life_years') else None
+                        category=category,
+                        standard='ni43101',
+                        tonnes=Decimal(str(res['tonnage_mt'])) * Decimal('1000000'),  # Convert Mt to tonnes
+                        report_date=doc_date,
+                        effective_date=doc_date,
+                        **grade_fields
                     )
-                    econ_stored = True
+                    resources_added += 1
                 except Exception as e:
-                    logger.error(f"Error storing economics: {str(e)}")
+                    logger.error(f"Error storing resource: {str(e)}")
 
-            # Store full document text for RAG/semantic search
-            chunks_stored = 0
+        # Store economic study
+        econ_data = extracted_data.get('economic_study', {})
+        econ_stored = False
+        npv_value = econ_data.get('npv_usd_millions') or econ_data.get('npv_millions')
+        if npv_value:
             try:
-                from .rag_utils import RAGManager
-                rag_manager = RAGManager()
-                full_text = docling_data['text']  # Full extracted text from Docling
-                chunks_stored = rag_manager.store_document_chunks(document, full_text)
-                logger.info(f"Stored {chunks_stored} chunks for semantic search")
+                EconomicStudy.objects.create(
+                    project=project or Project.objects.filter(company=company).first(),
+                    study_type=econ_data.get('study_type', 'pea').lower(),
+                    study_date=doc_date,
+                    npv_usd=Decimal(str(npv_value)) * Decimal('1000000'),
+                    discount_rate=Decimal(str(econ_data.get('discount_rate_percent') or econ_data.get('discount_rate', 5))),
+                    irr=Decimal(str(econ_data.get('irr_percent', 0))) if econ_data.get('irr_percent') else None,
+                    capex_initial=Decimal(str(econ_data.get('capex_initial_usd_millions', 0))) * Decimal('1000000') if econ_data.get('capex_initial_usd_millions') else None,
+                    payback_period_years=Decimal(str(econ_data.get('payback_period_years', 0))) if econ_data.get('payback_period_years') else None,
+                    mine_life_years=int(econ_data.get('mine_life_years', 0)) if econ_data.get('mine_life_years') else None
+                )
+                econ_stored = True
             except Exception as e:
-                logger.error(f"Error storing document chunks for RAG: {str(e)}")
-
-            return {
-                "success": True,
-                "method": "Docling + Claude Hybrid",
-                "document_id": document.id,
-                "company": company.name,
-                "project": project.name if project else None,
-                "processing_stats": {
-                    "tables_extracted": len(docling_data['tables']),
-                    "pages_processed": docling_data['page_count'],
-                    "resources_stored": resources_added,
-                    "economic_study_stored": econ_stored,
-                    "document_chunks_stored": chunks_stored
-                },
-                "extracted_data": {
-                    "document_info": doc_info,
-                    "project_info": project_info,
-                    "key_findings": extracted_data.get('key_findings', {})
-                },
-                "message": "NI 43-101 processed successfully with hybrid approach"
-            }
+                logger.error(f"Error storing economics: {str(e)}")
 
+        # Store full document text for RAG/semantic search
+        chunks_stored = 0
+        try:
+            from .rag_utils import RAGManager
+            rag_manager = RAGManager()
+            chunks_stored = rag_manager.store_document_chunks(document, docling_data['text'])
+            logger.info(f"Stored {chunks_stored} chunks for semantic search")
         except Exception as e:
-            return {"error": f"Hybrid processing failed: {str(e)}"}
-        finally:
-            # Cleanup temp file if it still exists
-            if 'pdf_path' in locals() and pdf_path.exists():
-                pdf_path.unlink()
+            logger.error(f"Error storing document chunks for RAG: {str(e)}")
+
+        return {
+            "document": document,
+            "project": project,
+            "resources_stored": resources_added,
+            "economic_study_stored": econ_stored,
+            "document_chunks_stored": chunks_stored
+        }
 
     def _extract_resource_tables(self, document_url: str) -> Dict:
         """Extract resource tables using Docling"""
@@ -855,7 +839,8 @@ Structure:
         company_name: str,
         project_name: str = None,
         decomposition_strategy: str = "hybrid",
-        validate: bool = True
+        validate: bool = True,
+        on_stage=None
     ) -> Dict:
         """
         Process NI 43-101 using Recursive Language Model (RLM) approach.
@@ -868,190 +853,22 @@ Structure:
 
         Best for documents over 50 pages where standard processing may miss information.
         """
-        try:
-            # Find company
-            company = Company.objects.filter(
-                Q(name__icontains=company_name) | Q(ticker_symbol__iexact=company_name)
-            ).first()
-
-            if not company:
-                return {"error": f"Company '{company_name}' not found"}
-
-            # Step 1: Download PDF
-            pdf_path = self._download_pdf(document_url)
-
-            # Step 2: Extract with Docling
-            docling_data = self._process_with_docling(pdf_path)
-
-            # Clean up temp file
-            pdf_path.unlink()
-
-            page_count = docling_data.get('page_count', 0)
-            logger.info(f"[RLM] Document has {page_count} pages, {len(docling_data['tables'])} tables")
-
-            # Step 3: Process with RLM
-            strategy_map = {
-                "hybrid": DecompositionStrategy.HYBRID,
-                "section": DecompositionStrategy.SECTION_BASED,
-                "page": DecompositionStrategy.PAGE_BASED,
-                "semantic": DecompositionStrategy.SEMANTIC
-            }
-            strategy = strategy_map.get(decomposition_strategy, DecompositionStrategy.HYBRID)
-
-            rlm_result = self.rlm_processor.process_document(
-                document_text=docling_data['text'],
-                tables=docling_data['tables'],
-                strategy=strategy,
-                validate=validate
-            )
-
-            # Convert to dictionary
-            extracted_data = self.rlm_processor.to_dict(rlm_result)
-
-            # Step 4: Store in database
-            doc_info = extracted_data.get('document_info', {})
-            doc_date = datetime.now().date()
-            if doc_info.get('report_date'):
-                try:
-                    doc_date = datetime.strptime(doc_info['report_date'], "%Y-%m-%d").date()
-                except (ValueError, TypeError):
-                    pass  # Use default date if parsing fails
+        company = self._find_company(company_name)
+        if not company:
+            return {"error": f"Company '{company_name}' not found"}
 
-            document = Document.objects.create(
+        try:
+            return DocumentPipeline(self, on_stage=on_stage).run(
+                document_url=document_url,
                 company=company,
-                title=doc_info.get('title', 'NI 43-101 Technical Report'),
-                document_type='ni43101',
-                document_date=doc_date,
-                file_url=document_url,
-                description=f"Processed with RLM ({strategy.value}) on {datetime.now().strftime('%Y-%m-%d')}"
+                project_name=project_name,
+                mode='rlm',
+                decomposition_strategy=decomposition_strategy,
+                validate=validate
             )
-
-            # Store project
-            project = None
-            project_info = extracted_data.get('project_info', {})
-            if project_info.get('project_name') or project_name:
-                proj_name = project_info.get('project_name') or project_name
-                project, created = Project.objects.get_or_create(
-                    company=company,
-                    name=proj_name,
-                    defaults={
-                        'country': project_info.get('country', 'Unknown'),
-                        'project_stage': project_info.get('stage', 'exploration'),
-                        'primary_commodity': 'gold'
-                    }
-                )
-                document.project = project
-                document.save()
-
-            # Store resources
-            resources_added = 0
-            for res in extracted_data.get('mineral_resources', []):
-                if res.get('tonnage_mt') and res.get('grade'):
-                    try:
-                        mineral_type = res.get('mineral_type', 'gold').lower()
-                        grade_value = Decimal(str(res['grade']))
-
-                        grade_fields = {}
-                        if mineral_type in ['gold', 'au']:
-                            if res.get('grade_unit') == 'g/t':
-                                grade_fields['gold_grade_gpt'] = grade_value
-                            if res.get('contained_metal'):
-                                grade_fields['gold_ounces'] = Decimal(str(res['contained_metal']))
-                        elif mineral_type in ['silver', 'ag']:
-                            if res.get('grade_unit') == 'g/t':
-                                grade_fields['silver_grade_gpt'] = grade_value
-                            if res.get('contained_metal'):
-                                grade_fields['silver_ounces'] = Decimal(str(res['contained_metal']))
-                        elif mineral_type in ['copper', 'cu']:
-                            if res.get('grade_unit') == '%':
-                                grade_fields['copper_grade_pct'] = grade_value
-
-                        # Determine category
-                        category = res.get('category', 'inferred').lower()
-                        if res.get('is_reserve'):
-                            category = 'proven' if 'proven' in category else 'probable'
-
-                        ResourceEstimate.objects.create(
-                            project=project or Project.objects.filter(company=company).first(),
-                            category=category,
-                            standard='ni43101',
-                            tonnes=Decimal(str(res['tonnage_mt'])) * Decimal('1000000'),
-                            report_date=doc_date,
-                            effective_date=doc_date,
-                            **grade_fields
-                        )
-                        resources_added += 1
-                    except Exception as e:
-                        logger.error(f"[RLM] Error storing resource: {str(e)}")
-
-            # Store economic study
-            econ_data = extracted_data.get('economic_study', {})
-            econ_stored = False
-            npv_value = econ_data.get('npv_usd_millions') or econ_data.get('npv_millions')
-            if npv_value:
-                try:
-                    EconomicStudy.objects.create(
-                        project=project or Project.objects.filter(company=company).first(),
-                        study_type=econ_data.get('study_type', 'pea').lower(),
-                        study_date=doc_date,
-                        npv_usd=Decimal(str(npv_value)) * Decimal('1000000'),
-                        discount_rate=Decimal(str(econ_data.get('discount_rate_percent') or econ_data.get('discount_rate', 5))),
-                        irr=Decimal(str(econ_data.get('irr_percent', 0))) if econ_data.get('irr_percent') else None,
-                        capex_initial=Decimal(str(econ_data.get('capex_initial_usd_millions', 0))) * Decimal('1000000') if econ_data.get('capex_initial_usd_millions') else None,
-                        payback_period_years=Decimal(str(econ_data.get('payback_period_years', 0))) if econ_data.get('payback_period_years') else None,
-                        mine_life_years=int(econ_data.get('mine_life_years', 0)) if econ_data.get('mine_life_years') else None
-                    )
-                    econ_stored = True
-                except Exception as e:
-                    logger.error(f"[RLM] Error storing economics: {str(e)}")
-
-            # Store document chunks for RAG
-            chunks_stored = 0
-            try:
-                from .rag_utils import RAGManager
-                rag_manager = RAGManager()
-                full_text = docling_data['text']
-                chunks_stored = rag_manager.store_document_chunks(document, full_text)
-                logger.info(f"[RLM] Stored {chunks_stored} chunks for semantic search")
-            except Exception as e:
-                logger.error(f"[RLM] Error storing document chunks for RAG: {str(e)}")
-
-            # Get processing metadata
-            proc_meta = extracted_data.get('processing_metadata', {})
-
+        except Exception as e:
+            logger.exception(f"[RLM] Processing failed: {e}")
             return {
-                "success": True,
-                "method": f"RLM ({strategy.value} decomposition)",
-                "document_id": document.id,
-                "company": company.name,
-                "project": project.name if project else None,
-                "rlm_stats": {
-                    "chunks_processed": proc_meta.get('chunks_processed', 0),
-                    "successful_extractions": proc_meta.get('successful_extractions', 0),
-                    "processing_time_seconds": proc_meta.get('processing_time_seconds', 0),
-                    "validation_passed": proc_meta.get('validation_passed'),
-                    "decomposition_strategy": strategy.value
-                },
-                "processing_stats": {
-                    "pages_processed": page_count,
-                    "tables_extracted": len(docling_data['tables']),
-                    "resources_stored": resources_added,
-                    "economic_study_stored": econ_stored,
-                    "document_chunks_stored": chunks_stored
-                },
-                "extracted_data": {
-                    "document_info": doc_info,
-                    "project_info": project_info,
-                    "key_findings": extracted_data.get('key_findings', {}),
-                    "resources_summary": f"{len(extracted_data.get('mineral_resources', []))} resource categories found"
-                },
-                "message": f"NI 43-101 processed successfully with RLM ({strategy.value})"
+                "error": f"RLM processing failed: {str(e)}",
+                "stage_timings": getattr(e, 'stage_timings', {})
             }
-
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            return {"error": f"RLM processing failed: {str(e)}"}
-        finally:
-            if 'pdf_path' in locals() and pdf_path.exists():
-                pdf_path.unlink()
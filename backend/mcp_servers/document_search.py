@@ -24,7 +24,7 @@ class DocumentSearchServer(BaseMCPServer):
         return [
             {
                 "name": "search_documents",
-                "description": """Search across all processed NI 43-101 technical reports and company documents.
+                "description": """Search across all processed NI 43-101 technical reports, company documents and news content.
 
                 This tool performs semantic search to find relevant information from processed documents.
                 Use this when users ask questions about:
@@ -82,13 +82,13 @@ class DocumentSearchServer(BaseMCPServer):
         ]
 
     def _search_documents(self, query: str, company_name: str = None, max_results: int = 5) -> Dict:
-        """Search documents and return results"""
+        """Search documents and news content and return one fused, ranked list"""
         try:
-            results = self.rag_manager.search_documents(
+            results = self.rag_manager.search_all(
                 query=query,
                 n_results=max_results,
                 filter_company=company_name
-            )
+            )['combined'][:max_results]
 
             if not results:
                 return {
@@ -101,17 +101,28 @@ class DocumentSearchServer(BaseMCPServer):
             formatted_results = []
             for idx, result in enumerate(results, 1):
                 meta = result['metadata']
-                formatted_results.append({
-                    "rank": idx,
-                    "relevance_score": 1 - result['distance'] if result.get('distance') else None,
-                    "text": result['text'],
-                    "source": {
+                if result['source_type'] == 'document':
+                    source = {
+                        "type": "document",
                         "document_title": meta['document_title'],
                         "document_date": meta['document_date'],
                         "company": meta['company'],
                         "document_type": meta['document_type'],
                         "document_id": meta['document_id']
                     }
+                else:
+                    source = {
+                        "type": "news",
+                        "title": meta.get('title', 'Unknown'),
+                        "date": meta.get('date', ''),
+                        "company": meta.get('company', ''),
+                        "url": meta.get('url', '')
+                    }
+                formatted_results.append({
+                    "rank": idx,
+                    "relevance_score": round(result['relevance'], 3) if result['relevance'] is not None else None,
+                    "text": result['text'],
+                    "source": source
                 })
 
             return {
@@ -3,13 +3,23 @@ Embedding utilities for RAG functionality.
 
 Uses Voyage AI for fast, high-quality embeddings.
 Falls back to ChromaDB's default embeddings if Voyage AI is not configured.
+
+Query embeddings go through a process-wide service that reuses one Voyage
+client and keeps an LRU cache keyed by (model, input_type, normalized text),
+optionally backed by the Django cache (Redis in production) so repeated chat
+questions skip the embedding API across workers.
 """
 
+import hashlib
 import logging
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
-from typing import List, Optional
+from typing import Dict, List, Optional
 from chromadb.api.types import EmbeddingFunction, Documents, Embeddings
 
 # Try to import voyageai
@@ -19,6 +29,23 @@ try:
 except ImportError:
     VOYAGE_AVAILABLE = False
 
+VOYAGE_MODEL = "voyage-2"
+# Model ChromaDB uses when a collection has no embedding function
+CHROMA_DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+_voyage_clients = {}
+_voyage_clients_lock = threading.Lock()
+
+
+def get_voyage_client(api_key: str):
+    """Return a process-wide Voyage AI client for api_key (connections are reused)"""
+    with _voyage_clients_lock:
+        client = _voyage_clients.get(api_key)
+        if client is None:
+            client = voyageai.Client(api_key=api_key)
+            _voyage_clients[api_key] = client
+        return client
+
 
 class VoyageEmbeddingFunction(EmbeddingFunction[Documents]):
     """
@@ -28,7 +55,7 @@ class VoyageEmbeddingFunction(EmbeddingFunction[Documents]):
     Model: voyage-2 (best balance of speed and quality)
     """
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "voyage-2"):
+    def __init__(self, api_key: Optional[str] = None, model: str = VOYAGE_MODEL):
         """
         Initialize the Voyage AI embedding function.
 
@@ -47,7 +74,7 @@ class VoyageEmbeddingFunction(EmbeddingFunction[Documents]):
             raise ValueError("Voyage AI API key not provided. Set VOYAGE_API_KEY environment variable.")
 
         self.model = model
-        self.client = voyageai.Client(api_key=self.api_key)
+        self.client = get_voyage_client(self.api_key)
 
     def __call__(self, input: Documents) -> Embeddings:
         """
@@ -105,11 +132,190 @@ def get_embedding_function() -> Optional[EmbeddingFunction]:
     return None
 
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class QueryEmbeddingService:
+    """
+    Process-wide query embedder with an in-memory LRU and optional shared cache.
+
+    Vectors match what the collections were built with: Voyage AI
+    (input_type="query") when configured, otherwise ChromaDB's default model.
+    """
+
+    def __init__(self, max_entries: int = 1024, shared_cache_ttl: int = 0):
+        """
+        Args:
+            max_entries: In-process LRU capacity (0 disables the local cache)
+            shared_cache_ttl: Seconds to keep vectors in the Django cache
+                              (0 disables the shared cache)
+        """
+        self.max_entries = max_entries
+        self.shared_cache_ttl = shared_cache_ttl
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._default_function = None
+        self._stats = {
+            'hits': 0,
+            'shared_hits': 0,
+            'misses': 0,
+            'errors': 0,
+            'api_seconds': 0.0,
+        }
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Collapse whitespace so trivially different phrasings share a cache entry"""
+        return _WHITESPACE_RE.sub(' ', text).strip()
+
+    @staticmethod
+    def cache_key(model: str, input_type: str, text: str) -> str:
+        digest = hashlib.sha256(f"{model}\0{input_type}\0{text}".encode('utf-8')).hexdigest()
+        return f"query_embedding:{digest}"
+
+    def _backend(self):
+        """Return (model name, embed callable) for the active embedding provider"""
+        api_key = os.getenv('VOYAGE_API_KEY', '')
+        if api_key and VOYAGE_AVAILABLE:
+            client = get_voyage_client(api_key)
+
+            def embed(texts, input_type):
+                return client.embed(texts=texts, model=VOYAGE_MODEL, input_type=input_type).embeddings
+
+            return VOYAGE_MODEL, embed
+
+        if self._default_function is None:
+            from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+            self._default_function = DefaultEmbeddingFunction()
+        default_function = self._default_function
+
+        def embed(texts, input_type):
+            return [list(map(float, vector)) for vector in default_function(texts)]
+
+        return CHROMA_DEFAULT_MODEL, embed
+
+    def _get_shared(self, key: str) -> Optional[List[float]]:
+        if not self.shared_cache_ttl:
+            return None
+        try:
+            from django.core.cache import cache
+            return cache.get(key)
+        except Exception as e:
+            logger.debug(f"Shared embedding cache unavailable: {e}")
+            return None
+
+    def _set_shared(self, key: str, vector: List[float]):
+        if not self.shared_cache_ttl:
+            return
+        try:
+            from django.core.cache import cache
+            cache.set(key, vector, timeout=self.shared_cache_ttl)
+        except Exception as e:
+            logger.debug(f"Shared embedding cache unavailable: {e}")
+
+    def _remember(self, key: str, vector: List[float]):
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._cache[key] = vector
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def embed(self, text: str, input_type: str = "query") -> Optional[List[float]]:
+        """
+        Return the embedding for text, from cache when possible.
+
+        Returns:
+            Embedding vector, or None if embedding fails (callers should then
+            fall back to query_texts)
+        """
+        text = self.normalize(text)
+        if not text:
+            return None
+
+        try:
+            model, embed = self._backend()
+        except Exception as e:
+            with self._lock:
+                self._stats['errors'] += 1
+            logger.warning(f"Query embedding unavailable: {e}")
+            return None
+
+        key = self.cache_key(model, input_type, text)
+        with self._lock:
+            vector = self._cache.get(key)
+            if vector is not None:
+                self._cache.move_to_end(key)
+                self._stats['hits'] += 1
+                return vector
+
+        vector = self._get_shared(key)
+        if vector is not None:
+            with self._lock:
+                self._stats['shared_hits'] += 1
+            self._remember(key, vector)
+            return vector
+
+        start = time.perf_counter()
+        try:
+            vector = list(embed([text], input_type)[0])
+        except Exception as e:
+            with self._lock:
+                self._stats['errors'] += 1
+            logger.warning(f"Query embedding failed: {e}")
+            return None
+
+        with self._lock:
+            self._stats['misses'] += 1
+            self._stats['api_seconds'] += time.perf_counter() - start
+        self._remember(key, vector)
+        self._set_shared(key, vector)
+        return vector
+
+    def stats(self) -> Dict:
+        """Cache hit-rate metrics for this process"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._cache)
+        lookups = stats['hits'] + stats['shared_hits'] + stats['misses']
+        stats['lookups'] = lookups
+        stats['hit_rate'] = round((stats['hits'] + stats['shared_hits']) / lookups, 3) if lookups else 0.0
+        stats['api_seconds'] = round(stats['api_seconds'], 3)
+        return stats
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+_query_service = None
+_query_service_lock = threading.Lock()
+
+
+def get_query_embedding_service() -> QueryEmbeddingService:
+    """Return the process-wide query embedding service (configured from Django settings)"""
+    global _query_service
+    with _query_service_lock:
+        if _query_service is None:
+            max_entries, shared_ttl = 1024, 0
+            try:
+                from django.conf import settings
+                max_entries = getattr(settings, 'EMBEDDING_QUERY_CACHE_SIZE', max_entries)
+                if getattr(settings, 'EMBEDDING_QUERY_CACHE_SHARED', False):
+                    shared_ttl = getattr(settings, 'EMBEDDING_QUERY_CACHE_TTL', 24 * 60 * 60)
+            except Exception:
+                pass  # Settings not configured (standalone use)
+            _query_service = QueryEmbeddingService(max_entries=max_entries, shared_cache_ttl=shared_ttl)
+        return _query_service
+
+
 def embed_query(query: str) -> Optional[List[float]]:
     """
     Generate embedding for a search query.
 
-    Uses Voyage AI with input_type="query" for better search performance.
+    Uses Voyage AI with input_type="query" for better search performance,
+    served from the process-wide query cache when the same question repeats.
 
     Args:
         query: The search query text
@@ -117,19 +323,9 @@ def embed_query(query: str) -> Optional[List[float]]:
     Returns:
         Embedding vector, or None if embedding fails
     """
-    api_key = os.getenv('VOYAGE_API_KEY', '')
+    return get_query_embedding_service().embed(query)
+
 
-    if not api_key or not VOYAGE_AVAILABLE:
-        return None  # Let ChromaDB handle it
-
-    try:
-        client = voyageai.Client(api_key=api_key)
-        result = client.embed(
-            texts=[query],
-            model="voyage-2",
-            input_type="query"  # Optimized for search queries
-        )
-        return result.embeddings[0]
-    except Exception as e:
-        logger.warning(f"Query embedding failed: {e}")
-        return None
+def get_query_embedding_stats() -> Dict:
+    """Hit-rate metrics of the process-wide query embedding cache"""
+    return get_query_embedding_service().stats()
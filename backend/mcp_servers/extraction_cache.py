@@ -0,0 +1,169 @@
+"""
+Content-Addressed Extraction Cache
+
+Two-level disk cache that lets reprocessed documents skip expensive work:
+
+1. Docling level: PDF SHA-256 -> Docling output (markdown text, tables, page count)
+2. Chunk level:   hash(prompt, chunk content, model) -> parsed extraction JSON
+
+Because chunk keys include the prompt text, changing one prompt only
+invalidates the chunks that use it; every other chunk is served from disk.
+
+Entries are gzip-compressed JSON files sharded by hash prefix. Hits refresh
+the file's mtime, and writes evict the least recently used files once the
+level exceeds its size budget.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DiskLRUCache:
+    """Size-bounded, disk-backed JSON cache with least-recently-used eviction"""
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._size = None  # Computed lazily on first write
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json.gz"
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"[CACHE] Discarding unreadable entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: Any):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temp file and rename so concurrent readers never see partial data
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                f.write(json.dumps(value, default=str).encode('utf-8'))
+            old_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_name, path)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += path.stat().st_size - old_size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _scan_size(self) -> int:
+        return sum(p.stat().st_size for p in self.directory.glob('*/*.json.gz'))
+
+    def _evict(self):
+        """Delete least recently used entries until the cache is at 90% of its budget"""
+        entries = []
+        for p in self.directory.glob('*/*.json.gz'):
+            try:
+                stat = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, p))
+        entries.sort()
+
+        size = sum(e[1] for e in entries)
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        for _, entry_size, p in entries:
+            if size <= target:
+                break
+            p.unlink(missing_ok=True)
+            size -= entry_size
+            evicted += 1
+
+        self._size = size
+        if evicted:
+            logger.info(f"[CACHE] Evicted {evicted} entries from {self.directory.name}")
+
+
+class ExtractionCache:
+    """Docling-output and chunk-extraction caches keyed by content hash"""
+
+    def __init__(self, directory: Path, max_bytes: int):
+        directory = Path(directory)
+        # Docling output is large but rare; chunk results are small but numerous
+        self.docling = DiskLRUCache(directory / 'docling', int(max_bytes * 0.8))
+        self.chunks = DiskLRUCache(directory / 'chunks', int(max_bytes * 0.2))
+
+    @staticmethod
+    def hash_file(path: Path) -> str:
+        """SHA-256 of a file, read in 1 MB blocks"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def chunk_key(prompt: str, content: str, model: str) -> str:
+        digest = hashlib.sha256()
+        for part in (model, prompt, content):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get_docling(self, pdf_sha256: str) -> Optional[Dict]:
+        return self.docling.get(pdf_sha256)
+
+    def set_docling(self, pdf_sha256: str, docling_data: Dict):
+        self.docling.set(pdf_sha256, docling_data)
+
+    def get_chunk(self, key: str) -> Optional[Dict]:
+        return self.chunks.get(key)
+
+    def set_chunk(self, key: str, data: Dict):
+        self.chunks.set(key, data)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """Return the process-wide extraction cache, or None if disabled in settings"""
+    global _cache
+    if not getattr(settings, 'EXTRACTION_CACHE_ENABLED', True):
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            directory = getattr(settings, 'EXTRACTION_CACHE_DIR', None) or Path(settings.BASE_DIR) / 'extraction_cache'
+            max_mb = getattr(settings, 'EXTRACTION_CACHE_MAX_MB', 2048)
+            _cache = ExtractionCache(Path(directory), max_mb * 1024 * 1024)
+        return _cache
@@ -0,0 +1,175 @@
+"""
+Structured Extraction Schema for NI 43-101 Chunk Calls
+
+RLMProcessor's tool extraction mode forces Claude to answer through the
+record_extraction tool, whose input schema is EXTRACTION_SCHEMA, instead of
+free-form JSON recovered by string scanning.
+
+validate_extraction() checks a result section by section (document_info,
+project_info, mineral_resources, ...): valid sections are kept as they are and
+only the failing ones are sent back for repair, so one bad field does not
+discard the rest of the chunk. Only the JSON Schema keywords used here are
+supported (type, properties, items, required), which avoids a jsonschema
+dependency.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+NUMBER = {"type": ["number", "null"]}
+STRING = {"type": ["string", "null"]}
+STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+RESOURCE_ITEM = {
+    "type": "object",
+    "properties": {
+        "category": {"type": "string", "description": "measured, indicated, inferred (or combined, e.g. measured & indicated)"},
+        "mineral_type": {"type": "string", "description": "gold, silver, copper, zinc, ..."},
+        "tonnage_mt": {**NUMBER, "description": "Million tonnes"},
+        "grade": NUMBER,
+        "grade_unit": {**STRING, "description": "g/t, %, oz/t"},
+        "contained_metal": NUMBER,
+        "contained_unit": {**STRING, "description": "oz, tonnes, lbs"},
+        "cutoff_grade": NUMBER,
+        "zone_name": STRING,
+    },
+    "required": ["category"],
+}
+
+RESERVE_ITEM = {
+    "type": "object",
+    "properties": {
+        "category": {"type": "string", "description": "proven or probable"},
+        "mineral_type": {"type": "string", "description": "gold, silver, copper, zinc, ..."},
+        "tonnage_mt": {**NUMBER, "description": "Million tonnes"},
+        "grade": NUMBER,
+        "grade_unit": STRING,
+        "contained_metal": NUMBER,
+        "contained_unit": STRING,
+    },
+    "required": ["category"],
+}
+
+EXTRACTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "document_info": {
+            "type": "object",
+            "properties": {
+                "title": STRING,
+                "report_date": {**STRING, "description": "YYYY-MM-DD"},
+                "authors": STRING_LIST,
+                "qualified_persons": {**STRING_LIST, "description": "QPs with credentials"},
+            },
+        },
+        "project_info": {
+            "type": "object",
+            "properties": {
+                "project_name": STRING,
+                "location": STRING,
+                "country": STRING,
+                "province_state": STRING,
+                "property_size_hectares": NUMBER,
+                "ownership_percentage": NUMBER,
+                "stage": {**STRING, "description": "exploration, development or production"},
+            },
+        },
+        "mineral_resources": {"type": "array", "items": RESOURCE_ITEM},
+        "mineral_reserves": {"type": "array", "items": RESERVE_ITEM},
+        "economic_study": {
+            "type": "object",
+            "properties": {
+                "study_type": {**STRING, "description": "PEA, PFS or FS"},
+                "npv_usd_millions": NUMBER,
+                "discount_rate_percent": NUMBER,
+                "irr_percent": NUMBER,
+                "capex_initial_usd_millions": NUMBER,
+                "capex_sustaining_usd_millions": NUMBER,
+                "opex_per_tonne_usd": NUMBER,
+                "payback_period_years": NUMBER,
+                "mine_life_years": NUMBER,
+                "gold_price_assumption": NUMBER,
+                "annual_production_oz": NUMBER,
+            },
+        },
+        "key_findings": {
+            "type": "object",
+            "properties": {
+                "highlights": STRING_LIST,
+                "risks": STRING_LIST,
+                "recommendations": STRING_LIST,
+            },
+        },
+    },
+}
+
+EXTRACTION_SECTIONS = tuple(EXTRACTION_SCHEMA["properties"])
+
+EXTRACTION_TOOL = {
+    "name": "record_extraction",
+    "description": (
+        "Record the data stated in one part of an NI 43-101 technical report. "
+        "Omit sections the text says nothing about and use null for values that are not stated."
+    ),
+    "input_schema": EXTRACTION_SCHEMA,
+}
+
+JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "boolean": bool,
+    "null": type(None),
+}
+
+
+def _is_type(value: Any, type_name: str) -> bool:
+    # bool is an int subclass but never a valid number here
+    if type_name == "number":
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if type_name == "integer":
+        return isinstance(value, int) and not isinstance(value, bool)
+    return isinstance(value, JSON_TYPES[type_name])
+
+
+def schema_errors(value: Any, schema: Dict, path: str) -> List[str]:
+    """Validation errors for value against schema, as "path: problem" strings"""
+    types = schema.get("type")
+    if types:
+        allowed = [types] if isinstance(types, str) else types
+        if not any(_is_type(value, t) for t in allowed):
+            return [f"{path}: expected {' or '.join(allowed)}, got {type(value).__name__} {str(value)[:60]!r}"]
+
+    errors = []
+    if isinstance(value, dict):
+        for key in schema.get("required", []):
+            if value.get(key) is None:
+                errors.append(f"{path}.{key}: missing")
+        for key, sub_schema in schema.get("properties", {}).items():
+            if key in value:
+                errors.extend(schema_errors(value[key], sub_schema, f"{path}.{key}"))
+    elif isinstance(value, list) and "items" in schema:
+        for i, item in enumerate(value):
+            errors.extend(schema_errors(item, schema["items"], f"{path}[{i}]"))
+    return errors
+
+
+def validate_extraction(data: Any) -> Tuple[Dict, Dict[str, List[str]]]:
+    """
+    Validate an extraction section by section
+
+    Returns:
+        (valid sections, {section: errors} for the failing ones). Keys outside
+        the schema are passed through unchecked.
+    """
+    if not isinstance(data, dict):
+        return {}, {"response": [f"expected an object, got {type(data).__name__}"]}
+
+    valid, errors = {}, {}
+    for key, value in data.items():
+        sub_schema = EXTRACTION_SCHEMA["properties"].get(key)
+        section_errors = schema_errors(value, sub_schema, key) if sub_schema else []
+        if section_errors:
+            errors[key] = section_errors
+        else:
+            valid[key] = value
+    return valid, errors
@@ -408,23 +408,21 @@ class FinancialDataServer(BaseMCPServer):
     def _compare_market_caps(self, sort_by: str = "market_cap") -> Dict:
         """Compare market capitalizations across companies"""
         try:
-            # Get latest market data for each company
-            companies = Company.objects.filter(is_active=True)
+            # Latest market data for every active company in one query
+            latest_rows = MarketData.latest_queryset().filter(
+                company__is_active=True
+            ).select_related('company')
 
             comparisons = []
-            for company in companies:
-                latest_data = MarketData.objects.filter(
-                    company=company
-                ).order_by('-date').first()
-
-                if latest_data:
-                    comparisons.append({
-                        "company": company.name,
-                        "ticker": company.ticker_symbol,
-                        "price": float(latest_data.close_price),
-                        "volume": latest_data.volume,
-                        "date": latest_data.date.isoformat()
-                    })
+            for latest_data in latest_rows:
+                company = latest_data.company
+                comparisons.append({
+                    "company": company.name,
+                    "ticker": company.ticker_symbol,
+                    "price": float(latest_data.close_price),
+                    "volume": latest_data.volume,
+                    "date": latest_data.date.isoformat()
+                })
 
             # Sort
             if sort_by == "price":
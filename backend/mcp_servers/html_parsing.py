@@ -0,0 +1,98 @@
+"""
+HTML parsing for crawled pages.
+
+The crawlers and scrapers parsed every page with BeautifulSoup's pure-Python
+'html.parser', and a page fetched by several strategies in one crawl (the
+news page tried by the Wix, investors and listing scans, a source URL that
+is also its own /news page) was parsed again each time. This module:
+
+- builds trees with lxml when it is installed (HTML_PARSER setting, falling
+  back to 'html.parser'); the result is still a BeautifulSoup tree, so
+  extractors keep their find/select code;
+- shares one tree per page: page_soup(html) returns the same parsed tree
+  for the same HTML from a small per-process LRU. Shared trees must be
+  treated as read-only; callers that strip tags use parse_html() for a
+  private tree;
+- exposes precompiled CSS selectors (css()), so selectors used in loops
+  are parsed once instead of on every select call.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+import soupsieve
+from bs4 import BeautifulSoup
+from django.conf import settings
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_trees = OrderedDict()  # html -> BeautifulSoup, most recently used last
+_trees_lock = threading.Lock()
+stats = {'parsed': 0, 'shared': 0, 'parse_seconds': 0.0}
+
+
+def html_parser_name() -> str:
+    """Tree builder for crawled pages: HTML_PARSER if available, else 'html.parser'"""
+    parser = getattr(settings, 'HTML_PARSER', 'lxml')
+    if parser == 'lxml' and not LXML_AVAILABLE:
+        return 'html.parser'
+    return parser
+
+
+def parse_html(html: str, parser: str = None) -> BeautifulSoup:
+    """Parse HTML into a new tree the caller may modify"""
+    started = time.perf_counter()
+    soup = BeautifulSoup(html or '', parser or html_parser_name())
+    stats['parsed'] += 1
+    stats['parse_seconds'] += time.perf_counter() - started
+    return soup
+
+
+def page_soup(html: str) -> BeautifulSoup:
+    """
+    Shared, read-only tree for a fetched page.
+
+    The same HTML (the same page fetched again in one crawl) returns the tree
+    parsed the first time. Do not decompose or extract tags from it.
+    """
+    html = html or ''
+    max_pages = getattr(settings, 'HTML_TREE_CACHE_PAGES', 8)
+    with _trees_lock:
+        soup = _trees.get(html)
+        if soup is not None:
+            _trees.move_to_end(html)
+            stats['shared'] += 1
+            return soup
+
+    soup = parse_html(html)
+    if max_pages > 0:
+        with _trees_lock:
+            _trees[html] = soup
+            while len(_trees) > max_pages:
+                _trees.popitem(last=False)
+    return soup
+
+
+def clear_page_trees():
+    """Drop the shared trees (e.g. at the end of a crawl)"""
+    with _trees_lock:
+        _trees.clear()
+
+
+@lru_cache(maxsize=512)
+def css(selector: str) -> soupsieve.SoupSieve:
+    """
+    Compiled CSS selector: css('a[href]').select(soup), .select_one(tag), .match(tag).
+
+    Compiled once per selector string and reused by every page.
+    """
+    return soupsieve.compile(selector)
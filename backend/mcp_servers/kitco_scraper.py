@@ -12,6 +12,8 @@ from datetime import datetime
 from typing import Dict, List, Optional
 import logging
 
+from .html_parsing import parse_html
+
 logger = logging.getLogger(__name__)
 
 
@@ -87,7 +89,7 @@ class KitcoScraper:
             response = self.session.get(self.BASE_URL, timeout=30)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = parse_html(response.text)
             prices = []
 
             # Find price tables/sections
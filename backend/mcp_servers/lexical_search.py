@@ -0,0 +1,147 @@
+"""
+Lexical (Full-Text) Search over Document and News Chunks
+
+PostgreSQL full-text search against the generated, GIN-indexed
+search_vector columns on DocumentChunk and NewsChunk. Complements the
+ChromaDB vector search for queries that hinge on exact tokens - figures
+("NPV at 5% discount"), drill hole IDs ("DDH-23-014"), claim numbers.
+
+A strict query (all terms, websearch syntax) runs first; if it returns too
+few rows, an any-term query fills the remaining slots. Results use the same
+dict shape as RAGManager.search_documents / search_news so they can be fused
+with vector results (see retrieval.fuse_results).
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+
+from core.models import DocumentChunk, NewsChunk
+
+SEARCH_CONFIG = 'english'
+
+# Terms for the any-term fallback: keep hyphenated IDs and decimals together
+_TERM_RE = re.compile(r'\w[\w.\-/]*\w|\w')
+
+
+def _any_term_query(query: str) -> Optional[SearchQuery]:
+    terms = _TERM_RE.findall(query)
+    if not terms:
+        return None
+    search_query = SearchQuery(terms[0], config=SEARCH_CONFIG)
+    for term in terms[1:]:
+        search_query |= SearchQuery(term, config=SEARCH_CONFIG)
+    return search_query
+
+
+def _ranked(queryset, query: str, n_results: int) -> List:
+    """Best-first rows for query: strict matches, then any-term matches"""
+    strict = SearchQuery(query, search_type='websearch', config=SEARCH_CONFIG)
+    rows = list(
+        queryset.filter(search_vector=strict)
+        .annotate(rank=SearchRank('search_vector', strict, cover_density=True))
+        .order_by('-rank')[:n_results]
+    )
+
+    if len(rows) < n_results:
+        loose = _any_term_query(query)
+        if loose is not None:
+            seen = [row.pk for row in rows]
+            rows.extend(
+                queryset.filter(search_vector=loose)
+                .exclude(pk__in=seen)
+                .annotate(rank=SearchRank('search_vector', loose, cover_density=True))
+                .order_by('-rank')[:n_results - len(rows)]
+            )
+    return rows
+
+
+def search_document_chunks(query: str, n_results: int = 5, filter_company: str = None) -> List[Dict]:
+    """
+    Full-text search across document chunks
+
+    Args:
+        query: User's question or search terms
+        n_results: Number of results to return
+        filter_company: Optional exact company name (same filter as the vector search)
+
+    Returns:
+        List of chunks in RAGManager.search_documents format, plus lexical_score
+    """
+    queryset = DocumentChunk.objects.select_related('document__company').defer('search_vector')
+    if filter_company:
+        queryset = queryset.filter(document__company__name=filter_company)
+
+    results = []
+    for chunk in _ranked(queryset, query, n_results):
+        document = chunk.document
+        metadata = {
+            'document_id': document.id,
+            'company': document.company.name,
+            'document_type': document.document_type,
+            'document_date': str(document.document_date),
+            'document_title': document.title[:100],
+            'chunk_index': chunk.chunk_index,
+        }
+        results.append({
+            'text': chunk.text,
+            'metadata': metadata,
+            'distance': None,
+            'document_id': document.id,
+            'chunk_index': chunk.chunk_index,
+            'chunk_id': chunk.chroma_id or f"doc_{document.id}_chunk_{chunk.chunk_index}",
+            'source_type': 'document',
+            'retrieval': 'lexical',
+            'lexical_score': chunk.rank,
+        })
+    return results
+
+
+def search_news_chunks(query: str, n_results: int = 5, filter_company: str = None,
+                       content_type: str = None) -> List[Dict]:
+    """
+    Full-text search across news chunks
+
+    Args:
+        query: User's question or search terms
+        n_results: Number of results to return
+        filter_company: Optional exact company name
+        content_type: Optional NewsChunk content type (e.g. 'news_release')
+
+    Returns:
+        List of chunks in RAGManager.search_news format, plus lexical_score
+    """
+    queryset = NewsChunk.objects.select_related('company').defer('search_vector')
+    if filter_company:
+        queryset = queryset.filter(company__name=filter_company)
+    if content_type:
+        queryset = queryset.filter(content_type=content_type)
+
+    results = []
+    for chunk in _ranked(queryset, query, n_results):
+        company_name = chunk.company.name if chunk.company else 'Unknown'
+        date = str(chunk.source_date) if chunk.source_date else ''
+        metadata = {
+            'content_type': chunk.content_type,
+            'source_id': chunk.news_release_id or chunk.news_article_id or chunk.company_news_id,
+            'company': company_name,
+            'company_id': chunk.company_id or 0,
+            'title': chunk.source_title[:100],
+            'url': chunk.source_url,
+            'date': date,
+            'chunk_index': chunk.chunk_index,
+        }
+        results.append({
+            'text': chunk.text,
+            'metadata': metadata,
+            'distance': None,
+            'chunk_id': chunk.chroma_id or f"news_{chunk.pk}",
+            'source_type': 'news',
+            'retrieval': 'lexical',
+            'lexical_score': chunk.rank,
+            'title': metadata['title'],
+            'date': date,
+            'company': company_name,
+        })
+    return results
@@ -8,13 +8,12 @@ Uses Voyage AI for fast embeddings when available, falls back to local model.
 
 import logging
 import asyncio
+import re
 import requests
 
 logger = logging.getLogger(__name__)
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
-from bs4 import BeautifulSoup
-import tiktoken
 import chromadb
 from chromadb.config import Settings
 from pathlib import Path
@@ -26,7 +25,12 @@ from core.models import (
 )
 from core.security_utils import is_safe_url, validate_redirect_url
 from .base import BaseMCPServer
-from .embeddings import get_embedding_function
+from .embeddings import embed_query, get_embedding_function
+from .html_parsing import parse_html
+from .text_chunker import get_encoding, iter_chunks
+
+# Control characters other than tab/newline (NUL bytes break PostgreSQL text fields)
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b-\x1f\x7f]')
 
 
 class NewsContentProcessor(BaseMCPServer):
@@ -45,7 +49,7 @@ class NewsContentProcessor(BaseMCPServer):
         super().__init__(company_id=company_id, user=user)
 
         # Initialize tokenizer
-        self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        self.tokenizer = get_encoding("cl100k_base")
 
         # Initialize ChromaDB
         chroma_path = Path(settings.BASE_DIR) / "chroma_db"
@@ -264,7 +268,7 @@ class NewsContentProcessor(BaseMCPServer):
             if response.text.strip().startswith('%PDF'):
                 return None
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = parse_html(response.text)
 
             # Remove script, style, nav, footer elements
             for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
@@ -299,32 +303,11 @@ class NewsContentProcessor(BaseMCPServer):
         if not text:
             return ""
         # Remove NUL bytes and other control characters except newlines/tabs
-        cleaned = ''.join(char for char in text if char == '\n' or char == '\t' or (ord(char) >= 32 and ord(char) != 127))
-        return cleaned
-
-    def _chunk_text(self, text: str, max_tokens: int = 400, overlap_tokens: int = 50) -> List[Dict]:
-        """Split text into overlapping chunks"""
-        # Sanitize text first
-        text = self._sanitize_text(text)
-        tokens = self.tokenizer.encode(text)
-        chunks = []
-        start_idx = 0
-
-        while start_idx < len(tokens):
-            end_idx = min(start_idx + max_tokens, len(tokens))
-            chunk_tokens = tokens[start_idx:end_idx]
-            chunk_text = self.tokenizer.decode(chunk_tokens)
-
-            chunks.append({
-                'text': chunk_text,
-                'token_count': len(chunk_tokens)
-            })
+        return _CONTROL_CHARS_RE.sub('', text)
 
-            start_idx = end_idx - overlap_tokens
-            if end_idx >= len(tokens):
-                break
-
-        return chunks
+    def _chunk_text(self, text: str, max_tokens: int = 400, overlap_tokens: int = 50) -> Iterator[Dict]:
+        """Split already-sanitized text into overlapping chunks, lazily"""
+        return iter_chunks(text, max_tokens=max_tokens, overlap_tokens=overlap_tokens, encoding=self.tokenizer)
 
     def _process_news_item(
         self,
@@ -372,7 +355,7 @@ class NewsContentProcessor(BaseMCPServer):
         # Prepend title for context
         full_text = f"Title: {title}\n\n{text}"
 
-        # Chunk the text
+        # Chunk the text (a generator, consumed once by the loop below)
         chunks = self._chunk_text(full_text)
 
         # Prepare ChromaDB data
@@ -430,7 +413,7 @@ class NewsContentProcessor(BaseMCPServer):
                 metadatas=chroma_metadatas
             )
 
-        return len(chunks)
+        return len(chroma_ids)
 
     def _process_company_news(
         self,
@@ -525,12 +508,20 @@ class NewsContentProcessor(BaseMCPServer):
                 if company:
                     where_filter = {"company_id": company.id}
 
-            # Query ChromaDB
-            results = self.collection.query(
-                query_texts=[query],
-                n_results=max_results,
-                where=where_filter
-            )
+            # Query ChromaDB (query vector served from the shared embedding cache)
+            query_embedding = embed_query(query)
+            if query_embedding is not None:
+                results = self.collection.query(
+                    query_embeddings=[query_embedding],
+                    n_results=max_results,
+                    where=where_filter
+                )
+            else:
+                results = self.collection.query(
+                    query_texts=[query],
+                    n_results=max_results,
+                    where=where_filter
+                )
 
             if not results or not results['documents'] or not results['documents'][0]:
                 return {
@@ -6,6 +6,7 @@ Provides tools for accessing company news releases from the database
 from typing import Dict, List
 from datetime import datetime, timedelta
 from core.models import NewsRelease, Company
+from .lexical_search import search_news_chunks
 
 
 class NewsReleaseServer:
@@ -168,12 +169,15 @@ class NewsReleaseServer:
                     "error": f"Company '{company_name}' not found"
                 }
 
-            # Search in title and URL
-            news_releases = NewsRelease.objects.filter(
+            # Title matches first, then releases whose content matches (full-text index)
+            news_releases = list(NewsRelease.objects.filter(
                 company=company
             ).filter(
                 title__icontains=keyword
-            ).order_by('-release_date')[:limit]
+            ).order_by('-release_date')[:limit])
+
+            if keyword and len(news_releases) < limit:
+                news_releases.extend(self._search_news_content(company, keyword, news_releases, limit))
 
             if not news_releases:
                 return {
@@ -204,6 +208,27 @@ class NewsReleaseServer:
         except Exception as e:
             return {"error": f"Error searching news: {str(e)}"}
 
+    def _search_news_content(self, company: Company, keyword: str,
+                             found: List[NewsRelease], limit: int) -> List[NewsRelease]:
+        """Releases whose processed content matches keyword, best match first"""
+        try:
+            chunks = search_news_chunks(
+                keyword, n_results=limit * 3, filter_company=company.name, content_type='news_release'
+            )
+        except Exception:
+            return []  # Title matches are still returned
+
+        seen = {nr.id for nr in found}
+        release_ids = []
+        for chunk in chunks:
+            release_id = chunk['metadata']['source_id']
+            if release_id and release_id not in seen:
+                seen.add(release_id)
+                release_ids.append(release_id)
+
+        releases = NewsRelease.objects.in_bulk(release_ids[:limit - len(found)])
+        return [releases[rid] for rid in release_ids if rid in releases]
+
     def _get_news_by_date_range(self, parameters: Dict) -> Dict:
         """Get news releases within a date range"""
 
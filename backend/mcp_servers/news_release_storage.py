@@ -14,6 +14,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
 from core.models import NewsRelease, Company
+from core.news_ingestion import ingest_news_releases
 from django.db import transaction
 
 
@@ -43,6 +44,7 @@ def store_news_releases(company_name: str, news_releases: List[Dict], overwrite_
         stats['errors'].append(f"Company '{company_name}' not found in database")
         return stats
 
+    items = []
     for news_item in news_releases:
         try:
             url = news_item['url']
@@ -64,48 +66,35 @@ def store_news_releases(company_name: str, news_releases: List[Dict], overwrite_
                 stats['skipped'] += 1
                 continue
 
-            # Check if news release already exists (by URL or title+date)
-            existing = NewsRelease.objects.filter(
-                company=company,
-                url=url
-            ).first()
-
-            if not existing:
-                # Check by title and date as well
-                existing = NewsRelease.objects.filter(
-                    company=company,
-                    title=title,
-                    release_date=release_date
-                ).first()
-
-            if existing:
-                if overwrite_duplicates:
-                    # Update existing
-                    existing.title = title
-                    existing.url = url
-                    existing.release_date = release_date
-                    existing.save()
-                    stats['updated'] += 1
-                else:
-                    # Skip duplicate
-                    stats['skipped'] += 1
-            else:
-                # Create new news release
-                NewsRelease.objects.create(
-                    company=company,
-                    title=title,
-                    url=url,
-                    release_date=release_date,
-                    release_type='other',  # Default type, can be classified later
-                    summary='',  # To be filled later
-                    full_text='',  # To be extracted later
-                    is_material=False  # To be determined later
-                )
-                stats['created'] += 1
+            items.append({
+                'url': url,
+                'title': title,
+                'release_date': release_date,
+                'release_type': 'other',  # Default type, can be classified later
+                'summary': '',  # To be filled later
+                'full_text': '',  # To be extracted later
+                'is_material': False  # To be determined later
+            })
 
         except Exception as e:
             stats['errors'].append(f"Error processing {news_item.get('title', 'Unknown')}: {str(e)}")
 
+    # Existing news releases (same URL, or same title and date) are updated or skipped;
+    # everything is written in bulk
+    try:
+        ingested = ingest_news_releases(
+            company,
+            items,
+            update_existing=overwrite_duplicates,
+            update_fields=['title', 'url', 'release_date'],
+            match_title_date=True
+        )
+        stats['created'] += len(ingested['created'])
+        stats['updated'] += len(ingested['updated'])
+        stats['skipped'] += ingested['skipped']
+    except Exception as e:
+        stats['errors'].append(f"Error storing news releases for {company_name}: {str(e)}")
+
     return stats
 
 
@@ -10,12 +10,15 @@ import sys
 from urllib.parse import urljoin, urlparse
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
-from bs4 import BeautifulSoup
+from crawl4ai import CrawlerRunConfig
 
 # SECURITY: Import URL validation for SSRF prevention
 from core.security_utils import is_safe_url
 
+from .crawl_engine import crawl_session
+from .date_extraction import article_date_extractor
+from .html_parsing import css, page_soup
+
 logger = logging.getLogger(__name__)
 
 # Fix Windows console encoding for Unicode characters
@@ -95,16 +98,11 @@ class MiningNewsScraper:
         self.articles = []
         config = self._get_site_config(source_url)
 
-        browser_config = BrowserConfig(
-            headless=True,
-            verbose=False
-        )
-
         crawler_config = CrawlerRunConfig(
             cache_mode="bypass",
         )
 
-        async with AsyncWebCrawler(config=browser_config) as crawler:
+        async with crawl_session() as crawler:
             self.crawler = crawler
             self.crawler_config = crawler_config
 
@@ -123,15 +121,15 @@ class MiningNewsScraper:
                     if not result.success:
                         continue
 
-                    soup = BeautifulSoup(result.html, 'html.parser')
+                    soup = page_soup(result.html)
 
                     # Use custom selector if provided, otherwise try configured selectors
                     if custom_selector:
-                        article_containers = soup.select(custom_selector)
+                        article_containers = css(custom_selector).select(soup)
                     else:
                         article_containers = []
                         for selector in config['article_selectors']:
-                            article_containers.extend(soup.select(selector))
+                            article_containers.extend(css(selector).select(soup))
 
                     logger.info(f"[{source_name}] Found {len(article_containers)} potential articles on {page_url}")
 
@@ -185,7 +183,7 @@ class MiningNewsScraper:
             if not result.success:
                 return None
 
-            soup = BeautifulSoup(result.html, 'html.parser')
+            soup = page_soup(result.html)
 
             # Try detail page date selectors
             detail_selectors = config.get('detail_date_selectors', config['date_selectors'])
@@ -193,13 +191,13 @@ class MiningNewsScraper:
             for selector in detail_selectors:
                 # Handle meta tag selectors specially
                 if selector.startswith('meta['):
-                    meta_elem = soup.select_one(selector)
+                    meta_elem = css(selector).select_one(soup)
                     if meta_elem and meta_elem.get('content'):
                         date_str = self._parse_date(meta_elem['content'])
                         if date_str:
                             return date_str
                 else:
-                    date_elem = soup.select_one(selector)
+                    date_elem = css(selector).select_one(soup)
                     if date_elem:
                         # Check for datetime attribute first
                         if date_elem.has_attr('datetime'):
@@ -244,7 +242,7 @@ class MiningNewsScraper:
         # Extract title and URL
         title_elem = None
         for selector in config['title_selectors']:
-            title_elem = container.select_one(selector)
+            title_elem = css(selector).select_one(container)
             if title_elem:
                 break
 
@@ -281,7 +279,7 @@ class MiningNewsScraper:
         # Extract publication date
         date_str = None
         for selector in config['date_selectors']:
-            date_elem = container.select_one(selector)
+            date_elem = css(selector).select_one(container)
             if date_elem:
                 # Check for datetime attribute first
                 if date_elem.has_attr('datetime'):
@@ -298,7 +296,7 @@ class MiningNewsScraper:
         # Extract summary/excerpt
         summary_text = ''
         for selector in config['summary_selectors']:
-            summary_elem = container.select_one(selector)
+            summary_elem = css(selector).select_one(container)
             if summary_elem:
                 summary_text = summary_elem.get_text(strip=True)
                 # Make sure it's not just the title repeated
@@ -364,62 +362,7 @@ class MiningNewsScraper:
         """Parse various date formats and return ISO format"""
         if not date_str:
             return None
-
-        # Try ISO format first
-        iso_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', date_str)
-        if iso_match:
-            return f"{iso_match.group(1)}-{iso_match.group(2)}-{iso_match.group(3)}"
-
-        # Try "Month Day, Year" format
-        month_day_year = re.search(
-            r'(January|February|March|April|May|June|July|August|September|October|November|December|'
-            r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[.\s]+(\d{1,2})[,\s]+(\d{4})',
-            date_str,
-            re.IGNORECASE
-        )
-        if month_day_year:
-            month_name = month_day_year.group(1).lower()[:3]
-            day = month_day_year.group(2).zfill(2)
-            year = month_day_year.group(3)
-
-            month_map = {
-                'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-                'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-                'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-            }
-            month = month_map.get(month_name, '01')
-            return f"{year}-{month}-{day}"
-
-        # Try "Day Month Year" format
-        day_month_year = re.search(
-            r'(\d{1,2})[.\s]+(January|February|March|April|May|June|July|August|September|October|November|December|'
-            r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[.\s]+(\d{4})',
-            date_str,
-            re.IGNORECASE
-        )
-        if day_month_year:
-            day = day_month_year.group(1).zfill(2)
-            month_name = day_month_year.group(2).lower()[:3]
-            year = day_month_year.group(3)
-
-            month_map = {
-                'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-                'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-                'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-            }
-            month = month_map.get(month_name, '01')
-            return f"{year}-{month}-{day}"
-
-        # Try numeric formats MM/DD/YYYY or DD/MM/YYYY
-        numeric_match = re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', date_str)
-        if numeric_match:
-            # Assume MM/DD/YYYY for US-based sites
-            month = numeric_match.group(1).zfill(2)
-            day = numeric_match.group(2).zfill(2)
-            year = numeric_match.group(3)
-            return f"{year}-{month}-{day}"
-
-        return None
+        return article_date_extractor(date_str)
 
 
 async def scrape_all_sources(sources: List[Dict]) -> Dict:
@@ -0,0 +1,424 @@
+"""
+Streaming PDF Downloader
+
+Shared by HybridDocumentProcessor._download_pdf and the GPU worker
+(gpu_worker.DocumentProcessor.download_document), which copies this file
+next to itself, so it has no Django dependency at import time.
+
+- Streams the body to disk in 1 MB blocks; large technical reports are never
+  held in memory.
+- One pooled requests.Session per downloader, so retries and consecutive
+  downloads reuse connections.
+- Retries resume with an HTTP Range request from the last byte written
+  (falling back to a full download if the server ignores Range).
+- Size and content-type guards run on the response headers before the body
+  is read; the first bytes must carry the %PDF signature.
+- Every redirect hop is checked with the caller's URL validator (SSRF).
+- Optional PDFStore: completed downloads are kept by SHA-256 with a URL
+  index, so a report fetched by auto-discovery and again by an admin job is
+  downloaded once.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+PDF_CONTENT_TYPES = (
+    'application/pdf',
+    'application/x-pdf',
+    'application/octet-stream',
+    'binary/octet-stream',
+    'application/binary',
+    'application/force-download',
+    'application/download',
+    'application/x-download',
+    'application/unknown',
+)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/pdf,application/octet-stream,*/*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    # Byte offsets for Range resume must refer to the file, not a gzip stream
+    'Accept-Encoding': 'identity',
+    'Connection': 'keep-alive',
+}
+
+# Statuses worth retrying; anything else in 4xx is treated as permanent
+RETRYABLE_STATUSES = {403, 408, 425, 429, 500, 502, 503, 504}
+
+BLOCK_SIZE = 1024 * 1024
+MAX_REDIRECTS = 5
+# The PDF header may be preceded by junk, but must appear in the first 1 KB
+PDF_SIGNATURE_WINDOW = 1024
+
+
+class DownloadError(Exception):
+    """Download failed; retryable is False for permanent failures (404, guard rejections)"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+@dataclass
+class DownloadResult:
+    path: Path
+    size: int
+    sha256: str
+    content_type: str = ''
+    from_store: bool = False
+    resumes: int = 0
+
+
+class PDFStore:
+    """
+    Content-addressed PDF files with a URL index
+
+    objects/<sha[:2]>/<sha>.pdf holds each distinct file once; urls/<hash>.json
+    maps a URL to its object. Callers always get their own hard link (or copy)
+    of the object, so they can delete it as before.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int, ttl_seconds: int = 30 * 24 * 3600):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.tmp_dir = self.directory / 'tmp'
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.directory / 'objects' / sha256[:2] / f"{sha256}.pdf"
+
+    def _index_path(self, url: str) -> Path:
+        return self.directory / 'urls' / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """Index entry for url if its object is present and younger than the TTL"""
+        index_path = self._index_path(url)
+        try:
+            entry = json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        object_path = self._object_path(entry['sha256'])
+        if not object_path.exists() or time.time() - entry.get('fetched_at', 0) > self.ttl_seconds:
+            return None
+        try:
+            os.utime(object_path)
+        except OSError:
+            pass
+        return entry
+
+    def checkout(self, sha256: str) -> Path:
+        """Caller-owned path to a stored object (hard link, copy across filesystems)"""
+        fd, name = tempfile.mkstemp(dir=self.tmp_dir, suffix='.pdf')
+        os.close(fd)
+        target = Path(name)
+        target.unlink()
+        try:
+            os.link(self._object_path(sha256), target)
+        except OSError:
+            shutil.copyfile(self._object_path(sha256), target)
+        return target
+
+    def add(self, url: str, path: Path, sha256: str, size: int, content_type: str):
+        """Record a finished download; path (inside tmp_dir) stays owned by the caller"""
+        object_path = self._object_path(sha256)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(path, object_path)
+            except FileExistsError:
+                pass
+            except OSError:
+                shutil.copyfile(path, object_path)
+
+        index_path = self._index_path(url)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_index = index_path.with_suffix('.tmp')
+        tmp_index.write_text(json.dumps({
+            'url': url,
+            'sha256': sha256,
+            'size': size,
+            'content_type': content_type,
+            'fetched_at': time.time(),
+        }))
+        os.replace(tmp_index, index_path)
+
+        with self._lock:
+            self._evict()
+
+    def _evict(self):
+        """Delete least recently used objects until the store is within budget"""
+        entries = []
+        for p in self.directory.glob('objects/*/*.pdf'):
+            try:
+                stat = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, p))
+
+        size = sum(e[1] for e in entries)
+        if size <= self.max_bytes:
+            return
+
+        entries.sort()
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        for _, entry_size, p in entries:
+            if size <= target:
+                break
+            p.unlink(missing_ok=True)
+            size -= entry_size
+            evicted += 1
+        if evicted:
+            # Index entries pointing at evicted objects are ignored by lookup()
+            logger.info(f"[PDF STORE] Evicted {evicted} files")
+
+
+class PDFDownloader:
+    """
+    Streaming, resumable PDF downloads over a pooled session
+
+    Args:
+        max_bytes: Largest accepted file
+        url_validator: Callable(url) -> bool or (bool, reason); applied to the
+                       URL and every redirect target
+        store: Optional PDFStore for cross-job de-duplication
+        timeout: Connect/read timeout in seconds
+        max_retries: Attempts per download (each resumes where the last stopped)
+        allowed_content_types: Accepted Content-Type values (missing is accepted)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 500 * 1024 * 1024,
+        url_validator: Callable = None,
+        store: PDFStore = None,
+        timeout: int = 60,
+        max_retries: int = 3,
+        allowed_content_types=PDF_CONTENT_TYPES,
+        pool_maxsize: int = 10
+    ):
+        self.max_bytes = max_bytes
+        self.url_validator = url_validator
+        self.store = store
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.allowed_content_types = allowed_content_types
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(DEFAULT_HEADERS)
+
+    def _check_url(self, url: str):
+        if self.url_validator is None:
+            return
+        verdict = self.url_validator(url)
+        allowed, reason = verdict if isinstance(verdict, tuple) else (verdict, '')
+        if not allowed:
+            raise DownloadError(f"URL validation failed - potentially unsafe: {url} {reason}".strip(), retryable=False)
+
+    def _get(self, url: str, headers: Dict) -> requests.Response:
+        """GET with manual redirects so every hop passes the URL validator"""
+        response = self.session.get(url, headers=headers, timeout=self.timeout,
+                                    stream=True, allow_redirects=False)
+        for _ in range(MAX_REDIRECTS):
+            if not response.is_redirect:
+                return response
+            location = urljoin(response.url, response.headers.get('Location', ''))
+            response.close()
+            self._check_url(location)
+            response = self.session.get(location, headers=headers, timeout=self.timeout,
+                                        stream=True, allow_redirects=False)
+        if response.is_redirect:
+            response.close()
+            raise DownloadError(f"Too many redirects: {url}", retryable=False)
+        return response
+
+    def _check_headers(self, response: requests.Response, offset: int):
+        """Size and content-type guards, applied before any of the body is read"""
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type and self.allowed_content_types and content_type not in self.allowed_content_types:
+            raise DownloadError(f"Not a PDF: Content-Type is {content_type}", retryable=False)
+
+        total = None
+        content_range = response.headers.get('Content-Range', '')
+        if '/' in content_range and not content_range.endswith('/*'):
+            total = int(content_range.rsplit('/', 1)[1])
+        elif response.headers.get('Content-Length'):
+            total = offset + int(response.headers['Content-Length'])
+        if total is not None and total > self.max_bytes:
+            raise DownloadError(
+                f"File too large: {total / 1024 / 1024:.1f} MB exceeds "
+                f"{self.max_bytes / 1024 / 1024:.0f} MB limit",
+                retryable=False
+            )
+        return content_type
+
+    def download(self, url: str, referer: str = None) -> DownloadResult:
+        """
+        Download url to a local file the caller owns (and should delete)
+
+        Raises:
+            DownloadError
+        """
+        self._check_url(url)
+
+        if self.store:
+            entry = self.store.lookup(url)
+            if entry:
+                logger.info(f"[PDF DOWNLOAD] Store hit for {url} ({entry['size'] / 1024 / 1024:.1f} MB)")
+                return DownloadResult(
+                    path=self.store.checkout(entry['sha256']),
+                    size=entry['size'],
+                    sha256=entry['sha256'],
+                    content_type=entry.get('content_type', ''),
+                    from_store=True
+                )
+
+        fd, name = tempfile.mkstemp(dir=self.store.tmp_dir if self.store else None, suffix='.pdf')
+        path = Path(name)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                result = self._stream(url, f, referer)
+            result.path = path
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+
+        if self.store:
+            try:
+                self.store.add(url, path, result.sha256, result.size, result.content_type)
+            except OSError as e:
+                logger.warning(f"[PDF STORE] Failed to store {url}: {e}")
+
+        logger.info(f"[PDF DOWNLOAD] {result.size / 1024 / 1024:.2f} MB from {url}"
+                    + (f" ({result.resumes} resumes)" if result.resumes else ""))
+        return result
+
+    def _stream(self, url: str, f, referer: str = None) -> DownloadResult:
+        written = 0
+        digest = hashlib.sha256()
+        validator = None  # ETag / Last-Modified of the partial body, for If-Range
+        content_type = ''
+        resumes = 0
+        last_error = None
+
+        for attempt in range(self.max_retries):
+            headers = {'Referer': referer or '/'.join(url.split('/')[:3]) + '/'}
+            if written:
+                headers['Range'] = f"bytes={written}-"
+                if validator:
+                    headers['If-Range'] = validator
+                resumes += 1
+
+            try:
+                response = self._get(url, headers)
+                with response:
+                    if response.status_code == 416 and written:
+                        # Our offset is no longer valid; start over
+                        f.seek(0)
+                        f.truncate()
+                        written = 0
+                        digest = hashlib.sha256()
+                        raise DownloadError("Range not satisfiable, restarting", retryable=True)
+                    if response.status_code >= 400:
+                        raise DownloadError(
+                            f"HTTP {response.status_code} for {url}",
+                            retryable=response.status_code in RETRYABLE_STATUSES
+                        )
+
+                    if written and response.status_code != 206:
+                        # Server ignored the Range (or the file changed): restart from zero
+                        f.seek(0)
+                        f.truncate()
+                        written = 0
+                        digest = hashlib.sha256()
+
+                    content_type = self._check_headers(response, written) or content_type
+                    validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+
+                    for block in response.iter_content(chunk_size=BLOCK_SIZE):
+                        if not block:
+                            continue
+                        if written == 0 and b'%PDF' not in block[:PDF_SIGNATURE_WINDOW]:
+                            raise DownloadError("Response is not a PDF (missing %PDF header)", retryable=False)
+                        f.write(block)
+                        digest.update(block)
+                        written += len(block)
+                        if written > self.max_bytes:
+                            raise DownloadError(
+                                f"Download aborted: exceeded {self.max_bytes / 1024 / 1024:.0f} MB limit",
+                                retryable=False
+                            )
+
+                if not written:
+                    raise DownloadError(f"Empty response from {url}", retryable=True)
+                f.flush()
+                return DownloadResult(path=None, size=written, sha256=digest.hexdigest(),
+                                      content_type=content_type, resumes=resumes)
+
+            except DownloadError as e:
+                if not e.retryable:
+                    raise
+                last_error = e
+            except requests.exceptions.RequestException as e:
+                # Timeouts and dropped connections keep the bytes written so far
+                last_error = e
+
+            if attempt < self.max_retries - 1:
+                wait_time = 2 ** attempt
+                logger.warning(f"[PDF DOWNLOAD] {last_error}; retrying in {wait_time}s from byte {written} "
+                               f"(attempt {attempt + 1}/{self.max_retries})")
+                time.sleep(wait_time)
+
+        raise DownloadError(f"Failed to download PDF after {self.max_retries} attempts: {last_error}")
+
+
+_downloader = None
+_downloader_lock = threading.Lock()
+
+
+def get_pdf_downloader() -> PDFDownloader:
+    """Process-wide downloader configured from Django settings (PDF_DOWNLOAD_*, PDF_STORE_*)"""
+    global _downloader
+    with _downloader_lock:
+        if _downloader is None:
+            from django.conf import settings
+            from core.security_utils import check_url_safety
+
+            store = None
+            if getattr(settings, 'PDF_STORE_ENABLED', True):
+                directory = getattr(settings, 'PDF_STORE_DIR', None) or Path(settings.BASE_DIR) / 'pdf_store'
+                store = PDFStore(
+                    Path(directory),
+                    max_bytes=getattr(settings, 'PDF_STORE_MAX_MB', 4096) * 1024 * 1024,
+                    ttl_seconds=getattr(settings, 'PDF_STORE_TTL_HOURS', 24 * 30) * 3600
+                )
+            _downloader = PDFDownloader(
+                max_bytes=getattr(settings, 'PDF_DOWNLOAD_MAX_MB', 500) * 1024 * 1024,
+                url_validator=check_url_safety,
+                store=store,
+                timeout=getattr(settings, 'PDF_DOWNLOAD_TIMEOUT', 60),
+                max_retries=getattr(settings, 'PDF_DOWNLOAD_MAX_RETRIES', 3)
+            )
+        return _downloader
@@ -6,20 +6,29 @@ Supports both technical documents (NI 43-101) and news content.
 Uses Voyage AI for fast embeddings when available, falls back to local model.
 """
 
+import logging
 import chromadb
 from chromadb.config import Settings
-import tiktoken
-from typing import List, Dict, Tuple, Optional
+from typing import Iterator, List, Dict, Tuple, Optional
 from pathlib import Path
 import anthropic
 from django.conf import settings
+from django.db import transaction
 from core.models import Document, DocumentChunk
-from .embeddings import get_embedding_function
+from .embeddings import embed_query, get_embedding_function
+from .lexical_search import search_document_chunks, search_news_chunks
+from .retrieval import dedupe_results, fuse_results, run_searches
+from .text_chunker import get_encoding, iter_chunks
+
+logger = logging.getLogger(__name__)
 
 
 class RAGManager:
     """Manages document chunking, embeddings, and semantic search"""
 
+    # Chunks per bulk_create / ChromaDB upsert (Voyage AI embeds up to 128 texts per call)
+    INGEST_BATCH_SIZE = 128
+
     def __init__(self):
         """Initialize ChromaDB client and embedding model"""
         # Initialize ChromaDB (persistent storage)
@@ -48,53 +57,36 @@ class RAGManager:
             embedding_function=self.embedding_function
         )
 
-        # Initialize tokenizer for Claude's model
-        self.tokenizer = tiktoken.get_encoding("cl100k_base")
+        # Initialize tokenizer for Claude's model (cached per process)
+        self.tokenizer = get_encoding("cl100k_base")
 
         # Initialize Anthropic client for LLM calls
         self.claude_client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
 
-    def chunk_text(self, text: str, max_tokens: int = 512, overlap_tokens: int = 50) -> List[Dict]:
+    def chunk_text(self, text: str, max_tokens: int = 512, overlap_tokens: int = 50,
+                   respect_headings: bool = False) -> Iterator[Dict]:
         """
         Split text into overlapping chunks based on token count
 
+        Chunks are produced lazily by the shared streaming chunker, so the
+        full token list of a large document is never materialized.
+
         Args:
             text: The full document text to chunk
             max_tokens: Maximum tokens per chunk
             overlap_tokens: Number of overlapping tokens between chunks
+            respect_headings: Start new chunks at markdown headings (Docling output)
 
         Returns:
-            List of chunks with metadata
+            Iterator of chunks with metadata
         """
-        # Tokenize the full text
-        tokens = self.tokenizer.encode(text)
-
-        chunks = []
-        start_idx = 0
-
-        while start_idx < len(tokens):
-            # Get chunk tokens
-            end_idx = min(start_idx + max_tokens, len(tokens))
-            chunk_tokens = tokens[start_idx:end_idx]
-
-            # Decode back to text
-            chunk_text = self.tokenizer.decode(chunk_tokens)
-
-            chunks.append({
-                'text': chunk_text,
-                'token_count': len(chunk_tokens),
-                'start_token': start_idx,
-                'end_token': end_idx
-            })
-
-            # Move start index forward (with overlap)
-            start_idx = end_idx - overlap_tokens
-
-            # Prevent infinite loop on last chunk
-            if end_idx >= len(tokens):
-                break
-
-        return chunks
+        return iter_chunks(
+            text,
+            max_tokens=max_tokens,
+            overlap_tokens=overlap_tokens,
+            encoding=self.tokenizer,
+            respect_headings=respect_headings
+        )
 
     def get_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
@@ -114,6 +106,16 @@ class RAGManager:
         """
         Chunk a document, generate embeddings, and store in both PostgreSQL and ChromaDB
 
+        Chunks are ingested in batches of INGEST_BATCH_SIZE: each batch is written
+        with one bulk_create and one ChromaDB upsert (which embeds the batch), so
+        memory stays flat and INSERT round-trips scale with batches, not chunks.
+        PostgreSQL writes share one transaction. Vector ids are per chunk index,
+        so new vectors replace the old ones in place; vectors beyond the new
+        chunk count are removed only once the transaction commits. If any batch
+        fails, the rows roll back and only the vectors written by this run are
+        removed (chunks they replaced are left without a vector until the
+        document is processed again).
+
         Args:
             document: Django Document instance
             text: Full document text extracted by Docling
@@ -121,60 +123,113 @@ class RAGManager:
         Returns:
             Number of chunks created
         """
-        # Delete existing chunks for this document
-        DocumentChunk.objects.filter(document=document).delete()
+        # Metadata is identical for every chunk of this document
+        base_metadata = {
+            'document_id': document.id,
+            'company': document.company.name,
+            'document_type': document.document_type,
+            'document_date': str(document.document_date),
+            'document_title': document.title[:100]  # Truncate for metadata
+        }
 
-        # Also remove from ChromaDB
-        existing_ids = [f"doc_{document.id}_chunk_{i}" for i in range(1000)]  # Assume max 1000 chunks
+        total = 0
+        written_ids = []
         try:
-            self.collection.delete(ids=existing_ids)
+            with transaction.atomic():
+                DocumentChunk.objects.filter(document=document).delete()
+
+                batch = []
+                # Docling output is markdown, so align chunks with its section headings
+                for chunk_data in self.chunk_text(text, respect_headings=True):
+                    batch.append(chunk_data)
+                    if len(batch) >= self.INGEST_BATCH_SIZE:
+                        self._ingest_chunk_batch(document, batch, total, base_metadata, written_ids)
+                        total += len(batch)
+                        batch = []
+
+                if batch:
+                    self._ingest_chunk_batch(document, batch, total, base_metadata, written_ids)
+                    total += len(batch)
+
+                # Old vectors past the new chunk count, once the new rows are committed
+                transaction.on_commit(lambda: self._delete_stale_vectors(document.id, total))
         except Exception:
-            pass  # Ignore if IDs don't exist in ChromaDB
-
-        # Create chunks
-        chunks = self.chunk_text(text)
-
-        # Prepare data for ChromaDB batch insert
-        chroma_ids = []
-        chroma_texts = []
-        chroma_metadatas = []
-
-        # Create DocumentChunk records and prepare ChromaDB data
-        for idx, chunk_data in enumerate(chunks):
-            chroma_id = f"doc_{document.id}_chunk_{idx}"
+            # Rows were rolled back; don't leave this run's vectors behind
+            if written_ids:
+                try:
+                    self.collection.delete(ids=written_ids)
+                except Exception as e:
+                    logger.warning(f"Could not remove vectors of failed ingest for document {document.id}: {e}")
+            raise
+
+        return total
+
+    def _delete_document_vectors(self, document_id: int):
+        """Remove all ChromaDB vectors for a document by metadata filter"""
+        try:
+            self.collection.delete(where={'document_id': document_id})
+        except Exception:
+            pass  # Nothing stored yet for this document
 
-            # Save to PostgreSQL
-            DocumentChunk.objects.create(
+    def _delete_stale_vectors(self, document_id: int, chunk_count: int):
+        """Remove a document's vectors with chunk_index >= chunk_count (left by a longer previous version)"""
+        try:
+            self.collection.delete(where={'$and': [
+                {'document_id': document_id},
+                {'chunk_index': {'$gte': chunk_count}},
+            ]})
+        except Exception as e:
+            logger.warning(f"Could not remove stale vectors for document {document_id}: {e}")
+
+    def _ingest_chunk_batch(self, document: Document, batch: List[Dict], offset: int, base_metadata: Dict,
+                            written_ids: List[str]):
+        """Write one batch of chunks to PostgreSQL and ChromaDB; vector ids are recorded in written_ids"""
+        chroma_ids = [f"doc_{document.id}_chunk_{offset + i}" for i in range(len(batch))]
+
+        DocumentChunk.objects.bulk_create([
+            DocumentChunk(
                 document=document,
-                chunk_index=idx,
+                chunk_index=offset + i,
+                section_title=(chunk_data.get('section_title') or '')[:500],
                 text=chunk_data['text'],
                 token_count=chunk_data['token_count'],
                 chroma_id=chroma_id
             )
+            for i, (chunk_data, chroma_id) in enumerate(zip(batch, chroma_ids))
+        ])
+
+        # Upsert embeds this batch via the collection's embedding function
+        written_ids.extend(chroma_ids)
+        self.collection.upsert(
+            ids=chroma_ids,
+            documents=[chunk_data['text'] for chunk_data in batch],
+            metadatas=[{**base_metadata, 'chunk_index': offset + i} for i in range(len(batch))]
+        )
 
-            # Prepare for ChromaDB
-            chroma_ids.append(chroma_id)
-            chroma_texts.append(chunk_data['text'])
-            chroma_metadatas.append({
-                'document_id': document.id,
-                'chunk_index': idx,
-                'company': document.company.name,
-                'document_type': document.document_type,
-                'document_date': str(document.document_date),
-                'document_title': document.title[:100]  # Truncate for metadata
-            })
-
-        # Batch insert into ChromaDB (it will auto-generate embeddings)
-        if chroma_ids:
-            self.collection.add(
-                ids=chroma_ids,
-                documents=chroma_texts,
-                metadatas=chroma_metadatas
-            )
+    def _query_collection(self, collection, query: str, n_results: int, where: Optional[Dict],
+                          query_embedding: Optional[List[float]] = None) -> Dict:
+        """
+        Query a collection with a (cached) query embedding
 
-        return len(chunks)
+        Falls back to letting ChromaDB embed the query text if no vector is available.
+        """
+        if query_embedding is None:
+            query_embedding = embed_query(query)
+
+        if query_embedding is not None:
+            return collection.query(
+                query_embeddings=[query_embedding],
+                n_results=n_results,
+                where=where
+            )
+        return collection.query(
+            query_texts=[query],
+            n_results=n_results,
+            where=where
+        )
 
-    def search_documents(self, query: str, n_results: int = 5, filter_company: str = None) -> List[Dict]:
+    def search_documents(self, query: str, n_results: int = 5, filter_company: str = None,
+                         query_embedding: Optional[List[float]] = None) -> List[Dict]:
         """
         Semantic search across all document chunks
 
@@ -182,6 +237,7 @@ class RAGManager:
             query: User's question or search query
             n_results: Number of results to return
             filter_company: Optional company name to filter results
+            query_embedding: Precomputed query vector (embedded here if omitted)
 
         Returns:
             List of relevant chunks with metadata and scores
@@ -192,10 +248,8 @@ class RAGManager:
             where_filter = {"company": filter_company}
 
         # Query ChromaDB
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=n_results,
-            where=where_filter
+        results = self._query_collection(
+            self.collection, query, n_results, where_filter, query_embedding
         )
 
         # Format results
@@ -207,7 +261,10 @@ class RAGManager:
                     'metadata': results['metadatas'][0][idx],
                     'distance': results['distances'][0][idx] if results.get('distances') else None,
                     'document_id': results['metadatas'][0][idx]['document_id'],
-                    'chunk_index': results['metadatas'][0][idx]['chunk_index']
+                    'chunk_index': results['metadatas'][0][idx]['chunk_index'],
+                    'chunk_id': results['ids'][0][idx],
+                    'source_type': 'document',
+                    'retrieval': 'vector'
                 })
 
         return formatted_results
@@ -224,7 +281,10 @@ class RAGManager:
         Returns:
             Formatted context string to include in Claude prompt
         """
-        results = self.search_documents(query, n_results=max_chunks, filter_company=company)
+        # Hybrid vector + full-text ranking over technical documents only
+        results = self.search_all(
+            query, n_results=max_chunks, filter_company=company, include_news=False
+        )['combined'][:max_chunks]
 
         if not results:
             return "No relevant document content found."
@@ -240,7 +300,8 @@ class RAGManager:
 
         return "\n---\n".join(context_parts)
 
-    def search_news(self, query: str, n_results: int = 5, filter_company: str = None) -> List[Dict]:
+    def search_news(self, query: str, n_results: int = 5, filter_company: str = None,
+                    query_embedding: Optional[List[float]] = None) -> List[Dict]:
         """
         Semantic search across news content chunks
 
@@ -248,6 +309,7 @@ class RAGManager:
             query: User's question or search query
             n_results: Number of results to return
             filter_company: Optional company name to filter results
+            query_embedding: Precomputed query vector (embedded here if omitted)
 
         Returns:
             List of relevant news chunks with metadata
@@ -258,10 +320,8 @@ class RAGManager:
             where_filter = {"company": filter_company}
 
         # Query news collection
-        results = self.news_collection.query(
-            query_texts=[query],
-            n_results=n_results,
-            where=where_filter
+        results = self._query_collection(
+            self.news_collection, query, n_results, where_filter, query_embedding
         )
 
         formatted_results = []
@@ -272,7 +332,9 @@ class RAGManager:
                     'text': results['documents'][0][idx],
                     'metadata': meta,
                     'distance': results['distances'][0][idx] if results.get('distances') else None,
+                    'chunk_id': results['ids'][0][idx],
                     'source_type': 'news',
+                    'retrieval': 'vector',
                     'title': meta.get('title', 'Unknown'),
                     'date': meta.get('date', ''),
                     'company': meta.get('company', '')
@@ -286,58 +348,75 @@ class RAGManager:
         n_results: int = 5,
         filter_company: str = None,
         include_documents: bool = True,
-        include_news: bool = True
+        include_news: bool = True,
+        fusion: str = None
     ) -> Dict[str, List[Dict]]:
         """
         Search across both technical documents and news content
 
+        Collections are queried concurrently with a single query embedding,
+        together with PostgreSQL full-text search (RAG_HYBRID_SEARCH), then
+        merged by score fusion and de-duplicated (see retrieval.py).
+
         Args:
             query: User's question
             n_results: Number of results per source type
             filter_company: Optional company name filter
             include_documents: Whether to search technical documents
             include_news: Whether to search news content
+            fusion: 'rrf' or 'normalized' (default: settings.RAG_FUSION_METHOD)
 
         Returns:
-            Dictionary with 'documents' and 'news' result lists
+            Dictionary with 'documents', 'news' and 'lexical' result lists, and
+            'combined' (fused, de-duplicated, up to 2x n_results)
         """
-        results = {
-            'documents': [],
-            'news': [],
-            'combined': []
-        }
+        # Embed the query once and reuse the vector for both collections
+        query_embedding = embed_query(query)
 
+        searches = {}
         if include_documents:
-            results['documents'] = self.search_documents(
-                query, n_results=n_results, filter_company=filter_company
+            searches['document'] = lambda: self.search_documents(
+                query, n_results=n_results, filter_company=filter_company,
+                query_embedding=query_embedding
             )
-
         if include_news:
-            results['news'] = self.search_news(
-                query, n_results=n_results, filter_company=filter_company
+            searches['news'] = lambda: self.search_news(
+                query, n_results=n_results, filter_company=filter_company,
+                query_embedding=query_embedding
             )
 
-        # Combine and sort by relevance
-        combined = []
+        if getattr(settings, 'RAG_HYBRID_SEARCH', True):
+            # Full-text matches for exact terms; runs on this thread (database connection)
+            searches['lexical'] = lambda: self._search_lexical(
+                query, n_results, filter_company, include_documents, include_news
+            )
 
-        for doc in results['documents']:
-            combined.append({
-                **doc,
-                'source_type': 'document',
-                'relevance': 1 - doc['distance'] if doc.get('distance') else 0.5
-            })
+        ranked = run_searches(searches, parallel=getattr(settings, 'RAG_PARALLEL_RETRIEVAL', True))
 
-        for news in results['news']:
-            combined.append({
-                **news,
-                'source_type': 'news',
-                'relevance': 1 - news['distance'] if news.get('distance') else 0.5
-            })
+        combined = fuse_results(ranked, method=fusion or getattr(settings, 'RAG_FUSION_METHOD', 'rrf'))
+        combined = dedupe_results(combined, threshold=getattr(settings, 'RAG_DEDUP_THRESHOLD', 0.85))
 
-        # Sort by relevance (highest first)
-        combined.sort(key=lambda x: x['relevance'], reverse=True)
-        results['combined'] = combined[:n_results * 2]  # Return up to 2x n_results
+        return {
+            'lexical': ranked.get('lexical', []),
+            'documents': ranked.get('document', []),
+            'news': ranked.get('news', []),
+            'combined': combined[:n_results * 2]  # Return up to 2x n_results
+        }
 
+    def _search_lexical(self, query: str, n_results: int, filter_company: Optional[str],
+                        include_documents: bool, include_news: bool) -> List[Dict]:
+        """Full-text hits from both chunk tables, as one list for fusion"""
+        results = []
+        try:
+            if include_documents:
+                results.extend(search_document_chunks(query, n_results, filter_company))
+            if include_news:
+                results.extend(search_news_chunks(query, n_results, filter_company))
+        except Exception as e:
+            # Vector results are still usable without the full-text index
+            logger.warning(f"Lexical search failed: {e}")
+            return []
+        results.sort(key=lambda r: r['lexical_score'], reverse=True)
         return results
 
     def get_combined_context(
@@ -349,6 +428,8 @@ class RAGManager:
         """
         Get context from both documents and news for answering questions
 
+        Sources are listed in fused relevance order rather than grouped by type.
+
         Args:
             query: User's question
             company: Optional company filter
@@ -364,23 +445,16 @@ class RAGManager:
         )
 
         context_parts = []
-
-        # Add document context
-        if results['documents']:
-            context_parts.append("=== TECHNICAL DOCUMENTS ===")
-            for idx, result in enumerate(results['documents'][:max_chunks], 1):
+        for idx, result in enumerate(results['combined'], 1):
+            if result['source_type'] == 'document':
                 meta = result['metadata']
                 context_parts.append(
-                    f"[Document {idx}: {meta.get('document_title', 'Unknown')} ({meta.get('document_date', '')})]\n"
+                    f"[Source {idx} - Document: {meta.get('document_title', 'Unknown')} ({meta.get('document_date', '')})]\n"
                     f"{result['text']}"
                 )
-
-        # Add news context
-        if results['news']:
-            context_parts.append("\n=== NEWS & PRESS RELEASES ===")
-            for idx, result in enumerate(results['news'][:max_chunks], 1):
+            else:
                 context_parts.append(
-                    f"[News {idx}: {result.get('title', 'Unknown')} ({result.get('date', '')})]\n"
+                    f"[Source {idx} - News: {result.get('title', 'Unknown')} ({result.get('date', '')})]\n"
                     f"Company: {result.get('company', 'Unknown')}\n"
                     f"{result['text']}"
                 )
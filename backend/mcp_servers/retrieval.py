@@ -0,0 +1,180 @@
+"""
+Multi-Collection Retrieval Engine
+
+Runs semantic searches against several ChromaDB collections (and full-text
+searches against PostgreSQL, see lexical_search.py) concurrently and merges
+them into one ranked list.
+
+Raw cosine distances from different collections are not comparable (document
+chunks and news chunks have different length and vocabulary distributions),
+so results are merged either by reciprocal-rank fusion (default) or by
+min-max normalizing each collection's scores before merging. Near-identical
+chunks - e.g. a press release stored both as a document and as news - are
+collapsed to the best-ranked copy.
+"""
+
+import hashlib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+# Standard RRF constant; dampens the advantage of the very top ranks
+RRF_K = 60
+
+FUSION_METHODS = ('rrf', 'normalized')
+
+_WORD_RE = re.compile(r'\w+')
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_retrieval_executor(max_workers: int = 4) -> ThreadPoolExecutor:
+    """Return the process-wide thread pool used for concurrent collection queries"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='rag-retrieval')
+        return _executor
+
+
+def relevance_from_distance(distance: Optional[float]) -> Optional[float]:
+    """Cosine distance -> similarity (None stays None; 0.0 is a perfect match)"""
+    if distance is None:
+        return None
+    return 1 - distance
+
+
+def run_searches(searches: Dict[str, Callable[[], List[Dict]]], parallel: bool = True) -> Dict[str, List[Dict]]:
+    """
+    Run named search callables, concurrently when parallel is True
+
+    The last search runs on the calling thread, so put database-backed
+    searches last to keep them on the caller's connection.
+
+    Returns:
+        Dict mapping each search name to its ranked result list
+    """
+    if not parallel or len(searches) < 2:
+        return {name: search() for name, search in searches.items()}
+
+    *pooled, (last_name, last_search) = searches.items()
+    executor = get_retrieval_executor()
+    futures = {name: executor.submit(search) for name, search in pooled}
+    results = {last_name: last_search()}
+    results.update({name: future.result() for name, future in futures.items()})
+    return {name: results[name] for name in searches}
+
+
+def _shingles(text: str, size: int = 3) -> set:
+    """Hashed word n-grams of lowercased text"""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return {' '.join(words)} if words else set()
+    return {
+        hashlib.blake2b(' '.join(words[i:i + size]).encode('utf-8'), digest_size=8).digest()
+        for i in range(len(words) - size + 1)
+    }
+
+
+def _jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _raw_score(result: Dict) -> Optional[float]:
+    """Similarity for vector hits, rank score for lexical hits"""
+    if result.get('distance') is not None:
+        return relevance_from_distance(result['distance'])
+    return result.get('lexical_score')
+
+
+def fuse_results(
+    ranked_lists: Dict[str, List[Dict]],
+    method: str = 'rrf',
+    weights: Optional[Dict[str, float]] = None
+) -> List[Dict]:
+    """
+    Merge ranked lists into one list sorted by fused score
+
+    A chunk found by several lists (e.g. by both vector and lexical search)
+    is merged into one entry whose score is the sum of its per-list scores.
+
+    Args:
+        ranked_lists: List name -> results (best first). Results carry
+                      'distance' (vector) or 'lexical_score' (full-text), and
+                      optionally 'chunk_id' and 'source_type' (defaults to
+                      the list name)
+        method: 'rrf' (reciprocal-rank fusion) or 'normalized' (per-list
+                min-max of the raw scores)
+        weights: Optional per-list multipliers (default 1.0)
+
+    Returns:
+        Copies of the input results with 'source_type', 'relevance',
+        'matched_by' and 'fused_score' set, best first
+    """
+    if method not in FUSION_METHODS:
+        raise ValueError(f"Unknown fusion method: {method}")
+    weights = weights or {}
+
+    merged = {}
+    for name, results in ranked_lists.items():
+        weight = weights.get(name, 1.0)
+        raw_scores = [_raw_score(r) for r in results]
+        known = [score for score in raw_scores if score is not None]
+        low, high = (min(known), max(known)) if known else (0.0, 0.0)
+
+        for rank, (result, raw) in enumerate(zip(results, raw_scores), 1):
+            if method == 'rrf':
+                score = 1.0 / (RRF_K + rank)
+            elif raw is None:
+                score = 0.5
+            elif high > low:
+                score = (raw - low) / (high - low)
+            else:
+                score = 1.0
+
+            key = result.get('chunk_id') or (name, rank)
+            entry = merged.get(key)
+            if entry is None:
+                merged[key] = {
+                    **result,
+                    'source_type': result.get('source_type', name),
+                    'relevance': relevance_from_distance(result.get('distance')),
+                    'matched_by': [name],
+                    'fused_score': weight * score,
+                }
+            else:
+                entry['fused_score'] += weight * score
+                entry['matched_by'].append(name)
+                if entry['relevance'] is None:
+                    entry['relevance'] = relevance_from_distance(result.get('distance'))
+
+    return sorted(merged.values(), key=lambda r: r['fused_score'], reverse=True)
+
+
+def dedupe_results(results: List[Dict], threshold: float = 0.85) -> List[Dict]:
+    """
+    Drop results whose text is near-identical to a better-ranked result
+
+    Args:
+        results: Ranked results (best first), each with 'text'
+        threshold: Word-trigram Jaccard similarity at or above which two
+                   chunks count as duplicates (>1 disables de-duplication)
+    """
+    kept = []
+    kept_shingles = []
+    for result in results:
+        shingles = _shingles(result.get('text', ''))
+        duplicate_of = next(
+            (kept[i] for i, other in enumerate(kept_shingles) if _jaccard(shingles, other) >= threshold),
+            None
+        )
+        if duplicate_of is not None:
+            duplicate_of.setdefault('also_in', []).append(result['source_type'])
+            continue
+        kept.append(result)
+        kept_shingles.append(shingles)
+    return kept
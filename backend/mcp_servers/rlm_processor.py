@@ -16,9 +16,13 @@ typically 100-300+ pages and contain complex tables, geological data, and financ
 
 import logging
 import json
+import random
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 import anthropic
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -29,6 +33,10 @@ import re
 
 from django.conf import settings
 
+from .extraction_cache import ExtractionCache, get_extraction_cache
+from .extraction_schema import EXTRACTION_TOOL, validate_extraction
+from .prompt_caching import UsageTotals, system_blocks
+
 
 class DecompositionStrategy(Enum):
     """Strategies for decomposing documents into processable chunks"""
@@ -58,6 +66,50 @@ class ExtractionResult:
     confidence: float = 1.0
     source_pages: Optional[List[int]] = None
     raw_response: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+
+class TokenRateLimiter:
+    """
+    Sliding-window token-per-minute limiter shared by concurrent chunk calls.
+
+    Callers reserve their estimated input tokens before each request and block
+    until the last 60 seconds of reservations leave room for them.
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(self, tokens_per_minute: int):
+        self.tokens_per_minute = tokens_per_minute
+        self._reservations: List[tuple] = []  # (timestamp, tokens)
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> float:
+        """Reserve tokens, sleeping as needed. Returns seconds spent waiting."""
+        if not self.tokens_per_minute:
+            return 0.0
+
+        # A single request larger than the budget still has to go through eventually
+        tokens = min(tokens, self.tokens_per_minute)
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                cutoff = now - self.WINDOW_SECONDS
+                self._reservations = [r for r in self._reservations if r[0] > cutoff]
+                used = sum(t for _, t in self._reservations)
+
+                if used + tokens <= self.tokens_per_minute:
+                    self._reservations.append((now, tokens))
+                    return waited
+
+                # Wait until the oldest reservation leaves the window
+                sleep_for = self._reservations[0][0] + self.WINDOW_SECONDS - now
+
+            sleep_for = max(sleep_for, 0.05)
+            time.sleep(sleep_for)
+            waited += sleep_for
 
 
 @dataclass
@@ -83,35 +135,67 @@ class RLMProcessor:
     4. Performing validation passes on aggregated data
     """
 
+    # NI 43-101 sections: (heading number, heading keyword pattern, section name)
+    NI43101_SECTION_KEYWORDS = [
+        ("1", r"(?:summary|executive\s+summary)", "executive_summary"),
+        ("2", r"introduction", "introduction"),
+        ("3", r"reliance\s+on\s+other\s+experts", "reliance"),
+        ("4", r"property\s+description\s+(?:and|&)\s+location", "property"),
+        ("5", r"accessibility.*infrastructure", "accessibility"),
+        ("6", r"history", "history"),
+        ("7", r"geological\s+setting", "geology"),
+        ("8", r"deposit\s+types?", "deposit_type"),
+        ("9", r"mineralization", "mineralization"),
+        ("10", r"exploration", "exploration"),
+        ("11", r"drilling", "drilling"),
+        ("12", r"sample\s+preparation", "sampling"),
+        ("13", r"data\s+verification", "data_verification"),
+        ("14", r"mineral\s+(?:processing|treatment)", "mineral_processing"),
+        ("15", r"mineral\s+resource\s+estimate", "mineral_resources"),
+        ("16", r"mineral\s+reserve\s+estimate", "mineral_reserves"),
+        ("17", r"mining\s+methods?", "mining_methods"),
+        ("18", r"recovery\s+methods?", "recovery_methods"),
+        ("19", r"project\s+infrastructure", "infrastructure"),
+        ("20", r"market\s+studies?", "market"),
+        ("21", r"environmental", "environmental"),
+        ("22", r"capital\s+(?:and|&)\s+operating\s+costs?", "costs"),
+        ("23", r"economic\s+analysis", "economics"),
+        ("24", r"adjacent\s+properties", "adjacent"),
+        ("25", r"other\s+relevant\s+data", "other"),
+        ("26", r"interpretation\s+(?:and|&)\s+conclusions?", "conclusions"),
+        ("27", r"recommendations?", "recommendations"),
+    ]
+
     # NI 43-101 section patterns for intelligent decomposition
     NI43101_SECTIONS = [
-        (r"(?:1\.?\s*)?(?:summary|executive\s+summary)", "executive_summary"),
-        (r"(?:2\.?\s*)?introduction", "introduction"),
-        (r"(?:3\.?\s*)?reliance\s+on\s+other\s+experts", "reliance"),
-        (r"(?:4\.?\s*)?property\s+description\s+(?:and|&)\s+location", "property"),
-        (r"(?:5\.?\s*)?accessibility.*infrastructure", "accessibility"),
-        (r"(?:6\.?\s*)?history", "history"),
-        (r"(?:7\.?\s*)?geological\s+setting", "geology"),
-        (r"(?:8\.?\s*)?deposit\s+types?", "deposit_type"),
-        (r"(?:9\.?\s*)?mineralization", "mineralization"),
-        (r"(?:10\.?\s*)?exploration", "exploration"),
-        (r"(?:11\.?\s*)?drilling", "drilling"),
-        (r"(?:12\.?\s*)?sample\s+preparation", "sampling"),
-        (r"(?:13\.?\s*)?data\s+verification", "data_verification"),
-        (r"(?:14\.?\s*)?mineral\s+(?:processing|treatment)", "mineral_processing"),
-        (r"(?:15\.?\s*)?mineral\s+resource\s+estimate", "mineral_resources"),
-        (r"(?:16\.?\s*)?mineral\s+reserve\s+estimate", "mineral_reserves"),
-        (r"(?:17\.?\s*)?mining\s+methods?", "mining_methods"),
-        (r"(?:18\.?\s*)?recovery\s+methods?", "recovery_methods"),
-        (r"(?:19\.?\s*)?project\s+infrastructure", "infrastructure"),
-        (r"(?:20\.?\s*)?market\s+studies?", "market"),
-        (r"(?:21\.?\s*)?environmental", "environmental"),
-        (r"(?:22\.?\s*)?capital\s+(?:and|&)\s+operating\s+costs?", "costs"),
-        (r"(?:23\.?\s*)?economic\s+analysis", "economics"),
-        (r"(?:24\.?\s*)?adjacent\s+properties", "adjacent"),
-        (r"(?:25\.?\s*)?other\s+relevant\s+data", "other"),
-        (r"(?:26\.?\s*)?interpretation\s+(?:and|&)\s+conclusions?", "conclusions"),
-        (r"(?:27\.?\s*)?recommendations?", "recommendations"),
+        (rf"(?:{number}\.?\s*)?{keyword}", name) for number, keyword, name in NI43101_SECTION_KEYWORDS
+    ]
+
+    # Every section keyword in one alternation, so the document is scanned once.
+    # No capture groups: Python's regex engine then skips ahead on the possible
+    # first characters instead of trying 27 alternatives at every offset. The
+    # section is resolved per hit, and the optional "N." heading number is
+    # checked backwards from the keyword (see locate_sections).
+    SECTION_KEYWORD_MATCHER = re.compile("|".join(keyword for _, keyword, _ in NI43101_SECTION_KEYWORDS))
+    SECTION_KEYWORD_PATTERNS = [
+        (re.compile(keyword), number, name) for number, keyword, name in NI43101_SECTION_KEYWORDS
+    ]
+
+    # Keyword groups for quick chunk classification (substring checks; C-level
+    # substring search beats a combined regex here, see benchmark_section_locator.py)
+    CONTENT_TYPE_KEYWORDS = [
+        ("resources", ('resource estimate', 'tonnage', 'grade g/t')),
+        ("economics", ('npv', 'irr', 'capex', 'economic')),
+        ("geology", ('geology', 'mineralization', 'deposit')),
+        ("exploration", ('drilling', 'assay', 'sample')),
+        ("conclusions", ('recommendation', 'conclusion')),
+    ]
+
+    # Resource, economics and summary sections for the key data chunk
+    KEY_DATA_PATTERNS = [
+        re.compile(r'mineral\s+resource\s+estimate.*?(?=\n(?:\d+\.|\#|\*{3}|mineral\s+reserve))', re.IGNORECASE | re.DOTALL),
+        re.compile(r'economic\s+analysis.*?(?=\n(?:\d+\.|\#|\*{3}|adjacent))', re.IGNORECASE | re.DOTALL),
+        re.compile(r'summary.*?(?=\n(?:\d+\.|\#|\*{3}|introduction))', re.IGNORECASE | re.DOTALL),
     ]
 
     # Maximum tokens per chunk (leaving room for prompts)
@@ -120,11 +204,65 @@ class RLMProcessor:
     # Token estimation ratio (chars to tokens)
     CHARS_PER_TOKEN = 4
 
-    def __init__(self, model: str = "claude-sonnet-4-20250514"):
+    # "[Page N]" lines written by sharded Docling conversion (docling_service.PAGE_MARKER)
+    PAGE_MARKER_PATTERN = re.compile(r'^\[Page (\d+)\]$', re.MULTILINE)
+
+    # HTTP status codes worth retrying: rate limited / API overloaded
+    RETRYABLE_STATUS_CODES = (429, 529)
+
+    # Chunk extraction modes: "tool" answers through the record_extraction tool
+    # (extraction_schema.EXTRACTION_TOOL); "json" is the free-form JSON prompts
+    EXTRACTION_MODES = ("tool", "json")
+
+    # Previous output included in a repair prompt (characters)
+    REPAIR_CONTEXT_CHARS = 12000
+
+    def __init__(
+        self,
+        model: str = "claude-sonnet-4-20250514",
+        max_concurrency: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        cache: Optional[ExtractionCache] = None,
+        extraction_mode: Optional[str] = None,
+        max_repairs: Optional[int] = None
+    ):
         self.client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
         self.model = model
         self.processing_log: List[Dict] = []
 
+        # Concurrency controls for chunk extraction (1 = sequential)
+        self.max_concurrency = max_concurrency or getattr(settings, 'RLM_MAX_CONCURRENCY', 4)
+        self.max_retries = max_retries if max_retries is not None else getattr(settings, 'RLM_MAX_RETRIES', 5)
+        self.rate_limiter = TokenRateLimiter(
+            tokens_per_minute if tokens_per_minute is not None
+            else getattr(settings, 'RLM_TOKENS_PER_MINUTE', 400000)
+        )
+        self._retry_count = 0
+        self._stats_lock = threading.Lock()
+
+        # Content-addressed cache of parsed chunk extractions
+        self.cache = cache if cache is not None else get_extraction_cache()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        # Schema-validated extraction with per-chunk repair of malformed responses
+        self.extraction_mode = extraction_mode or getattr(settings, 'RLM_EXTRACTION_MODE', 'tool')
+        if self.extraction_mode not in self.EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode: {self.extraction_mode}")
+        self.max_repairs = max_repairs if max_repairs is not None else getattr(settings, 'RLM_MAX_REPAIRS', 1)
+        self._reset_extraction_stats()
+
+        # Token usage per document, including prompt cache writes/reads
+        self.usage = UsageTotals()
+
+    def _reset_extraction_stats(self):
+        self._extraction_calls = 0   # Chunk extractions sent to the model (cache misses)
+        self._parse_failures = 0     # ... whose first response was malformed
+        self._repair_attempts = 0
+        self._repaired_chunks = 0    # Malformed chunks fully fixed by repair prompts
+        self._unrepaired_chunks = 0  # Still failing after max_repairs (valid sections kept)
+
     def _estimate_tokens(self, text: str) -> int:
         """Estimate token count from text"""
         return len(text) // self.CHARS_PER_TOKEN
@@ -141,6 +279,53 @@ class RLMProcessor:
         log_func = getattr(logger, level, logger.info)
         log_func(f"[RLM] {message}")
 
+    def _create_message(self, max_tokens: int, messages: List[Dict], system: Optional[List[Dict]] = None, **kwargs):
+        """
+        Call the Messages API with rate-limit awareness.
+
+        Reserves the estimated input tokens with the shared limiter and retries
+        with exponential backoff (honouring retry-after) on 429/529 responses.
+        Token usage (including prompt cache reads/writes) is added to self.usage.
+        """
+        estimated_tokens = sum(
+            self._estimate_tokens(m["content"]) for m in messages if isinstance(m.get("content"), str)
+        ) + sum(self._estimate_tokens(block["text"]) for block in system or [])
+        if system:
+            kwargs["system"] = system
+
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(estimated_tokens)
+            try:
+                start = time.monotonic()
+                response = self.client.messages.create(
+                    model=self.model,
+                    max_tokens=max_tokens,
+                    messages=messages,
+                    **kwargs
+                )
+                self.usage.add(getattr(response, "usage", None), time.monotonic() - start)
+                return response
+            except anthropic.APIStatusError as e:
+                if e.status_code not in self.RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+                    raise
+
+                retry_after = None
+                try:
+                    retry_after = float(e.response.headers.get("retry-after"))
+                except (TypeError, ValueError, AttributeError):
+                    pass
+                delay = retry_after if retry_after is not None else min(60.0, 2 ** attempt + random.random())
+
+                attempt += 1
+                with self._stats_lock:
+                    self._retry_count += 1
+                self._log(
+                    f"API returned {e.status_code}, retrying in {delay:.1f}s (attempt {attempt}/{self.max_retries})",
+                    "warning"
+                )
+                time.sleep(delay)
+
     # =========================================================================
     # PHASE 1: Document Decomposition
     # =========================================================================
@@ -179,19 +364,7 @@ class RLMProcessor:
         chunks = []
 
         # Find section boundaries
-        section_positions = []
-        text_lower = document_text.lower()
-
-        for pattern, section_name in self.NI43101_SECTIONS:
-            for match in re.finditer(pattern, text_lower, re.IGNORECASE):
-                section_positions.append({
-                    "start": match.start(),
-                    "name": section_name,
-                    "title": match.group(0)
-                })
-
-        # Sort by position
-        section_positions.sort(key=lambda x: x["start"])
+        section_positions = self.locate_sections(document_text)
 
         # Extract content for each section
         for i, section in enumerate(section_positions):
@@ -223,6 +396,52 @@ class RLMProcessor:
         self._log(f"Created {len(chunks)} section-based chunks")
         return chunks
 
+    @classmethod
+    def locate_sections(cls, document_text: str) -> List[Dict]:
+        """
+        NI 43-101 section headings in document order, found in a single scan
+
+        Matches the same positions as running each NI43101_SECTIONS pattern
+        over the document separately, except where two sections' matches
+        overlap (only the first is kept).
+
+        Returns:
+            List of {"start", "name", "title"} (title lowercased), sorted by start
+        """
+        text_lower = document_text.lower()
+        positions = []
+        last_end = {}
+
+        for match in cls.SECTION_KEYWORD_MATCHER.finditer(text_lower):
+            keyword_start = match.start()
+            # The alternation takes the first section (in order) matching here
+            for pattern, number, name in cls.SECTION_KEYWORD_PATTERNS:
+                if pattern.match(text_lower, keyword_start):
+                    break
+
+            start = cls._heading_number_start(text_lower, keyword_start, number)
+            if start < last_end.get(name, 0):
+                # Number belongs to the previous match of the same section
+                start = keyword_start
+            last_end[name] = match.end()
+
+            positions.append({"start": start, "name": name, "title": text_lower[start:match.end()]})
+
+        positions.sort(key=lambda x: x["start"])
+        return positions
+
+    @staticmethod
+    def _heading_number_start(text: str, keyword_start: int, number: str) -> int:
+        """Start of an "N." / "N " heading number directly before keyword_start (matches r"N\.?\s*")"""
+        i = keyword_start
+        while i > 0 and text[i - 1].isspace():
+            i -= 1
+        if i > 0 and text[i - 1] == '.':
+            i -= 1
+        if text.startswith(number, i - len(number)) and i >= len(number):
+            return i - len(number)
+        return keyword_start
+
     def _decompose_by_pages(
         self,
         document_text: str,
@@ -232,30 +451,42 @@ class RLMProcessor:
         """Decompose by page ranges (uses page markers if available)"""
         chunks = []
 
-        # Split by common page markers
-        page_pattern = r'\n(?:Page\s+\d+|\d+\s*\n{2,}|\[Page\s+\d+\])'
-        pages = re.split(page_pattern, document_text)
+        # Sharded Docling conversions mark every page with its real number
+        markers = list(self.PAGE_MARKER_PATTERN.finditer(document_text))
+        if markers:
+            pages = [
+                document_text[m.end():markers[i + 1].start() if i + 1 < len(markers) else len(document_text)]
+                for i, m in enumerate(markers)
+            ]
+            page_numbers = [int(m.group(1)) for m in markers]
+        else:
+            # Split by common page markers
+            page_pattern = r'\n(?:Page\s+\d+|\d+\s*\n{2,}|\[Page\s+\d+\])'
+            pages = re.split(page_pattern, document_text)
+            page_numbers = list(range(1, len(pages) + 1))
 
         # Group pages into chunks
         current_content = ""
-        current_start_page = 1
+        current_start_page = page_numbers[0] if page_numbers else 1
+        previous_page = current_start_page
         chunk_count = 0
 
-        for i, page_content in enumerate(pages):
+        for page_no, page_content in zip(page_numbers, pages):
             if self._estimate_tokens(current_content + page_content) > self.MAX_CHUNK_TOKENS:
                 if current_content:
                     chunks.append(DocumentChunk(
                         content=current_content,
-                        chunk_id=f"pages_{current_start_page}_{i}",
+                        chunk_id=f"pages_{current_start_page}_{previous_page}",
                         chunk_type="page_range",
-                        page_range=(current_start_page, i),
+                        page_range=(current_start_page, previous_page),
                         token_count=self._estimate_tokens(current_content)
                     ))
                     chunk_count += 1
                 current_content = page_content
-                current_start_page = i + 1
+                current_start_page = page_no
             else:
                 current_content += page_content
+            previous_page = page_no
 
         # Add remaining content
         if current_content:
@@ -263,7 +494,7 @@ class RLMProcessor:
                 content=current_content,
                 chunk_id=f"pages_{current_start_page}_end",
                 chunk_type="page_range",
-                page_range=(current_start_page, len(pages)),
+                page_range=(current_start_page, previous_page),
                 token_count=self._estimate_tokens(current_content)
             ))
 
@@ -406,15 +637,9 @@ class RLMProcessor:
     def _extract_key_data_chunk(self, document_text: str) -> Optional[DocumentChunk]:
         """Extract a focused chunk with likely key data (resources, economics)"""
         # Look for resource estimate and economic analysis sections
-        key_patterns = [
-            r'mineral\s+resource\s+estimate.*?(?=\n(?:\d+\.|\#|\*{3}|mineral\s+reserve))',
-            r'economic\s+analysis.*?(?=\n(?:\d+\.|\#|\*{3}|adjacent))',
-            r'summary.*?(?=\n(?:\d+\.|\#|\*{3}|introduction))',
-        ]
-
         key_content = ""
-        for pattern in key_patterns:
-            matches = re.findall(pattern, document_text, re.IGNORECASE | re.DOTALL)
+        for pattern in self.KEY_DATA_PATTERNS:
+            matches = pattern.findall(document_text)
             for match in matches:
                 if len(match) > 500:  # Only include substantial matches
                     key_content += f"\n\n---\n\n{match[:20000]}"  # Limit each section
@@ -430,22 +655,14 @@ class RLMProcessor:
 
         return None
 
-    def _classify_chunk_content(self, content: str) -> List[str]:
+    @classmethod
+    def _classify_chunk_content(cls, content: str) -> List[str]:
         """Quick classification of chunk content types"""
         content_lower = content.lower()
-        types = []
-
-        if any(kw in content_lower for kw in ['resource estimate', 'tonnage', 'grade g/t']):
-            types.append("resources")
-        if any(kw in content_lower for kw in ['npv', 'irr', 'capex', 'economic']):
-            types.append("economics")
-        if any(kw in content_lower for kw in ['geology', 'mineralization', 'deposit']):
-            types.append("geology")
-        if any(kw in content_lower for kw in ['drilling', 'assay', 'sample']):
-            types.append("exploration")
-        if any(kw in content_lower for kw in ['recommendation', 'conclusion']):
-            types.append("conclusions")
-
+        types = [
+            name for name, keywords in cls.CONTENT_TYPE_KEYWORDS
+            if any(kw in content_lower for kw in keywords)
+        ]
         return types if types else ["general"]
 
     # =========================================================================
@@ -464,9 +681,12 @@ class RLMProcessor:
         that instructs it to extract specific information based on chunk type.
         """
         self._log(f"Processing chunk: {chunk.chunk_id} (type: {chunk.chunk_type})")
+        chunk_start = time.monotonic()
 
         # Select prompt based on chunk type
-        if chunk.chunk_type == "tables":
+        if self.extraction_mode == "tool":
+            prompt = self._get_tool_extraction_prompt(chunk, extraction_focus)
+        elif chunk.chunk_type == "tables":
             prompt = self._get_table_extraction_prompt()
         elif chunk.chunk_type == "key_data":
             prompt = self._get_comprehensive_extraction_prompt()
@@ -475,26 +695,57 @@ class RLMProcessor:
         else:
             prompt = self._get_section_extraction_prompt(chunk)
 
+        # Identical prompt + content + model -> reuse the earlier extraction
+        cache_key = None
+        if self.cache:
+            # The tool schema is part of the prompt in tool mode
+            key_prompt = prompt
+            if self.extraction_mode == "tool":
+                key_prompt = "\n".join(
+                    [self.TOOL_EXTRACTION_INSTRUCTIONS, prompt, json.dumps(EXTRACTION_TOOL, sort_keys=True)]
+                )
+            cache_key = ExtractionCache.chunk_key(key_prompt, chunk.content, self.model)
+            cached_data = self.cache.get_chunk(cache_key)
+            with self._stats_lock:
+                if cached_data is not None:
+                    self._cache_hits += 1
+                else:
+                    self._cache_misses += 1
+            if cached_data is not None:
+                self._log(f"Cache hit for chunk {chunk.chunk_id}")
+                return ExtractionResult(
+                    chunk_id=chunk.chunk_id,
+                    data=cached_data,
+                    confidence=self._estimate_confidence(cached_data),
+                    elapsed_seconds=time.monotonic() - chunk_start
+                )
+
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4000,
-                messages=[{
-                    "role": "user",
-                    "content": f"{prompt}\n\nCONTENT TO ANALYZE:\n{chunk.content}"
-                }]
+            response = self._request_extraction(
+                f"CONTENT TO ANALYZE:\n{chunk.content}", max_tokens=4000, prompt=prompt
             )
+            extracted_data, response_text, errors = self._read_extraction(response)
 
-            response_text = response.content[0].text
+            with self._stats_lock:
+                self._extraction_calls += 1
+                if errors:
+                    self._parse_failures += 1
 
-            # Parse JSON from response
-            extracted_data = self._parse_json_response(response_text)
+            if errors:
+                extracted_data, errors = self._repair_extraction(chunk, extracted_data, response_text, errors)
+
+            if cache_key and not errors:
+                try:
+                    self.cache.set_chunk(cache_key, extracted_data)
+                except Exception as e:
+                    self._log(f"Failed to cache chunk {chunk.chunk_id}: {e}", "warning")
 
             return ExtractionResult(
                 chunk_id=chunk.chunk_id,
                 data=extracted_data,
                 confidence=self._estimate_confidence(extracted_data),
-                raw_response=response_text
+                raw_response=response_text,
+                elapsed_seconds=time.monotonic() - chunk_start
             )
 
         except Exception as e:
@@ -502,9 +753,207 @@ class RLMProcessor:
             return ExtractionResult(
                 chunk_id=chunk.chunk_id,
                 data={"error": str(e)},
-                confidence=0.0
+                confidence=0.0,
+                elapsed_seconds=time.monotonic() - chunk_start
             )
 
+    def _request_extraction(self, content: str, max_tokens: int, prompt: Optional[str] = None):
+        """
+        One extraction call; in tool mode the answer must be a record_extraction call
+
+        The extraction instructions go in the system prompt as a cached block
+        (with the tool definition ahead of it in tool mode), so every chunk
+        after the first reads them from the prompt cache; prompt is the
+        per-chunk part that follows the cache breakpoint.
+        """
+        messages = [{"role": "user", "content": content}]
+        if self.extraction_mode == "tool":
+            return self._create_message(
+                max_tokens=max_tokens,
+                messages=messages,
+                system=system_blocks(self.TOOL_EXTRACTION_INSTRUCTIONS, prompt),
+                tools=[EXTRACTION_TOOL],
+                tool_choice={"type": "tool", "name": EXTRACTION_TOOL["name"]}
+            )
+        return self._create_message(max_tokens=max_tokens, messages=messages, system=system_blocks(prompt))
+
+    def _read_extraction(self, response) -> tuple:
+        """
+        Parse and validate an extraction response
+
+        Returns:
+            (valid sections, raw response text, {section: errors} for what failed)
+        """
+        tool_input = None
+        text_parts = []
+        for block in response.content:
+            if getattr(block, "type", None) == "tool_use" and block.name == EXTRACTION_TOOL["name"]:
+                tool_input = block.input
+            elif getattr(block, "type", None) == "text":
+                text_parts.append(block.text)
+
+        if tool_input is not None:
+            data, errors = validate_extraction(tool_input)
+            return data, json.dumps(tool_input, default=str), errors
+
+        response_text = "\n".join(text_parts)
+        parsed = self._parse_json_response(response_text)
+        if parsed.get("parse_error"):
+            reason = "response was cut off" if response.stop_reason == "max_tokens" else "no valid JSON in response"
+            return {}, response_text, {"response": [reason]}
+        data, errors = validate_extraction(parsed)
+        return data, response_text, errors
+
+    def _repair_extraction(self, chunk: DocumentChunk, data: Dict, response_text: str, errors: Dict) -> tuple:
+        """
+        Re-ask only the failing part of one chunk with a short repair prompt
+
+        Failing sections are sent back with their validation errors (without
+        the chunk content); the content is re-sent only if nothing usable came
+        back. Sections that pass are merged into data as they arrive.
+
+        Returns:
+            (data, remaining errors); on final failure data keeps the valid
+            sections and lists the rest under "validation_errors"
+        """
+        previous = response_text
+        for attempt in range(1, self.max_repairs + 1):
+            with self._stats_lock:
+                self._repair_attempts += 1
+            self._log(
+                f"Repairing chunk {chunk.chunk_id} (attempt {attempt}/{self.max_repairs}): "
+                f"{', '.join(errors)} failed validation", "warning"
+            )
+            try:
+                response = self._request_extraction(
+                    self._get_repair_prompt(chunk, data, previous, errors), max_tokens=4000
+                )
+            except Exception as e:
+                self._log(f"Repair call failed for chunk {chunk.chunk_id}: {e}", "warning")
+                break
+
+            repaired, repaired_text, repaired_errors = self._read_extraction(response)
+            if "response" in repaired_errors:
+                # Unusable answer: try again with the same errors
+                continue
+
+            if "response" not in errors:
+                # Keep sections already validated; take only what was asked for
+                repaired = {k: v for k, v in repaired.items() if k in errors}
+                repaired_errors = {k: v for k, v in repaired_errors.items() if k in errors}
+            data.update(repaired)
+            errors = repaired_errors
+            previous = repaired_text
+
+            if not errors:
+                with self._stats_lock:
+                    self._repaired_chunks += 1
+                return data, {}
+
+        with self._stats_lock:
+            self._unrepaired_chunks += 1
+        self._log(f"Chunk {chunk.chunk_id} still invalid after repair: {errors}", "warning")
+        if not data:
+            return {"raw_response": response_text, "parse_error": True}, errors
+        data["validation_errors"] = errors
+        return data, errors
+
+    def _get_repair_prompt(self, chunk: DocumentChunk, data: Dict, previous: str, errors: Dict) -> str:
+        """Short prompt asking to correct only the failing sections of a chunk extraction"""
+        error_lines = "\n".join(f"- {e}" for section_errors in errors.values() for e in section_errors[:10])
+        answer = (
+            "Call record_extraction with the corrected sections only."
+            if self.extraction_mode == "tool" else
+            "Return ONLY valid JSON containing the corrected sections."
+        )
+
+        if "response" in errors:
+            # Nothing usable came back: ask again for this chunk with short instructions
+            return f"""Your previous answer for this part of an NI 43-101 report could not be used ({error_lines.lstrip('- ')}).
+
+Extract document_info, project_info, mineral_resources, mineral_reserves, economic_study and key_findings.
+Only what is explicitly stated; null for missing values. {answer}
+
+CONTENT TO ANALYZE:
+{chunk.content}"""
+
+        try:
+            failing = json.dumps({k: v for k, v in json.loads(previous).items() if k in errors}, indent=1, default=str)
+        except (ValueError, AttributeError):
+            # JSON mode: the object was embedded in prose
+            failing = previous
+        failing = failing[:self.REPAIR_CONTEXT_CHARS]
+
+        return f"""Your extraction from an NI 43-101 report section ("{chunk.section_title or chunk.chunk_id}") failed validation:
+{error_lines}
+
+PREVIOUS OUTPUT:
+{failing}
+
+Fix these problems without inventing data: numbers must be plain numbers (no units or commas), lists must be lists, and unknown values must be null. Every resource/reserve needs a category. {answer}"""
+
+    def process_chunks(self, chunks: List[DocumentChunk]) -> List[ExtractionResult]:
+        """
+        Process chunks with bounded concurrency.
+
+        Up to max_concurrency chunk calls run at once on a thread pool; the
+        shared rate limiter keeps them under the token-per-minute budget.
+        Results are returned in the original chunk order so aggregation is
+        identical to sequential processing.
+        """
+        workers = max(1, min(self.max_concurrency, len(chunks)))
+
+        def run(indexed_chunk):
+            i, chunk = indexed_chunk
+            self._log(f"Processing chunk {i+1}/{len(chunks)}: {chunk.chunk_id}")
+            return self.process_chunk(chunk)
+
+        if workers == 1:
+            return [run(item) for item in enumerate(chunks)]
+
+        self._log(f"Processing {len(chunks)} chunks with concurrency {workers}")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rlm-chunk") as executor:
+            # executor.map yields results in submission order
+            return list(executor.map(run, enumerate(chunks)))
+
+    # What to look for per chunk / section type in tool mode
+    TOOL_FOCUS_HINTS = {
+        "tables": "These are tables extracted from the report. Focus on resource/reserve estimate tables "
+                  "(tonnage, grade, contained metal per category) and economic summary tables (NPV, IRR, costs).",
+        "key_data": "This excerpt combines the report's summary, resource and economic sections. "
+                    "Extract everything available.",
+        "executive_summary": "Summary section: project overview, headline resources and economics, highlights and recommendations.",
+        "property": "Property description: project name, location, property size and ownership.",
+        "geology": "Geology section: record notable geological points as key_findings highlights.",
+        "mineral_resources": "Resource estimate section: every resource category with tonnage, grade, contained metal and cut-off.",
+        "mineral_reserves": "Reserve estimate section: every proven and probable reserve.",
+        "economics": "Economic analysis: study type, NPV, discount rate, IRR, capex, opex, payback, mine life, price assumptions.",
+        "costs": "Capital and operating costs: initial and sustaining capex, opex per tonne.",
+        "recommendations": "Recommendations section: record each recommendation in key_findings.",
+        "conclusions": "Conclusions: key findings, risks and recommendations.",
+    }
+
+    # Static tool-mode instructions, identical for every chunk (cached system block)
+    TOOL_EXTRACTION_INSTRUCTIONS = """You extract data from NI 43-101 mining technical reports. Each request contains one part of a report; record the data it states with the record_extraction tool.
+
+IMPORTANT:
+- Extract ONLY what is explicitly stated in the text; use null for missing values, do not guess
+- Report ALL resource categories found (measured, indicated, inferred) and reserves (proven, probable)
+- Tonnage in million tonnes; note the grade unit (g/t for gold, % for base metals)
+- Money in USD millions except per-tonne costs
+- Numbers must be plain numbers without units or thousands separators
+- Omit sections the text says nothing about"""
+
+    def _get_tool_extraction_prompt(self, chunk: DocumentChunk, extraction_focus: Optional[str] = None) -> str:
+        """Per-chunk part of the tool-mode prompt (follows TOOL_EXTRACTION_INSTRUCTIONS)"""
+        section_name = chunk.metadata.get("section_name", "general")
+        focus = extraction_focus or (chunk.chunk_type if chunk.chunk_type in ("tables", "key_data") else section_name)
+        if focus == "resources":
+            focus = "mineral_resources"
+        hint = self.TOOL_FOCUS_HINTS.get(focus, "Extract any data this part of the report states.")
+
+        return f"This part of the report: {focus.replace('_', ' ')}. {hint}"
+
     def _get_comprehensive_extraction_prompt(self) -> str:
         """Prompt for extracting all key data from a chunk"""
         return """Analyze this section of an NI 43-101 mining technical report.
@@ -852,8 +1301,8 @@ Return ONLY valid JSON. Use null for missing values."""
         seen = {}
         for res in resources:
             key = (
-                res.get("category", "").lower(),
-                res.get("mineral_type", "").lower(),
+                (res.get("category") or "").lower(),
+                (res.get("mineral_type") or "").lower(),
                 res.get("zone_name", "")
             )
 
@@ -1003,8 +1452,7 @@ Return JSON with corrections:
 If everything looks correct, return {{"corrections": [], "validation_passed": true}}"""
 
         try:
-            response = self.client.messages.create(
-                model=self.model,
+            response = self._create_message(
                 max_tokens=2000,
                 messages=[{"role": "user", "content": validation_prompt}]
             )
@@ -1097,15 +1545,35 @@ If everything looks correct, return {{"corrections": [], "validation_passed": tr
         chunks = self.decompose_document(document_text, tables, strategy)
         self._log(f"Document decomposed into {len(chunks)} chunks")
 
-        # Phase 2: Recursive Processing
-        results = []
-        for i, chunk in enumerate(chunks):
-            self._log(f"Processing chunk {i+1}/{len(chunks)}: {chunk.chunk_id}")
-            result = self.process_chunk(chunk)
-            results.append(result)
+        # Phase 2: Recursive Processing (bounded concurrency, original order)
+        self._retry_count = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._reset_extraction_stats()
+        self.usage.reset()
+        extraction_start = time.monotonic()
+        results = self.process_chunks(chunks)
+        extraction_elapsed = time.monotonic() - extraction_start
 
         # Phase 3: Aggregate
         aggregated = self.aggregate_results(results)
+        aggregated.processing_metadata["chunk_timings"] = [
+            {"chunk_id": r.chunk_id, "seconds": round(r.elapsed_seconds, 2)}
+            for r in results
+        ]
+        aggregated.processing_metadata["extraction_time_seconds"] = extraction_elapsed
+        aggregated.processing_metadata["max_concurrency"] = self.max_concurrency
+        aggregated.processing_metadata["rate_limit_retries"] = self._retry_count
+        aggregated.processing_metadata["cache_hits"] = self._cache_hits
+        aggregated.processing_metadata["cache_misses"] = self._cache_misses
+        aggregated.processing_metadata["extraction_mode"] = self.extraction_mode
+        aggregated.processing_metadata["parse_failures"] = self._parse_failures
+        aggregated.processing_metadata["parse_failure_rate"] = (
+            round(self._parse_failures / self._extraction_calls, 3) if self._extraction_calls else 0.0
+        )
+        aggregated.processing_metadata["repair_attempts"] = self._repair_attempts
+        aggregated.processing_metadata["repaired_chunks"] = self._repaired_chunks
+        aggregated.processing_metadata["unrepaired_chunks"] = self._unrepaired_chunks
 
         # Phase 4: Validate (optional)
         if validate:
@@ -1114,6 +1582,7 @@ If everything looks correct, return {{"corrections": [], "validation_passed": tr
         # Add timing metadata
         elapsed = (datetime.now() - start_time).total_seconds()
         aggregated.processing_metadata["processing_time_seconds"] = elapsed
+        aggregated.processing_metadata["usage"] = self.usage.as_dict()
         aggregated.processing_metadata["strategy"] = strategy.value
 
         self._log(f"RLM processing complete in {elapsed:.1f}s")
@@ -3,11 +3,19 @@ Stock Price Scraper
 Fetches daily closing prices and volume for all companies in the database.
 Primary source: Stockwatch.com
 Designed to run after market close (4:30 PM ET weekdays).
+
+Quotes for all companies are fetched concurrently over one pooled HTTP
+session, with a rate limiter per provider (Alpha Vantage has strict
+per-minute quotas), then written with one bulk upsert per table.
 """
 
 import re
+import threading
+import time
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional
 from datetime import datetime, date
 import decimal
@@ -19,21 +27,91 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class ProviderRateLimiter:
+    """
+    Thread-safe limiter for one quote provider.
+
+    Spaces requests evenly (60 / requests_per_minute seconds apart) so
+    concurrent workers can't burst through a per-minute quota.
+    """
+
+    def __init__(self, name: str, requests_per_minute: int):
+        self.name = name
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats = {'requests': 0, 'succeeded': 0, 'request_seconds': 0.0, 'wait_seconds': 0.0}
+
+    def acquire(self):
+        """Block until this provider may be called again"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        wait = slot - now
+        if wait > 0:
+            with self._stats_lock:
+                self.stats['wait_seconds'] += wait
+            time.sleep(wait)
+
+    def record(self, seconds: float, succeeded: bool):
+        with self._stats_lock:
+            self.stats['requests'] += 1
+            self.stats['request_seconds'] += seconds
+            if succeeded:
+                self.stats['succeeded'] += 1
+
+    def summary(self) -> Dict:
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats['avg_request_seconds'] = round(stats['request_seconds'] / stats['requests'], 3) if stats['requests'] else 0.0
+        stats['request_seconds'] = round(stats['request_seconds'], 2)
+        stats['wait_seconds'] = round(stats['wait_seconds'], 2)
+        return stats
+
+
 class StockPriceScraper:
     """
     Scrapes daily stock prices for all companies using Stockwatch.com.
     Falls back to Alpha Vantage or Yahoo Finance if Stockwatch fails.
     """
 
-    def __init__(self):
+    def __init__(self, max_workers: int = None):
         self.alpha_vantage_key = getattr(settings, 'ALPHA_VANTAGE_API_KEY', None)
         self.alpha_vantage_url = "https://www.alphavantage.co/query"
         self.stockwatch_url = "https://www.stockwatch.com/Quote/Detail"
+        self.max_workers = max_workers or getattr(settings, 'STOCK_PRICE_MAX_WORKERS', 4)
+
+        # One pooled session shared by all worker threads
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
 
+        self.rate_limiters = {
+            'Stockwatch': ProviderRateLimiter(
+                'Stockwatch', getattr(settings, 'STOCKWATCH_REQUESTS_PER_MINUTE', 60)
+            ),
+            'Alpha Vantage': ProviderRateLimiter(
+                'Alpha Vantage', getattr(settings, 'ALPHA_VANTAGE_REQUESTS_PER_MINUTE', 5)
+            ),
+        }
+
+    def _call_provider(self, provider: str, fetch, ticker: str, exchange: str) -> Optional[Dict]:
+        """Call one provider's fetch method under its rate limiter, recording timing"""
+        limiter = self.rate_limiters[provider]
+        limiter.acquire()
+        start = time.perf_counter()
+        quote = fetch(ticker, exchange)
+        limiter.record(time.perf_counter() - start, quote is not None)
+        return quote
+
     def _get_stockwatch_exchange_prefix(self, exchange: str) -> str:
         """
         Get the Stockwatch exchange prefix for a given exchange.
@@ -239,7 +317,7 @@ class StockPriceScraper:
                 "apikey": self.alpha_vantage_key
             }
 
-            response = requests.get(self.alpha_vantage_url, params=params, timeout=15)
+            response = self.session.get(self.alpha_vantage_url, params=params, timeout=15)
             response.raise_for_status()
             data = response.json()
 
@@ -280,93 +358,188 @@ class StockPriceScraper:
 
         # For Canadian exchanges, try Stockwatch first
         if exchange in ['tsx', 'tsxv', 'cse']:
-            quote = self.fetch_quote_stockwatch(ticker, exchange)
+            quote = self._call_provider('Stockwatch', self.fetch_quote_stockwatch, ticker, exchange)
             if quote:
                 return quote
 
         # Fallback to Alpha Vantage
-        quote = self.fetch_quote_alpha_vantage(ticker, exchange)
-        if quote:
-            return quote
+        if self.alpha_vantage_key:
+            quote = self._call_provider('Alpha Vantage', self.fetch_quote_alpha_vantage, ticker, exchange)
+            if quote:
+                return quote
 
         return None
 
-    def save_price(self, company, quote: Dict) -> bool:
+    def _price_rows(self, company, quote: Dict):
+        """Build unsaved StockPrice and MarketData rows for a quote"""
+        from core.models import StockPrice, MarketData
+
+        trade_date = datetime.strptime(quote['date'], '%Y-%m-%d').date() if quote.get('date') else date.today()
+
+        # Determine currency based on exchange
+        currency = 'CAD' if company.exchange in ['tsx', 'tsxv', 'cse'] else 'USD'
+
+        stock_price = StockPrice(
+            company=company,
+            date=trade_date,
+            close_price=quote['close'],
+            volume=quote.get('volume', 0),
+            open_price=quote.get('open'),
+            high_price=quote.get('high'),
+            low_price=quote.get('low'),
+            change_amount=quote.get('change', Decimal('0')),
+            change_percent=quote.get('change_percent', Decimal('0')),
+            currency=currency,
+            source=quote.get('source', 'Unknown')
+        )
+
+        # MarketData requires non-null OHLC values, so provide defaults
+        market_data = MarketData(
+            company=company,
+            date=trade_date,
+            open_price=quote.get('open') or quote['close'],
+            high_price=quote.get('high') or quote['close'],
+            low_price=quote.get('low') or quote['close'],
+            close_price=quote['close'],
+            volume=quote.get('volume', 0),
+            change_amount=quote.get('change', Decimal('0')),
+            change_percent=quote.get('change_percent', Decimal('0')),
+            currency=currency,
+            source=quote.get('source', 'Unknown')
+        )
+        return stock_price, market_data
+
+    def _validated_price_rows(self, company, quote: Dict):
         """
-        Save price data to both StockPrice and MarketData models.
-        This ensures data is accessible via both the scheduled task results
-        and the AI assistant's financial tools.
+        _price_rows with numeric values checked against the model fields
+
+        Raises ValueError for a quote the database would reject: NaN or
+        infinite decimals, values too large for max_digits, non-numeric volume.
         """
-        from core.models import StockPrice, MarketData
+        from django.core.exceptions import ValidationError
+        from django.db import models
 
         try:
-            trade_date = datetime.strptime(quote['date'], '%Y-%m-%d').date() if quote.get('date') else date.today()
-
-            # Determine currency based on exchange
-            currency = 'CAD' if company.exchange in ['tsx', 'tsxv', 'cse'] else 'USD'
-
-            # Create or update the StockPrice record
-            price_obj, created = StockPrice.objects.update_or_create(
-                company=company,
-                date=trade_date,
-                defaults={
-                    'close_price': quote['close'],
-                    'volume': quote.get('volume', 0),
-                    'open_price': quote.get('open'),
-                    'high_price': quote.get('high'),
-                    'low_price': quote.get('low'),
-                    'change_amount': quote.get('change', Decimal('0')),
-                    'change_percent': quote.get('change_percent', Decimal('0')),
-                    'currency': currency,
-                    'source': quote.get('source', 'Unknown')
-                }
+            rows = self._price_rows(company, quote)
+            for row in rows:
+                for field in row._meta.concrete_fields:
+                    value = getattr(row, field.attname)
+                    if value is None or not isinstance(field, (models.DecimalField, models.IntegerField)):
+                        continue
+                    value = field.to_python(value)
+                    if isinstance(field, models.DecimalField) and \
+                            value.adjusted() >= field.max_digits - field.decimal_places:
+                        raise ValueError(f"{field.name}={value} exceeds {field.max_digits} digits")
+                    setattr(row, field.attname, value)
+        except (KeyError, TypeError, ValueError, decimal.InvalidOperation, ValidationError) as e:
+            raise ValueError(f"Invalid quote: {e.messages[0] if isinstance(e, ValidationError) else e}")
+        return rows
+
+    def _upsert_price_rows(self, stock_rows: List, market_rows: List, companies: List):
+        """Write StockPrice and MarketData rows and current_price in one transaction"""
+        from django.db import transaction
+        from core.models import Company, StockPrice, MarketData
+
+        price_fields = [
+            'close_price', 'volume', 'open_price', 'high_price', 'low_price',
+            'change_amount', 'change_percent', 'currency', 'source'
+        ]
+        with transaction.atomic():
+            StockPrice.objects.bulk_create(
+                stock_rows,
+                update_conflicts=True,
+                unique_fields=['company', 'date'],
+                update_fields=price_fields,
             )
-
             # Also save to MarketData for AI assistant access
-            # MarketData requires non-null OHLC values, so provide defaults
-            MarketData.objects.update_or_create(
-                company=company,
-                date=trade_date,
-                defaults={
-                    'open_price': quote.get('open') or quote['close'],
-                    'high_price': quote.get('high') or quote['close'],
-                    'low_price': quote.get('low') or quote['close'],
-                    'close_price': quote['close'],
-                    'volume': quote.get('volume', 0),
-                    'change_amount': quote.get('change', Decimal('0')),
-                    'change_percent': quote.get('change_percent', Decimal('0')),
-                    'currency': currency,
-                    'source': quote.get('source', 'Unknown')
-                }
+            MarketData.objects.bulk_create(
+                market_rows,
+                update_conflicts=True,
+                unique_fields=['company', 'date'],
+                update_fields=price_fields,
             )
+            Company.objects.bulk_update(companies, ['current_price', 'updated_at'])
 
-            # Also update the company's current_price field
-            company.current_price = quote['close']
-            company.save(update_fields=['current_price', 'updated_at'])
-
-            logger.info(f"{'Created' if created else 'Updated'} price for {company.ticker_symbol}: ${quote['close']}")
-            return True
-
+    def save_price(self, company, quote: Dict) -> bool:
+        """
+        Save one quote to both StockPrice and MarketData models.
+        This ensures data is accessible via both the scheduled task results
+        and the AI assistant's financial tools.
+        """
+        try:
+            stock_price, market_data = self._validated_price_rows(company, quote)
+            company.current_price = stock_price.close_price
+            company.updated_at = timezone.now()
+            self._upsert_price_rows([stock_price], [market_data], [company])
         except Exception as e:
             logger.error(f"Error saving price for {company.ticker_symbol}: {e}")
             return False
 
+        logger.info(f"Saved price for {company.ticker_symbol}: ${quote['close']}")
+        return True
+
+    def save_prices(self, quotes: List[tuple]) -> tuple:
+        """
+        Upsert many (company, quote) pairs: one bulk write per table.
+
+        Malformed quotes are skipped before the write. If the bulk write
+        still fails, each company is saved on its own so good rows land.
+
+        Returns:
+            (saved (company, quote) pairs, failed (company, error) pairs)
+        """
+        saved, failed = [], []
+        stock_rows, market_rows, companies = [], [], []
+        now = timezone.now()
+        for company, quote in quotes:
+            try:
+                stock_price, market_data = self._validated_price_rows(company, quote)
+            except ValueError as e:
+                logger.warning(f"Skipping price for {company.ticker_symbol}: {e}")
+                failed.append((company, str(e)))
+                continue
+            stock_rows.append(stock_price)
+            market_rows.append(market_data)
+            company.current_price = stock_price.close_price
+            company.updated_at = now
+            companies.append(company)
+            saved.append((company, quote))
+
+        if not saved:
+            return saved, failed
+
+        try:
+            self._upsert_price_rows(stock_rows, market_rows, companies)
+        except Exception as e:
+            logger.error(f"Bulk price save failed, saving {len(saved)} companies one by one: {e}")
+            pairs, saved = saved, []
+            for company, quote in pairs:
+                if self.save_price(company, quote):
+                    saved.append((company, quote))
+                else:
+                    failed.append((company, "Error saving price"))
+
+        return saved, failed
+
     def fetch_all_company_prices(self) -> Dict:
         """
         Fetch and save prices for all companies with ticker symbols.
-        Returns summary of results.
+
+        Quotes are fetched concurrently (STOCK_PRICE_MAX_WORKERS), each
+        provider behind its own rate limiter, and saved in one bulk upsert.
+        Returns summary of results, including per-provider timings.
         """
         from core.models import Company
 
         # Get all active companies with ticker symbols
-        companies = Company.objects.filter(
+        companies = list(Company.objects.filter(
             is_active=True,
             ticker_symbol__isnull=False
-        ).exclude(ticker_symbol='')
+        ).exclude(ticker_symbol=''))
 
         results = {
             'success': True,
-            'total_companies': companies.count(),
+            'total_companies': len(companies),
             'successful': 0,
             'failed': 0,
             'skipped': 0,
@@ -375,30 +548,49 @@ class StockPriceScraper:
             'timestamp': timezone.now().isoformat()
         }
 
-        for company in companies:
+        start = time.perf_counter()
+
+        def fetch(company):
             try:
-                quote = self.fetch_company_price(company)
-
-                if quote:
-                    if self.save_price(company, quote):
-                        results['successful'] += 1
-                        results['details'].append({
-                            'ticker': company.ticker_symbol,
-                            'price': float(quote['close']),
-                            'source': quote.get('source')
-                        })
-                    else:
-                        results['failed'] += 1
-                        results['errors'].append(f"{company.ticker_symbol}: Failed to save")
+                return company, self.fetch_company_price(company), None
+            except Exception as e:
+                return company, None, e
+
+        # Network only in worker threads; all database writes happen below on this thread
+        quotes = []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='stock-price') as executor:
+            for company, quote, error in executor.map(fetch, companies):
+                if error is not None:
+                    results['failed'] += 1
+                    results['errors'].append(f"{company.ticker_symbol}: {str(error)}")
+                elif quote:
+                    quotes.append((company, quote))
                 else:
                     results['skipped'] += 1
                     results['errors'].append(f"{company.ticker_symbol}: No quote data available")
 
-            except Exception as e:
-                results['failed'] += 1
-                results['errors'].append(f"{company.ticker_symbol}: {str(e)}")
+        fetch_seconds = time.perf_counter() - start
+
+        saved, failed = self.save_prices(quotes)
+        results['successful'] = len(saved)
+        for company, quote in saved:
+            results['details'].append({
+                'ticker': company.ticker_symbol,
+                'price': float(quote['close']),
+                'source': quote.get('source')
+            })
+        results['failed'] += len(failed)
+        for company, error in failed:
+            results['errors'].append(f"{company.ticker_symbol}: {error}")
 
         results['success'] = results['failed'] == 0
+        results['timings'] = {
+            'fetch_seconds': round(fetch_seconds, 2),
+            'save_seconds': round(time.perf_counter() - start - fetch_seconds, 2),
+            'max_workers': self.max_workers,
+            'providers': {name: limiter.summary() for name, limiter in self.rate_limiters.items()},
+        }
+        logger.info(f"Stock price timings: {results['timings']}")
 
         return results
 
@@ -0,0 +1,168 @@
+"""
+Streaming Token Chunker
+
+Shared chunker for RAG documents, news content and the GPU worker.
+
+Works incrementally over paragraphs: each paragraph is tokenized on its own
+and only a sliding window of token offsets is kept in memory. Chunk text is
+sliced straight from the original string using token character offsets, so
+there is no decode round-trip and no full-document token list.
+
+Standalone on purpose (no Django imports): gpu_orchestrator copies this file
+next to gpu_worker.py on the GPU droplet.
+"""
+
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+DEFAULT_ENCODING = "cl100k_base"
+
+# Paragraph boundary: a newline followed by optional whitespace and another newline
+_PARAGRAPH_BREAK_RE = re.compile(r'\n[ \t\r\f\v]*\n\s*')
+
+# Markdown heading at the start of a segment (Docling exports "## 14 Mineral Resource Estimates")
+_HEADING_RE = re.compile(r'[ \t]*(#{1,6})[ \t]+([^\n]+)')
+
+# Fallback tokenization when tiktoken is not installed: whitespace-delimited words
+_WORD_RE = re.compile(r'\S+\s*|\s+')
+
+# Paragraphs longer than this are tokenized in line-aligned pieces to bound memory
+MAX_SEGMENT_CHARS = 64 * 1024
+
+
+@lru_cache(maxsize=4)
+def get_encoding(name: str = DEFAULT_ENCODING):
+    """Return a cached tiktoken encoding, or None if tiktoken is unavailable"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    return tiktoken.get_encoding(name)
+
+
+def _iter_segments(text: str) -> Iterator[Tuple[int, int]]:
+    """Yield contiguous (start, end) spans covering text, split after paragraph breaks"""
+    start = 0
+    for match in _PARAGRAPH_BREAK_RE.finditer(text):
+        yield from _split_long_segment(text, start, match.end())
+        start = match.end()
+    if start < len(text):
+        yield from _split_long_segment(text, start, len(text))
+
+
+def _split_long_segment(text: str, start: int, end: int) -> Iterator[Tuple[int, int]]:
+    while end - start > MAX_SEGMENT_CHARS:
+        # Prefer a line break, otherwise cut at a space, otherwise hard cut
+        cut = text.rfind('\n', start, start + MAX_SEGMENT_CHARS)
+        if cut <= start:
+            cut = text.rfind(' ', start, start + MAX_SEGMENT_CHARS)
+        cut = cut + 1 if cut > start else start + MAX_SEGMENT_CHARS
+        yield start, cut
+        start = cut
+    if start < end:
+        yield start, end
+
+
+def _token_spans(segment: str, encoding) -> List[Tuple[int, int]]:
+    """Character (start, end) offsets of each token within segment"""
+    if encoding is None:
+        return [m.span() for m in _WORD_RE.finditer(segment)]
+
+    tokens = encoding.encode(segment, disallowed_special=())
+    if not tokens:
+        return []
+    _, starts = encoding.decode_with_offsets(tokens)
+    ends = starts[1:] + [len(segment)]
+    return list(zip(starts, ends))
+
+
+def iter_chunks(
+    text: str,
+    max_tokens: int = 512,
+    overlap_tokens: int = 50,
+    encoding=None,
+    respect_headings: bool = False
+) -> Iterator[Dict]:
+    """
+    Split text into overlapping token-bounded chunks, lazily.
+
+    Args:
+        text: Text to chunk
+        max_tokens: Maximum tokens per chunk
+        overlap_tokens: Tokens shared between consecutive chunks
+        encoding: tiktoken Encoding (default: cached cl100k_base; word split if
+                  tiktoken is not installed)
+        respect_headings: Start a new chunk at each markdown heading and tag
+                          chunks with the heading they fall under
+
+    Yields:
+        dicts with text, token_count, start_token, end_token, start_char,
+        end_char and section_title (None unless respect_headings)
+    """
+    if not text:
+        return
+    if encoding is None:
+        encoding = get_encoding()
+    overlap_tokens = max(0, min(overlap_tokens, max_tokens - 1))
+
+    window = deque()           # (char_start, char_end) of tokens not yet dropped
+    window_first = 0           # absolute index of window[0]
+    covered = 0                # absolute index of the first token not in any emitted chunk
+    total_tokens = 0
+    section_title = None
+    chunk_section = None
+
+    def emit(count: int) -> Dict:
+        start_char = window[0][0]
+        end_char = window[count - 1][1]
+        return {
+            'text': text[start_char:end_char],
+            'token_count': count,
+            'start_token': window_first,
+            'end_token': window_first + count,
+            'start_char': start_char,
+            'end_char': end_char,
+            'section_title': chunk_section,
+        }
+
+    for seg_start, seg_end in _iter_segments(text):
+        if respect_headings:
+            heading = _HEADING_RE.match(text, seg_start, seg_end)
+            if heading:
+                # Flush tokens not yet covered so the heading starts a fresh chunk
+                if covered < total_tokens:
+                    yield emit(len(window))
+                    covered = total_tokens
+                window.clear()
+                window_first = total_tokens
+                section_title = heading.group(2).strip()
+                chunk_section = section_title
+
+        for tok_start, tok_end in _token_spans(text[seg_start:seg_end], encoding):
+            window.append((seg_start + tok_start, seg_start + tok_end))
+            total_tokens += 1
+
+            if len(window) == max_tokens:
+                yield emit(max_tokens)
+                covered = window_first + max_tokens
+                # Keep the overlap tail as the start of the next chunk
+                for _ in range(max_tokens - overlap_tokens):
+                    window.popleft()
+                window_first += max_tokens - overlap_tokens
+                chunk_section = section_title
+
+    # Final partial chunk, only if it contains tokens not already emitted
+    if covered < total_tokens and window:
+        yield emit(len(window))
+
+
+def chunk_list(text: str, max_tokens: int = 512, overlap_tokens: int = 50,
+               encoding=None, respect_headings: bool = False) -> List[Dict]:
+    """Convenience wrapper returning all chunks as a list"""
+    return list(iter_chunks(text, max_tokens, overlap_tokens, encoding, respect_headings))
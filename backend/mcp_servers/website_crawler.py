@@ -6,16 +6,23 @@ Updated: Comprehensive date parsing, external news wire support, title cleaning
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
+import time
 from urllib.parse import urljoin, urlparse
 from typing import List, Dict, Set, Optional, Tuple
 import re
 import sys
 from datetime import datetime, timedelta
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
+from crawl4ai import CrawlerRunConfig
 from bs4 import BeautifulSoup
+from django.conf import settings
 from core.security_utils import check_url_safety as is_safe_url
 from core.api_utils import extract_url_slug
+from .crawl_engine import crawl_session
+from .date_extraction import MONTH_MAP, leading_date_extractor, standalone_date_extractor
+from .html_parsing import css, page_soup
 
 logger = logging.getLogger(__name__)
 
@@ -26,18 +33,9 @@ if sys.platform == 'win32':
 
 # ============================================================================
 # DATE PARSING - Comprehensive date extraction from multiple formats
+# (compiled rules, hit counters and memo in mcp_servers/date_extraction.py)
 # ============================================================================
 
-MONTH_MAP = {
-    'jan': '01', 'january': '01', 'feb': '02', 'february': '02',
-    'mar': '03', 'march': '03', 'apr': '04', 'april': '04',
-    'may': '05', 'jun': '06', 'june': '06', 'jul': '07', 'july': '07',
-    'aug': '08', 'august': '08', 'sep': '09', 'sept': '09', 'september': '09',
-    'oct': '10', 'october': '10', 'nov': '11', 'november': '11',
-    'dec': '12', 'december': '12'
-}
-
-
 def parse_date_comprehensive(text: str) -> Tuple[Optional[str], str]:
     """
     Extract date from text using all known patterns.
@@ -46,356 +44,14 @@ def parse_date_comprehensive(text: str) -> Tuple[Optional[str], str]:
     """
     if not text:
         return None, text
-
-    text = text.strip()
-    original_text = text
-    date_str = None
-
-    # Pattern 1: XX.XX.YYYY or XX.XX.YY - Could be MM.DD or DD.MM format
-    # Determine format by checking which interpretation is valid
-    match = re.match(r'^(\d{1,2})\.(\d{1,2})\.(20\d{2}|\d{2})\s*[-–]?\s*(.*)$', text)
-    if match:
-        first = match.group(1).zfill(2)
-        second = match.group(2).zfill(2)
-        year = match.group(3)
-        if len(year) == 2:
-            year = f"20{year}" if int(year) <= 50 else f"19{year}"
-        first_int, second_int = int(first), int(second)
-
-        # Try MM.DD.YYYY first (US format)
-        if 1 <= first_int <= 12 and 1 <= second_int <= 31:
-            date_str = f"{year}-{first}-{second}"
-            text = match.group(4).strip() if match.group(4) else ''
-            return date_str, text
-        # If first > 12, it must be DD.MM.YYYY (European format)
-        elif 1 <= second_int <= 12 and 1 <= first_int <= 31:
-            date_str = f"{year}-{second}-{first}"
-            text = match.group(4).strip() if match.group(4) else ''
-            return date_str, text
-
-    # Pattern 2: Month DD, YYYY at start (January 5, 2026Lavras Gold...)
-    match = re.match(
-        r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s*(20\d{2})\s*[-–]?\s*(.*)$',
-        text, re.IGNORECASE
-    )
-    if match:
-        month = MONTH_MAP.get(match.group(1).lower(), '01')
-        day = match.group(2).zfill(2)
-        year = match.group(3)
-        date_str = f"{year}-{month}-{day}"
-        text = match.group(4).strip() if match.group(4) else ''
-        return date_str, text
-
-    # Pattern 3: DDMonTitle - embedded date in title (Kuya Silver: "22DecKuya Silver...")
-    match = re.match(r'^(\d{1,2})(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)([A-Z].*)', text)
-    if match:
-        day = match.group(1).zfill(2)
-        month = MONTH_MAP.get(match.group(2).lower(), '01')
-        remaining_title = match.group(3)
-        # Determine year - if month is in future, use last year
-        current_year = datetime.now().year
-        current_month = datetime.now().month
-        year = current_year if int(month) <= current_month else current_year - 1
-        date_str = f"{year}-{month}-{day}"
-        return date_str, remaining_title
-
-    # Pattern 4: XX/XX/YY at start - could be MM/DD/YY or DD/MM/YY
-    # Detect format by checking if first or second number > 12
-    match = re.match(r'^(\d{1,2})/(\d{1,2})/(\d{2})\s+(.*)$', text)
-    if match:
-        first = match.group(1).zfill(2)
-        second = match.group(2).zfill(2)
-        year_short = match.group(3)
-        year = f"20{year_short}" if int(year_short) <= 50 else f"19{year_short}"
-        first_int, second_int = int(first), int(second)
-
-        # If first > 12, it MUST be DD/MM/YY (e.g., 13/11/25 = Nov 13)
-        if first_int > 12 and 1 <= second_int <= 12:
-            date_str = f"{year}-{second}-{first}"  # DD/MM -> YYYY-MM-DD
-            text = match.group(4).strip()
-            return date_str, text
-        # If second > 12, it MUST be MM/DD/YY (e.g., 01/25/26 = Jan 25)
-        elif second_int > 12 and 1 <= first_int <= 12:
-            date_str = f"{year}-{first}-{second}"  # MM/DD -> YYYY-MM-DD
-            text = match.group(4).strip()
-            return date_str, text
-        # Both <= 12: ambiguous - try DD/MM first (more common internationally)
-        # If that would be in the future, fall back to MM/DD
-        elif 1 <= first_int <= 12 and 1 <= second_int <= 12:
-            # Try DD/MM interpretation first
-            dd_mm_date = f"{year}-{second}-{first}"  # DD/MM -> YYYY-MM-DD
-            mm_dd_date = f"{year}-{first}-{second}"  # MM/DD -> YYYY-MM-DD
-
-            # Check if DD/MM interpretation is in the future
-            try:
-                dd_mm_parsed = datetime.strptime(dd_mm_date, '%Y-%m-%d')
-                mm_dd_parsed = datetime.strptime(mm_dd_date, '%Y-%m-%d')
-                today = datetime.now()
-
-                # If DD/MM is more than 7 days in future but MM/DD is not, use MM/DD
-                if dd_mm_parsed > today + timedelta(days=7) and mm_dd_parsed <= today + timedelta(days=7):
-                    date_str = mm_dd_date
-                else:
-                    # Default to DD/MM (European format, more common internationally)
-                    date_str = dd_mm_date
-            except ValueError:
-                # If parsing fails, default to DD/MM
-                date_str = dd_mm_date
-
-            text = match.group(4).strip()
-            return date_str, text
-
-    # Pattern 5: Abbreviated month (Jan 26 2023 or Jan262023 or Dec. 17, 2025)
-    match = re.match(
-        r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s*(\d{1,2})\s*,?\s*(20\d{2})\s*[-–]?\s*(.*)$',
-        text, re.IGNORECASE
-    )
-    if match:
-        month = MONTH_MAP.get(match.group(1).lower(), '01')
-        day = match.group(2).zfill(2)
-        year = match.group(3)
-        date_str = f"{year}-{month}-{day}"
-        text = match.group(4).strip() if match.group(4) else ''
-        return date_str, text
-
-    # Now try to find dates anywhere in text (don't modify text for these)
-
-    # Pattern 6: YYYYMMDD (20261128)
-    match = re.search(r'(20\d{2})(\d{2})(\d{2})', text)
-    if match:
-        year, month, day = match.group(1), match.group(2), match.group(3)
-        if 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
-            date_str = f"{year}-{month}-{day}"
-            return date_str, original_text
-
-    # Pattern 7: YYYY-MM-DD or YYYY_MM_DD
-    match = re.search(r'(20\d{2})[_-](\d{2})[_-](\d{2})', text)
-    if match:
-        year, month, day = match.group(1), match.group(2), match.group(3)
-        if 1 <= int(month) <= 12 and 1 <= int(day) <= 31:
-            date_str = f"{year}-{month}-{day}"
-            return date_str, original_text
-
-    # Pattern 8: Month DD, YYYY anywhere (including abbreviated with period like "Dec. 17, 2025")
-    match = re.search(
-        r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+(\d{1,2}),?\s*(20\d{2})',
-        text, re.IGNORECASE
-    )
-    if match:
-        month_name = match.group(1).lower()[:3]
-        month = MONTH_MAP.get(month_name, '01')
-        day = match.group(2).zfill(2)
-        year = match.group(3)
-        date_str = f"{year}-{month}-{day}"
-        return date_str, original_text
-
-    # Pattern 9: XX/XX/YYYY anywhere - could be MM/DD or DD/MM format
-    match = re.search(r'(\d{1,2})/(\d{1,2})/(20\d{2})', text)
-    if match:
-        first = match.group(1).zfill(2)
-        second = match.group(2).zfill(2)
-        year = match.group(3)
-        first_int, second_int = int(first), int(second)
-
-        # If first > 12, it MUST be DD/MM format
-        if first_int > 12 and 1 <= second_int <= 12:
-            date_str = f"{year}-{second}-{first}"  # DD/MM -> YYYY-MM-DD
-            return date_str, original_text
-        # If second > 12, it MUST be MM/DD format
-        elif second_int > 12 and 1 <= first_int <= 12:
-            date_str = f"{year}-{first}-{second}"  # MM/DD -> YYYY-MM-DD
-            return date_str, original_text
-        # Both <= 12: ambiguous - default to DD/MM (international standard)
-        # Use future date check as sanity validation
-        elif 1 <= first_int <= 12 and 1 <= second_int <= 12:
-            dd_mm_date = f"{year}-{second}-{first}"  # DD/MM interpretation
-            mm_dd_date = f"{year}-{first}-{second}"  # MM/DD interpretation
-            try:
-                dd_mm_parsed = datetime.strptime(dd_mm_date, "%Y-%m-%d")
-                mm_dd_parsed = datetime.strptime(mm_dd_date, "%Y-%m-%d")
-                now = datetime.now()
-                future_threshold = now + timedelta(days=7)
-                # If DD/MM is far in future but MM/DD is not, use MM/DD
-                if dd_mm_parsed > future_threshold and mm_dd_parsed <= future_threshold:
-                    return mm_dd_date, original_text
-                return dd_mm_date, original_text
-            except (ValueError, TypeError):
-                return dd_mm_date, original_text
-
-    return None, original_text
+    return leading_date_extractor(text)
 
 
 def parse_date_standalone(text: str) -> Optional[str]:
     """Parse date from a string that contains ONLY a date (for dedicated date elements)."""
     if not text:
         return None
-    text = text.strip()
-
-    # Strip ordinal suffixes from day numbers (1st, 2nd, 3rd, 4th, 22nd, etc.)
-    # e.g., "January 22nd, 2026" → "January 22, 2026"
-    text = re.sub(r'(\d)(st|nd|rd|th)\b', r'\1', text)
-
-    # XX.XX.YYYY - Dot-separated dates
-    # Mining company websites are predominantly North American and use MM.DD.YYYY
-    # Even with dots (e.g., Aztec Minerals uses 01.07.2026 for January 7th)
-    # Prefer MM.DD.YYYY for ambiguous cases
-    match = re.match(r'^(\d{1,2})\.(\d{1,2})\.(20\d{2}|\d{2})$', text)
-    if match:
-        first, second, year = match.groups()
-        if len(year) == 2:
-            year = f"20{year}"
-        first_int, second_int = int(first), int(second)
-
-        # If first > 12, it MUST be DD.MM.YYYY (e.g., 22.01.2026)
-        if first_int > 12 and 1 <= second_int <= 12:
-            return f"{year}-{second.zfill(2)}-{first.zfill(2)}"
-        # If second > 12, it MUST be MM.DD.YYYY (e.g., 01.22.2026)
-        elif second_int > 12 and 1 <= first_int <= 12:
-            return f"{year}-{first.zfill(2)}-{second.zfill(2)}"
-        # Ambiguous (both <= 12): prefer MM.DD.YYYY for North American mining sites
-        elif 1 <= first_int <= 12 and 1 <= second_int <= 31:
-            return f"{year}-{first.zfill(2)}-{second.zfill(2)}"
-        # Fallback to DD.MM.YYYY
-        return f"{year}-{second.zfill(2)}-{first.zfill(2)}"
-
-    # Month DD, YYYY (1911 Gold: December 17, 2025)
-    match = re.match(
-        r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s*(20\d{2})$',
-        text, re.IGNORECASE
-    )
-    if match:
-        month = MONTH_MAP.get(match.group(1).lower()[:3], '01')
-        day = match.group(2).zfill(2)
-        year = match.group(3)
-        return f"{year}-{month}-{day}"
-
-    # Month DD / YYYY (GoldMining: January 22 / 2026)
-    match = re.match(
-        r'^(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})\s*/\s*(20\d{2})$',
-        text, re.IGNORECASE
-    )
-    if match:
-        month = MONTH_MAP.get(match.group(1).lower()[:3], '01')
-        day = match.group(2).zfill(2)
-        year = match.group(3)
-        return f"{year}-{month}-{day}"
-
-    # DD Month YYYY (Cantex: 28 JANUARY 2026)
-    match = re.match(
-        r'^(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(20\d{2})$',
-        text, re.IGNORECASE
-    )
-    if match:
-        day = match.group(1).zfill(2)
-        month = MONTH_MAP.get(match.group(2).lower()[:3], '01')
-        year = match.group(3)
-        return f"{year}-{month}-{day}"
-
-    # DD Mon, YYYY (Firefox Gold: 20 Jan, 2026)
-    match = re.match(
-        r'^(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec),?\s+(20\d{2})$',
-        text, re.IGNORECASE
-    )
-    if match:
-        day = match.group(1).zfill(2)
-        month = MONTH_MAP.get(match.group(2).lower(), '01')
-        year = match.group(3)
-        return f"{year}-{month}-{day}"
-
-    # Mon DD YYYY - no comma (Aston Bay: Nov 17 2025)
-    match = re.match(
-        r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})\s+(20\d{2})$',
-        text, re.IGNORECASE
-    )
-    if match:
-        month = MONTH_MAP.get(match.group(1).lower(), '01')
-        day = match.group(2).zfill(2)
-        year = match.group(3)
-        return f"{year}-{month}-{day}"
-
-    # Mon DD, YYYY - with comma (55 North Mining: Jul 7, 2025)
-    match = re.match(
-        r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s*(20\d{2})$',
-        text, re.IGNORECASE
-    )
-    if match:
-        month = MONTH_MAP.get(match.group(1).lower(), '01')
-        day = match.group(2).zfill(2)
-        year = match.group(3)
-        return f"{year}-{month}-{day}"
-
-    # Mon. DD, YYYY - abbreviated month with period (Morien Resources: Dec. 17, 2025)
-    match = re.match(
-        r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.\s*(\d{1,2}),?\s*(20\d{2})$',
-        text, re.IGNORECASE
-    )
-    if match:
-        month = MONTH_MAP.get(match.group(1).lower(), '01')
-        day = match.group(2).zfill(2)
-        year = match.group(3)
-        return f"{year}-{month}-{day}"
-
-    # XX/XX/YYYY or XX/XX/YY - could be MM/DD or DD/MM format
-    # Detect format by checking if first or second number > 12
-    match = re.match(r'^(\d{1,2})/(\d{1,2})/(20\d{2}|\d{2})$', text)
-    if match:
-        first, second, year = match.groups()
-        if len(year) == 2:
-            year = f"20{year}"
-        first_int, second_int = int(first), int(second)
-
-        # If first > 12, it MUST be DD/MM format (e.g., 13/11/25 = Nov 13)
-        if first_int > 12 and 1 <= second_int <= 12:
-            return f"{year}-{second.zfill(2)}-{first.zfill(2)}"  # DD/MM -> YYYY-MM-DD
-        # If second > 12, it MUST be MM/DD format (e.g., 01/25/26 = Jan 25)
-        elif second_int > 12 and 1 <= first_int <= 12:
-            return f"{year}-{first.zfill(2)}-{second.zfill(2)}"  # MM/DD -> YYYY-MM-DD
-        # Both <= 12: ambiguous - default to DD/MM (more common internationally)
-        # But use future date check as sanity validation
-        elif 1 <= first_int <= 12 and 1 <= second_int <= 12:
-            dd_mm_date = f"{year}-{second.zfill(2)}-{first.zfill(2)}"  # DD/MM interpretation
-            mm_dd_date = f"{year}-{first.zfill(2)}-{second.zfill(2)}"  # MM/DD interpretation
-            # Check if DD/MM interpretation is far in the future (>7 days)
-            try:
-                from datetime import datetime, timedelta
-                dd_mm_parsed = datetime.strptime(dd_mm_date, "%Y-%m-%d")
-                mm_dd_parsed = datetime.strptime(mm_dd_date, "%Y-%m-%d")
-                now = datetime.now()
-                future_threshold = now + timedelta(days=7)
-
-                # If DD/MM is far in future but MM/DD is not, use MM/DD
-                if dd_mm_parsed > future_threshold and mm_dd_parsed <= future_threshold:
-                    return mm_dd_date
-                # Otherwise default to DD/MM (international standard)
-                return dd_mm_date
-            except (ValueError, TypeError):
-                return dd_mm_date  # Default to DD/MM on any error
-        else:
-            return f"{year}-{second.zfill(2)}-{first.zfill(2)}"  # Default DD/MM
-
-    # Mon DD - NO YEAR (Freegold Ventures: "Jan 15", "Dec 19")
-    # Infer year based on whether the date is in the future
-    match = re.match(
-        r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})$',
-        text, re.IGNORECASE
-    )
-    if match:
-        month = MONTH_MAP.get(match.group(1).lower(), '01')
-        day = match.group(2).zfill(2)
-        # Determine year - if month/day is in the future, use last year
-        current_year = datetime.now().year
-        current_month = datetime.now().month
-        current_day = datetime.now().day
-        month_int = int(month)
-        day_int = int(day)
-        # If the date appears to be in the future, assume it's from last year
-        if month_int > current_month or (month_int == current_month and day_int > current_day):
-            year = current_year - 1
-        else:
-            year = current_year
-        return f"{year}-{month}-{day}"
-
-    return None
+    return standalone_date_extractor(text)
 
 
 def clean_news_title(title: str, url: str = '') -> str:
@@ -571,19 +227,27 @@ class MiningDocumentCrawler:
     """
     Crawler specialized for discovering mining company documents
     Focuses on NI 43-101 reports, presentations, and technical documents
+
+    Pages are crawled from a priority frontier: shallower pages first and,
+    at the same depth, the links _page_score rates most document-heavy, fetched
+    by DOCUMENT_CRAWLER_WORKERS concurrent workers until the page or time budget
+    is spent.
     """
 
     def __init__(self):
         """Initialize the crawler"""
         self.discovered_urls = set()
         self.pdf_urls = []
+        self.crawl_stats = {}
 
     async def discover_documents(
         self,
         start_url: str,
         max_depth: int = 2,
         max_pages: int = 50,
-        keywords: List[str] = None
+        keywords: List[str] = None,
+        max_seconds: Optional[float] = None,
+        workers: Optional[int] = None
     ) -> List[Dict]:
         """
         Discover documents on a website
@@ -593,6 +257,8 @@ class MiningDocumentCrawler:
             max_depth: How deep to crawl (1 = just start page, 2 = one link deep, etc.)
             max_pages: Maximum pages to visit
             keywords: Keywords to filter documents (e.g., ['ni 43-101', 'technical report'])
+            max_seconds: Stop starting new pages after this long (default DOCUMENT_CRAWLER_MAX_SECONDS)
+            workers: Pages fetched at once (default DOCUMENT_CRAWLER_WORKERS)
 
         Returns:
             List of discovered document dictionaries with url, title, type, etc.
@@ -604,29 +270,27 @@ class MiningDocumentCrawler:
                 'pea', 'prefeasibility', 'feasibility',
                 'mineral resource', 'mineral reserve'
             ]
+        if max_seconds is None:
+            max_seconds = getattr(settings, 'DOCUMENT_CRAWLER_MAX_SECONDS', 300)
+        if workers is None:
+            workers = getattr(settings, 'DOCUMENT_CRAWLER_WORKERS', 4)
 
         self.discovered_urls = set()
         self.pdf_urls = []
 
-        # Configure browser
-        browser_config = BrowserConfig(
-            headless=True,
-            verbose=False
-        )
-
         # Configure crawler
         crawler_config = CrawlerRunConfig(
             cache_mode="bypass",  # Don't use cache for fresh results
         )
 
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            # Start crawling
-            await self._crawl_recursive(
+        async with crawl_session() as crawler:
+            await self._crawl_frontier(
                 crawler,
                 start_url,
                 max_depth=max_depth,
-                current_depth=0,
                 max_pages=max_pages,
+                max_seconds=max_seconds,
+                workers=workers,
                 keywords=keywords,
                 crawler_config=crawler_config
             )
@@ -636,89 +300,157 @@ class MiningDocumentCrawler:
 
         return documents
 
-    async def _crawl_recursive(
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Frontier dedupe key: no fragment, lowercase scheme/host, no trailing slash"""
+        parsed = urlparse(url)
+        path = parsed.path.rstrip('/')
+        key = f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{path}"
+        if parsed.query:
+            key += f"?{parsed.query}"
+        return key
+
+    async def _crawl_frontier(
         self,
         crawler,
-        url: str,
+        start_url: str,
         max_depth: int,
-        current_depth: int,
         max_pages: int,
+        max_seconds: float,
+        workers: int,
         keywords: List[str],
         crawler_config
     ):
-        """Recursively crawl pages to discover documents"""
-
-        # Stop if we've hit limits
-        if current_depth > max_depth or len(self.discovered_urls) >= max_pages:
-            return
-
-        # Skip if already visited
-        if url in self.discovered_urls:
-            return
+        """
+        Crawl pages from a priority queue with concurrent workers
+
+        Frontier entries are ordered by (depth, -score), so every relevant page
+        one link from the start page is fetched before any page two links deep,
+        and one deep branch can no longer spend the page budget. Each URL is
+        queued once (by _normalize_url). Workers stop taking pages once
+        max_pages have been started or max_seconds have passed; pages already
+        being fetched are finished.
+        """
+        started = time.monotonic()
+        deadline = started + max_seconds
+        order = itertools.count()
+        frontier = [(0, 0, next(order), start_url)]
+        queued = {self._normalize_url(start_url)}
+        wakeup = asyncio.Condition()
+        active = 0
+        stats = {'pages_fetched': 0, 'pages_failed': 0, 'links_queued': 1, 'stopped_by': 'frontier'}
+
+        async def worker():
+            nonlocal active
+            while True:
+                async with wakeup:
+                    # Wait while the frontier is empty but other workers may still add links
+                    while not frontier and active:
+                        await wakeup.wait()
+                    if not frontier:
+                        return
+                    if len(self.discovered_urls) >= max_pages:
+                        stats['stopped_by'] = 'max_pages'
+                        return
+                    if time.monotonic() >= deadline:
+                        stats['stopped_by'] = 'max_seconds'
+                        return
+                    depth, _, _, url = heapq.heappop(frontier)
+                    self.discovered_urls.add(url)
+                    active += 1
 
-        self.discovered_urls.add(url)
+                try:
+                    links = await self._crawl_page(crawler, url, depth < max_depth, keywords, crawler_config)
+                    if links is None:
+                        stats['pages_failed'] += 1
+                    else:
+                        stats['pages_fetched'] += 1
+                except Exception as e:
+                    logger.error(f"[ERROR] Crawling {url}: {str(e)}")
+                    stats['pages_failed'] += 1
+                    links = None
+
+                async with wakeup:
+                    for link_url, score in links or []:
+                        key = self._normalize_url(link_url)
+                        if key not in queued:
+                            queued.add(key)
+                            heapq.heappush(frontier, (depth + 1, -score, next(order), link_url))
+                            stats['links_queued'] += 1
+                    active -= 1
+                    wakeup.notify_all()
+
+        await asyncio.gather(*(worker() for _ in range(max(workers, 1))))
+
+        stats['seconds'] = round(time.monotonic() - started, 2)
+        stats['pdfs_found'] = len(self.pdf_urls)
+        stats['links_unvisited'] = len(frontier)
+        self.crawl_stats = stats
+        logger.info(
+            f"[CRAWL] {stats['pages_fetched']} pages ({stats['pages_failed']} failed), "
+            f"{stats['pdfs_found']} PDF links in {stats['seconds']}s; "
+            f"stopped by {stats['stopped_by']} with {stats['links_unvisited']} links unvisited"
+        )
 
-        try:
-            # Crawl the page
-            result = await crawler.arun(url=url, config=crawler_config)
+    async def _crawl_page(
+        self,
+        crawler,
+        url: str,
+        follow_links: bool,
+        keywords: List[str],
+        crawler_config
+    ) -> Optional[List[Tuple[str, int]]]:
+        """
+        Fetch one page, record its PDF links, and return the (url, score) links
+        worth crawling next (empty when follow_links is False, None on failure)
+        """
+        result = await crawler.arun(url=url, config=crawler_config)
 
-            if not result.success:
-                logger.warning(f"[!] Failed to crawl: {url}")
-                return
+        if not result.success:
+            logger.warning(f"[!] Failed to crawl: {url}")
+            return None
 
-            # Parse HTML
-            soup = BeautifulSoup(result.html, 'html.parser')
+        # Parse HTML
+        soup = page_soup(result.html)
 
-            # Special handling for news/press-release pages - extract titles from news listings
-            if any(keyword in url.lower() for keyword in ['/news/', '/press-release', '/media']):
-                self._extract_news_titles(soup, url)
+        # Special handling for news/press-release pages - extract titles from news listings
+        if any(keyword in url.lower() for keyword in ['/news/', '/press-release', '/media']):
+            self._extract_news_titles(soup, url)
 
-            # Find all links
-            links = soup.find_all('a', href=True)
+        next_links = []
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            full_url = urljoin(url, href)
 
-            for link in links:
-                href = link['href']
-                full_url = urljoin(url, href)
+            # Check if it's a PDF (handle URLs with parameters like ?v=111911)
+            is_pdf = '.pdf' in href.lower() or '.pdf' in full_url.lower().split('?')[0]
 
-                # Check if it's a PDF (handle URLs with parameters like ?v=111911)
-                is_pdf = '.pdf' in href.lower() or '.pdf' in full_url.lower().split('?')[0]
+            if is_pdf:
+                link_text = link.get_text(strip=True)
+                pdf_info = {
+                    'url': full_url,
+                    'link_text': link_text,
+                    'source_page': url
+                }
+                self.pdf_urls.append(pdf_info)
+                # Safely print with Unicode handling
+                try:
+                    if link_text:
+                        logger.info(f"[PDF] Found: {link_text[:60]}...")
+                    else:
+                        # Show URL filename if no link text
+                        filename = full_url.split('/')[-1].split('?')[0]
+                        logger.info(f"[PDF] Found: {filename}")
+                except UnicodeEncodeError:
+                    logger.info(f"[PDF] Found PDF document")
 
-                if is_pdf:
-                    link_text = link.get_text(strip=True)
-                    pdf_info = {
-                        'url': full_url,
-                        'link_text': link_text,
-                        'source_page': url
-                    }
-                    self.pdf_urls.append(pdf_info)
-                    # Safely print with Unicode handling
-                    try:
-                        if link_text:
-                            logger.info(f"[PDF] Found: {link_text[:60]}...")
-                        else:
-                            # Show URL filename if no link text
-                            filename = full_url.split('/')[-1].split('?')[0]
-                            logger.info(f"[PDF] Found: {filename}")
-                    except UnicodeEncodeError:
-                        logger.info(f"[PDF] Found PDF document")
-
-                # If it's an internal link and we haven't hit depth limit, crawl it
-                elif current_depth < max_depth:
-                    # Skip if it's a PDF (don't crawl PDFs as pages)
-                    # Already handled above
-                    pass
-                    # Check if it's an internal link
-                    if self._is_internal_link(url, full_url):
-                        # Check if it's likely to contain documents
-                        if self._is_relevant_page(full_url, link.get_text(strip=True), keywords):
-                            await self._crawl_recursive(
-                                crawler, full_url,
-                                max_depth, current_depth + 1,
-                                max_pages, keywords, crawler_config
-                            )
+            # Queue internal links that are likely to contain documents
+            elif follow_links and self._is_internal_link(url, full_url):
+                score = self._page_score(full_url, link.get_text(strip=True), keywords)
+                if score:
+                    next_links.append((full_url.split('#')[0], score))
 
-        except Exception as e:
-            logger.error(f"[ERROR] Crawling {url}: {str(e)}")
+        return next_links
 
     def _is_internal_link(self, base_url: str, link_url: str) -> bool:
         """Check if a link is internal (same domain)"""
@@ -737,37 +469,34 @@ class MiningDocumentCrawler:
         Check if a page is likely to contain relevant documents
         Looks at URL path and link text for keywords
         """
-        # Skip certain page types
-        skip_patterns = [
-            '/contact', '/careers', '/team', '/login', '/signin',
-            'facebook.com', 'twitter.com', 'linkedin.com',
-            'youtube.com', 'instagram.com'
-        ]
+        return self._page_score(url, link_text, keywords) > 0
 
-        url_lower = url.lower()
-        for pattern in skip_patterns:
-            if pattern in url_lower:
-                return False
+    # Section paths that usually list documents directly rank above general ones
+    DOCUMENT_PAGE_PATTERNS = [
+        '/reports', '/technical', '/presentations', '/disclosure', '/documents', '/filings'
+    ]
+    GENERAL_PAGE_PATTERNS = ['/investor', '/news', '/resources', '/projects']
+    SKIP_PAGE_PATTERNS = [
+        '/contact', '/careers', '/team', '/login', '/signin',
+        'facebook.com', 'twitter.com', 'linkedin.com',
+        'youtube.com', 'instagram.com'
+    ]
 
-        # Look for relevant keywords
-        relevant_patterns = [
-            '/investor', '/reports', '/technical', '/news',
-            '/presentations', '/resources', '/projects',
-            '/disclosure', '/documents', '/filings'
-        ]
+    def _page_score(self, url: str, link_text: str, keywords: List[str]) -> int:
+        """
+        Frontier priority for a link: 0 = not worth crawling, higher = more
+        likely to list documents (2 per document-section pattern or document
+        keyword in the URL/link text, 1 per general section pattern)
+        """
+        url_lower = url.lower()
+        if any(pattern in url_lower for pattern in self.SKIP_PAGE_PATTERNS):
+            return 0
 
         text_lower = (url + ' ' + link_text).lower()
-
-        for pattern in relevant_patterns:
-            if pattern in text_lower:
-                return True
-
-        # Check for general keywords
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                return True
-
-        return False
+        score = 2 * sum(1 for pattern in self.DOCUMENT_PAGE_PATTERNS if pattern in text_lower)
+        score += sum(1 for pattern in self.GENERAL_PAGE_PATTERNS if pattern in text_lower)
+        score += 2 * sum(1 for keyword in keywords if keyword.lower() in text_lower)
+        return score
 
     def _extract_news_titles(self, soup: BeautifulSoup, source_url: str):
         """
@@ -1200,7 +929,6 @@ async def crawl_technical_documents(url: str) -> List[Dict]:
     """
     from urllib.parse import urljoin
 
-    browser_config = BrowserConfig(headless=True, verbose=False)
     crawler_config = CrawlerRunConfig(cache_mode="bypass")
 
     technical_docs = []
@@ -1223,13 +951,13 @@ async def crawl_technical_documents(url: str) -> List[Dict]:
     # Sub-paths to check under discovered project pages
     tech_subpaths = ['/technical-documents/', '/technical-reports/', '/reports/', '/documents/']
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
+    async with crawl_session() as crawler:
         # First, try to find project pages that might have technical documents
         project_pages = []
         try:
             result = await crawler.arun(url=url, config=crawler_config)
             if result.success:
-                soup = BeautifulSoup(result.html, 'html.parser')
+                soup = page_soup(result.html)
 
                 # Find project links that might lead to technical documents
                 for link in soup.find_all('a', href=True):
@@ -1270,7 +998,7 @@ async def crawl_technical_documents(url: str) -> List[Dict]:
                     continue
 
                 logger.info(f"[TECH-DOCS] Scanning: {tech_url}")
-                soup = BeautifulSoup(result.html, 'html.parser')
+                soup = page_soup(result.html)
 
                 # Find all PDF links
                 for link in soup.find_all('a', href=True):
@@ -1463,7 +1191,7 @@ async def _extract_date_from_article_page(crawler, article_url: str, crawler_con
     Fetch an individual news article page and extract the publication date.
 
     Args:
-        crawler: AsyncWebCrawler instance
+        crawler: Crawler from crawl_session()
         article_url: URL of the news article page
         crawler_config: Crawler configuration
 
@@ -1477,7 +1205,7 @@ async def _extract_date_from_article_page(crawler, article_url: str, crawler_con
         if not result.success:
             return None
 
-        soup = BeautifulSoup(result.html, 'html.parser')
+        soup = page_soup(result.html)
 
         # Strategy 1: Look for meta tags with publication date
         meta_tags = [
@@ -1791,11 +1519,6 @@ async def crawl_html_news_pages(url: str, months: int = 6, custom_news_url: str
     successful_news_url = None  # Track which URL pattern found news
     cutoff_date = datetime.now() - timedelta(days=months * 30)
 
-    browser_config = BrowserConfig(
-        headless=True,
-        verbose=False
-    )
-
     # Fast config for daily news scraping - no delays, short timeout
     # The slow config (5s delay, networkidle) caused 2+ hour scrapes
     # page_timeout=15000 (15 seconds) prevents slow/unreachable sites from blocking
@@ -1808,7 +1531,7 @@ async def crawl_html_news_pages(url: str, months: int = 6, custom_news_url: str
     # Track scrape start time for time-based early exit
     scrape_start_time = datetime.now()
 
-    async with AsyncWebCrawler(config=browser_config) as crawler:
+    async with crawl_session() as crawler:
         current_year = datetime.now().year
 
         # Normalize URL - remove trailing slashes to avoid double slashes
@@ -1845,7 +1568,7 @@ async def crawl_html_news_pages(url: str, months: int = 6, custom_news_url: str
                 if not result.success:
                     continue
 
-                soup = BeautifulSoup(result.html, 'html.parser')
+                soup = page_soup(result.html)
 
                 # Check for Evergreen year selector
                 year_select = soup.select_one('select.evergreen-dropdown')
@@ -1883,7 +1606,7 @@ async def crawl_html_news_pages(url: str, months: int = 6, custom_news_url: str
                         if not year_result.success:
                             continue
 
-                        year_soup = BeautifulSoup(year_result.html, 'html.parser')
+                        year_soup = page_soup(year_result.html)
 
                         # Extract news items from Evergreen structure
                         for item in year_soup.select('.evergreen-news-item, .evergreen-item'):
@@ -2297,7 +2020,7 @@ async def crawl_html_news_pages(url: str, months: int = 6, custom_news_url: str
 
             wix_result = await crawler.arun(url=wix_news_url, config=crawler_config)
             if wix_result.success:
-                wix_soup = BeautifulSoup(wix_result.html, 'html.parser')
+                wix_soup = page_soup(wix_result.html)
 
                 # Check if this looks like a Wix site
                 is_wix = 'wix' in wix_result.html.lower() or 'parastorage' in wix_result.html.lower()
@@ -2527,7 +2250,7 @@ async def crawl_html_news_pages(url: str, months: int = 6, custom_news_url: str
 
             inv_result = await crawler.arun(url=investors_url, config=crawler_config)
             if inv_result.success:
-                inv_soup = BeautifulSoup(inv_result.html, 'html.parser')
+                inv_soup = page_soup(inv_result.html)
 
                 # Look for news-item divs with data-year attribute
                 news_items = inv_soup.find_all('div', class_=lambda c: c and 'news-item' in c, attrs={'data-year': True})
@@ -2773,7 +2496,7 @@ async def crawl_html_news_pages(url: str, months: int = 6, custom_news_url: str
                 if not result.success:
                     continue
 
-                soup = BeautifulSoup(result.html, 'html.parser')
+                soup = page_soup(result.html)
                 logger.info(f"[SCAN] {news_url}")
 
                 # ============================================================
@@ -5555,7 +5278,7 @@ async def crawl_html_news_pages(url: str, months: int = 6, custom_news_url: str
                 # Handles: Laurion (.news-item .date), 1911 Gold, Troilus (<a class='news-item'>), etc.
                 # ============================================================
                 for selector in ['.news-item', '.news_item', '.press-release', '.news-release', 'article.post', 'div.post', 'article', 'a.news-item']:
-                    for item in soup.select(selector)[:50]:
+                    for item in css(selector).select(soup)[:50]:
                         news = _extract_news_from_element(item, news_url, url)
                         if news:
                             _add_news_item(news_by_url, news, cutoff_date, "ITEM")